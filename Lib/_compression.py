@@ -160,3 +160,207 @@ def seek(self, offset, whence=io.SEEK_SET):
     def tell(self):
         """Return the current file position."""
         return self._pos
+
+
+# Minimal amount of compressed data decompressed by a single task
+PARALLEL_SEGMENT_SIZE = 1024 * 1024
+# Compressed data without member boundary after which parallel
+# decompression is given up
+PARALLEL_MAX_SEGMENT = 64 * 1024 * 1024
+# Decompressed data of a single task after which parallel decompression
+# is given up
+PARALLEL_MAX_OUTPUT = 32 * 1024 * 1024
+# Number of bytes needed after the start of a member to recognize it
+_MEMBER_LOOKAHEAD = 16
+
+
+class _PrependedFile:
+    """Minimal read-only file object returning some data before the contents
+    of an actual file."""
+
+    def __init__(self, data, fp):
+        self._data = data
+        self._offset = 0
+        self._fp = fp
+
+    def read(self, size=-1):
+        if self._offset >= len(self._data):
+            return self._fp.read(size)
+        data = self._data[self._offset:]
+        if size < 0:
+            self._offset = len(self._data)
+            return data + self._fp.read()
+        data = data[:size]
+        self._offset += len(data)
+        if len(data) < size:
+            data += self._fp.read(size - len(data))
+        return data
+
+
+class ParallelDecompressReader(DecompressReader):
+    """Decompresses the members of a multi-member stream in parallel threads.
+
+    The compressed data is cut at possible member boundaries found by
+    find_member(data, start), which returns the offset of the next member
+    header in data at or after start, or -1.  Segments of at least
+    PARALLEL_SEGMENT_SIZE bytes are decompressed by
+    decompress(data, max_length) in a thread pool, and their output is
+    returned in order.  decompress() must raise an exception if the segment
+    does not end at the end of a member; the segment is then merged with
+    the following one.  It must return None if the decompressed data would
+    be larger than max_length bytes, so that at most 2 * workers segments
+    of PARALLEL_MAX_OUTPUT bytes are held in memory.
+
+    If no boundary can be found, if a segment decompresses to too much
+    data, or at the end of the data if it cannot be decompressed, the
+    remaining data is read by the sequential reader returned by
+    serial_reader(fp), which also handles trailing garbage and reports
+    errors.
+    """
+
+    def __init__(self, fp, workers, find_member, decompress, serial_reader):
+        from concurrent.futures import ThreadPoolExecutor
+        self._fp = fp
+        self._eof = False
+        self._pos = 0
+        self._size = -1
+        self._workers = workers
+        self._find_member = find_member
+        self._decompress = decompress
+        self._serial_reader = serial_reader
+        self._segment_size = PARALLEL_SEGMENT_SIZE
+        self._max_segment = max(PARALLEL_MAX_SEGMENT, PARALLEL_SEGMENT_SIZE)
+        self._max_output = PARALLEL_MAX_OUTPUT
+        self._executor = ThreadPoolExecutor(workers)
+        self._init_state()
+
+    def _init_state(self):
+        self._input = bytearray()  # Compressed data not yet submitted
+        self._input_eof = False
+        self._search = 0  # Offset in _input from which to search boundaries
+        self._pending = []  # (compressed segment, future) pairs
+        self._chunk = b""  # Decompressed data being returned
+        self._offset = 0
+        self._serial = None
+
+    def _reset(self):
+        for data, future in self._pending:
+            future.cancel()
+        if self._serial is not None:
+            self._serial.close()
+        self._init_state()
+
+    def close(self):
+        if self._executor is not None:
+            self._reset()
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        return io.RawIOBase.close(self)
+
+    def _output(self, result):
+        # Return the decompressed data from the result of decompress()
+        return result
+
+    def _submit(self):
+        # Cut the input into segments and submit them until enough
+        # of them are pending.
+        while len(self._pending) < 2 * self._workers:
+            cut = self._find_member(self._input,
+                                    max(self._search, self._segment_size))
+            if cut < 0:
+                if not self._input_eof:
+                    if len(self._input) >= self._max_segment:
+                        # Member too large, let the serial reader handle it
+                        return
+                    self._search = max(self._search,
+                                       len(self._input) - _MEMBER_LOOKAHEAD)
+                    data = self._fp.read(self._segment_size)
+                    if data:
+                        self._input += data
+                    else:
+                        self._input_eof = True
+                    continue
+                if not self._input:
+                    return
+                cut = len(self._input)
+            data = bytes(self._input[:cut])
+            del self._input[:cut]
+            self._search = 0
+            self._pending.append(
+                (data, self._executor.submit(self._decompress, data,
+                                             self._max_output)))
+
+    def _unsubmit(self, data):
+        # Cancel the pending tasks and put data and their data back in
+        # front of the input.
+        for _, future in self._pending:
+            future.cancel()
+        self._input[:0] = data + b"".join(d for d, _ in self._pending)
+        self._pending.clear()
+
+    def _next_chunk(self):
+        # Return the decompressed data of the next segment, or None if the
+        # remaining data must be read by the serial reader.
+        while True:
+            self._submit()
+            if not self._pending:
+                break
+            data, future = self._pending.pop(0)
+            try:
+                result = future.result()
+            except Exception:
+                if not self._pending and not self._input and self._input_eof:
+                    # Nothing to merge with, get the error (if any) from
+                    # the serial reader.
+                    self._input[:] = data
+                    break
+                # The segment did not end at a member boundary.  Search for
+                # the next boundary after it and resubmit.
+                self._unsubmit(data)
+                self._search = len(data) + 1
+                continue
+            if result is None:
+                # Too much decompressed data, let the serial reader handle
+                # the remaining data with a bounded output size.
+                self._unsubmit(data)
+                break
+            return self._output(result)
+        if self._input or not self._input_eof:
+            self._serial = self._serial_reader(
+                _PrependedFile(bytes(self._input), self._fp))
+        self._input = bytearray()
+        return None
+
+    def read(self, size=-1):
+        if size < 0:
+            return self.readall()
+
+        if not size or self._eof:
+            return b""
+        while True:
+            if self._serial is not None:
+                data = self._serial.read(size)
+                break
+            if self._offset < len(self._chunk):
+                data = self._chunk[self._offset:self._offset + size]
+                self._offset += len(data)
+                break
+            self._chunk = self._next_chunk()
+            self._offset = 0
+            if self._chunk is None:
+                self._chunk = b""
+                if self._serial is None:
+                    data = b""
+                    break
+        if not data:
+            self._eof = True
+            self._size = self._pos
+            return b""
+        self._pos += len(data)
+        return data
+
+    def _rewind(self):
+        self._reset()
+        self._fp.seek(0)
+        self._eof = False
+        self._pos = 0
@@ -12,6 +12,7 @@
 from .futures import *
 from .graph import *
 from .locks import *
+from .pools import *
 from .protocols import *
 from .runners import *
 from .queues import *
@@ -30,6 +31,7 @@
            futures.__all__ +
            graph.__all__ +
            locks.__all__ +
+           pools.__all__ +
            protocols.__all__ +
            runners.__all__ +
            queues.__all__ +
@@ -47,6 +49,12 @@
 else:
     from .unix_events import *  # pragma: no cover
     __all__ += unix_events.__all__
+    try:
+        from .uring_events import *  # pragma: no cover
+    except ImportError:  # pragma: no cover
+        pass
+    else:
+        __all__ += uring_events.__all__
 
 def __getattr__(name: str):
     import warnings
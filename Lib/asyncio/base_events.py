@@ -19,6 +19,7 @@
 import errno
 import heapq
 import itertools
+import operator
 import os
 import socket
 import stat
@@ -61,6 +62,14 @@
 # before cleanup of cancelled handles is performed.
 _MIN_CANCELLED_TIMER_HANDLES_FRACTION = 0.5
 
+# Timers due less than _TIMER_WHEEL_HORIZON seconds ahead are kept in a
+# timer wheel in front of the _scheduled heap, with a bucket per
+# 1 / _TIMER_WHEEL_FREQUENCY seconds.  Adding a timer to the wheel and
+# expiring it do not compare TimerHandles, unlike the heap operations.
+_TIMER_WHEEL_FREQUENCY = 256
+_TIMER_WHEEL_SLOTS = 256
+_TIMER_WHEEL_HORIZON = (_TIMER_WHEEL_SLOTS - 1) / _TIMER_WHEEL_FREQUENCY
+
 
 _HAS_IPv6 = hasattr(socket, 'AF_INET6')
 
@@ -204,6 +213,92 @@ def _check_ssl_socket(sock):
         raise TypeError("Socket cannot be of type SSLSocket")
 
 
+_timer_when = operator.attrgetter('_when')
+
+
+class _TimerWheel:
+    """Timer handles due soon after the wheel time, in buckets.
+
+    The bucket of a timer is given by its time, so that the timers are
+    only sorted when they expire.  The event loop moves the wheel time
+    forward as the time passes.
+    """
+
+    # The state of the wheel is kept out of the event loop instance:
+    # attribute lookups get slower on instances with many attributes.
+    __slots__ = ('buckets', 'time', 'count')
+
+    def __init__(self):
+        self.buckets = [[] for _ in range(_TIMER_WHEEL_SLOTS)]
+        self.time = 0.0
+        self.count = 0
+
+    def add(self, timer):
+        """Add a timer due less than _TIMER_WHEEL_HORIZON seconds after
+        the wheel time."""
+        tick = int(timer._when * _TIMER_WHEEL_FREQUENCY)
+        self.buckets[tick % _TIMER_WHEEL_SLOTS].append(timer)
+        self.count += 1
+
+    def next_time(self):
+        """Return the time of the earliest timer."""
+        buckets = self.buckets
+        tick = int(self.time * _TIMER_WHEEL_FREQUENCY)
+        for tick in range(tick, tick + _TIMER_WHEEL_SLOTS):
+            bucket = buckets[tick % _TIMER_WHEEL_SLOTS]
+            if bucket:
+                return min(bucket, key=_timer_when)._when
+        raise RuntimeError('the timer wheel is empty')
+
+    def expire(self, end_time):
+        """Remove the timers due before end_time and the cancelled timers
+        of their buckets, and move the wheel time to end_time.
+
+        Return the timers which are not cancelled, sorted by time.
+        """
+        buckets = self.buckets
+        start = int(self.time * _TIMER_WHEEL_FREQUENCY)
+        end = int(end_time * _TIMER_WHEEL_FREQUENCY)
+        due = []
+        for tick in range(start, min(end + 1, start + _TIMER_WHEEL_SLOTS)):
+            bucket = buckets[tick % _TIMER_WHEEL_SLOTS]
+            if bucket:
+                buckets[tick % _TIMER_WHEEL_SLOTS] = self._keep(
+                    bucket, end_time, due)
+        if end_time > self.time:
+            self.time = end_time
+        if len(due) > 1:
+            due.sort(key=_timer_when)
+        return due
+
+    def remove_cancelled(self):
+        """Remove the cancelled timers."""
+        buckets = self.buckets
+        for i, bucket in enumerate(buckets):
+            if bucket:
+                buckets[i] = self._keep(bucket, None, None)
+
+    def _keep(self, bucket, end_time, due):
+        # Return the timers of bucket which are not cancelled and not due
+        # before end_time, and append the due ones to due.
+        keep = []
+        for handle in bucket:
+            if handle._cancelled:
+                handle._scheduled = False
+            elif end_time is not None and handle._when < end_time:
+                handle._scheduled = False
+                due.append(handle)
+            else:
+                keep.append(handle)
+        self.count -= len(bucket) - len(keep)
+        return keep
+
+    def clear(self):
+        for bucket in self.buckets:
+            bucket.clear()
+        self.count = 0
+
+
 class _SendfileFallbackProtocol(protocols.Protocol):
     def __init__(self, transp):
         if not isinstance(transp, transports._FlowControlMixin):
@@ -422,6 +517,7 @@ def __init__(self):
         self._stopping = False
         self._ready = collections.deque()
         self._scheduled = []
+        self._timer_wheel = _TimerWheel()
         self._default_executor = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
@@ -743,6 +839,7 @@ def close(self):
         self._closed = True
         self._ready.clear()
         self._scheduled.clear()
+        self._timer_wheel.clear()
         self._executor_shutdown_called = True
         executor = self._default_executor
         if executor is not None:
@@ -810,7 +907,11 @@ def call_at(self, when, callback, *args, context=None):
         timer = events.TimerHandle(when, callback, args, self, context)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
+        wheel = self._timer_wheel
+        if 0 <= when - wheel.time < _TIMER_WHEEL_HORIZON:
+            wheel.add(timer)
+        else:
+            heapq.heappush(self._scheduled, timer)
         timer._scheduled = True
         return timer
 
@@ -1962,7 +2063,8 @@ def _run_once(self):
         'call_later' callbacks.
         """
 
-        sched_count = len(self._scheduled)
+        wheel = self._timer_wheel
+        sched_count = len(self._scheduled) + wheel.count
         if (sched_count > _MIN_SCHEDULED_TIMER_HANDLES and
             self._timer_cancelled_count / sched_count >
                 _MIN_CANCELLED_TIMER_HANDLES_FRACTION):
@@ -1977,6 +2079,8 @@ def _run_once(self):
 
             heapq.heapify(new_scheduled)
             self._scheduled = new_scheduled
+            if wheel.count:
+                wheel.remove_cancelled()
             self._timer_cancelled_count = 0
         else:
             # Remove delayed calls that were cancelled from head of queue.
@@ -1988,9 +2092,15 @@ def _run_once(self):
         timeout = None
         if self._ready or self._stopping:
             timeout = 0
-        elif self._scheduled:
+        elif self._scheduled or wheel.count:
             # Compute the desired timeout.
-            timeout = self._scheduled[0]._when - self.time()
+            if not wheel.count:
+                when = self._scheduled[0]._when
+            elif not self._scheduled:
+                when = wheel.next_time()
+            else:
+                when = min(self._scheduled[0]._when, wheel.next_time())
+            timeout = when - self.time()
             if timeout > MAXIMUM_SELECT_TIMEOUT:
                 timeout = MAXIMUM_SELECT_TIMEOUT
             elif timeout < 0:
@@ -2003,13 +2113,32 @@ def _run_once(self):
 
         # Handle 'later' callbacks that are ready.
         end_time = self.time() + self._clock_resolution
-        while self._scheduled:
-            handle = self._scheduled[0]
-            if handle._when >= end_time:
-                break
-            handle = heapq.heappop(self._scheduled)
-            handle._scheduled = False
-            self._ready.append(handle)
+        if wheel.count:
+            count = wheel.count
+            due = wheel.expire(end_time)
+            # Cancelled timers were removed from the wheel too.
+            self._timer_cancelled_count -= count - wheel.count - len(due)
+            from_wheel = len(due)
+            while self._scheduled:
+                handle = self._scheduled[0]
+                if handle._when >= end_time:
+                    break
+                handle = heapq.heappop(self._scheduled)
+                handle._scheduled = False
+                due.append(handle)
+            if from_wheel and len(due) > from_wheel:
+                # Timers from both the wheel and the heap.
+                due.sort(key=_timer_when)
+            self._ready.extend(due)
+        else:
+            wheel.time = end_time
+            while self._scheduled:
+                handle = self._scheduled[0]
+                if handle._when >= end_time:
+                    break
+                handle = heapq.heappop(self._scheduled)
+                handle._scheduled = False
+                self._ready.append(handle)
 
         # This is the only place where callbacks are actually *called*.
         # All other places just add them to ready.
@@ -2018,8 +2147,9 @@ def _run_once(self):
         # they will be run the next time (after another I/O poll).
         # Use an idiom that is thread-safe without using locks.
         ntodo = len(self._ready)
+        popleft = self._ready.popleft
         for i in range(ntodo):
-            handle = self._ready.popleft()
+            handle = popleft()
             if handle._cancelled:
                 continue
             if self._debug:
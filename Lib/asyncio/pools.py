@@ -0,0 +1,288 @@
+"""Connection pool for streams."""
+
+__all__ = ('ConnectionPool',)
+
+import collections
+
+from . import locks
+from . import mixins
+from . import streams
+
+
+class _HostPool:
+    """Connections to one (host, port, ssl, server_hostname) key."""
+
+    __slots__ = ('idle', 'size', 'waiters')
+
+    def __init__(self):
+        # (reader, writer, timer handle) tuples, most recently used last.
+        self.idle = collections.deque()
+        # Number of idle, in use and connecting connections.
+        self.size = 0
+        # Futures of acquire() calls waiting for a free slot.
+        self.waiters = collections.deque()
+
+
+class _PooledConnection:
+    """Asynchronous context manager returned by ConnectionPool.connection()."""
+
+    def __init__(self, pool, host, port, kwds):
+        self._pool = pool
+        self._args = (host, port)
+        self._kwds = kwds
+        self._writer = None
+
+    async def __aenter__(self):
+        reader, writer = await self._pool.acquire(*self._args, **self._kwds)
+        self._writer = writer
+        return reader, writer
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        writer, self._writer = self._writer, None
+        # A connection used by code which failed may be in any state.
+        self._pool.release(writer, discard=exc_type is not None)
+
+
+class ConnectionPool(mixins._LoopBoundMixin):
+    """A pool of stream connections, reused by host, port and TLS settings.
+
+    acquire() returns an idle connection to the same destination if there
+    is one which passes the health check, or else opens a new connection
+    with open_connection().  release() returns the connection to the pool.
+
+    max_size is the maximum number of connections per destination, including
+    the connections in use; acquire() waits for a connection to be released
+    when it is reached.  Idle connections are closed after idle_timeout
+    seconds if it is not None.  max_connecting limits the number of
+    connections being opened at the same time for all destinations.
+
+    health_check is an optional coroutine function called with the
+    (reader, writer) pair of an idle connection before it is reused; if it
+    returns a false value, the connection is closed and another one is used.
+
+    Other keyword arguments are passed to open_connection().
+    """
+
+    def __init__(self, *, max_size=10, idle_timeout=None, max_connecting=None,
+                 health_check=None, **kwds):
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+        if idle_timeout is not None and idle_timeout < 0:
+            raise ValueError("idle_timeout must be a non-negative number")
+        if max_connecting is not None and max_connecting <= 0:
+            raise ValueError("max_connecting must be greater than 0")
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        if max_connecting is not None:
+            self._connecting = locks.Semaphore(max_connecting)
+        else:
+            self._connecting = None
+        self._health_check = health_check
+        self._kwds = kwds
+        self._pools = {}
+        # writer -> (key, reader) for the connections in use.
+        self._in_use = {}
+        self._closed = False
+
+    def __repr__(self):
+        info = [f'max_size={self._max_size}']
+        idle = sum(len(pool.idle) for pool in self._pools.values())
+        if idle:
+            info.append(f'idle={idle}')
+        if self._in_use:
+            info.append(f'in_use={len(self._in_use)}')
+        if self._closed:
+            info.append('closed')
+        return f'<{type(self).__name__} {" ".join(info)}>'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def connection(self, host=None, port=None, *, ssl=None,
+                   server_hostname=None):
+        """Return an asynchronous context manager for a pooled connection.
+
+        The context manager acquires a connection, returns its
+        (reader, writer) pair, and releases it on exit.  The connection is
+        closed instead of being reused if an exception is raised in the
+        body of the async with statement.
+        """
+        return _PooledConnection(self, host, port,
+                                 {'ssl': ssl,
+                                  'server_hostname': server_hostname})
+
+    async def acquire(self, host=None, port=None, *, ssl=None,
+                      server_hostname=None):
+        """Return a (reader, writer) pair connected to host and port.
+
+        Reuse an idle connection with the same destination and TLS settings
+        if possible, else open a new connection.  The connection must be
+        given back to the pool with release().
+        """
+        self._check_closed()
+        key = (host, port, ssl, server_hostname)
+        while True:
+            # The pool of the key is forgotten when it has no connection,
+            # which may happen while waiting for a free slot.
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = _HostPool()
+            # Reuse the most recently used connections first: the least
+            # recently used ones are left to expire.
+            while pool.idle:
+                reader, writer, handle = pool.idle.pop()
+                if handle is not None:
+                    handle.cancel()
+                try:
+                    healthy = await self._is_healthy(reader, writer)
+                except BaseException:
+                    self._discard(pool, writer)
+                    self._forget_if_unused(key, pool)
+                    raise
+                if healthy:
+                    self._in_use[writer] = (key, reader)
+                    return reader, writer
+                self._discard(pool, writer)
+            if pool.size < self._max_size:
+                break
+            await self._wait_for_slot(pool)
+            self._check_closed()
+
+        pool.size += 1
+        try:
+            if self._connecting is not None:
+                async with self._connecting:
+                    reader, writer = await self._open_connection(key)
+            else:
+                reader, writer = await self._open_connection(key)
+        except BaseException:
+            pool.size -= 1
+            self._wakeup_next(pool)
+            self._forget_if_unused(key, pool)
+            raise
+        self._in_use[writer] = (key, reader)
+        return reader, writer
+
+    def release(self, writer, *, discard=False):
+        """Give back a connection returned by acquire() to the pool.
+
+        The connection is closed instead of being kept idle if discard is
+        true, if it is closed or has unread data, or if the pool is closed.
+        """
+        try:
+            key, reader = self._in_use.pop(writer)
+        except KeyError:
+            raise ValueError(
+                f'{writer!r} was not acquired from this pool') from None
+        pool = self._pools[key]
+        if discard or self._closed or not self._is_reusable(reader, writer):
+            self._discard(pool, writer)
+            self._forget_if_unused(key, pool)
+            return
+        handle = None
+        if self._idle_timeout is not None:
+            handle = self._get_loop().call_later(
+                self._idle_timeout, self._expire, key, pool, writer)
+        pool.idle.append((reader, writer, handle))
+        self._wakeup_next(pool)
+
+    async def close(self):
+        """Close the idle connections and wait until they are closed.
+
+        Connections in use are closed when they are released.  acquire()
+        raises RuntimeError once the pool is closed.
+        """
+        self._closed = True
+        writers = []
+        for pool in self._pools.values():
+            while pool.idle:
+                reader, writer, handle = pool.idle.pop()
+                if handle is not None:
+                    handle.cancel()
+                pool.size -= 1
+                writer.close()
+                writers.append(writer)
+            # Waiters raise RuntimeError when they wake up.
+            while pool.waiters:
+                waiter = pool.waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+        for writer in writers:
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    def is_closed(self):
+        """Return True if the pool is closed."""
+        return self._closed
+
+    def _check_closed(self):
+        if self._closed:
+            raise RuntimeError('the connection pool is closed')
+
+    async def _open_connection(self, key):
+        host, port, ssl, server_hostname = key
+        return await streams.open_connection(
+            host, port, ssl=ssl, server_hostname=server_hostname,
+            **self._kwds)
+
+    def _is_reusable(self, reader, writer):
+        # Unread data would be returned to the next user of the connection.
+        return not (writer.is_closing() or reader._eof or reader._buffer
+                    or reader.exception() is not None)
+
+    async def _is_healthy(self, reader, writer):
+        if not self._is_reusable(reader, writer):
+            return False
+        if self._health_check is not None:
+            return await self._health_check(reader, writer)
+        return True
+
+    async def _wait_for_slot(self, pool):
+        waiter = self._get_loop().create_future()
+        pool.waiters.append(waiter)
+        try:
+            await waiter
+        except:
+            waiter.cancel()  # Just in case waiter is not done yet.
+            try:
+                pool.waiters.remove(waiter)
+            except ValueError:
+                # The waiter could be removed from pool.waiters by a
+                # previous release() call.
+                pass
+            if not waiter.cancelled():
+                # We were woken up by release(), but can't take the
+                # connection.  Wake up the next in line.
+                self._wakeup_next(pool)
+            raise
+
+    def _wakeup_next(self, pool):
+        # Wake up the next waiter (if any) that isn't cancelled.
+        waiters = pool.waiters
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    def _discard(self, pool, writer):
+        writer.close()
+        pool.size -= 1
+        self._wakeup_next(pool)
+
+    def _expire(self, key, pool, writer):
+        for i, (_, idle_writer, _) in enumerate(pool.idle):
+            if idle_writer is writer:
+                del pool.idle[i]
+                self._discard(pool, writer)
+                self._forget_if_unused(key, pool)
+                break
+
+    def _forget_if_unused(self, key, pool):
+        if not pool.size and not pool.waiters and self._pools.get(key) is pool:
+            del self._pools[key]
@@ -1,11 +1,12 @@
 """Event loop using a proactor and related classes.
 
 A proactor is a "notify-on-completion" multiplexer.  Currently a
-proactor is only implemented on Windows with IOCP.
+proactor is implemented on Windows with IOCP and on Linux with io_uring.
 """
 
 __all__ = 'BaseProactorEventLoop',
 
+import errno
 import io
 import os
 import socket
@@ -162,7 +163,12 @@ def _call_connection_lost(self, exc):
             # just close our end.  First calling shutdown() seems to
             # cure it, but maybe using DisconnectEx() would be better.
             if hasattr(self._sock, 'shutdown') and self._sock.fileno() != -1:
-                self._sock.shutdown(socket.SHUT_RDWR)
+                try:
+                    self._sock.shutdown(socket.SHUT_RDWR)
+                except OSError as exc:
+                    # ENOTCONN on Linux if the peer already closed
+                    if exc.errno != errno.ENOTCONN:
+                        raise
             self._sock.close()
             self._sock = None
             server = self._server
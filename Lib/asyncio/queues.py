@@ -130,6 +130,10 @@ async def put(self, item):
 
         Raises QueueShutDown if the queue has been shut down.
         """
+        await self._wait_not_full()
+        return self.put_nowait(item)
+
+    async def _wait_not_full(self):
         while self.full():
             if self._is_shutdown:
                 raise QueueShutDown
@@ -151,7 +155,6 @@ async def put(self, item):
                     # the call.  Wake up the next in line.
                     self._wakeup_next(self._putters)
                 raise
-        return self.put_nowait(item)
 
     def put_nowait(self, item):
         """Put an item into the queue without blocking.
@@ -169,6 +172,59 @@ def put_nowait(self, item):
         self._finished.clear()
         self._wakeup_next(self._getters)
 
+    async def put_many(self, items):
+        """Put all items of an iterable into the queue, in order.
+
+        Put as many items as there are free slots at once, and wait for
+        more free slots if the queue is full.  If the call is cancelled while
+        waiting, the items put so far stay in the queue.
+
+        Raises QueueShutDown if the queue has been shut down.
+        """
+        items = list(items)
+        start = 0
+        while True:
+            if self._is_shutdown:
+                raise QueueShutDown
+            stop = len(items)
+            if self._maxsize > 0:
+                stop = min(stop, start + self._maxsize - self.qsize())
+            if stop > start:
+                self._put_many(items, start, stop)
+                start = stop
+            if start >= len(items):
+                return
+            await self._wait_not_full()
+
+    def put_many_nowait(self, items):
+        """Put all items of an iterable into the queue without blocking.
+
+        If there are not enough free slots for all items, raise QueueFull
+        and do not put any item.
+
+        Raises QueueShutDown if the queue has been shut down.
+        """
+        if self._is_shutdown:
+            raise QueueShutDown
+        items = list(items)
+        if self._maxsize > 0 and self.qsize() + len(items) > self._maxsize:
+            raise QueueFull
+        self._put_many(items, 0, len(items))
+
+    def _put_many(self, items, start, stop):
+        put = self._put
+        for i in range(start, stop):
+            put(items[i])
+        if stop > start:
+            self._unfinished_tasks += stop - start
+            self._finished.clear()
+            # Wake up as many getters as there are new items.
+            getters = self._getters
+            for _ in range(stop - start):
+                if not getters:
+                    break
+                self._wakeup_next(getters)
+
     async def get(self):
         """Remove and return an item from the queue.
 
@@ -177,6 +233,10 @@ async def get(self):
         Raises QueueShutDown if the queue has been shut down and is empty, or
         if the queue has been shut down immediately.
         """
+        await self._wait_not_empty()
+        return self.get_nowait()
+
+    async def _wait_not_empty(self):
         while self.empty():
             if self._is_shutdown and self.empty():
                 raise QueueShutDown
@@ -198,7 +258,6 @@ async def get(self):
                     # the call.  Wake up the next in line.
                     self._wakeup_next(self._getters)
                 raise
-        return self.get_nowait()
 
     def get_nowait(self):
         """Remove and return an item from the queue.
@@ -216,6 +275,50 @@ def get_nowait(self):
         self._wakeup_next(self._putters)
         return item
 
+    async def get_many(self, max_items=None):
+        """Remove and return a list of items from the queue.
+
+        If queue is empty, wait until an item is available, then return all
+        the available items, but at most max_items items if it is not None.
+
+        task_done() must be called for each returned item.
+
+        Raises QueueShutDown if the queue has been shut down and is empty, or
+        if the queue has been shut down immediately.
+        """
+        if max_items is not None and max_items <= 0:
+            raise ValueError("max_items must be greater than 0")
+        await self._wait_not_empty()
+        return self.get_many_nowait(max_items)
+
+    def get_many_nowait(self, max_items=None):
+        """Remove and return a list of items from the queue.
+
+        Return all the immediately available items, but at most max_items
+        items if it is not None.  If no item is available, raise QueueEmpty.
+
+        Raises QueueShutDown if the queue has been shut down and is empty, or
+        if the queue has been shut down immediately.
+        """
+        if max_items is not None and max_items <= 0:
+            raise ValueError("max_items must be greater than 0")
+        if self.empty():
+            if self._is_shutdown:
+                raise QueueShutDown
+            raise QueueEmpty
+        count = self.qsize()
+        if max_items is not None:
+            count = min(count, max_items)
+        get = self._get
+        items = [get() for _ in range(count)]
+        # Wake up as many putters as there are new free slots.
+        putters = self._putters
+        for _ in range(count):
+            if not putters:
+                break
+            self._wakeup_next(putters)
+        return items
+
     def task_done(self):
         """Indicate that a formerly enqueued task is complete.
 
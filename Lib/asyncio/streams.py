@@ -409,6 +409,16 @@ def __del__(self, warnings=warnings):
                 self.close()
                 warnings.warn(f"unclosed {self!r}", ResourceWarning)
 
+
+def _writable_nbytes(buf):
+    with memoryview(buf) as view:
+        if view.readonly:
+            raise TypeError(
+                f'a writable bytes-like object is required, '
+                f'not {type(buf).__name__!r}')
+        return view.nbytes
+
+
 class StreamReader:
 
     _source_traceback = None
@@ -777,6 +787,72 @@ async def readexactly(self, n):
         self._maybe_resume_transport()
         return data
 
+    async def readinto(self, buf):
+        """Read up to len(buf) bytes from the stream into buf.
+
+        Return the number of bytes read, as soon as at least 1 byte is
+        available in the internal buffer.  If EOF was received and the
+        internal buffer is empty, return 0.
+
+        Unlike read(), no bytes object is created: the data is copied
+        directly from the internal buffer to the writable bytes-like
+        object buf.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        n = _writable_nbytes(buf)
+        if n == 0:
+            return 0
+
+        if not self._buffer and not self._eof:
+            await self._wait_for_data('readinto')
+
+        n = min(n, len(self._buffer))
+        with memoryview(buf) as view, view.cast('B') as view:
+            view[:n] = memoryview(self._buffer)[:n]
+        del self._buffer[:n]
+
+        self._maybe_resume_transport()
+        return n
+
+    async def readexactly_into(self, buf):
+        """Read exactly len(buf) bytes into buf.
+
+        Raise an IncompleteReadError if EOF is reached before len(buf)
+        bytes can be read. The IncompleteReadError.partial attribute of the
+        exception will contain the partial read bytes, buf is not modified.
+
+        Unlike readexactly(), no bytes object is created: the data is copied
+        directly from the internal buffer to the writable bytes-like
+        object buf.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        n = _writable_nbytes(buf)
+        if n == 0:
+            return
+
+        while len(self._buffer) < n:
+            if self._eof:
+                incomplete = bytes(self._buffer)
+                self._buffer.clear()
+                raise exceptions.IncompleteReadError(incomplete, n)
+
+            await self._wait_for_data('readexactly_into')
+
+        with memoryview(buf) as view, view.cast('B') as view:
+            view[:] = memoryview(self._buffer)[:n]
+        del self._buffer[:n]
+        self._maybe_resume_transport()
+
     def __aiter__(self):
         return self
 
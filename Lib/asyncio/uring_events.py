@@ -0,0 +1,573 @@
+"""Proactor event loop for Linux using io_uring."""
+
+import sys
+
+if not sys.platform.startswith('linux'):  # pragma: no cover
+    raise ImportError('Linux only')
+
+import _uring
+import errno
+import functools
+import os
+import select
+import socket
+import time
+import warnings
+import weakref
+
+from . import events
+from . import futures
+from . import proactor_events
+from . import unix_events
+from .log import logger
+
+
+__all__ = (
+    'UringEventLoop', 'UringProactor',
+)
+
+
+# Returned by the completion callback of an operation which has been
+# submitted again to complete the work (e.g. after a partial write).
+_PENDING = object()
+
+
+def _fileno(conn):
+    fd = conn if isinstance(conn, int) else conn.fileno()
+    if fd < 0:
+        raise OSError(errno.EBADF, os.strerror(errno.EBADF))
+    return fd
+
+
+def _check_result(result):
+    if result < 0:
+        raise OSError(-result, os.strerror(-result))
+    return result
+
+
+class _UringFuture(futures.Future):
+    """Subclass of Future which represents an io_uring operation.
+
+    Cancelling it will cancel the operation.
+    """
+
+    def __init__(self, proactor, *, loop=None):
+        super().__init__(loop=loop)
+        if self._source_traceback:
+            del self._source_traceback[-1]
+        self._proactor = proactor
+        self._user_data = None
+
+    def _repr_info(self):
+        info = super()._repr_info()
+        if self._user_data is not None:
+            info.insert(1, f'user_data={self._user_data}')
+        return info
+
+    def _cancel_operation(self):
+        if self._user_data is None:
+            return
+        try:
+            self._proactor._cancel(self._user_data)
+        except OSError as exc:
+            context = {
+                'message': 'Cancelling an io_uring future failed',
+                'exception': exc,
+                'future': self,
+            }
+            if self._source_traceback:
+                context['source_traceback'] = self._source_traceback
+            self._loop.call_exception_handler(context)
+        self._user_data = None
+
+    def cancel(self, msg=None):
+        self._cancel_operation()
+        return super().cancel(msg=msg)
+
+    def set_exception(self, exception):
+        super().set_exception(exception)
+        self._user_data = None
+
+    def set_result(self, result):
+        super().set_result(result)
+        self._user_data = None
+
+
+class UringProactor:
+    """Proactor implementation using io_uring."""
+
+    def __init__(self, entries=256):
+        self._loop = None
+        self._results = []
+        self._ring = _uring.Ring(entries)
+        self._cache = {}
+        self._stopped_serving = weakref.WeakSet()
+
+    def _check_closed(self):
+        if self._ring is None:
+            raise RuntimeError('UringProactor is closed')
+
+    def __repr__(self):
+        info = ['operation#=%s' % len(self._cache),
+                'result#=%s' % len(self._results)]
+        if self._ring is None:
+            info.append('closed')
+        return '<%s %s>' % (self.__class__.__name__, " ".join(info))
+
+    def set_loop(self, loop):
+        self._loop = loop
+
+    def select(self, timeout=None):
+        if not self._results:
+            self._poll(timeout)
+        tmp = self._results
+        self._results = []
+        try:
+            return tmp
+        finally:
+            # Needed to break cycles when an exception occurs.
+            tmp = None
+
+    def _result(self, value):
+        fut = self._loop.create_future()
+        fut.set_result(value)
+        return fut
+
+    @staticmethod
+    def _finish_recv(result, data):
+        _check_result(result)
+        return data
+
+    def recv(self, conn, nbytes, flags=0):
+        fut = self._new_future()
+        fd = _fileno(conn)
+        if isinstance(conn, socket.socket):
+            user_data = self._ring.recv(fd, nbytes, flags)
+        else:
+            user_data = self._ring.read(fd, nbytes)
+        return self._register(fut, user_data, conn, self._finish_recv)
+
+    def recv_into(self, conn, buf, flags=0):
+        fut = self._new_future()
+        fd = _fileno(conn)
+        if isinstance(conn, socket.socket):
+            user_data = self._ring.recv_into(fd, buf, flags)
+        else:
+            user_data = self._ring.read_into(fd, buf)
+        return self._register(fut, user_data, conn, self._finish_io)
+
+    def recvfrom(self, conn, nbytes, flags=0):
+        return self._call_when_ready(
+            conn, select.POLLIN, lambda: conn.recvfrom(nbytes, flags))
+
+    def recvfrom_into(self, conn, buf, nbytes=0, flags=0):
+        return self._call_when_ready(
+            conn, select.POLLIN,
+            lambda: conn.recvfrom_into(buf, nbytes, flags))
+
+    def sendto(self, conn, buf, flags=0, addr=None):
+        if addr is None:
+            return self._call_when_ready(
+                conn, select.POLLOUT, lambda: conn.send(buf, flags))
+        return self._call_when_ready(
+            conn, select.POLLOUT, lambda: conn.sendto(buf, flags, addr))
+
+    def send(self, conn, buf, flags=0):
+        fut = self._new_future()
+        fd = _fileno(conn)
+        is_socket = isinstance(conn, socket.socket)
+        nbytes = len(buf)
+
+        def submit(view):
+            if is_socket:
+                user_data = self._ring.send(fd, view, flags)
+            else:
+                user_data = self._ring.write(fd, view)
+            self._register(fut, user_data, conn,
+                           functools.partial(finish_send, view))
+
+        def finish_send(view, result, data):
+            sent = _check_result(result)
+            if sent < len(view):
+                # Partial write: send the rest of the data.
+                submit(view[sent:])
+                return _PENDING
+            return nbytes
+
+        submit(memoryview(buf).cast('B'))
+        return fut
+
+    def accept(self, listener):
+        fut = self._new_future()
+        user_data = self._ring.accept(_fileno(listener), socket.SOCK_CLOEXEC)
+
+        def finish_accept(result, data):
+            conn = socket.socket(listener.family, listener.type,
+                                 listener.proto, fileno=_check_result(result))
+            try:
+                conn.setblocking(False)
+                return conn, conn.getpeername()
+            except:
+                conn.close()
+                raise
+
+        def discard_accept(result):
+            if result >= 0:
+                os.close(result)
+
+        return self._register(fut, user_data, listener, finish_accept,
+                              discard_accept)
+
+    def connect(self, conn, address):
+        if conn.type == socket.SOCK_DGRAM:
+            # connect() completes immediately for UDP sockets
+            conn.connect(address)
+            return self._result(None)
+
+        try:
+            conn.connect(address)
+        except (BlockingIOError, InterruptedError):
+            pass
+        else:
+            return self._result(None)
+
+        def finish_connect():
+            err = conn.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            if err != 0:
+                raise OSError(err, f'Connect call failed {address}')
+
+        return self._call_when_ready(conn, select.POLLOUT, finish_connect)
+
+    def sendfile(self, sock, file, offset, count):
+        fileno = file.fileno()
+        start = offset
+
+        def send_chunk():
+            nonlocal offset, count
+            while count:
+                try:
+                    sent = os.sendfile(sock.fileno(), fileno, offset, count)
+                except (BlockingIOError, InterruptedError):
+                    raise
+                except OSError:
+                    # The caller only updates the file position for
+                    # complete chunks.
+                    if offset != start:
+                        os.lseek(fileno, offset, os.SEEK_SET)
+                    raise
+                if not sent:
+                    break  # EOF
+                offset += sent
+                count -= sent
+
+        return self._call_when_ready(sock, select.POLLOUT, send_chunk)
+
+    def poll(self, conn, events):
+        """Return a future which is done when conn is ready.
+
+        events is a mask of select.POLL* flags.  The result of the future is
+        the mask of events which occurred.
+        """
+        fut = self._new_future()
+        user_data = self._ring.poll(_fileno(conn), events)
+        return self._register(fut, user_data, conn, self._finish_io)
+
+    def _call_when_ready(self, conn, events, func):
+        # Wait until conn is ready, then call func() and return its
+        # result.  Operations which are not supported by the ring, or which
+        # must be called with the socket object (e.g. to get the address of
+        # a datagram), are implemented in this way.
+        fut = self._new_future()
+        fd = _fileno(conn)
+
+        def finish_ready(result, data):
+            _check_result(result)
+            try:
+                return func()
+            except (BlockingIOError, InterruptedError):
+                self._register(fut, self._ring.poll(fd, events), conn,
+                               finish_ready)
+                return _PENDING
+
+        return self._register(fut, self._ring.poll(fd, events), conn,
+                              finish_ready)
+
+    @staticmethod
+    def _finish_io(result, data):
+        return _check_result(result)
+
+    def _new_future(self):
+        self._check_closed()
+        return _UringFuture(self, loop=self._loop)
+
+    def _register(self, fut, user_data, obj, callback, discard=None):
+        # Return a future which will be set with the result of the
+        # operation when it completes.  The future's value is actually
+        # the value returned by callback(result, data).  If the future has
+        # been cancelled but the operation still succeeded, discard(result)
+        # is called to release the resources it allocated.  Note that we
+        # only store obj to prevent it from being garbage collected too
+        # early.
+        fut._user_data = user_data
+        self._cache[user_data] = (fut, obj, callback, discard)
+        return fut
+
+    def _cancel(self, user_data):
+        if self._ring is not None and user_data in self._cache:
+            self._ring.cancel(user_data)
+
+    def _poll(self, timeout=None):
+        if timeout is not None and timeout < 0:
+            raise ValueError("negative timeout")
+
+        for user_data, result, data in self._ring.wait(timeout):
+            try:
+                f, obj, callback, discard = self._cache.pop(user_data)
+            except KeyError:
+                if self._loop.get_debug():
+                    self._loop.call_exception_handler({
+                        'message': ('io_uring returned an unexpected '
+                                    'completion'),
+                        'status': ('user_data=%s result=%s'
+                                   % (user_data, result)),
+                    })
+                continue
+
+            if obj in self._stopped_serving:
+                f.cancel()
+            if f.done():
+                # The operation has been cancelled.
+                if discard is not None:
+                    discard(result)
+                continue
+            if isinstance(data, BaseException):
+                # The operation completed, but its result could not be
+                # retrieved.
+                if discard is not None:
+                    discard(result)
+                f.set_exception(data)
+                self._results.append(f)
+                continue
+            try:
+                value = callback(result, data)
+            except Exception as e:
+                # Don't drop the next completions.
+                f.set_exception(e)
+                self._results.append(f)
+            else:
+                if value is not _PENDING:
+                    f.set_result(value)
+                    self._results.append(f)
+            finally:
+                f = None
+
+    def _stop_serving(self, obj):
+        # obj is a socket.  It will be closed in
+        # BaseProactorEventLoop._stop_serving() after its accept()
+        # operation has been cancelled.  Submit the cancellation now so
+        # that the listening socket is released by the kernel when it is
+        # closed.
+        self._stopped_serving.add(obj)
+        self._poll(0)
+
+    def close(self):
+        if self._ring is None:
+            # already closed
+            return
+
+        # Cancel remaining registered operations.
+        for fut, obj, callback, discard in list(self._cache.values()):
+            if not fut.cancelled():
+                fut.cancel()
+
+        # Wait until all cancelled operations complete: the kernel may
+        # still write to their buffers. Display progress every second if
+        # the loop is still running.
+        msg_update = 1.0
+        start_time = time.monotonic()
+        next_msg = start_time + msg_update
+        while self._cache:
+            if next_msg <= time.monotonic():
+                logger.debug('%r is running after closing for %.1f seconds',
+                             self, time.monotonic() - start_time)
+                next_msg = time.monotonic() + msg_update
+
+            # handle a few events, or timeout
+            self._poll(msg_update)
+
+        self._results = []
+
+        self._ring.close()
+        self._ring = None
+
+    def __del__(self):
+        self.close()
+
+
+class UringEventLoop(proactor_events.BaseProactorEventLoop):
+    """Linux version of proactor event loop using io_uring.
+
+    Adds signal handling, UNIX Domain Socket support, add_reader() and
+    add_writer() to the proactor event loop.
+    """
+
+    def __init__(self, proactor=None):
+        if proactor is None:
+            proactor = UringProactor()
+        self._readers = {}
+        self._writers = {}
+        self._signal_handlers = {}
+        self._unix_server_sockets = {}
+        super().__init__(proactor)
+        if unix_events.can_use_pidfd():
+            self._watcher = unix_events._PidfdChildWatcher()
+        else:
+            self._watcher = unix_events._ThreadedChildWatcher()
+
+    def _run_forever_setup(self):
+        assert self._self_reading_future is None
+        self.call_soon(self._loop_self_reading)
+        super()._run_forever_setup()
+
+    def _run_forever_cleanup(self):
+        super()._run_forever_cleanup()
+        if self._self_reading_future is not None:
+            self._self_reading_future.cancel()
+            self._self_reading_future = None
+
+    def _loop_self_reading(self, f=None):
+        if f is not None and not f.cancelled() and f.exception() is None:
+            self._process_self_data(f.result())
+        super()._loop_self_reading(f)
+
+    def close(self):
+        for fd in list(self._readers):
+            self._remove_reader(fd)
+        for fd in list(self._writers):
+            self._remove_writer(fd)
+        super().close()
+        if not sys.is_finalizing():
+            for sig in list(self._signal_handlers):
+                self.remove_signal_handler(sig)
+        else:
+            if self._signal_handlers:
+                warnings.warn(f"Closing the loop {self!r} "
+                              f"on interpreter shutdown "
+                              f"stage, skipping signal handlers removal",
+                              ResourceWarning,
+                              source=self)
+                self._signal_handlers.clear()
+
+    # Signals, UNIX Domain Sockets, pipes and subprocesses are handled in
+    # the same way as by the selector event loop.
+    _process_self_data = unix_events._UnixSelectorEventLoop._process_self_data
+    add_signal_handler = unix_events._UnixSelectorEventLoop.add_signal_handler
+    _handle_signal = unix_events._UnixSelectorEventLoop._handle_signal
+    remove_signal_handler = (
+        unix_events._UnixSelectorEventLoop.remove_signal_handler)
+    _check_signal = unix_events._UnixSelectorEventLoop._check_signal
+    _make_read_pipe_transport = (
+        unix_events._UnixSelectorEventLoop._make_read_pipe_transport)
+    _make_write_pipe_transport = (
+        unix_events._UnixSelectorEventLoop._make_write_pipe_transport)
+    _make_subprocess_transport = (
+        unix_events._UnixSelectorEventLoop._make_subprocess_transport)
+    _child_watcher_callback = (
+        unix_events._UnixSelectorEventLoop._child_watcher_callback)
+    create_unix_connection = (
+        unix_events._UnixSelectorEventLoop.create_unix_connection)
+    create_unix_server = unix_events._UnixSelectorEventLoop.create_unix_server
+
+    def _stop_serving(self, sock):
+        # Is this a unix socket that needs cleanup?
+        if sock in self._unix_server_sockets:
+            path = sock.getsockname()
+        else:
+            path = None
+
+        super()._stop_serving(sock)
+
+        if path is not None:
+            prev_ino = self._unix_server_sockets.pop(sock)
+            try:
+                if os.stat(path).st_ino == prev_ino:
+                    os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError as err:
+                logger.error('Unable to clean up listening UNIX socket '
+                             '%r: %r', path, err)
+
+    def _add_reader(self, fd, callback, *args):
+        return self._add_fd_callback(self._readers, fd, select.POLLIN,
+                                  callback, args)
+
+    def _remove_reader(self, fd):
+        return self._remove_fd_callback(self._readers, fd)
+
+    def _add_writer(self, fd, callback, *args):
+        return self._add_fd_callback(self._writers, fd, select.POLLOUT,
+                                  callback, args)
+
+    def _remove_writer(self, fd):
+        """Remove a writer callback."""
+        return self._remove_fd_callback(self._writers, fd)
+
+    def add_reader(self, fd, callback, *args):
+        """Add a reader callback."""
+        self._add_reader(fd, callback, *args)
+
+    def remove_reader(self, fd):
+        """Remove a reader callback."""
+        return self._remove_reader(fd)
+
+    def add_writer(self, fd, callback, *args):
+        """Add a writer callback."""
+        self._add_writer(fd, callback, *args)
+
+    def remove_writer(self, fd):
+        """Remove a writer callback."""
+        return self._remove_writer(fd)
+
+    def _add_fd_callback(self, registry, fd, mask, callback, args):
+        self._check_closed()
+        fd = _fileno(fd)
+        handle = events.Handle(callback, args, self, None)
+        self._remove_fd_callback(registry, fd)
+        self._wait_ready(registry, fd, mask, handle)
+        return handle
+
+    def _wait_ready(self, registry, fd, mask, handle):
+        # The poll operation is one-shot: it is submitted again each time
+        # the file descriptor is ready, until the callback is removed.
+        fut = self._proactor.poll(fd, mask)
+        registry[fd] = (handle, fut)
+
+        def ready(fut):
+            if fut.cancelled() or registry.get(fd, (None,))[0] is not handle:
+                return
+            if handle._cancelled:
+                del registry[fd]
+                return
+            if fut.exception() is not None:
+                # The file descriptor cannot be polled (for example, it was
+                # closed): like the selector event loop does for a file
+                # descriptor in error, run the callback, whose I/O on the
+                # file descriptor then fails with the error.
+                del registry[fd]
+            else:
+                self._wait_ready(registry, fd, mask, handle)
+            handle._run()
+
+        fut.add_done_callback(ready)
+
+    def _remove_fd_callback(self, registry, fd):
+        if self.is_closed():
+            return False
+        try:
+            handle, fut = registry.pop(_fileno(fd))
+        except (KeyError, OSError):
+            return False
+        handle.cancel()
+        fut.cancel()
+        return True
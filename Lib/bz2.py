@@ -34,7 +34,7 @@ class BZ2File(_compression.BaseStream):
     returned as bytes, and data to be written should be given as bytes.
     """
 
-    def __init__(self, filename, mode="r", *, compresslevel=9):
+    def __init__(self, filename, mode="r", *, compresslevel=9, workers=None):
         """Open a bzip2-compressed file.
 
         If filename is a str, bytes, or PathLike object, it gives the
@@ -50,7 +50,8 @@ def __init__(self, filename, mode="r", *, compresslevel=9):
         compression, and 9 (default) produces the most compression.
 
         If mode is 'r', the input file may be the concatenation of
-        multiple compressed streams.
+        multiple compressed streams.  If workers is given, these streams
+        are decompressed in parallel by that number of threads.
         """
         self._fp = None
         self._closefp = False
@@ -58,6 +59,8 @@ def __init__(self, filename, mode="r", *, compresslevel=9):
 
         if not (1 <= compresslevel <= 9):
             raise ValueError("compresslevel must be between 1 and 9")
+        if workers is not None and workers <= 0:
+            raise ValueError("workers must be greater than 0")
 
         if mode in ("", "r", "rb"):
             mode = "rb"
@@ -76,6 +79,8 @@ def __init__(self, filename, mode="r", *, compresslevel=9):
             self._compressor = BZ2Compressor(compresslevel)
         else:
             raise ValueError("Invalid mode: %r" % (mode,))
+        if workers is not None and mode_code != _MODE_READ:
+            raise ValueError("workers is only supported in read mode")
 
         if isinstance(filename, (str, bytes, os.PathLike)):
             self._fp = _builtin_open(filename, mode)
@@ -88,8 +93,11 @@ def __init__(self, filename, mode="r", *, compresslevel=9):
             raise TypeError("filename must be a str, bytes, file or PathLike object")
 
         if self._mode == _MODE_READ:
-            raw = _compression.DecompressReader(self._fp,
-                BZ2Decompressor, trailing_error=OSError)
+            if workers is not None:
+                raw = _compression.ParallelDecompressReader(self._fp,
+                    workers, _find_stream, _decompress_streams, _serial_reader)
+            else:
+                raw = _serial_reader(self._fp)
             self._buffer = io.BufferedReader(raw)
         else:
             self._pos = 0
@@ -276,6 +284,44 @@ def tell(self):
         return self._pos
 
 
+def _serial_reader(fp):
+    return _compression.DecompressReader(fp,
+        BZ2Decompressor, trailing_error=OSError)
+
+
+def _find_stream(data, start):
+    # Return the offset of the next possible bzip2 stream header in data,
+    # or -1.  The header is followed by the magic of the first block, or
+    # by the end of stream magic for an empty stream.
+    while (pos := data.find(b"BZh", start)) >= 0:
+        if pos + 10 > len(data):
+            break
+        if (0x31 <= data[pos + 3] <= 0x39 and
+            data[pos + 4:pos + 10] in (b"1AY&SY", b"\x17rE8P\x90")):
+            return pos
+        start = pos + 1
+    return -1
+
+
+def _decompress_streams(data, max_length):
+    # Like decompress(), but fail if the data is not a sequence of
+    # complete streams.  Return None if the decompressed data is larger
+    # than max_length bytes.
+    results = []
+    while data:
+        decomp = BZ2Decompressor()
+        result = decomp.decompress(data, max_length + 1)
+        if len(result) > max_length:
+            return None
+        max_length -= len(result)
+        results.append(result)
+        if not decomp.eof:
+            raise ValueError("Compressed data ended before the "
+                             "end-of-stream marker was reached")
+        data = decomp.unused_data
+    return b"".join(results)
+
+
 def open(filename, mode="rb", compresslevel=9,
          encoding=None, errors=None, newline=None):
     """Open a bzip2-compressed file in binary or text mode.
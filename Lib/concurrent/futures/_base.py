@@ -4,10 +4,12 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 import collections
+import itertools
 import logging
 import threading
 import time
 import types
+import weakref
 
 FIRST_COMPLETED = 'FIRST_COMPLETED'
 FIRST_EXCEPTION = 'FIRST_EXCEPTION'
@@ -572,7 +574,8 @@ def submit(self, fn, /, *args, **kwargs):
         """
         raise NotImplementedError()
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def map(self, fn, *iterables, timeout=None, chunksize=1,
+            buffersize=None, ordered=True):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -584,6 +587,13 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before being passed to a child process. This argument is only
                 used by ProcessPoolExecutor; it is ignored by
                 ThreadPoolExecutor.
+            buffersize: The number of submitted tasks whose results have not
+                yet been yielded. If the buffer is full, iteration over the
+                iterables pauses until a result is yielded from the buffer.
+                If None, all input elements are eagerly collected, and a task
+                is submitted for each.
+            ordered: If True, the results are yielded in the order of the
+                input elements, else as soon as they are available.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -594,10 +604,34 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if buffersize is not None and not isinstance(buffersize, int):
+            raise TypeError("buffersize must be an integer or None")
+        if buffersize is not None and buffersize < 1:
+            raise ValueError("buffersize must be None or > 0")
+
         if timeout is not None:
             end_time = timeout + time.monotonic()
 
-        fs = [self.submit(fn, *args) for args in zip(*iterables)]
+        zipped_iterables = zip(*iterables)
+        if buffersize:
+            fs = collections.deque(
+                self.submit(fn, *args)
+                for args in itertools.islice(zipped_iterables, buffersize)
+            )
+        else:
+            fs = collections.deque(
+                self.submit(fn, *args) for args in zipped_iterables)
+
+        # The iterator must not keep the executor alive.
+        executor_weakref = weakref.ref(self)
+
+        def submit_next(add):
+            # Submit a task for the next input element, if any, so that
+            # buffersize tasks are in flight.
+            if buffersize and (executor := executor_weakref()) is not None:
+                args = next(zipped_iterables, None)
+                if args is not None:
+                    add(executor.submit(fn, *args))
 
         # Yield must be hidden in closure so that the futures are submitted
         # before the first iterator value is required.
@@ -606,6 +640,7 @@ def result_iterator():
                 # reverse to keep finishing order
                 fs.reverse()
                 while fs:
+                    submit_next(fs.appendleft)
                     # Careful not to keep a reference to the popped future
                     if timeout is None:
                         yield _result_or_cancel(fs.pop())
@@ -614,7 +649,46 @@ def result_iterator():
             finally:
                 for future in fs:
                     future.cancel()
-        return result_iterator()
+
+        def unordered_result_iterator():
+            pending = set()
+            finished = collections.deque()
+            event = threading.Event()
+
+            def on_done(future):
+                # Called from the thread which completes the future.
+                finished.append(future)
+                event.set()
+
+            def add(future):
+                pending.add(future)
+                future.add_done_callback(on_done)
+
+            try:
+                while fs:
+                    add(fs.popleft())
+                while pending:
+                    while not finished:
+                        if timeout is None:
+                            wait_timeout = None
+                        else:
+                            wait_timeout = end_time - time.monotonic()
+                            if wait_timeout < 0:
+                                raise TimeoutError(
+                                    '%d futures unfinished' % len(pending))
+                        event.wait(wait_timeout)
+                        event.clear()
+                    pending.remove(finished[0])
+                    submit_next(add)
+                    # Careful not to keep a reference to the popped future
+                    yield _result_or_cancel(finished.popleft())
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        if ordered:
+            return result_iterator()
+        return unordered_result_iterator()
 
     def shutdown(self, wait=True, *, cancel_futures=False):
         """Clean-up the resources associated with the Executor.
@@ -1,6 +1,8 @@
 """Implements InterpreterPoolExecutor."""
 
+import array
 import contextlib
+import io
 import pickle
 import textwrap
 from . import thread as _thread
@@ -38,6 +40,135 @@ def __str__(self):
 
 UNBOUND = 2  # error; this should not happen.
 
+# The bytes, bytearray and array.array objects of at least this size are
+# passed to the other interpreter as cross-interpreter data instead of being
+# pickled.
+SHARE_THRESHOLD = 1024
+
+
+class _Pickler(pickle.Pickler):
+    """Pickle the large buffers as cross-interpreter data.
+
+    The bytes objects, and bytes snapshots of the bytearray and array.array
+    objects, are collected in the shared list instead of being pickled, and
+    so are the out-of-band buffers (pickle protocol 5).  The memoryview
+    objects are collected too: if share_memoryviews is true, the other
+    interpreter gets a view of the same memory, otherwise a copy.
+    """
+
+    def __init__(self, file, share_memoryviews):
+        # Don't pass a bound method, the reference cycle would keep the
+        # pickled objects alive.
+        buffers = []
+        def buffer_callback(buffer):
+            try:
+                view = buffer.raw()
+            except BufferError:
+                # Not contiguous.
+                return True
+            buffers.append(view)
+            return False
+        super().__init__(file, 5, buffer_callback=buffer_callback)
+        self.share_memoryviews = share_memoryviews
+        self.shared = []
+        self.buffers = buffers
+        # Map the ids of the shared objects to their persistent id, since
+        # persistent ids are not memoized by the pickler.
+        self._pids = {}
+
+    def persistent_id(self, obj):
+        cls = type(obj)
+        if cls is bytes:
+            if len(obj) < SHARE_THRESHOLD:
+                return None
+            kind = 'bytes'
+        elif cls is bytearray:
+            if len(obj) < SHARE_THRESHOLD:
+                return None
+            kind = 'bytearray'
+        elif cls is array.array:
+            if len(obj) * obj.itemsize < SHARE_THRESHOLD:
+                return None
+            kind = obj.typecode
+        elif cls is memoryview:
+            kind = 'memoryview'
+        else:
+            return None
+        key = id(obj)
+        try:
+            return self._pids[key]
+        except KeyError:
+            pass
+        pid = (kind, len(self.shared))
+        # Take a snapshot of the mutable objects: exporting their buffer
+        # until the call runs would prevent resizing them, and the call
+        # would see the later changes.
+        if cls is bytearray:
+            obj = bytes(obj)
+        elif cls is array.array:
+            obj = obj.tobytes()
+        elif cls is memoryview and not self.share_memoryviews:
+            # Keep the layout to rebuild the copy.
+            pid += (obj.format, obj.shape)
+            obj = obj.tobytes()
+        self.shared.append(obj)
+        self._pids[key] = pid
+        return pid
+
+
+class _Unpickler(pickle.Unpickler):
+
+    def __init__(self, file, shared, buffers):
+        # The objects rebuilt from out-of-band buffers may keep them: copy
+        # them, as the objects could otherwise be read-only or outlive the
+        # interpreter owning the memory.
+        super().__init__(file, buffers=[bytearray(b) for b in buffers])
+        self.shared = shared
+        self._objs = {}
+
+    def persistent_load(self, pid):
+        kind, index, *layout = pid
+        try:
+            return self._objs[index]
+        except KeyError:
+            pass
+        obj = self.shared[index]
+        if kind == 'bytearray':
+            obj = bytearray(obj)
+        elif kind == 'memoryview':
+            if layout:
+                # A copy of a memoryview.
+                fmt, shape = layout
+                obj = memoryview(obj)
+                if fmt != 'B' or len(shape) != 1:
+                    obj = obj.cast(fmt, shape)
+        elif kind != 'bytes':
+            a = array.array(kind)
+            a.frombytes(obj)
+            obj = a
+        self._objs[index] = obj
+        return obj
+
+
+def _dumps(obj, *, share_memoryviews=False):
+    """Return a shareable tuple, which _loads() turns into a copy of obj."""
+    file = io.BytesIO()
+    pickler = _Pickler(file, share_memoryviews)
+    pickler.dump(obj)
+    return (file.getvalue(), tuple(pickler.shared), tuple(pickler.buffers))
+
+
+def _loads(data, shared, buffers):
+    return _Unpickler(io.BytesIO(data), shared, buffers).load()
+
+
+def _has_memoryview(obj):
+    if type(obj) is memoryview:
+        return True
+    if type(obj) is tuple:
+        return any(map(_has_memoryview, obj))
+    return False
+
 
 class WorkerContext(_thread.WorkerContext):
 
@@ -61,7 +192,9 @@ def resolve_task(fn, args, kwargs):
                 # Functions defined in the __main__ module can't be pickled,
                 # so they can't be used here.  In the future, we could possibly
                 # borrow from multiprocessing to work around this.
-                data = pickle.dumps((fn, args, kwargs))
+                # The large buffers in the arguments are passed as
+                # cross-interpreter data, without copy for memoryviews.
+                data = _dumps((fn, args, kwargs), share_memoryviews=True)
                 kind = 'function'
             return (data, kind)
 
@@ -98,17 +231,24 @@ def _send_script_result(cls, resultsid):
     def _call(cls, func, args, kwargs, resultsid):
         with cls._capture_exc(resultsid):
             res = func(*args or (), **kwargs or {})
-        # Send the result back.
-        try:
-            _interpqueues.put(resultsid, (res, None), 0, UNBOUND)
-        except _interpreters.NotShareableError:
-            res = pickle.dumps(res)
-            _interpqueues.put(resultsid, (res, None), 1, UNBOUND)
+        # Send the result back.  The memoryviews are copied: they could
+        # outlive the interpreter owning their memory.
+        if not _has_memoryview(res):
+            try:
+                _interpqueues.put(resultsid, (res, None), 0, UNBOUND)
+                return
+            except _interpreters.NotShareableError:
+                pass
+        with cls._capture_exc(resultsid):
+            res = _dumps(res)
+        _interpqueues.put(resultsid, (res, None), 1, UNBOUND)
 
     @classmethod
-    def _call_pickled(cls, pickled, resultsid):
+    def _call_queued(cls, callsid, resultsid):
         with cls._capture_exc(resultsid):
-            fn, args, kwargs = pickle.loads(pickled)
+            data, _, _ = _interpqueues.get(callsid)
+            fn, args, kwargs = _loads(*data)
+            del data
         cls._call(fn, args, kwargs, resultsid)
 
     def __init__(self, initdata, shared=None):
@@ -116,6 +256,7 @@ def __init__(self, initdata, shared=None):
         self.shared = dict(shared) if shared else None
         self.interpid = None
         self.resultsid = None
+        self.callsid = None
 
     def __del__(self):
         if self.interpid is not None:
@@ -136,6 +277,7 @@ def initialize(self):
             maxsize = 0
             fmt = 0
             self.resultsid = _interpqueues.create(maxsize, fmt, UNBOUND)
+            self.callsid = _interpqueues.create(maxsize, fmt, UNBOUND)
 
             self._exec(f'from {__name__} import WorkerContext')
 
@@ -152,11 +294,15 @@ def initialize(self):
     def finalize(self):
         interpid = self.interpid
         resultsid = self.resultsid
+        callsid = self.callsid
         self.resultsid = None
+        self.callsid = None
         self.interpid = None
-        if resultsid is not None:
+        for qid in (resultsid, callsid):
+            if qid is None:
+                continue
             try:
-                _interpqueues.destroy(resultsid)
+                _interpqueues.destroy(qid)
             except _interpqueues.QueueNotFoundError:
                 pass
         if interpid is not None:
@@ -174,7 +320,11 @@ def run(self, task):
 {textwrap.indent(data, '    ')}
 WorkerContext._send_script_result({self.resultsid})"""
         elif kind == 'function':
-            script = f'WorkerContext._call_pickled({data!r}, {self.resultsid})'
+            # The call is passed through a queue rather than in the script,
+            # which would have to be compiled.
+            _interpqueues.put(self.callsid, data, 0, UNBOUND)
+            script = (f'WorkerContext._call_queued({self.callsid}, '
+                      f'{self.resultsid})')
         else:
             raise NotImplementedError(kind)
 
@@ -207,7 +357,7 @@ def run(self, task):
             assert exc_wrapper is not None
             exc = pickle.loads(excdata)
             raise exc from exc_wrapper
-        return pickle.loads(res) if pickled else res
+        return _loads(*res) if pickled else res
 
 
 class BrokenInterpreterPool(_thread.BrokenThreadPool):
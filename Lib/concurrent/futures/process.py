@@ -45,7 +45,10 @@
 
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
+import importlib
+import io
 import os
+import pickle
 from concurrent.futures import _base
 import queue
 import multiprocessing as mp
@@ -53,6 +56,7 @@
 # so that it can be accessed later as `mp.connection`
 import multiprocessing.connection
 from multiprocessing.queues import Queue
+from multiprocessing.reduction import ForkingPickler
 import threading
 import weakref
 from functools import partial
@@ -169,6 +173,188 @@ def __init__(self, work_id, fn, args, kwargs):
         self.kwargs = kwargs
 
 
+# Shared memory transport: the buffers of at least shared_memory_threshold
+# bytes of a _CallItem or a _ResultItem are pickled out-of-band (pickle
+# protocol 5) and copied to a single shared memory segment when the item is
+# put in its queue, so that only the name of the segment and the rest of the
+# pickle go through the pipe.  The receiver copies the buffers out of the
+# segment while unpickling, so that the segment can be released right after.
+#
+# The segments of the _CallItems are created by the queue feeder thread and
+# unlinked by the executor manager thread when the call is done.  The
+# segments of the _ResultItems are created by the workers and unlinked by the
+# executor manager thread once the result is unpickled.
+
+# On Windows, a segment is destroyed when its last handle is closed, so a
+# worker cannot hand one over to the executor: the results are only sent
+# through shared memory on POSIX.
+_SHARED_MEMORY_RESULTS = os.name != 'nt'
+
+# Formats of the memoryviews which can be rebuilt with memoryview.cast().
+_MEMORYVIEW_FORMATS = frozenset('bBhHiIlLqQnNfdc?')
+
+
+class _SharedMemoryPickler(ForkingPickler):
+    """Pickle buffers of at least threshold bytes out-of-band."""
+
+    def __init__(self, file, threshold):
+        super().__init__(file, 5, buffer_callback=self._buffer_callback)
+        self._threshold = threshold
+        # Out-of-band buffers and whether they were created by
+        # persistent_id(), in pickling order.
+        self.buffers = []
+        self._own_buffers = set()
+
+    def persistent_id(self, obj):
+        # The pickler never puts bytes and bytearray out-of-band, and
+        # memoryview is not picklable: wrap them in a PickleBuffer.
+        cls = type(obj)
+        if cls is bytes or cls is bytearray:
+            if len(obj) < self._threshold:
+                return None
+            layout = None
+        elif cls is memoryview:
+            if (obj.nbytes < self._threshold or not obj.c_contiguous
+                    or obj.format not in _MEMORYVIEW_FORMATS):
+                return None
+            layout = (obj.format, obj.shape)
+        else:
+            return None
+        buffer = pickle.PickleBuffer(obj)
+        self._own_buffers.add(id(buffer))
+        return (cls.__name__, buffer, layout)
+
+    def _buffer_callback(self, buffer):
+        with buffer.raw() as raw:
+            if raw.nbytes < self._threshold:
+                # Pickle small buffers of other objects in-band.
+                return True
+        self.buffers.append((buffer, id(buffer) in self._own_buffers))
+        return False
+
+
+class _SharedMemoryUnpickler(pickle.Unpickler):
+
+    def persistent_load(self, pid):
+        cls_name, buffer, layout = pid
+        if cls_name == 'bytes':
+            return bytes(buffer)
+        if cls_name == 'bytearray':
+            return bytearray(buffer)
+        if cls_name == 'memoryview':
+            view = memoryview(bytearray(buffer))
+            format, shape = layout
+            if format != 'B' or len(shape) != 1:
+                view = view.cast(format, shape)
+            return view
+        raise pickle.UnpicklingError("unsupported persistent id")
+
+
+def _dump_to_shared_memory(obj, threshold):
+    """Pickle obj with its large buffers in a new shared memory segment.
+
+    Return the pickle data, the SharedMemory (or None if obj has no large
+    buffer) and the layout of the buffers in the segment.
+    """
+    file = io.BytesIO()
+    pickler = _SharedMemoryPickler(file, threshold)
+    pickler.dump(obj)
+    data = file.getvalue()
+    if not pickler.buffers:
+        return data, None, ()
+
+    from multiprocessing.shared_memory import SharedMemory
+    layout = []
+    for buffer, own in pickler.buffers:
+        with buffer.raw() as raw:
+            layout.append((raw.nbytes, own))
+    shm = SharedMemory(create=True, size=sum(size for size, _ in layout))
+    try:
+        offset = 0
+        for buffer, own in pickler.buffers:
+            with buffer.raw() as raw:
+                shm.buf[offset:offset + raw.nbytes] = raw
+                offset += raw.nbytes
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    return data, shm, tuple(layout)
+
+
+def _load_from_shared_memory(data, name, layout, unlink):
+    """Unpickle the data of _dump_to_shared_memory().
+
+    The buffers are copied out of the segment, which is closed, and
+    unlinked if unlink is true.
+    """
+    if name is None:
+        return pickle.loads(data)
+
+    from multiprocessing.shared_memory import SharedMemory
+    shm = SharedMemory(name, track=unlink)
+    views = []
+    buffers = []
+    try:
+        offset = 0
+        for size, own in layout:
+            view = shm.buf[offset:offset + size]
+            views.append(view)
+            # The buffers of other objects may be kept by the objects
+            # rebuilt from them: copy them too.
+            buffers.append(view if own else bytearray(view))
+            offset += size
+        return _SharedMemoryUnpickler(io.BytesIO(data),
+                                      buffers=buffers).load()
+    finally:
+        buffers.clear()
+        for view in views:
+            view.release()
+        shm.close()
+        if unlink:
+            shm.unlink()
+
+
+def _rebuild_call_item(data, name, layout):
+    return _CallItem(*_load_from_shared_memory(data, name, layout, False))
+
+def _rebuild_result_item(data, name, layout):
+    return _ResultItem(*_load_from_shared_memory(data, name, layout, True))
+
+class _SharedMemoryCallItem(_CallItem):
+    """A _CallItem whose large buffers are sent through shared memory."""
+    def __init__(self, work_id, fn, args, kwargs, threshold, segments):
+        super().__init__(work_id, fn, args, kwargs)
+        self.threshold = threshold
+        # Maps work ids to their SharedMemory, owned by the executor.
+        self.segments = segments
+
+    def __reduce__(self):
+        data, shm, layout = _dump_to_shared_memory(
+            (self.work_id, self.fn, self.args, self.kwargs), self.threshold)
+        if shm is None:
+            return _rebuild_call_item, (data, None, ())
+        self.segments[self.work_id] = shm
+        return _rebuild_call_item, (data, shm.name, layout)
+
+class _SharedMemoryResultItem(_ResultItem):
+    """A _ResultItem whose large buffers are sent through shared memory."""
+    def __init__(self, work_id, exception=None, result=None, exit_pid=None,
+                 *, threshold):
+        super().__init__(work_id, exception, result, exit_pid)
+        self.threshold = threshold
+
+    def __reduce__(self):
+        data, shm, layout = _dump_to_shared_memory(
+            (self.work_id, self.exception, self.result, self.exit_pid),
+            self.threshold)
+        if shm is None:
+            return _rebuild_result_item, (data, None, ())
+        # The executor unlinks the segment once it has read it.
+        shm.close()
+        return _rebuild_result_item, (data, shm.name, layout)
+
+
 class _SafeQueue(Queue):
     """Safe Queue set exception to the future object linked to a job"""
     def __init__(self, max_size=0, *, ctx, pending_work_items, thread_wakeup):
@@ -204,18 +390,26 @@ def _process_chunk(fn, chunk):
 
 
 def _sendback_result(result_queue, work_id, result=None, exception=None,
-                     exit_pid=None):
+                     exit_pid=None, shared_memory_threshold=None):
     """Safely send back the given result or exception"""
     try:
-        result_queue.put(_ResultItem(work_id, result=result,
-                                     exception=exception, exit_pid=exit_pid))
+        if shared_memory_threshold is not None:
+            result_item = _SharedMemoryResultItem(
+                work_id, result=result, exception=exception,
+                exit_pid=exit_pid, threshold=shared_memory_threshold)
+        else:
+            result_item = _ResultItem(work_id, result=result,
+                                      exception=exception, exit_pid=exit_pid)
+        result_queue.put(result_item)
     except BaseException as e:
         exc = _ExceptionWithTraceback(e, e.__traceback__)
         result_queue.put(_ResultItem(work_id, exception=exc,
                                      exit_pid=exit_pid))
 
 
-def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None):
+def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None,
+                    shared_memory_threshold=None, preload_modules=(),
+                    start_semaphore=None):
     """Evaluates calls from call_queue and places the results in result_queue.
 
     This worker is run in a separate process.
@@ -227,7 +421,21 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
             to by the worker.
         initializer: A callable initializer, or None
         initargs: A tuple of args for the initializer
+        max_tasks: The maximum number of calls before exiting, or None
+        shared_memory_threshold: The minimum size of the buffers of the
+            results sent through shared memory, or None
+        preload_modules: The names of the modules to import before calling
+            the initializer
+        start_semaphore: A ctx.Semaphore acquired before evaluating calls,
+            or None
     """
+    try:
+        for name in preload_modules:
+            importlib.import_module(name)
+    except BaseException:
+        _base.LOGGER.critical('Exception in preloading modules:',
+                              exc_info=True)
+        return
     if initializer is not None:
         try:
             initializer(*initargs)
@@ -236,6 +444,9 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
             # The parent will notice that the process stopped and
             # mark the pool broken
             return
+    if start_semaphore is not None:
+        # This is a spare worker: wait until the executor needs it.
+        start_semaphore.acquire()
     num_tasks = 0
     exit_pid = None
     while True:
@@ -255,10 +466,12 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
         except BaseException as e:
             exc = _ExceptionWithTraceback(e, e.__traceback__)
             _sendback_result(result_queue, call_item.work_id, exception=exc,
-                             exit_pid=exit_pid)
+                             exit_pid=exit_pid,
+                             shared_memory_threshold=shared_memory_threshold)
         else:
             _sendback_result(result_queue, call_item.work_id, result=r,
-                             exit_pid=exit_pid)
+                             exit_pid=exit_pid,
+                             shared_memory_threshold=shared_memory_threshold)
             del r
 
         # Liberate the resource as soon as possible, to avoid holding onto
@@ -325,6 +538,15 @@ def weakref_cb(_,
         #     {5: <_WorkItem...>, 6: <_WorkItem...>, ...}
         self.pending_work_items = executor._pending_work_items
 
+        # The minimum size of the buffers sent through shared memory, or
+        # None, and a dict mapping work ids to the SharedMemory of their
+        # _CallItem.
+        self.shared_memory_threshold = executor._shared_memory_threshold
+        self.shared_memory_segments = executor._shared_memory_segments
+
+        # A ctx.Semaphore released to start a spare worker, or None.
+        self.spare_worker_semaphore = executor._spare_worker_semaphore
+
         super().__init__()
 
     def run(self):
@@ -393,11 +615,18 @@ def add_call_item_to_queue(self):
                 work_item = self.pending_work_items[work_id]
 
                 if work_item.future.set_running_or_notify_cancel():
-                    self.call_queue.put(_CallItem(work_id,
-                                                  work_item.fn,
-                                                  work_item.args,
-                                                  work_item.kwargs),
-                                        block=True)
+                    if self.shared_memory_threshold is not None:
+                        call_item = _SharedMemoryCallItem(
+                            work_id, work_item.fn, work_item.args,
+                            work_item.kwargs, self.shared_memory_threshold,
+                            self.shared_memory_segments)
+                    else:
+                        call_item = _CallItem(work_id,
+                                              work_item.fn,
+                                              work_item.args,
+                                              work_item.kwargs)
+                    self.call_queue.put(call_item, block=True)
+                    del call_item
                 else:
                     del self.pending_work_items[work_id]
                     continue
@@ -437,6 +666,7 @@ def process_result_item(self, result_item):
         # worker that exited gracefully or a _ResultItem
 
         # Received a _ResultItem so mark the future as completed.
+        self.release_shared_memory(result_item.work_id)
         work_item = self.pending_work_items.pop(result_item.work_id, None)
         # work_item can be None if another process terminated (see above)
         if work_item is not None:
@@ -445,6 +675,21 @@ def process_result_item(self, result_item):
             else:
                 work_item.future.set_result(result_item.result)
 
+    def release_shared_memory(self, work_id=None):
+        # Unlink the segment of the _CallItem of work_id, or of all the
+        # _CallItems if work_id is None.
+        if not self.shared_memory_segments:
+            return
+        if work_id is None:
+            segments = list(self.shared_memory_segments.values())
+            self.shared_memory_segments.clear()
+        else:
+            shm = self.shared_memory_segments.pop(work_id, None)
+            segments = [shm] if shm is not None else []
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
     def is_shutting_down(self):
         # Check whether we should start shutting down the executor.
         executor = self.executor_reference()
@@ -534,6 +779,10 @@ def flag_executor_shutting_down(self):
 
     def shutdown_workers(self):
         n_children_to_stop = self.get_n_children_alive()
+        if self.spare_worker_semaphore is not None:
+            # Start the spare workers so that they read their sentinel.
+            for _ in range(n_children_to_stop):
+                self.spare_worker_semaphore.release()
         n_sentinels_sent = 0
         # Send the right number of sentinels, to make sure all children are
         # properly terminated.
@@ -558,6 +807,8 @@ def _join_executor_internals(self, broken=False):
         # Release the queue's resources as soon as possible.
         self.call_queue.close()
         self.call_queue.join_thread()
+        # The feeder thread is joined: no _CallItem is pickled anymore.
+        self.release_shared_memory()
         self.thread_wakeup.close()
 
         # If .join() is not called on the created processes then
@@ -608,6 +859,15 @@ def _check_system_limits():
     raise NotImplementedError(_system_limited)
 
 
+def _add_forkserver_preload(modules):
+    # Add modules to the modules imported by the forkserver process when it
+    # starts, so that the processes forked from it do not import them again.
+    # This has no effect if the forkserver process is already running.
+    from multiprocessing import forkserver
+    preload = forkserver._forkserver._preload_modules
+    forkserver.set_forkserver_preload(list(dict.fromkeys([*preload, *modules])))
+
+
 def _chain_from_iterable_of_lists(iterable):
     """
     Specialized implementation of itertools.chain.from_iterable.
@@ -629,7 +889,9 @@ class BrokenProcessPool(_base.BrokenExecutor):
 
 class ProcessPoolExecutor(_base.Executor):
     def __init__(self, max_workers=None, mp_context=None,
-                 initializer=None, initargs=(), *, max_tasks_per_child=None):
+                 initializer=None, initargs=(), *, max_tasks_per_child=None,
+                 shared_memory_threshold=None, preload_modules=None,
+                 spare_workers=0):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
@@ -647,6 +909,21 @@ def __init__(self, max_workers=None, mp_context=None,
                 live as long as the executor. Requires a non-'fork' mp_context
                 start method. When given, we default to using 'spawn' if no
                 mp_context is supplied.
+            shared_memory_threshold: If not None, the bytes-like objects and
+                out-of-band pickle buffers of at least this number of bytes
+                in the arguments and results of the calls are sent to and
+                from the worker processes through shared memory rather than
+                through a pipe.
+            preload_modules: A sequence of names of modules imported by the
+                worker processes before the initializer is called. If the
+                'forkserver' start method is used, they are also added to the
+                modules preloaded by the forkserver process. When given, we
+                default to using 'forkserver' if no mp_context is supplied
+                and it is available.
+            spare_workers: The number of worker processes started in advance,
+                which wait after calling the initializer until they replace a
+                worker which exited or are needed for new calls. Requires a
+                non-'fork' mp_context start method.
         """
         _check_system_limits()
 
@@ -665,8 +942,30 @@ def __init__(self, max_workers=None, mp_context=None,
 
             self._max_workers = max_workers
 
+        if preload_modules is not None:
+            preload_modules = tuple(preload_modules)
+            if not all(type(name) is str for name in preload_modules):
+                raise TypeError("preload_modules must be a sequence of "
+                                "strings")
+        else:
+            preload_modules = ()
+        self._preload_modules = preload_modules
+
+        if not isinstance(spare_workers, int):
+            raise TypeError("spare_workers must be an integer")
+        elif spare_workers < 0:
+            raise ValueError("spare_workers must be >= 0")
+        elif (sys.platform == 'win32' and
+              self._max_workers + spare_workers > _MAX_WINDOWS_WORKERS):
+            raise ValueError(
+                f"max_workers + spare_workers must be <= "
+                f"{_MAX_WINDOWS_WORKERS}")
+
         if mp_context is None:
-            if max_tasks_per_child is not None:
+            if (preload_modules and
+                    "forkserver" in mp.get_all_start_methods()):
+                mp_context = mp.get_context("forkserver")
+            elif max_tasks_per_child is not None:
                 mp_context = mp.get_context("spawn")
             else:
                 mp_context = mp.get_context()
@@ -693,6 +992,35 @@ def __init__(self, max_workers=None, mp_context=None,
                                  " supply a different mp_context.")
         self._max_tasks_per_child = max_tasks_per_child
 
+        if spare_workers and not self._safe_to_dynamically_spawn_children:
+            # https://github.com/python/cpython/issues/90622
+            raise ValueError("spare_workers is incompatible with the 'fork'"
+                             " multiprocessing start method; supply a"
+                             " different mp_context.")
+        self._spare_workers = spare_workers
+        # The number of spare workers started and waiting for
+        # _spare_worker_semaphore to be released.
+        self._waiting_spare_workers = 0
+        if spare_workers:
+            self._spare_worker_semaphore = self._mp_context.Semaphore(0)
+        else:
+            self._spare_worker_semaphore = None
+
+        if (preload_modules and
+                self._mp_context.get_start_method(allow_none=False)
+                == "forkserver"):
+            _add_forkserver_preload(preload_modules)
+
+        if shared_memory_threshold is not None:
+            if not isinstance(shared_memory_threshold, int):
+                raise TypeError("shared_memory_threshold must be an integer")
+            elif shared_memory_threshold <= 0:
+                raise ValueError("shared_memory_threshold must be >= 1")
+            # Fail early if shared memory is not supported.
+            import multiprocessing.shared_memory
+        self._shared_memory_threshold = shared_memory_threshold
+        self._shared_memory_segments = {}
+
         # Management thread
         self._executor_manager_thread = None
 
@@ -751,15 +1079,24 @@ def _adjust_process_count(self):
         if self._idle_worker_semaphore.acquire(blocking=False):
             return
 
-        process_count = len(self._processes)
+        process_count = len(self._processes) - self._waiting_spare_workers
         if process_count < self._max_workers:
-            # Assertion disabled as this codepath is also used to replace a
-            # worker that unexpectedly dies, even when using the 'fork' start
-            # method. That means there is still a potential deadlock bug. If a
-            # 'fork' mp_context worker dies, we'll be forking a new one when
-            # we know a thread is running (self._executor_manager_thread).
-            #assert self._safe_to_dynamically_spawn_children or not self._executor_manager_thread, 'https://github.com/python/cpython/issues/90622'
-            self._spawn_process()
+            if self._waiting_spare_workers:
+                # Start a spare worker, which is ready to evaluate calls.
+                self._waiting_spare_workers -= 1
+                self._spare_worker_semaphore.release()
+            else:
+                # Assertion disabled as this codepath is also used to replace
+                # a worker that unexpectedly dies, even when using the 'fork'
+                # start method. That means there is still a potential deadlock
+                # bug. If a 'fork' mp_context worker dies, we'll be forking a
+                # new one when we know a thread is running
+                # (self._executor_manager_thread).
+                #assert self._safe_to_dynamically_spawn_children or not self._executor_manager_thread, 'https://github.com/python/cpython/issues/90622'
+                self._spawn_process()
+            while self._waiting_spare_workers < self._spare_workers:
+                self._spawn_process(spare=True)
+                self._waiting_spare_workers += 1
 
     def _launch_processes(self):
         # https://github.com/python/cpython/issues/90622
@@ -769,14 +1106,18 @@ def _launch_processes(self):
         for _ in range(len(self._processes), self._max_workers):
             self._spawn_process()
 
-    def _spawn_process(self):
+    def _spawn_process(self, spare=False):
         p = self._mp_context.Process(
             target=_process_worker,
             args=(self._call_queue,
                   self._result_queue,
                   self._initializer,
                   self._initargs,
-                  self._max_tasks_per_child))
+                  self._max_tasks_per_child,
+                  self._shared_memory_threshold if _SHARED_MEMORY_RESULTS
+                  else None,
+                  self._preload_modules,
+                  self._spare_worker_semaphore if spare else None))
         p.start()
         self._processes[p.pid] = p
 
@@ -805,7 +1146,8 @@ def submit(self, fn, /, *args, **kwargs):
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def map(self, fn, *iterables, timeout=None, chunksize=1,
+            buffersize=None, ordered=True):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -816,6 +1158,14 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
             chunksize: If greater than one, the iterables will be chopped into
                 chunks of size chunksize and submitted to the process pool.
                 If set to one, the items in the list will be sent one at a time.
+            buffersize: The number of submitted chunks whose results have not
+                yet been yielded. If the buffer is full, iteration over the
+                iterables pauses until a result is yielded from the buffer.
+                If None, all input elements are eagerly collected, and a task
+                is submitted for each chunk.
+            ordered: If True, the results are yielded in the order of the
+                input elements, else the results of a chunk are yielded as
+                soon as the chunk is done.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -831,7 +1181,8 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
 
         results = super().map(partial(_process_chunk, fn),
                               itertools.batched(zip(*iterables), chunksize),
-                              timeout=timeout)
+                              timeout=timeout, buffersize=buffersize,
+                              ordered=ordered)
         return _chain_from_iterable_of_lists(results)
 
     def shutdown(self, wait=True, *, cancel_futures=False):
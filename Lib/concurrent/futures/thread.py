@@ -6,6 +6,7 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 from concurrent.futures import _base
+import collections
 import itertools
 import queue
 import threading
@@ -141,6 +142,167 @@ def _worker(executor_reference, ctx, work_queue):
         ctx.finalize()
 
 
+# Put in the shared queue of a _WorkStealingQueue to wake up an idle worker
+# when a work item is appended to the deque of another worker.
+_WAKEUP = object()
+
+
+class _WorkStealingQueue:
+    """The work queue of a ThreadPoolExecutor using work stealing.
+
+    Each worker thread has a deque.  The work items submitted by a worker
+    thread are appended to its deque, and workers take the most recent work
+    item of their deque first.  When their deque is empty, workers take the
+    work items submitted by other threads from the shared queue, then steal
+    the oldest work items of the deques of the other workers.  Idle workers
+    wait on the shared queue.
+    """
+
+    def __init__(self):
+        self._shared = queue.SimpleQueue()
+        self._deques = []
+        # Map the identifiers of the worker threads to their deque.
+        self._thread_deques = {}
+        self._lock = threading.Lock()
+        # Number of workers looking for work before waiting on the shared
+        # queue, and number of _WAKEUP sentinels in the shared queue.
+        self._idle = 0
+        self._wakeups = 0
+        self._closed = False
+
+    def add_worker(self):
+        """Return the queue of a new worker thread."""
+        self._deques.append(collections.deque())
+        return _WorkerQueue(self, len(self._deques) - 1)
+
+    def register_thread(self, thread_id, worker_queue):
+        # Work items submitted by the thread go to the deque of worker_queue.
+        self._thread_deques[thread_id] = self._deques[worker_queue.index]
+
+    def in_worker_thread(self):
+        return threading.get_ident() in self._thread_deques
+
+    def close(self):
+        """Make put_local() fail, to be called on shutdown."""
+        with self._lock:
+            self._closed = True
+
+    def put(self, item):
+        self._shared.put(item)
+
+    def put_local(self, item):
+        """Append item to the deque of the current worker thread.
+
+        Return False if the current thread is not a worker thread or if the
+        queue is closed.
+        """
+        local = self._thread_deques.get(threading.get_ident())
+        if local is None:
+            return False
+        # Appending and checking for idle workers under the lock ensures
+        # that a worker going idle either sees the work item or is woken up.
+        with self._lock:
+            if self._closed:
+                return False
+            local.append(item)
+            wakeup = self._idle > self._wakeups
+            if wakeup:
+                self._wakeups += 1
+        if wakeup:
+            self._shared.put(_WAKEUP)
+        return True
+
+    def get_nowait(self, index=None):
+        """Remove and return an item from the shared queue, else steal one.
+
+        index is the index of the deque of the calling worker, or None.
+        Raise queue.Empty if there is no item.
+        """
+        while True:
+            try:
+                item = self._shared.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return self._check_exit(index)
+            if item is not _WAKEUP:
+                return item
+            with self._lock:
+                self._wakeups -= 1
+        return self._steal(index)
+
+    def get(self, index):
+        """Remove and return an item, waiting for one if necessary."""
+        with self._lock:
+            self._idle += 1
+        try:
+            while True:
+                # Look for work items appended to the deques before the
+                # worker was counted as idle.
+                try:
+                    return self.get_nowait(index)
+                except queue.Empty:
+                    pass
+                item = self._shared.get()
+                if item is None:
+                    return self._check_exit(index)
+                if item is not _WAKEUP:
+                    return item
+                with self._lock:
+                    self._wakeups -= 1
+        finally:
+            with self._lock:
+                self._idle -= 1
+
+    def _steal(self, index):
+        deques = self._deques
+        n = len(deques)
+        start = 0 if index is None else index + 1
+        for i in range(start, start + n):
+            victim = deques[i % n]
+            if victim:
+                try:
+                    return victim.popleft()
+                except IndexError:
+                    pass
+        raise queue.Empty
+
+    def _check_exit(self, index):
+        # The None sentinel was taken from the shared queue.  A worker may
+        # only exit once the deques are empty: the owner of a deque could be
+        # waiting for the futures of its work items.
+        try:
+            stolen = self._steal(index)
+        except queue.Empty:
+            return None
+        self._shared.put(None)
+        return stolen
+
+
+class _WorkerQueue:
+    """The view of a _WorkStealingQueue used by one worker thread."""
+
+    def __init__(self, work_queue, index):
+        self._work_queue = work_queue
+        self._deque = work_queue._deques[index]
+        self.index = index
+
+    def put(self, item):
+        self._work_queue.put(item)
+
+    def get_nowait(self):
+        if self._deque:
+            try:
+                return self._deque.pop()
+            except IndexError:
+                # Stolen in the meantime.
+                pass
+        return self._work_queue.get_nowait(self.index)
+
+    def get(self, block=True):
+        return self._work_queue.get(self.index)
+
+
 class BrokenThreadPool(_base.BrokenExecutor):
     """
     Raised when a worker thread in a ThreadPoolExecutor failed initializing.
@@ -159,7 +321,8 @@ def prepare_context(cls, initializer, initargs):
         return WorkerContext.prepare(initializer, initargs)
 
     def __init__(self, max_workers=None, thread_name_prefix='',
-                 initializer=None, initargs=(), **ctxkwargs):
+                 initializer=None, initargs=(), *, work_stealing=False,
+                 **ctxkwargs):
         """Initializes a new ThreadPoolExecutor instance.
 
         Args:
@@ -168,6 +331,10 @@ def __init__(self, max_workers=None, thread_name_prefix='',
             thread_name_prefix: An optional name prefix to give our threads.
             initializer: A callable used to initialize worker threads.
             initargs: A tuple of arguments to pass to the initializer.
+            work_stealing: If true, the calls submitted by a worker thread
+                are queued in a deque local to that thread, which the idle
+                worker threads steal calls from, instead of in the queue
+                shared by all the worker threads.
             ctxkwargs: Additional arguments to cls.prepare_context().
         """
         if max_workers is None:
@@ -187,7 +354,11 @@ def __init__(self, max_workers=None, thread_name_prefix='',
          ) = type(self).prepare_context(initializer, initargs, **ctxkwargs)
 
         self._max_workers = max_workers
-        self._work_queue = queue.SimpleQueue()
+        self._work_stealing = bool(work_stealing)
+        if self._work_stealing:
+            self._work_queue = _WorkStealingQueue()
+        else:
+            self._work_queue = queue.SimpleQueue()
         self._idle_semaphore = threading.Semaphore(0)
         self._threads = set()
         self._broken = False
@@ -197,6 +368,22 @@ def __init__(self, max_workers=None, thread_name_prefix='',
                                     ("ThreadPoolExecutor-%d" % self._counter()))
 
     def submit(self, fn, /, *args, **kwargs):
+        if (self._work_stealing and len(self._threads) >= self._max_workers
+                and self._work_queue.in_worker_thread()):
+            # Fast path for the calls submitted by a worker thread once all
+            # the worker threads are started: the executor locks, shared by
+            # all the threads, are not needed.
+            if self._broken:
+                raise self.BROKEN(self._broken)
+            if _shutdown:
+                raise RuntimeError('cannot schedule new futures after '
+                                   'interpreter shutdown')
+            f = _base.Future()
+            task = self._resolve_work_item_task(fn, args, kwargs)
+            if not self._work_queue.put_local(_WorkItem(f, task)):
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            return f
+
         with self._shutdown_lock, _global_shutdown_lock:
             if self._broken:
                 raise self.BROKEN(self._broken)
@@ -211,7 +398,8 @@ def submit(self, fn, /, *args, **kwargs):
             task = self._resolve_work_item_task(fn, args, kwargs)
             w = _WorkItem(f, task)
 
-            self._work_queue.put(w)
+            if not (self._work_stealing and self._work_queue.put_local(w)):
+                self._work_queue.put(w)
             self._adjust_thread_count()
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
@@ -230,11 +418,17 @@ def weakref_cb(_, q=self._work_queue):
         if num_threads < self._max_workers:
             thread_name = '%s_%d' % (self._thread_name_prefix or self,
                                      num_threads)
+            if self._work_stealing:
+                work_queue = self._work_queue.add_worker()
+            else:
+                work_queue = self._work_queue
             t = threading.Thread(name=thread_name, target=_worker,
                                  args=(weakref.ref(self, weakref_cb),
                                        self._create_worker_context(),
-                                       self._work_queue))
+                                       work_queue))
             t.start()
+            if self._work_stealing:
+                self._work_queue.register_thread(t.ident, work_queue)
             self._threads.add(t)
             _threads_queues[t] = self._work_queue
 
@@ -254,6 +448,8 @@ def _initializer_failed(self):
     def shutdown(self, wait=True, *, cancel_futures=False):
         with self._shutdown_lock:
             self._shutdown = True
+            if self._work_stealing:
+                self._work_queue.close()
             if cancel_futures:
                 # Drain all work items from the queue, and then cancel their
                 # associated futures.
@@ -8,13 +8,15 @@
 
 The function translate(PATTERN) returns a regular expression
 corresponding to PATTERN.  (It does not compile it.)
+
+PatternSet(PATTERNS) matches a filename against many patterns at once.
 """
 import os
 import posixpath
 import re
 import functools
 
-__all__ = ["filter", "fnmatch", "fnmatchcase", "translate"]
+__all__ = ["filter", "fnmatch", "fnmatchcase", "translate", "PatternSet"]
 
 def fnmatch(name, pat):
     """Test whether FILENAME matches PATTERN.
@@ -61,6 +63,99 @@ def filter(names, pat):
                 result.append(name)
     return result
 
+class PatternSet:
+    """A set of shell patterns which are matched at once.
+
+    PatternSet(PATTERNS).match(FILENAME) is true if FILENAME matches any
+    of PATTERNS.  The patterns are compiled into one regular expression,
+    and patterns without wildcards, or with a single '*' at the start or at
+    the end, are matched without regular expressions, so the cost of
+    matching grows slowly with the number of patterns.
+
+    If case_sensitive is None (the default), the filename and the patterns
+    are case-normalized if the operating system requires it, as in
+    fnmatch().  If it is true, they are compared as is, as in fnmatchcase().
+    If it is false, they are compared case-insensitively.
+    """
+
+    def __init__(self, patterns, *, case_sensitive=None):
+        self.patterns = tuple(patterns)
+        self.case_sensitive = case_sensitive
+        if case_sensitive is None:
+            normcase = None if os.path is posixpath else os.path.normcase
+        elif case_sensitive:
+            normcase = None
+        else:
+            normcase = _lower
+        self._normcase = normcase
+        (self._literals, self._prefixes, self._suffixes,
+         self._regex) = _compile_pattern_set(self.patterns, normcase)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self.patterns)!r})'
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def match(self, name):
+        """Test whether FILENAME matches any of the patterns."""
+        if self._normcase is not None:
+            name = self._normcase(name)
+        return (name in self._literals or
+                (self._prefixes and name.startswith(self._prefixes)) or
+                (self._suffixes and name.endswith(self._suffixes)) or
+                (self._regex is not None and self._regex(name) is not None))
+
+    def filter(self, names):
+        """Construct a list from those elements of the iterable NAMES that
+        match any of the patterns."""
+        match = self.match
+        return [name for name in names if match(name)]
+
+def _lower(s):
+    return s.lower()
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern_set(patterns, normcase):
+    if patterns and not all(isinstance(pat, type(patterns[0]))
+                            for pat in patterns):
+        raise TypeError("cannot mix bytes and str patterns")
+    literals = set()
+    prefixes = []
+    suffixes = []
+    rest = []
+    for pat in patterns:
+        if normcase is not None:
+            pat = normcase(pat)
+        if isinstance(pat, bytes):
+            pat_str = str(pat, 'ISO-8859-1')
+        else:
+            pat_str = pat
+        core = pat_str.strip('*')
+        if '?' in pat_str or '[' in pat_str or '*' in core:
+            rest.append(pat_str)
+            continue
+        lead = len(pat_str) - len(pat_str.lstrip('*'))
+        trail = len(pat_str) - len(pat_str.rstrip('*'))
+        fixed = pat[lead:len(pat) - trail]
+        if not lead and not trail:
+            literals.add(pat)
+        elif not fixed or not lead:
+            # Consecutive stars are the same as one, and '*' matches all.
+            prefixes.append(fixed)
+        elif not trail:
+            suffixes.append(fixed)
+        else:
+            rest.append(pat_str)
+    regex = None
+    if rest:
+        res = '|'.join(map(translate, rest))
+        if isinstance(patterns[0], bytes):
+            res = bytes(res, 'ISO-8859-1')
+        regex = re.compile(res).match
+    return frozenset(literals), tuple(prefixes), tuple(suffixes), regex
+
+
 def fnmatchcase(name, pat):
     """Test whether FILENAME matches PATTERN, including case.
 
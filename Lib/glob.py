@@ -11,7 +11,7 @@
 import sys
 
 
-__all__ = ["glob", "iglob", "escape", "translate"]
+__all__ = ["glob", "iglob", "globmany", "iglobmany", "escape", "translate"]
 
 def glob(pathname, *, root_dir=None, dir_fd=None, recursive=False,
         include_hidden=False):
@@ -60,6 +60,45 @@ def iglob(pathname, *, root_dir=None, dir_fd=None, recursive=False,
             pass
     return it
 
+def globmany(patterns, *, exclude=(), root_dir=None, recursive=False,
+             include_hidden=False):
+    """Return a dict mapping each of several pathname patterns to the list
+    of paths matching it.
+
+    All patterns are matched in a single walk of the directory tree, which
+    only descends into directories that some pattern can still match.
+    Patterns must be relative, and paths are returned relative to
+    `root_dir` (or the current directory).  A path matching any pattern in
+    `exclude` is not returned, and if it is a directory, it is not walked
+    into.
+
+    `recursive` and `include_hidden` have the same meaning as for glob().
+    """
+    result = {pattern: [] for pattern in patterns}
+    for pattern, path in iglobmany(result, exclude=exclude, root_dir=root_dir,
+                                   recursive=recursive,
+                                   include_hidden=include_hidden):
+        result[pattern].append(path)
+    return result
+
+def iglobmany(patterns, *, exclude=(), root_dir=None, recursive=False,
+              include_hidden=False):
+    """Return an iterator which yields (pattern, path) pairs for the paths
+    matching several pathname patterns.
+
+    The arguments are the same as for globmany().  A path matching several
+    patterns is yielded once for each of them.
+    """
+    patterns = list(dict.fromkeys(patterns))
+    exclude = list(exclude)
+    for pattern in patterns:
+        sys.audit("glob.glob", pattern, recursive)
+        sys.audit("glob.glob/2", pattern, recursive, root_dir, None)
+    if root_dir is not None:
+        root_dir = os.fspath(root_dir)
+    globber = _MultiGlobber(patterns, exclude, recursive, include_hidden)
+    return globber.walk(root_dir)
+
 def _iglob(pathname, root_dir, dir_fd, recursive, dironly,
            include_hidden=False):
     dirname, basename = os.path.split(pathname)
@@ -544,3 +583,223 @@ def add_slash(pathname):
             if not pathname or pathname[-1] == '/':
                 return pathname
             return f'{pathname}/'
+
+
+class _MultiGlobber:
+    """Matches several glob patterns against a directory tree in one walk.
+
+    The patterns are compiled to a nondeterministic automaton over path
+    segments: a state is a position in a pattern, and the states which are
+    active for a directory determine which of its entries are matched and
+    which of its subdirectories are walked.
+    """
+
+    def __init__(self, patterns, exclude, recursive, include_hidden):
+        self.tags = patterns + [None] * len(exclude)
+        self.include_hidden = include_hidden
+        self.normcase = os.path.normcase if os.name == 'nt' else None
+        self.curdir = os.curdir
+        self.sep = os.path.sep
+        if patterns and isinstance(patterns[0], bytes):
+            self.curdir = os.fsencode(os.curdir)
+            self.sep = os.fsencode(os.path.sep)
+        # Per state: the kind of segment, the segment, the index of the
+        # pattern, and whether only directories are accepted in a final
+        # state.  A final state has no segment.
+        self.kinds = []
+        self.segments = []
+        self.owners = []
+        self.dir_only = []
+        # The state to continue with when a '**' wildcard matches nothing.
+        self.skips = {}
+        start = []
+        for index, pattern in enumerate(patterns + exclude):
+            start.append(len(self.kinds))
+            self._add_pattern(index, pattern, recursive)
+        # The states reachable from each state without consuming a segment.
+        self.closures = [None] * len(self.kinds)
+        for state in reversed(range(len(self.kinds))):
+            if self.kinds[state] is _RECURSIVE:
+                self.closures[state] = {state} | self.closures[self.skips[state]]
+            else:
+                self.closures[state] = {state}
+        self.start = frozenset().union(*(self.closures[s] for s in start))
+        self._nodes = {}
+        self._results = {}
+
+    def _add_pattern(self, index, pattern, recursive):
+        pattern = os.fspath(pattern)
+        sep = os.path.sep
+        dot = '.'
+        if isinstance(pattern, bytes):
+            sep = os.fsencode(sep)
+            dot = b'.'
+            if os.path.altsep:
+                pattern = pattern.replace(os.fsencode(os.path.altsep), sep)
+        elif os.path.altsep:
+            pattern = pattern.replace(os.path.altsep, sep)
+        if any(os.path.splitroot(pattern)[:2]):
+            raise ValueError(f"pattern must be relative: {pattern!r}")
+        parts = pattern.split(sep)
+        dir_only = len(parts) > 1 and not parts[-1]
+        kind = None
+        for part in parts:
+            if not part or part == dot:
+                continue
+            if part == dot * 2:
+                raise ValueError(f"pattern must not contain '..': {pattern!r}")
+            if recursive and _isrecursive(part):
+                kind = _RECURSIVE
+            elif self.normcase is None and not has_magic(part):
+                kind = _LITERAL
+            else:
+                kind = _WILDCARD
+                if self.normcase is not None:
+                    part = self.normcase(part)
+            if kind is _RECURSIVE:
+                self.skips[len(self.kinds)] = len(self.kinds) + 1
+            self._add_state(kind, part, index, False)
+        self._add_state(None, None, index, dir_only)
+        if kind is _RECURSIVE:
+            # Like glob(), a trailing '**' matches the directory itself
+            # (with a trailing separator) in addition to its contents.
+            self.skips[len(self.kinds) - 2] = len(self.kinds)
+            self._add_state(None, None, index, True)
+
+    def _add_state(self, kind, segment, index, dir_only):
+        self.kinds.append(kind)
+        self.segments.append(segment)
+        self.owners.append(index)
+        self.dir_only.append(dir_only)
+
+    def _node(self, states):
+        """Return the transitions out of a set of active states, as a dict
+        of literal names and a list of wildcard matchers, each with the
+        states they lead to, and the states reached by '**' wildcards.
+        """
+        node = self._nodes.get(states)
+        if node is not None:
+            return node
+        literals = {}
+        wildcards = {}
+        recursive = set()
+        for state in states:
+            kind = self.kinds[state]
+            if kind is None:
+                continue
+            if kind is _RECURSIVE:
+                recursive.add(state)
+                recursive.update(self.closures[state + 1])
+                continue
+            target = literals if kind is _LITERAL else wildcards
+            target.setdefault(self.segments[state], set()).update(
+                self.closures[state + 1])
+        literals = {name: frozenset(targets)
+                    for name, targets in literals.items()}
+        # Like glob(), wildcards only match hidden names if they start
+        # with a dot themselves.
+        wildcards = [(fnmatch._compile_pattern(segment),
+                      self.include_hidden or _ishidden(segment),
+                      frozenset(targets))
+                     for segment, targets in wildcards.items()]
+        recursive = frozenset(recursive)
+        recursive_hidden = recursive if self.include_hidden else frozenset()
+        node = (literals, wildcards, recursive, recursive_hidden)
+        self._nodes[states] = node
+        return node
+
+    def _result(self, states):
+        """Return what a set of states reached by a directory entry means:
+        the patterns it matches, the patterns it matches if it is a
+        directory, whether it is excluded (always or if it is a directory),
+        and the states to walk its contents with if it is a directory.
+        """
+        result = self._results.get(states)
+        if result is not None:
+            return result
+        matches = []
+        dir_matches = []
+        excluded = dir_excluded = False
+        child = set()
+        for state in sorted(states):
+            if self.kinds[state] is not None:
+                child.add(state)
+                continue
+            tag = self.tags[self.owners[state]]
+            if tag is None:
+                if self.dir_only[state]:
+                    dir_excluded = True
+                else:
+                    excluded = True
+            elif self.dir_only[state]:
+                dir_matches.append(tag)
+            else:
+                matches.append(tag)
+        result = (matches, dir_matches, excluded, dir_excluded,
+                  frozenset(child))
+        self._results[states] = result
+        return result
+
+    def walk(self, root_dir):
+        normcase = self.normcase
+        stack = [(None, self.start)]
+        while stack:
+            dirname, states = stack.pop()
+            literals, wildcards, recursive, recursive_hidden = \
+                self._node(states)
+            path = _join(root_dir, dirname)
+            try:
+                # We must close the scandir() object before proceeding to
+                # avoid exhausting file descriptors when globbing deep trees.
+                with os.scandir(path or self.curdir) as scandir_it:
+                    entries = list(scandir_it)
+            except OSError:
+                continue
+            subdirs = []
+            for entry in entries:
+                name = entry.name
+                key = name if normcase is None else normcase(name)
+                hidden = _ishidden(name)
+                targets = []
+                found = literals.get(key)
+                if found is not None:
+                    targets.append(found)
+                for match, hidden_ok, found in wildcards:
+                    if (hidden_ok or not hidden) and match(key):
+                        targets.append(found)
+                if recursive:
+                    targets.append(recursive_hidden if hidden else recursive)
+                if not targets:
+                    continue
+                next_states = targets[0]
+                if len(targets) > 1:
+                    next_states = next_states.union(*targets[1:])
+                if not next_states:
+                    continue
+                matches, dir_matches, excluded, dir_excluded, child = \
+                    self._result(next_states)
+                if excluded:
+                    continue
+                is_dir = False
+                if dir_matches or dir_excluded or child:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        pass
+                    if is_dir and dir_excluded:
+                        continue
+                entry_path = _join(dirname, name)
+                for pattern in matches:
+                    yield pattern, entry_path
+                if is_dir:
+                    for pattern in dir_matches:
+                        # Like glob(), keep the trailing separator.
+                        yield pattern, entry_path + self.sep
+                    if child:
+                        subdirs.append((entry_path, child))
+            stack.extend(reversed(subdirs))
+
+
+_LITERAL = 'literal'
+_WILDCARD = 'wildcard'
+_RECURSIVE = 'recursive'
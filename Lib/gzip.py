@@ -6,12 +6,14 @@
 # based on Andrew Kuchling's minigzip.py distributed with the zlib module
 
 import struct, sys, time, os
+import bisect
 import zlib
 import builtins
 import io
 import _compression
 
-__all__ = ["BadGzipFile", "GzipFile", "open", "compress", "decompress"]
+__all__ = ["BadGzipFile", "GzipFile", "GzipIndex", "open", "compress",
+           "decompress"]
 
 FTEXT, FHCRC, FEXTRA, FNAME, FCOMMENT = 1, 2, 4, 8, 16
 
@@ -24,6 +26,12 @@
 
 READ_BUFFER_SIZE = 128 * 1024
 _WRITE_BUFFER_SIZE = 4 * io.DEFAULT_BUFFER_SIZE
+_PARALLEL_BLOCK_SIZE = 128 * 1024
+# Size of the dictionary passed from a block to the next one
+_DICT_SIZE = 32 * 1024
+# Default distance between index access points in the uncompressed data
+_INDEX_SPAN = 1024 * 1024
+_INDEX_MAGIC = b'PYGZIDX1'
 
 
 def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
@@ -137,6 +145,98 @@ def writable(self):
         return True
 
 
+def _compress_block(data, compresslevel, zdict):
+    if zdict:
+        compress = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                    -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, 0,
+                                    zdict)
+    else:
+        compress = zlib.compressobj(compresslevel, zlib.DEFLATED,
+                                    -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, 0)
+    # A sync flush ends the block on a byte boundary, so that the compressed
+    # blocks can be concatenated into a single deflate stream.
+    return compress.compress(data) + compress.flush(zlib.Z_SYNC_FLUSH)
+
+
+class _ParallelCompressor:
+    """Raw deflate compressor which compresses blocks in a thread pool.
+
+    The input is split into blocks of a fixed size which are compressed
+    independently, using the end of the previous block as dictionary, like
+    pigz does.  The output is the same whatever the number of threads and
+    their scheduling.  It supports the compress() and flush() methods of
+    zlib compression objects.
+    """
+
+    def __init__(self, compresslevel, workers, block_size=_PARALLEL_BLOCK_SIZE):
+        from concurrent.futures import ThreadPoolExecutor
+        self._compresslevel = compresslevel
+        self._workers = workers
+        self._block_size = block_size
+        self._executor = ThreadPoolExecutor(workers)
+        self._buffer = bytearray()
+        self._zdict = b''
+        self._pending = []
+
+    def _submit(self, block):
+        self._pending.append(self._executor.submit(
+            _compress_block, block, self._compresslevel, self._zdict))
+        self._zdict = block[-_DICT_SIZE:]
+
+    def _collect(self, limit):
+        # Return the compressed blocks which are done, in order, waiting
+        # for them while more than limit blocks are pending.
+        pending = self._pending
+        n = 0
+        while n < len(pending) and (len(pending) - n > limit or
+                                    pending[n].done()):
+            n += 1
+        output = b''.join([future.result() for future in pending[:n]])
+        del pending[:n]
+        return output
+
+    def compress(self, data):
+        if self._executor is None:
+            raise ValueError("compressor was flushed with Z_FINISH")
+        self._buffer += data
+        block_size = self._block_size
+        if len(self._buffer) >= block_size:
+            buffer = self._buffer
+            end = len(buffer) - len(buffer) % block_size
+            for start in range(0, end, block_size):
+                self._submit(bytes(buffer[start:start + block_size]))
+            del buffer[:end]
+        return self._collect(2 * self._workers)
+
+    def flush(self, mode=zlib.Z_FINISH):
+        if self._executor is None:
+            raise ValueError("compressor was flushed with Z_FINISH")
+        if mode == zlib.Z_NO_FLUSH:
+            return b''
+        if self._buffer:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+        try:
+            output = self._collect(0)
+        except:
+            self.close()
+            raise
+        if mode == zlib.Z_FULL_FLUSH:
+            # Following blocks must not refer to previous data
+            self._zdict = b''
+        elif mode == zlib.Z_FINISH:
+            # An empty final block terminates the deflate stream
+            output += b'\003\000'
+            self.close()
+        return output
+
+    def close(self):
+        executor = self._executor
+        if executor is not None:
+            self._executor = None
+            executor.shutdown(cancel_futures=True)
+
+
 class GzipFile(_compression.BaseStream):
     """The GzipFile class simulates most of the methods of a file object with
     the exception of the truncate() method.
@@ -151,7 +251,8 @@ class GzipFile(_compression.BaseStream):
     myfileobj = None
 
     def __init__(self, filename=None, mode=None,
-                 compresslevel=_COMPRESS_LEVEL_BEST, fileobj=None, mtime=None):
+                 compresslevel=_COMPRESS_LEVEL_BEST, fileobj=None, mtime=None,
+                 *, workers=None, index=None):
         """Constructor for the GzipFile class.
 
         At least one of fileobj and filename must be given a
@@ -184,10 +285,23 @@ def __init__(self, filename=None, mode=None,
         If mtime is omitted or None, the current time is used. Use mtime = 0
         to generate a compressed stream that does not depend on creation time.
 
+        If workers is given when writing, the data is split into blocks
+        which are compressed in parallel by that number of threads.  The
+        result is a regular gzip file, slightly larger than with the default
+        single-threaded compression.  When reading, the members of a file
+        made of several concatenated gzip members are decompressed in
+        parallel by that number of threads.
+
+        The optional index argument is a GzipIndex built for the file.  When
+        reading, it makes seek() start decompressing from the closest access
+        point instead of from the beginning of the file.
+
         """
 
         if mode and ('t' in mode or 'U' in mode):
             raise ValueError("Invalid mode: {!r}".format(mode))
+        if workers is not None and workers <= 0:
+            raise ValueError("workers must be greater than 0")
         if mode and 'b' not in mode:
             mode += 'b'
         if fileobj is None:
@@ -204,12 +318,25 @@ def __init__(self, filename=None, mode=None,
 
 
         if mode.startswith('r'):
+            if index is not None and workers is not None:
+                raise ValueError("index and workers cannot be used together")
+            if index is not None:
+                pos = fileobj.tell()
+                size = fileobj.seek(0, io.SEEK_END)
+                fileobj.seek(pos)
+                if size != index.compressed_size:
+                    raise ValueError("index does not match the file")
             self.mode = READ
-            raw = _GzipReader(fileobj)
+            if workers is not None:
+                raw = _ParallelGzipReader(fileobj, workers)
+            else:
+                raw = _GzipReader(fileobj, index)
             self._buffer = io.BufferedReader(raw)
             self.name = filename
 
         elif mode.startswith(('w', 'a', 'x')):
+            if index is not None:
+                raise ValueError("index is only supported in read mode")
             if origmode is None:
                 import warnings
                 warnings.warn(
@@ -219,11 +346,14 @@ def __init__(self, filename=None, mode=None,
                     FutureWarning, 2)
             self.mode = WRITE
             self._init_write(filename)
-            self.compress = zlib.compressobj(compresslevel,
-                                             zlib.DEFLATED,
-                                             -zlib.MAX_WBITS,
-                                             zlib.DEF_MEM_LEVEL,
-                                             0)
+            if workers is not None:
+                self.compress = _ParallelCompressor(compresslevel, workers)
+            else:
+                self.compress = zlib.compressobj(compresslevel,
+                                                 zlib.DEFLATED,
+                                                 -zlib.MAX_WBITS,
+                                                 zlib.DEF_MEM_LEVEL,
+                                                 0)
             self._write_mtime = mtime
             self._buffer_size = _WRITE_BUFFER_SIZE
             self._buffer = io.BufferedWriter(_WriteBufferStream(self),
@@ -483,16 +613,22 @@ def _read_gzip_header(fp):
 
 
 class _GzipReader(_compression.DecompressReader):
-    def __init__(self, fp):
+    def __init__(self, fp, index=None):
         super().__init__(_PaddedFile(fp), zlib._ZlibDecompressor,
                          wbits=-zlib.MAX_WBITS)
         # Set flag indicating start of a new member
         self._new_member = True
         self._last_mtime = None
+        self._index = index
+        if index is not None:
+            self._size = index.size
 
     def _init_read(self):
         self._crc = zlib.crc32(b"")
         self._stream_size = 0  # Decompressed size of unconcatenated stream
+        # False if the member was entered in the middle, so that its CRC
+        # and size cannot be checked
+        self._verify = True
 
     def _read_gzip_header(self):
         last_mtime = _read_gzip_header(self._fp)
@@ -560,7 +696,9 @@ def _read_eof(self):
         # uncompressed data matches the stored values.  Note that the size
         # stored is the true file size mod 2**32.
         crc32, isize = struct.unpack("<II", _read_exact(self._fp, 8))
-        if crc32 != self._crc:
+        if not self._verify:
+            pass
+        elif crc32 != self._crc:
             raise BadGzipFile("CRC check failed %s != %s" % (hex(crc32),
                                                              hex(self._crc)))
         elif isize != (self._stream_size & 0xffffffff):
@@ -579,6 +717,202 @@ def _rewind(self):
         super()._rewind()
         self._new_member = True
 
+    def _jump(self, point):
+        # Restart decompression at an access point of the index
+        out, start, bits, window = point
+        self._eof = False
+        self._pos = out
+        if window is None:
+            # Start of a member
+            self._fp.seek(start)
+            self._decompressor = self._decomp_factory(**self._decomp_args)
+            self._new_member = True
+            return
+        self._decompressor = self._decomp_factory(
+            zdict=zlib.decompress(window), **self._decomp_args)
+        if bits:
+            self._fp.seek(start - 1)
+            self._decompressor._prime(bits, self._fp.read(1)[0] >> (8 - bits))
+        else:
+            self._fp.seek(start)
+        self._init_read()
+        self._verify = False
+        self._new_member = False
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if self._index is not None:
+            if whence == io.SEEK_CUR:
+                offset = self._pos + offset
+                whence = io.SEEK_SET
+            elif whence == io.SEEK_END:
+                offset = self._index.size + offset
+                whence = io.SEEK_SET
+            if whence == io.SEEK_SET:
+                point = self._index._find(offset)
+                # Jump unless it is cheaper to keep reading from here
+                if point is not None and (offset < self._pos or
+                                          point[0] > self._pos):
+                    self._jump(point)
+        return super().seek(offset, whence)
+
+
+def _find_member(data, start):
+    # Return the offset of the next possible gzip header in data, or -1
+    while (pos := data.find(b'\037\213\010', start)) >= 0:
+        if pos + 3 >= len(data):
+            break
+        if not data[pos + 3] & 0xe0:  # Reserved flags must be zero
+            return pos
+        start = pos + 1
+    return -1
+
+
+class _ParallelGzipReader(_compression.ParallelDecompressReader):
+    """Reader decompressing the members of a gzip file in parallel."""
+
+    def __init__(self, fp, workers):
+        super().__init__(fp, workers, _find_member, _decompress, _GzipReader)
+        self._mtime = None
+
+    def _output(self, result):
+        data, mtime = result
+        if mtime is not None:
+            self._mtime = mtime
+        return data
+
+    @property
+    def _last_mtime(self):
+        if self._serial is not None and self._serial._last_mtime is not None:
+            return self._serial._last_mtime
+        return self._mtime
+
+
+class GzipIndex:
+    """Access points for random access into a gzip file.
+
+    An index is created by decompressing the whole file once with build().
+    Every *span* bytes of uncompressed data it records a point from which
+    decompression can be resumed, together with the 32 KiB of data
+    preceding it.  Passing the index to GzipFile makes seek() cost
+    O(span) instead of O(file size).  The index can be written next to the
+    file with save() and read back with load().
+    """
+
+    def __init__(self, points, compressed_size, size):
+        # List of (uncompressed offset, compressed offset, bits, window)
+        # tuples.  window is None for the start of a member, otherwise it is
+        # the compressed dictionary and bits is the number of bits of the
+        # byte before the compressed offset that belong to the next block.
+        self._points = points
+        self._offsets = [point[0] for point in points]
+        self.compressed_size = compressed_size
+        self.size = size
+
+    def __len__(self):
+        return len(self._points)
+
+    def _find(self, offset):
+        i = bisect.bisect_right(self._offsets, offset)
+        return self._points[i - 1] if i else None
+
+    @classmethod
+    def build(cls, fileobj, span=_INDEX_SPAN):
+        """Build an index of the gzip file *fileobj*.
+
+        fileobj can be a filename or a seekable binary file object.  An
+        access point is added at the start of every member and after every
+        *span* bytes of uncompressed data.
+        """
+        if span <= 0:
+            raise ValueError("span must be greater than 0")
+        if isinstance(fileobj, (str, bytes, os.PathLike)):
+            with builtins.open(fileobj, 'rb') as fp:
+                return cls._build(fp, span)
+        return cls._build(fileobj, span)
+
+    @classmethod
+    def _build(cls, fp, span):
+        points = []
+        out = 0
+        start = 0
+        while True:
+            fp.seek(start)
+            if _read_gzip_header(fp) is None:
+                break
+            points.append((out, start, 0, None))
+            last = out
+            crc = zlib.crc32(b"")
+            member_size = 0
+            window = b""
+            pos = fp.tell()  # Offset of the next byte to decompress
+            decompressor = zlib._ZlibDecompressor(wbits=-zlib.MAX_WBITS)
+            while not decompressor.eof:
+                if decompressor.needs_input:
+                    buf = fp.read(READ_BUFFER_SIZE)
+                    if not buf:
+                        raise EOFError("Compressed file ended before the "
+                                       "end-of-stream marker was reached")
+                    pos += len(buf)
+                else:
+                    buf = b""
+                data, data_type, unconsumed = decompressor._decompress_block(buf)
+                crc = zlib.crc32(data, crc)
+                member_size += len(data)
+                out += len(data)
+                window = (window + data)[-_DICT_SIZE:]
+                # Stopped at the end of a block which is not the last one
+                if data_type & 0xc0 == 0x80 and out - last >= span:
+                    points.append((out, pos - unconsumed, data_type & 7,
+                                   zlib.compress(window, 1)))
+                    last = out
+            fp.seek(pos - len(decompressor.unused_data))
+            crc32, isize = struct.unpack("<II", _read_exact(fp, 8))
+            if crc32 != crc:
+                raise BadGzipFile("CRC check failed %s != %s" % (hex(crc32),
+                                                                 hex(crc)))
+            elif isize != (member_size & 0xffffffff):
+                raise BadGzipFile("Incorrect length of data produced")
+            c = b"\x00"
+            while c == b"\x00":
+                c = fp.read(1)
+            start = fp.tell() - len(c)
+        return cls(points, fp.seek(0, io.SEEK_END), out)
+
+    def save(self, fileobj):
+        """Write the index to *fileobj*, a filename or a binary file object."""
+        if isinstance(fileobj, (str, bytes, os.PathLike)):
+            with builtins.open(fileobj, 'wb') as fp:
+                return self.save(fp)
+        fileobj.write(struct.pack("<8sQQQ", _INDEX_MAGIC, self.compressed_size,
+                                  self.size, len(self._points)))
+        for out, start, bits, window in self._points:
+            window = window or b""
+            fileobj.write(struct.pack("<QQBI", out, start, bits, len(window)))
+            fileobj.write(window)
+
+    @classmethod
+    def load(cls, fileobj):
+        """Read an index written by save() from *fileobj*.
+
+        fileobj can be a filename or a binary file object.
+        """
+        if isinstance(fileobj, (str, bytes, os.PathLike)):
+            with builtins.open(fileobj, 'rb') as fp:
+                return cls.load(fp)
+        def read(n):
+            data = fileobj.read(n)
+            if len(data) != n:
+                raise ValueError("Truncated gzip index")
+            return data
+        magic, compressed_size, size, count = struct.unpack("<8sQQQ", read(32))
+        if magic != _INDEX_MAGIC:
+            raise ValueError("Not a gzip index (%r)" % magic)
+        points = []
+        for i in range(count):
+            out, start, bits, length = struct.unpack("<QQBI", read(21))
+            points.append((out, start, bits, read(length) if length else None))
+        return cls(points, compressed_size, size)
+
 
 def compress(data, compresslevel=_COMPRESS_LEVEL_BEST, *, mtime=0):
     """Compress data in one shot and return the compressed string.
@@ -601,15 +935,30 @@ def decompress(data):
     """Decompress a gzip compressed string in one shot.
     Return the decompressed string.
     """
+    return _decompress(data)[0]
+
+
+def _decompress(data, max_length=-1):
+    # Return the decompressed data and the mtime of the last member, or
+    # None if the decompressed data is larger than max_length bytes
     decompressed_members = []
+    last_mtime = None
     while True:
         fp = io.BytesIO(data)
-        if _read_gzip_header(fp) is None:
-            return b"".join(decompressed_members)
+        mtime = _read_gzip_header(fp)
+        if mtime is None:
+            return b"".join(decompressed_members), last_mtime
+        last_mtime = mtime
         # Use a zlib raw deflate compressor
         do = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
         # Read all the data except the header
-        decompressed = do.decompress(data[fp.tell():])
+        if max_length < 0:
+            decompressed = do.decompress(data[fp.tell():])
+        else:
+            decompressed = do.decompress(data[fp.tell():], max_length + 1)
+            if len(decompressed) > max_length:
+                return None
+            max_length -= len(decompressed)
         if not do.eof or len(do.unused_data) < 8:
             raise EOFError("Compressed file ended before the end-of-stream "
                            "marker was reached")
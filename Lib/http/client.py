@@ -82,6 +82,7 @@
 # HTTPMessage, parse_headers(), and the HTTP status code constants are
 # intentionally omitted for simplicity
 __all__ = ["HTTPResponse", "HTTPConnection",
+           "AsyncHTTPResponse", "AsyncHTTPConnection",
            "HTTPException", "NotConnected", "UnknownProtocol",
            "UnknownTransferEncoding", "UnimplementedFileMode",
            "IncompleteRead", "InvalidURL", "ImproperConnectionState",
@@ -353,6 +354,9 @@ def begin(self):
             for hdr, val in self.headers.items():
                 print("header:", hdr + ":", val)
 
+        self._init_body_framing(status)
+
+    def _init_body_framing(self, status):
         # are we using the chunked-style of transfer encoding?
         tr_enc = self.headers.get("transfer-encoding")
         if tr_enc and tr_enc.lower() == "chunked":
@@ -1446,6 +1450,463 @@ def getresponse(self):
             response.close()
             raise
 
+class AsyncHTTPResponse:
+    """Response to a request sent with AsyncHTTPConnection.
+
+    The body is read with the read() coroutine or by iterating over the
+    response with "async for", which returns the body in chunks.
+    """
+
+    def __init__(self, conn, reader, method=None, blocksize=8192):
+        self._conn = conn
+        self._reader = reader
+        self._method = method
+        self._blocksize = blocksize
+
+        self.headers = self.msg = None
+
+        # from the Status-Line of the response
+        self.version = _UNKNOWN # HTTP-Version
+        self.status = _UNKNOWN  # Status-Code
+        self.reason = _UNKNOWN  # Reason-Phrase
+
+        self.chunked = _UNKNOWN         # is "chunked" being used?
+        self.chunk_left = _UNKNOWN      # bytes left to read in current chunk
+        self.length = _UNKNOWN          # number of bytes left in response
+        self.will_close = _UNKNOWN      # conn will close at end of response
+        self.closed = False
+
+    async def _readline(self, line_type):
+        try:
+            line = await self._reader.readline()
+        except ValueError:
+            # The line is longer than the limit of the stream.
+            raise LineTooLong(line_type) from None
+        if len(line) > _MAXLINE:
+            raise LineTooLong(line_type)
+        return line
+
+    async def _read_headers(self):
+        headers = []
+        while True:
+            line = await self._readline("header line")
+            headers.append(line)
+            if len(headers) > _MAXHEADERS:
+                raise HTTPException("got more than %d headers" % _MAXHEADERS)
+            if line in (b'\r\n', b'\n', b''):
+                break
+        return headers
+
+    async def _read_status(self):
+        line = str(await self._readline("status line"), "iso-8859-1")
+        if not line:
+            # Presumably, the server closed the connection before
+            # sending a valid response.
+            raise RemoteDisconnected("Remote end closed connection without"
+                                     " response")
+        try:
+            version, status, reason = line.split(None, 2)
+        except ValueError:
+            try:
+                version, status = line.split(None, 1)
+                reason = ""
+            except ValueError:
+                # empty version will cause next test to fail.
+                version = ""
+        if not version.startswith("HTTP/"):
+            raise BadStatusLine(line)
+
+        # The status code is a three-digit number
+        try:
+            status = int(status)
+            if status < 100 or status > 999:
+                raise BadStatusLine(line)
+        except ValueError:
+            raise BadStatusLine(line)
+        return version, status, reason
+
+    async def begin(self):
+        if self.headers is not None:
+            # we've already started reading the response
+            return
+
+        # read until we get a non-100 response
+        while True:
+            version, status, reason = await self._read_status()
+            if status != CONTINUE:
+                break
+            # skip the header from the 100 response
+            await self._read_headers()
+
+        self.code = self.status = status
+        self.reason = reason.strip()
+        if version in ("HTTP/1.0", "HTTP/0.9"):
+            # Some servers might still return "0.9", treat it as 1.0 anyway
+            self.version = 10
+        elif version.startswith("HTTP/1."):
+            self.version = 11   # use HTTP/1.1 code for HTTP/1.x where x>=1
+        else:
+            raise UnknownProtocol(version)
+
+        self.headers = self.msg = _parse_header_lines(
+            await self._read_headers())
+
+        self._init_body_framing(status)
+        if self.length == 0:
+            self._finish()
+
+    # The rules to find the length of the body and whether the connection
+    # is persistent are the same as for HTTPResponse.
+    _init_body_framing = HTTPResponse._init_body_framing
+    _check_close = HTTPResponse._check_close
+
+    def _finish(self):
+        # The body was read entirely.
+        if not self.closed:
+            self.closed = True
+            self._conn._response_done(self, reusable=not self.will_close)
+
+    def close(self):
+        """Close the response.
+
+        If the body was not read entirely, the connection is closed as it
+        cannot be used for other requests.
+        """
+        if not self.closed:
+            self.closed = True
+            self._conn._response_done(self, reusable=False)
+
+    def isclosed(self):
+        """True if the body was read entirely or the response was closed."""
+        return self.closed
+
+    async def read(self, amt=None):
+        """Read and return up to amt bytes of the body, or all of it."""
+        if self.closed:
+            return b""
+        if amt is not None and amt < 0:
+            amt = None
+        if amt is None:
+            chunks = []
+            async for chunk in self:
+                chunks.append(chunk)
+            return b"".join(chunks)
+        if amt == 0:
+            return b""
+        return await self._read1(amt)
+
+    async def _read1(self, amt):
+        # Read at most amt bytes and at least one byte, unless the body
+        # was read entirely.
+        if self.chunked:
+            data = await self._read1_chunked(amt)
+        elif self.length is None:
+            # Read until the server closes the connection.
+            data = await self._reader.read(amt)
+            if not data:
+                self._finish()
+        else:
+            data = await self._reader.read(min(amt, self.length))
+            if not data:
+                self.close()
+                raise IncompleteRead(b"", self.length)
+            self.length -= len(data)
+            if not self.length:
+                self._finish()
+        return data
+
+    async def _read1_chunked(self, amt):
+        if not self.chunk_left:
+            if self.chunk_left == 0:
+                # Read the CRLF at the end of the previous chunk.
+                await self._readexactly(2)
+            line = await self._readline("chunk size")
+            i = line.find(b";")
+            if i >= 0:
+                line = line[:i] # strip chunk-extensions
+            try:
+                self.chunk_left = int(line, 16)
+            except ValueError:
+                # close the connection as protocol synchronisation is
+                # probably lost
+                self.close()
+                raise IncompleteRead(b"")
+            if self.chunk_left == 0:
+                # Read and discard the trailer up to the CRLF terminator.
+                await self._read_headers()
+                self._finish()
+                return b""
+        data = await self._reader.read(min(amt, self.chunk_left))
+        if not data:
+            self.close()
+            raise IncompleteRead(b"")
+        self.chunk_left -= len(data)
+        return data
+
+    async def _readexactly(self, n):
+        try:
+            return await self._reader.readexactly(n)
+        except EOFError as exc:  # asyncio.IncompleteReadError
+            self.close()
+            raise IncompleteRead(exc.partial, n) from None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.closed:
+            data = await self._read1(self._blocksize)
+            if data:
+                return data
+        raise StopAsyncIteration
+
+    getheader = HTTPResponse.getheader
+    getheaders = HTTPResponse.getheaders
+    info = HTTPResponse.info
+    getcode = HTTPResponse.getcode
+
+
+class AsyncHTTPConnection:
+    """HTTP/1.1 client connection for asyncio.
+
+    The methods which send a request and read a response are coroutines.
+    The connection is kept open between requests unless the server closes
+    it, and several requests may be sent before reading their responses
+    (pipelining): getresponse() returns the responses in the order of the
+    requests, after the body of the previous response was read.
+    """
+
+    _http_vsn = 11
+    _http_vsn_str = 'HTTP/1.1'
+
+    response_class = AsyncHTTPResponse
+    default_port = HTTP_PORT
+
+    def __init__(self, host, port=None, *, source_address=None,
+                 blocksize=8192):
+        self.source_address = source_address
+        self.blocksize = blocksize
+        self._reader = self._writer = None
+        # Methods of the requests whose response was not read yet.
+        self._pending = collections.deque()
+        self._response = None
+
+        (self.host, self.port) = self._get_hostport(host, port)
+
+        self._validate_host(self.host)
+
+    _get_hostport = HTTPConnection._get_hostport
+    _wrap_ipv6 = HTTPConnection._wrap_ipv6
+    _encode_request = HTTPConnection._encode_request
+    _validate_method = HTTPConnection._validate_method
+    _validate_path = HTTPConnection._validate_path
+    _validate_host = HTTPConnection._validate_host
+    _get_content_length = staticmethod(HTTPConnection._get_content_length)
+
+    async def connect(self):
+        """Connect to the host and port specified in __init__."""
+        import asyncio
+        self._pending.clear()
+        self._reader, self._writer = await asyncio.open_connection(
+            self.host, self.port, local_addr=self.source_address,
+            **self._connect_kwargs())
+
+    def _connect_kwargs(self):
+        return {}
+
+    async def close(self):
+        """Close the connection to the HTTP server."""
+        writer = self._writer
+        self._reader = self._writer = None
+        self._pending.clear()
+        response, self._response = self._response, None
+        if response is not None:
+            response.closed = True
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    def _close_transport(self):
+        # The requests which were sent on the connection without reading
+        # their response are kept, getresponse() reports that they failed.
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def request(self, method, url, body=None, headers={}, *,
+                      encode_chunked=False):
+        """Send a complete request to the server.
+
+        body may be a bytes-like object, a str, or an iterable or
+        asynchronous iterable of bytes-like objects; the latter two are
+        sent with the chunked transfer encoding if the Content-Length header
+        is not set.  The connection is opened if it is not open.
+        """
+        self._validate_method(method)
+        url = url or '/'
+        self._validate_path(url)
+
+        lines = [self._encode_request(
+            '%s %s %s' % (method, url, self._http_vsn_str))]
+
+        header_names = frozenset(k.lower() for k in headers)
+        if 'host' not in header_names:
+            lines.append(self._format_header('Host', self._host_header(url)))
+        if 'accept-encoding' not in header_names:
+            lines.append(self._format_header('Accept-Encoding', 'identity'))
+
+        # The rules to choose between Content-Length and the chunked
+        # encoding are the same as for HTTPConnection.request().
+        if 'content-length' not in header_names:
+            if 'transfer-encoding' not in header_names:
+                encode_chunked = False
+                content_length = self._get_content_length(body, method)
+                if content_length is None:
+                    if body is not None:
+                        encode_chunked = True
+                        lines.append(self._format_header(
+                            'Transfer-Encoding', 'chunked'))
+                else:
+                    lines.append(self._format_header(
+                        'Content-Length', str(content_length)))
+        else:
+            encode_chunked = False
+
+        for hdr, value in headers.items():
+            lines.append(self._format_header(hdr, value))
+        lines.extend((b"", b""))
+
+        chunks = None
+        if isinstance(body, str):
+            # RFC 2616 Section 3.7.1 says that text default has a
+            # default charset of iso-8859-1.
+            body = _encode(body, 'body')
+        elif body is not None:
+            try:
+                memoryview(body)
+            except TypeError:
+                if hasattr(body, '__aiter__'):
+                    chunks = body
+                else:
+                    try:
+                        chunks = iter(body)
+                    except TypeError:
+                        raise TypeError("body should be a bytes-like object, "
+                                        "an iterable or an asynchronous "
+                                        "iterable, got %r" % type(body))
+
+        if self._writer is None:
+            await self.connect()
+        writer = self._writer
+        self._pending.append(method)
+        writer.write(b"\r\n".join(lines))
+
+        if chunks is not None:
+            if hasattr(chunks, '__aiter__'):
+                async for chunk in chunks:
+                    await self._send_chunk(writer, chunk, encode_chunked)
+            else:
+                for chunk in chunks:
+                    await self._send_chunk(writer, chunk, encode_chunked)
+            if encode_chunked:
+                # end chunked transfer
+                writer.write(b'0\r\n\r\n')
+        elif body is not None:
+            writer.write(body)
+        await writer.drain()
+
+    async def _send_chunk(self, writer, chunk, encode_chunked):
+        if not chunk:
+            return
+        if encode_chunked:
+            writer.write(f'{len(chunk):X}\r\n'.encode('ascii'))
+            writer.write(chunk)
+            writer.write(b'\r\n')
+        else:
+            writer.write(chunk)
+        await writer.drain()
+
+    def _host_header(self, url):
+        netloc = ''
+        if url.startswith('http'):
+            nil, netloc, nil, nil, nil = urlsplit(url)
+        if netloc:
+            try:
+                netloc_enc = netloc.encode("ascii")
+            except UnicodeEncodeError:
+                netloc_enc = netloc.encode("idna")
+            return _strip_ipv6_iface(netloc_enc)
+
+        try:
+            host_enc = self.host.encode("ascii")
+        except UnicodeEncodeError:
+            host_enc = self.host.encode("idna")
+
+        # As per RFC 273, IPv6 address should be wrapped with []
+        # when used as Host header
+        host_enc = self._wrap_ipv6(host_enc)
+        if ":" in self.host:
+            host_enc = _strip_ipv6_iface(host_enc)
+
+        if self.port == self.default_port:
+            return host_enc
+        return "%s:%s" % (host_enc.decode("ascii"), self.port)
+
+    def _format_header(self, header, *values):
+        if hasattr(header, 'encode'):
+            header = header.encode('ascii')
+
+        if not _is_legal_header_name(header):
+            raise ValueError('Invalid header name %r' % (header,))
+
+        values = list(values)
+        for i, one_value in enumerate(values):
+            if hasattr(one_value, 'encode'):
+                values[i] = one_value.encode('latin-1')
+            elif isinstance(one_value, int):
+                values[i] = str(one_value).encode('ascii')
+
+            if _is_illegal_header_value(values[i]):
+                raise ValueError('Invalid header value %r' % (values[i],))
+
+        value = b'\r\n\t'.join(values)
+        return header + b': ' + value
+
+    async def getresponse(self):
+        """Get the response to the oldest request without a response.
+
+        The headers of the response are read; its body must be read or the
+        response closed before the next response can be read.  Raise
+        ResponseNotReady if there is no request without a response, or if
+        the body of the previous response was not read.
+        """
+        if self._response is not None or not self._pending:
+            raise ResponseNotReady()
+        method = self._pending.popleft()
+        if self._reader is None:
+            raise RemoteDisconnected("Remote end closed connection without"
+                                     " response")
+        response = self.response_class(self, self._reader, method,
+                                       blocksize=self.blocksize)
+        self._response = response
+        try:
+            await response.begin()
+        except:
+            response.close()
+            raise
+        return response
+
+    def _response_done(self, response, reusable):
+        if self._response is not response:
+            # The connection was closed.
+            return
+        self._response = None
+        if not reusable:
+            self._close_transport()
+
 try:
     import ssl
 except ImportError:
@@ -1481,6 +1942,24 @@ def connect(self):
 
     __all__.append("HTTPSConnection")
 
+    class AsyncHTTPSConnection(AsyncHTTPConnection):
+        "This class allows asynchronous communication via SSL."
+
+        default_port = HTTPS_PORT
+
+        def __init__(self, host, port=None, *, source_address=None,
+                     context=None, blocksize=8192):
+            super().__init__(host, port, source_address=source_address,
+                             blocksize=blocksize)
+            if context is None:
+                context = _create_https_context(self._http_vsn)
+            self._context = context
+
+        def _connect_kwargs(self):
+            return {'ssl': self._context, 'server_hostname': self.host}
+
+    __all__.append("AsyncHTTPSConnection")
+
 class HTTPException(Exception):
     # Subclasses that define an __init__ must call Exception.__init__
     # or define self.args.  Otherwise, str() will fail.
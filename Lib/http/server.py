@@ -85,6 +85,8 @@
 __all__ = [
     "HTTPServer", "ThreadingHTTPServer", "BaseHTTPRequestHandler",
     "SimpleHTTPRequestHandler", "CGIHTTPRequestHandler",
+    "AsyncHTTPServer", "AsyncBaseHTTPRequestHandler",
+    "AsyncSimpleHTTPRequestHandler",
 ]
 
 import copy
@@ -149,6 +151,107 @@ class ThreadingHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
     daemon_threads = True
 
 
+class AsyncHTTPServer:
+
+    """HTTP server running on an asyncio event loop.
+
+    Each connection is handled by a task calling the handle() coroutine of
+    a RequestHandlerClass(reader, writer, server) instance, usually a
+    subclass of AsyncBaseHTTPRequestHandler.  An idle keep-alive connection
+    only costs its stream and task, so one event loop can serve many
+    concurrent connections.
+
+    """
+
+    allow_reuse_address = True
+
+    def __init__(self, server_address, RequestHandlerClass, *, ssl=None):
+        self.server_address = server_address
+        self.RequestHandlerClass = RequestHandlerClass
+        self.ssl = ssl
+        self._server = None
+        self._handlers = set()
+
+    async def __aenter__(self):
+        await self.start_serving()
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+        await self.wait_closed()
+
+    async def start_serving(self):
+        """Bind the server and start accepting connections."""
+        import asyncio
+        if self._server is not None:
+            return
+        host, port = self.server_address[:2]
+        self._server = await asyncio.start_server(
+            self._handle_client, host or None, port, ssl=self.ssl,
+            reuse_address=self.allow_reuse_address)
+        self.server_address = self._server.sockets[0].getsockname()
+        host, port = self.server_address[:2]
+        loop = asyncio.get_running_loop()
+        self.server_name = await loop.run_in_executor(
+            None, socket.getfqdn, host)
+        self.server_port = port
+
+    async def serve_forever(self):
+        """Accept connections until the task is cancelled."""
+        await self.start_serving()
+        await self._server.serve_forever()
+
+    def close(self):
+        """Stop accepting connections and close the idle connections.
+
+        The requests being handled are completed before their connection
+        is closed.
+        """
+        if self._server is None:
+            return
+        self._server.close()
+        for handler in list(self._handlers):
+            handler._shutdown()
+
+    async def wait_closed(self):
+        """Wait until the server and all its connections are closed."""
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    async def _handle_client(self, reader, writer):
+        client_address = writer.get_extra_info('peername')
+        handler = None
+        try:
+            handler = self.RequestHandlerClass(reader, writer, self)
+            self._handlers.add(handler)
+            if not self._server.is_serving():
+                # The server was closed before the handler was added.
+                handler._shutdown()
+            await handler.handle()
+        except Exception:
+            self.handle_error(client_address)
+        finally:
+            self._handlers.discard(handler)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    def handle_error(self, client_address):
+        """Handle an error gracefully.  May be overridden.
+
+        The default is to print a traceback and continue.
+
+        """
+        import traceback
+        print('-'*40, file=sys.stderr)
+        print('Exception occurred during processing of request from',
+            client_address, file=sys.stderr)
+        traceback.print_exc()
+        print('-'*40, file=sys.stderr)
+
+
 class BaseHTTPRequestHandler(socketserver.StreamRequestHandler):
 
     """HTTP request handler base class.
@@ -281,6 +384,20 @@ def parse_request(self):
         error response has already been sent back.
 
         """
+        if not self._parse_request_line():
+            return False
+
+        # Examine the headers and look for a Connection directive.
+        try:
+            self.headers = http.client.parse_headers(self.rfile,
+                                                     _class=self.MessageClass)
+        except http.client.HTTPException as err:
+            self._send_headers_error(err)
+            return False
+        return self._check_request_headers()
+
+    def _parse_request_line(self):
+        # Parse self.raw_requestline, see parse_request().
         self.command = None  # set in case of error on the first line
         self.request_version = version = self.default_request_version
         self.close_connection = True
@@ -346,25 +463,25 @@ def parse_request(self):
         # without scheme (similar to http://path) rather than a path.
         if self.path.startswith('//'):
             self.path = '/' + self.path.lstrip('/')  # Reduce to a single /
+        return True
 
-        # Examine the headers and look for a Connection directive.
-        try:
-            self.headers = http.client.parse_headers(self.rfile,
-                                                     _class=self.MessageClass)
-        except http.client.LineTooLong as err:
+    def _send_headers_error(self, err):
+        # Send the error response for an exception raised by reading the
+        # headers.
+        if isinstance(err, http.client.LineTooLong):
             self.send_error(
                 HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
                 "Line too long",
                 str(err))
-            return False
-        except http.client.HTTPException as err:
+        else:
             self.send_error(
                 HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
                 "Too many headers",
                 str(err)
             )
-            return False
 
+    def _check_request_headers(self):
+        # Examine the headers parsed in self.headers, see parse_request().
         conntype = self.headers.get('Connection', "")
         if conntype.lower() == 'close':
             self.close_connection = True
@@ -910,6 +1027,181 @@ def guess_type(self, path):
         return 'application/octet-stream'
 
 
+class AsyncBaseHTTPRequestHandler(BaseHTTPRequestHandler):
+
+    """HTTP request handler base class for AsyncHTTPServer.
+
+    This works like BaseHTTPRequestHandler, except that the do_SPAM()
+    methods are coroutines.  self.rfile is the asyncio.StreamReader of the
+    connection, from which the request body is read, and self.wfile is its
+    asyncio.StreamWriter.  The request line and the headers are parsed with
+    the same rules as BaseHTTPRequestHandler, and send_response(),
+    send_header(), end_headers() and send_error() are used in the same way.
+
+    """
+
+    # Close a keep-alive connection if no request arrives within timeout
+    # seconds, and a request whose headers take longer to arrive.
+    timeout = None
+
+    def __init__(self, reader, writer, server):
+        self.rfile = reader
+        self.wfile = writer
+        self.server = server
+        self.client_address = writer.get_extra_info('peername')
+        self._idle = False
+        self._closing = False
+
+    async def handle_one_request(self):
+        """Handle a single HTTP request.
+
+        You normally don't need to override this method; see the class
+        __doc__ string for information on how to handle specific HTTP
+        commands such as GET and POST.
+
+        """
+        import asyncio
+        try:
+            async with asyncio.timeout(self.timeout):
+                self._idle = True
+                try:
+                    self.raw_requestline = await self.rfile.readline()
+                except ValueError:
+                    # The request line is longer than the stream limit.
+                    self.raw_requestline = None
+                finally:
+                    self._idle = False
+                if (self.raw_requestline is None
+                        or len(self.raw_requestline) > 65536):
+                    self.requestline = ''
+                    self.request_version = ''
+                    self.command = ''
+                    self.send_error(HTTPStatus.REQUEST_URI_TOO_LONG)
+                    return
+                if not self.raw_requestline:
+                    self.close_connection = True
+                    return
+                if not self._parse_request_line():
+                    # An error code has been sent, just exit
+                    return
+                try:
+                    self.headers = http.client._parse_header_lines(
+                        await self._read_header_lines(),
+                        _class=self.MessageClass)
+                except http.client.HTTPException as err:
+                    self._send_headers_error(err)
+                    return
+            if not self._check_request_headers():
+                return
+            mname = 'do_' + self.command
+            if not hasattr(self, mname):
+                self.send_error(
+                    HTTPStatus.NOT_IMPLEMENTED,
+                    "Unsupported method (%r)" % self.command)
+                return
+            method = getattr(self, mname)
+            await method()
+            await self.wfile.drain() #actually send the response.
+        except TimeoutError as e:
+            #reading the request timed out.  Discard this connection
+            self.log_error("Request timed out: %r", e)
+            self.close_connection = True
+        except ConnectionError:
+            self.close_connection = True
+        finally:
+            if self.close_connection or self._closing:
+                # Send the error response, if any, before closing.
+                try:
+                    await self.wfile.drain()
+                except ConnectionError:
+                    pass
+
+    async def _read_header_lines(self):
+        # Same as http.client._read_headers() on a stream.
+        headers = []
+        while True:
+            try:
+                line = await self.rfile.readline()
+            except ValueError:
+                raise http.client.LineTooLong("header line") from None
+            if len(line) > http.client._MAXLINE:
+                raise http.client.LineTooLong("header line")
+            headers.append(line)
+            if len(headers) > http.client._MAXHEADERS:
+                raise http.client.HTTPException(
+                    "got more than %d headers" % http.client._MAXHEADERS)
+            if line in (b'\r\n', b'\n', b''):
+                break
+        return headers
+
+    async def handle(self):
+        """Handle multiple requests if necessary."""
+        self.close_connection = True
+
+        await self.handle_one_request()
+        while not self.close_connection and not self._closing:
+            await self.handle_one_request()
+
+    def _shutdown(self):
+        # Called when the server is closed: close the connection now if it
+        # waits for a request, or else after the current request.
+        self._closing = True
+        if self._idle:
+            self.wfile.close()
+
+
+class AsyncSimpleHTTPRequestHandler(AsyncBaseHTTPRequestHandler,
+                                    SimpleHTTPRequestHandler):
+
+    """Simple HTTP request handler with GET and HEAD commands for
+    AsyncHTTPServer.
+
+    This serves files like SimpleHTTPRequestHandler.  The files are sent
+    with the sendfile() system call if it is available.
+
+    """
+
+    def __init__(self, *args, directory=None, **kwargs):
+        if directory is None:
+            directory = os.getcwd()
+        self.directory = os.fspath(directory)
+        super().__init__(*args, **kwargs)
+
+    async def do_GET(self):
+        """Serve a GET request."""
+        f = self.send_head()
+        if f:
+            try:
+                await self.copyfile(f, self.wfile)
+            finally:
+                f.close()
+
+    async def do_HEAD(self):
+        """Serve a HEAD request."""
+        f = self.send_head()
+        if f:
+            f.close()
+
+    async def copyfile(self, source, outputfile):
+        """Copy all data from a file object to a stream writer.
+
+        The SOURCE argument is a file object open for reading and the
+        DESTINATION argument is an asyncio.StreamWriter.  Regular files
+        are sent with loop.sendfile().
+
+        """
+        import asyncio
+        try:
+            source.fileno()
+        except (AttributeError, OSError):
+            # In-memory file, such as a directory listing.
+            shutil.copyfileobj(source, outputfile)
+            return
+        loop = asyncio.get_running_loop()
+        await outputfile.drain()
+        await loop.sendfile(outputfile.transport, source)
+
+
 # Utilities for CGIHTTPRequestHandler
 
 def _url_collapse_path(path):
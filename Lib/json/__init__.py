@@ -53,6 +53,9 @@
     >>> io = StringIO('["streaming API"]')
     >>> json.load(io)[0] == 'streaming API'
     True
+    >>> io = StringIO('["foo", {"bar": 1}]')
+    >>> list(json.iterload(io))
+    ['foo', {'bar': 1}]
 
 Specializing JSON object decoding::
 
@@ -97,13 +100,13 @@
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
-    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
+    'dump', 'dumps', 'dumpb', 'load', 'loads', 'iterload',
+    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder', 'JSONStreamDecoder',
 ]
 
 __author__ = 'Bob Ippolito <bob@redivi.com>'
 
-from .decoder import JSONDecoder, JSONDecodeError
+from .decoder import JSONDecoder, JSONDecodeError, JSONStreamDecoder
 from .encoder import JSONEncoder
 import codecs
 
@@ -238,6 +241,33 @@ def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         **kw).encode(obj)
 
 
+def dumpb(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
+        allow_nan=True, cls=None, indent=None, separators=None,
+        default=None, sort_keys=False, **kw):
+    """Serialize ``obj`` to a JSON formatted ``bytes`` object encoded with
+    UTF-8.
+
+    This is equivalent to ``dumps(obj, ...).encode('utf-8')``, but the
+    output is produced without building the intermediate ``str``.
+
+    The arguments have the same meaning as in ``dumps()``.
+
+    """
+    # cached encoder
+    if (not skipkeys and ensure_ascii and
+        check_circular and allow_nan and
+        cls is None and indent is None and separators is None and
+        default is None and not sort_keys and not kw):
+        return _default_encoder._encode_utf8(obj)
+    if cls is None:
+        cls = JSONEncoder
+    return cls(
+        skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+        check_circular=check_circular, allow_nan=allow_nan, indent=indent,
+        separators=separators, default=default, sort_keys=sort_keys,
+        **kw)._encode_utf8(obj)
+
+
 _default_decoder = JSONDecoder(object_hook=None, object_pairs_hook=None)
 
 
@@ -357,3 +387,42 @@ def loads(s, *, cls=None, object_hook=None, parse_float=None,
     if parse_constant is not None:
         kw['parse_constant'] = parse_constant
     return cls(**kw).decode(s)
+
+
+_ITERLOAD_CHUNK_SIZE = 64 * 1024
+
+def iterload(fp, *, lines=False, cls=None, object_hook=None, parse_float=None,
+        parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
+    """Incrementally deserialize ``fp`` (a ``.read()``-supporting file-like
+    object containing a JSON document) and return an iterator over the
+    decoded values.
+
+    If the document is a JSON array, its elements are yielded one at a time
+    as soon as each of them has been read, otherwise the document itself
+    is yielded.  If ``lines`` is true, ``fp`` contains a sequence of
+    whitespace-separated JSON values (for example JSON Lines) and each of
+    them is yielded.
+
+    ``fp`` is read in chunks and only the data of the value being decoded
+    is kept in memory, so huge arrays and streams can be processed with
+    memory bounded by the size of their largest element.
+
+    The other arguments have the same meaning as in ``load()``.
+    """
+    if cls is None:
+        cls = JSONDecoder
+    if object_hook is not None:
+        kw['object_hook'] = object_hook
+    if object_pairs_hook is not None:
+        kw['object_pairs_hook'] = object_pairs_hook
+    if parse_float is not None:
+        kw['parse_float'] = parse_float
+    if parse_int is not None:
+        kw['parse_int'] = parse_int
+    if parse_constant is not None:
+        kw['parse_constant'] = parse_constant
+    decoder = JSONStreamDecoder(cls(**kw), lines=lines)
+    read = fp.read
+    while chunk := read(_ITERLOAD_CHUNK_SIZE):
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
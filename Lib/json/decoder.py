@@ -8,7 +8,7 @@
 except ImportError:
     c_scanstring = None
 
-__all__ = ['JSONDecoder', 'JSONDecodeError']
+__all__ = ['JSONDecoder', 'JSONDecodeError', 'JSONStreamDecoder']
 
 FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
 
@@ -362,3 +362,266 @@ def raw_decode(self, s, idx=0):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+
+# Parser states of JSONStreamDecoder
+_START = 0          # expecting the document (or the next JSON Lines value)
+_ARRAY_FIRST = 1    # after '[', expecting a value or ']'
+_ARRAY_VALUE = 2    # after ',', expecting a value
+_ARRAY_NEXT = 3     # after an array element, expecting ',' or ']'
+_END = 4            # the document is complete
+
+STREAM_DELIMITER = re.compile(r'["\[\]{}]', FLAGS)
+STREAM_STRING_DELIMITER = re.compile(r'["\\]', FLAGS)
+STREAM_SCALAR = re.compile(r'[-+.\w]*', FLAGS)
+
+
+class JSONStreamDecoder(object):
+    """Incremental JSON <https://json.org> decoder
+
+    Data is pushed in chunks with ``feed()``, and every call returns the
+    list of values completed so far.  If the document is a JSON array, its
+    elements are returned one by one as soon as each of them is complete,
+    otherwise the document itself is returned.  If ``lines`` is true, the
+    input is a sequence of whitespace-separated JSON values (for example
+    JSON Lines) and each of them is returned.
+
+    Only the data of the value being decoded is kept in memory, so the
+    memory use is bounded by the largest element rather than by the size
+    of the whole document.
+
+    """
+
+    def __init__(self, decoder=None, *, lines=False):
+        """``decoder``, if specified, is the ``JSONDecoder`` instance used to
+        decode the values.  By default a ``JSONDecoder`` with default
+        arguments is used.
+        """
+        if decoder is None:
+            decoder = JSONDecoder()
+        self.scan_once = decoder.scan_once
+        self.lines = lines
+        # Data of the value not complete yet, as a list of chunks
+        self._buffer = []
+        self._state = _START
+        self._started = False
+        self._binary = None
+        self._pending = b''
+        self._decoder = None
+        # Progress of the search for the end of a partially received value
+        self._scanpos = -1
+        self._depth = 0
+        self._instring = False
+        # Position of the buffered data in the document: index, number of
+        # lines before it and index of the last newline before it
+        self._offset = 0
+        self._lineno = 0
+        self._lastnl = -1
+
+    def feed(self, data):
+        """Feed ``data`` (a ``str``, ``bytes`` or ``bytearray`` instance)
+        to the decoder and return the list of the values completed by it.
+
+        """
+        return self._parse(self._decode_data(data, False), False)
+
+    def close(self):
+        """Signal the end of the input and return the list of the remaining
+        values.  Raise ``JSONDecodeError`` if the document is incomplete.
+
+        """
+        data = ''
+        if self._binary:
+            data = self._decode_data(b'', True)
+        return self._parse(data, True)
+
+    def _decode_data(self, data, final):
+        if isinstance(data, str):
+            if self._binary:
+                raise TypeError('cannot mix str and bytes data')
+            self._binary = False
+            if not self._started and data:
+                self._started = True
+                if data.startswith('\ufeff'):
+                    raise JSONDecodeError("Unexpected UTF-8 BOM (decode "
+                                          "using utf-8-sig)", data, 0)
+            return data
+        if not isinstance(data, (bytes, bytearray)):
+            raise TypeError(f'the JSON data must be str, bytes or bytearray, '
+                            f'not {data.__class__.__name__}')
+        if self._binary is False:
+            raise TypeError('cannot mix str and bytes data')
+        self._binary = True
+        if self._decoder is None:
+            # Wait for enough data to detect the encoding
+            self._pending += data
+            if len(self._pending) < 4 and not final:
+                return ''
+            from json import detect_encoding
+            import codecs
+            encoding = detect_encoding(self._pending)
+            self._decoder = codecs.getincrementaldecoder(encoding)(
+                'surrogatepass')
+            data = self._pending
+            self._pending = b''
+        return self._decoder.decode(data, final)
+
+    def _value_end(self, s, idx):
+        """Return the index in ``s`` after the end of the value starting at
+        ``idx``, or -1 if it is not complete yet.
+
+        The value is not validated, this only looks for the closing quote or
+        bracket so that the value can be passed to the scanner in one piece.
+        """
+        if s[idx] not in '"[{':
+            end = STREAM_SCALAR.match(s, idx).end()
+            return end if end < len(s) else -1
+        self._scanpos = idx
+        self._depth = 0
+        self._instring = False
+        return self._scan_value(s)
+
+    def _scan_value(self, s):
+        """Continue the search for the end of a string, an array or an
+        object at ``self._scanpos`` in ``s``.
+
+        Return the index in ``s`` after the end of the value, or -1 if it is
+        not complete yet; the search then continues in the next data.
+        """
+        i = self._scanpos
+        depth = self._depth
+        instring = self._instring
+        while True:
+            if instring:
+                m = STREAM_STRING_DELIMITER.search(s, i)
+                if m is None:
+                    i = len(s)
+                    break
+                i = m.end()
+                if m.group() == '\\':
+                    # Skip the escaped character, which may be the first
+                    # character of the next data
+                    i += 1
+                    if i > len(s):
+                        break
+                    continue
+                instring = False
+                if not depth:
+                    break
+            else:
+                m = STREAM_DELIMITER.search(s, i)
+                if m is None:
+                    i = len(s)
+                    break
+                i = m.end()
+                c = m.group()
+                if c == '"':
+                    instring = True
+                elif c in '[{':
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth <= 0:
+                        break
+        if instring or depth > 0:
+            self._scanpos = i - len(s)
+            self._depth = depth
+            self._instring = instring
+            return -1
+        self._scanpos = -1
+        return i
+
+    def _error(self, msg, s, pos):
+        """Return a ``JSONDecodeError`` for the index ``pos`` in ``s``, the
+        data kept after the values already decoded.
+
+        The position, line and column are counted from the start of the
+        document; ``doc`` is ``s``.
+        """
+        err = JSONDecodeError(msg, s, pos)
+        if self._offset:
+            err.pos = self._offset + pos
+            if err.lineno == 1:
+                err.colno = err.pos - self._lastnl
+            err.lineno += self._lineno
+            err.args = ('%s: line %d column %d (char %d)' %
+                        (msg, err.lineno, err.colno, err.pos),)
+        return err
+
+    def _parse(self, data, final, _w=WHITESPACE.match):
+        complete = False
+        if self._buffer:
+            # The data starts with an incomplete value.
+            if not final and self._scanpos >= 0:
+                # Only look for the end of a string, an array or an object
+                # in the new data, and join the data once it is complete.
+                if not data or self._scan_value(data) < 0:
+                    if data:
+                        self._buffer.append(data)
+                    return []
+                complete = True
+            self._buffer.append(data)
+            s = ''.join(self._buffer)
+            self._buffer = []
+        else:
+            s = data
+        pos = 0
+        state = self._state
+        values = []
+        while True:
+            pos = _w(s, pos).end()
+            if pos == len(s):
+                break
+            nextchar = s[pos]
+            if state == _ARRAY_NEXT:
+                if nextchar == ',':
+                    state = _ARRAY_VALUE
+                elif nextchar == ']':
+                    state = _END
+                else:
+                    raise self._error("Expecting ',' delimiter", s, pos)
+                pos += 1
+                continue
+            if state == _END:
+                raise self._error("Extra data", s, pos)
+            if nextchar == ']' and state != _START:
+                if state == _ARRAY_VALUE:
+                    raise self._error(
+                        "Illegal trailing comma before end of array", s, pos)
+                state = _END
+                pos += 1
+                continue
+            if nextchar == '[' and state == _START and not self.lines:
+                state = _ARRAY_FIRST
+                pos += 1
+                continue
+            if not (final or complete) and self._value_end(s, pos) < 0:
+                break
+            complete = False
+            try:
+                value, pos = self.scan_once(s, pos)
+            except StopIteration as err:
+                raise self._error("Expecting value", s, err.value) from None
+            except JSONDecodeError as err:
+                raise self._error(err.msg, s, err.pos) from None
+            values.append(value)
+            if state != _START:
+                state = _ARRAY_NEXT
+            elif not self.lines:
+                state = _END
+        if final:
+            if state == _ARRAY_NEXT:
+                raise self._error("Expecting ',' delimiter", s, pos)
+            if (state == _ARRAY_FIRST or state == _ARRAY_VALUE or
+                    (state == _START and not self.lines)):
+                raise self._error("Expecting value", s, pos)
+        # Only keep the data of the value which is not complete yet
+        newlines = s.count('\n', 0, pos)
+        if newlines:
+            self._lineno += newlines
+            self._lastnl = self._offset + s.rfind('\n', 0, pos)
+        self._offset += pos
+        if pos < len(s):
+            self._buffer = [s[pos:]]
+        self._state = state
+        return values
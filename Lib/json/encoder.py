@@ -1,6 +1,8 @@
 """Implementation of JSONEncoder
 """
 import re
+from enum import Enum
+from operator import attrgetter
 
 try:
     from _json import encode_basestring_ascii as c_encode_basestring_ascii
@@ -71,6 +73,26 @@ def replace(match):
 encode_basestring_ascii = (
     c_encode_basestring_ascii or py_encode_basestring_ascii)
 
+
+_enum_value = attrgetter('value')
+
+def _builtin_converter(cls, sort_keys):
+    """Return how JSONEncoder.default() converts instances of cls.
+
+    The result is a tuple of attribute names for dataclasses, which are
+    encoded as JSON objects, a function returning the value of the member
+    for enums, or None if instances of cls are not supported.
+
+    """
+    if hasattr(cls, '__dataclass_fields__'):
+        import dataclasses
+        names = tuple(field.name for field in dataclasses.fields(cls))
+        return tuple(sorted(names)) if sort_keys else names
+    if issubclass(cls, Enum):
+        return _enum_value
+    return None
+
+
 class JSONEncoder(object):
     """Extensible JSON <https://json.org> encoder for Python data structures.
 
@@ -94,17 +116,22 @@ class JSONEncoder(object):
     | None              | null          |
     +-------------------+---------------+
 
+    Instances of dataclasses are encoded as objects of their fields, and
+    members of enums as their value.
+
     To extend this to recognize other objects, subclass and implement a
     ``.default()`` method with another method that returns a serializable
     object for ``o`` if possible, otherwise it should call the superclass
-    implementation (to raise ``TypeError``).
+    implementation (to raise ``TypeError``), or register conversion
+    functions for specific classes in ``dispatch_table``.
 
     """
     item_separator = ', '
     key_separator = ': '
+    dispatch_table = None
     def __init__(self, *, skipkeys=False, ensure_ascii=True,
             check_circular=True, allow_nan=True, sort_keys=False,
-            indent=None, separators=None, default=None):
+            indent=None, separators=None, default=None, dispatch_table=None):
         """Constructor for JSONEncoder, with sensible defaults.
 
         If skipkeys is false, then it is a TypeError to attempt
@@ -143,6 +170,12 @@ def __init__(self, *, skipkeys=False, ensure_ascii=True,
         that can't otherwise be serialized.  It should return a JSON encodable
         version of the object or raise a ``TypeError``.
 
+        If specified, dispatch_table is a mapping from classes to functions
+        that get called for their instances, and their subclasses, that can't
+        otherwise be serialized.  They should return a JSON encodable version
+        of the object.  It takes priority over default, and the function used
+        for a given class is looked up only once per call of ``encode()``.
+
         """
 
         self.skipkeys = skipkeys
@@ -157,6 +190,8 @@ def __init__(self, *, skipkeys=False, ensure_ascii=True,
             self.item_separator = ','
         if default is not None:
             self.default = default
+        if dispatch_table is not None:
+            self.dispatch_table = dispatch_table
 
     def default(self, o):
         """Implement this method in a subclass such that it returns
@@ -176,7 +211,15 @@ def default(self, o):
                 # Let the base class default method raise the TypeError
                 return super().default(o)
 
+        The base implementation supports instances of dataclasses and
+        members of enums.
+
         """
+        converter = _builtin_converter(type(o), self.sort_keys)
+        if isinstance(converter, tuple):
+            return {name: getattr(o, name) for name in converter}
+        if converter is not None:
+            return converter(o)
         raise TypeError(f'Object of type {o.__class__.__name__} '
                         f'is not JSON serializable')
 
@@ -212,6 +255,78 @@ def iterencode(self, o, _one_shot=False):
                 mysocket.write(chunk)
 
         """
+        return self._iterencoder(_one_shot)(o, 0)
+
+    def encode_into(self, o, fp):
+        """Encode a Python data structure to JSON and write it encoded
+        with UTF-8 to ``fp``, a ``bytearray`` to which the output is
+        appended or a binary file-like object with a ``.write()`` method.
+
+        The output is written in chunks, without building the whole JSON
+        string first.
+
+        >>> from json.encoder import JSONEncoder
+        >>> buf = bytearray()
+        >>> JSONEncoder().encode_into({"foo": ["bar", "baz"]}, buf)
+        >>> buf
+        bytearray(b'{"foo": ["bar", "baz"]}')
+
+        """
+        if isinstance(fp, bytearray):
+            write = fp.extend
+        else:
+            write = fp.write
+        self._encode_utf8(o, write)
+
+    def _encode_utf8(self, o, write=None):
+        # Return the JSON representation of o encoded with UTF-8, or pass it
+        # in chunks to write() if specified.  The C encoder produces the
+        # bytes directly, unless iterencode() was overridden.
+        if (c_make_encoder is not None and
+                type(self).iterencode is JSONEncoder.iterencode):
+            return self._iterencoder(_one_shot=True).encode_utf8(o, 0, write)
+        chunks = self.iterencode(o, _one_shot=True)
+        if write is None:
+            if not isinstance(chunks, (list, tuple)):
+                chunks = list(chunks)
+            return ''.join(chunks).encode('utf-8', 'surrogatepass')
+        for chunk in chunks:
+            write(chunk.encode('utf-8', 'surrogatepass'))
+
+    def _find_converter(self, cls):
+        # Return the function converting instances of cls which can't
+        # otherwise be serialized, or the tuple of the names of the attributes
+        # to encode as a JSON object.
+        if self.dispatch_table:
+            for base in cls.__mro__:
+                if base in self.dispatch_table:
+                    return self.dispatch_table[base]
+        if self._has_builtin_default():
+            converter = _builtin_converter(cls, self.sort_keys)
+            if converter is not None:
+                return converter
+        return self.default
+
+    def _has_builtin_default(self):
+        return getattr(self.default, '__func__', None) is JSONEncoder.default
+
+    def _caching_default(self):
+        # Return a function converting objects which can't otherwise be
+        # serialized, which only looks up the converter once per class.
+        cache = {}
+        find_converter = self._find_converter
+        def default(o):
+            cls = type(o)
+            try:
+                converter = cache[cls]
+            except KeyError:
+                converter = cache[cls] = find_converter(cls)
+            if isinstance(converter, tuple):
+                return {name: getattr(o, name) for name in converter}
+            return converter(o)
+        return default
+
+    def _iterencoder(self, _one_shot=False):
         if self.check_circular:
             markers = {}
         else:
@@ -248,17 +363,24 @@ def floatstr(o, allow_nan=self.allow_nan,
             indent = self.indent
         else:
             indent = ' ' * self.indent
+        if not self.dispatch_table and not self._has_builtin_default():
+            dispatch = None
+        else:
+            dispatch = self._find_converter
         if _one_shot and c_make_encoder is not None:
             _iterencode = c_make_encoder(
                 markers, self.default, _encoder, indent,
                 self.key_separator, self.item_separator, self.sort_keys,
-                self.skipkeys, self.allow_nan)
+                self.skipkeys, self.allow_nan, dispatch)
         else:
+            _default = self.default
+            if dispatch is not None:
+                _default = self._caching_default()
             _iterencode = _make_iterencode(
-                markers, self.default, _encoder, indent, floatstr,
+                markers, _default, _encoder, indent, floatstr,
                 self.key_separator, self.item_separator, self.sort_keys,
                 self.skipkeys, _one_shot)
-        return _iterencode(o, 0)
+        return _iterencode
 
 def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
         _key_separator, _item_separator, _sort_keys, _skipkeys, _one_shot,
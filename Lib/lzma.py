@@ -21,6 +21,7 @@
     "open", "compress", "decompress", "is_check_supported",
 ]
 
+import binascii
 import builtins
 import io
 import os
@@ -47,7 +48,8 @@ class LZMAFile(_compression.BaseStream):
     """
 
     def __init__(self, filename=None, mode="r", *,
-                 format=None, check=-1, preset=None, filters=None):
+                 format=None, check=-1, preset=None, filters=None,
+                 workers=None):
         """Open an LZMA-compressed file in binary mode.
 
         filename can be either an actual file name (given as a str,
@@ -89,11 +91,20 @@ def __init__(self, filename=None, mode="r", *,
         filters (if provided) should be a sequence of dicts. Each dict
         should have an entry for "id" indicating ID of the filter, plus
         additional entries for options to the filter.
+
+        If workers is given when reading, the streams of a file made of
+        several concatenated .xz streams are decompressed in parallel by
+        that number of threads.
         """
         self._fp = None
         self._closefp = False
         self._mode = None
 
+        if workers is not None:
+            if workers <= 0:
+                raise ValueError("workers must be greater than 0")
+            if mode not in ("r", "rb"):
+                raise ValueError("workers is only supported in read mode")
         if mode in ("r", "rb"):
             if check != -1:
                 raise ValueError("Cannot specify an integrity check "
@@ -127,8 +138,16 @@ def __init__(self, filename=None, mode="r", *,
             raise TypeError("filename must be a str, bytes, file or PathLike object")
 
         if self._mode == _MODE_READ:
-            raw = _compression.DecompressReader(self._fp, LZMADecompressor,
-                trailing_error=LZMAError, format=format, filters=filters)
+            def serial_reader(fp):
+                return _compression.DecompressReader(fp, LZMADecompressor,
+                    trailing_error=LZMAError, format=format, filters=filters)
+            def decompress(data, max_length):
+                return _decompress_streams(data, max_length, format, filters)
+            if workers is not None:
+                raw = _compression.ParallelDecompressReader(self._fp,
+                    workers, _find_stream, decompress, serial_reader)
+            else:
+                raw = serial_reader(self._fp)
             self._buffer = io.BufferedReader(raw)
 
     def close(self):
@@ -336,6 +355,39 @@ def compress(data, format=FORMAT_XZ, check=-1, preset=None, filters=None):
     return comp.compress(data) + comp.flush()
 
 
+def _find_stream(data, start):
+    # Return the offset of the next possible .xz stream header in data,
+    # or -1.  The magic bytes are followed by the stream flags and their
+    # CRC32.
+    while (pos := data.find(b"\xfd7zXZ\x00", start)) >= 0:
+        if pos + 12 > len(data):
+            break
+        if binascii.crc32(data[pos + 6:pos + 8]) == int.from_bytes(
+                data[pos + 8:pos + 12], "little"):
+            return pos
+        start = pos + 1
+    return -1
+
+
+def _decompress_streams(data, max_length, format, filters):
+    # Like decompress(), but fail if the data is not a sequence of
+    # complete streams.  Return None if the decompressed data is larger
+    # than max_length bytes.
+    results = []
+    while data:
+        decomp = LZMADecompressor(format, None, filters)
+        result = decomp.decompress(data, max_length + 1)
+        if len(result) > max_length:
+            return None
+        max_length -= len(result)
+        results.append(result)
+        if not decomp.eof:
+            raise LZMAError("Compressed data ended before the "
+                            "end-of-stream marker was reached")
+        data = decomp.unused_data
+    return b"".join(results)
+
+
 def decompress(data, format=FORMAT_AUTO, memlimit=None, filters=None):
     """Decompress a block of data.
 
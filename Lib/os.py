@@ -293,7 +293,50 @@ def renames(old, new):
 # regular files.
 _walk_symlinks_as_files = object()
 
-def walk(top, topdown=True, onerror=None, followlinks=False):
+def _walk_scandir(top, topdown, followlinks):
+    # Scan the directory top for walk().  Return the names of its
+    # subdirectories and of its other files, and when walking bottom up
+    # also the paths of the subdirectories to walk into.
+    dirs = []
+    nondirs = []
+    walk_dirs = []
+    with scandir(top) as entries:
+        for entry in entries:
+            try:
+                if followlinks is _walk_symlinks_as_files:
+                    is_dir = entry.is_dir(follow_symlinks=False) and not entry.is_junction()
+                else:
+                    is_dir = entry.is_dir()
+            except OSError:
+                # If is_dir() raises an OSError, consider the entry not to
+                # be a directory, same behaviour as os.path.isdir().
+                is_dir = False
+
+            if is_dir:
+                dirs.append(entry.name)
+            else:
+                nondirs.append(entry.name)
+
+            if not topdown and is_dir:
+                # Bottom-up: traverse into sub-directory, but exclude
+                # symlinks to directories if followlinks is False
+                if followlinks:
+                    walk_into = True
+                else:
+                    try:
+                        is_symlink = entry.is_symlink()
+                    except OSError:
+                        # If is_symlink() raises an OSError, consider the
+                        # entry not to be a symbolic link, same behaviour
+                        # as os.path.islink().
+                        is_symlink = False
+                    walk_into = not is_symlink
+
+                if walk_into:
+                    walk_dirs.append(entry.path)
+    return dirs, nondirs, walk_dirs
+
+def walk(top, topdown=True, onerror=None, followlinks=False, *, workers=None):
     """Directory tree generator.
 
     For each directory in the directory tree rooted at top (including top
@@ -336,6 +379,12 @@ def walk(top, topdown=True, onerror=None, followlinks=False):
     systems that support them.  In order to get this functionality, set the
     optional argument 'followlinks' to true.
 
+    If optional arg 'workers' is given, up to that many threads scan the
+    directories which will be visited next while the caller processes the
+    current one.  This hides the latency of os.scandir() on network and
+    FUSE file systems.  The results are generated in the same order as
+    without workers, and onerror is still called from the calling thread.
+
     Caution:  if you pass a relative pathname for top, don't change the
     current working directory between resumptions of walk.  walk never
     changes the current directory, and assumes that the client doesn't
@@ -355,6 +404,13 @@ def walk(top, topdown=True, onerror=None, followlinks=False):
     """
     sys.audit("os.walk", top, topdown, onerror, followlinks)
 
+    if workers is not None:
+        if workers <= 0:
+            raise ValueError("workers must be greater than 0")
+        yield from _walk_parallel(fspath(top), topdown, onerror, followlinks,
+                                  workers)
+        return
+
     stack = [fspath(top)]
     islink, join = path.islink, path.join
     while stack:
@@ -363,50 +419,13 @@ def walk(top, topdown=True, onerror=None, followlinks=False):
             yield top
             continue
 
-        dirs = []
-        nondirs = []
-        walk_dirs = []
-
         # We may not have read permission for top, in which case we can't
         # get a list of the files the directory contains.
         # We suppress the exception here, rather than blow up for a
         # minor reason when (say) a thousand readable directories are still
         # left to visit.
         try:
-            with scandir(top) as entries:
-                for entry in entries:
-                    try:
-                        if followlinks is _walk_symlinks_as_files:
-                            is_dir = entry.is_dir(follow_symlinks=False) and not entry.is_junction()
-                        else:
-                            is_dir = entry.is_dir()
-                    except OSError:
-                        # If is_dir() raises an OSError, consider the entry not to
-                        # be a directory, same behaviour as os.path.isdir().
-                        is_dir = False
-
-                    if is_dir:
-                        dirs.append(entry.name)
-                    else:
-                        nondirs.append(entry.name)
-
-                    if not topdown and is_dir:
-                        # Bottom-up: traverse into sub-directory, but exclude
-                        # symlinks to directories if followlinks is False
-                        if followlinks:
-                            walk_into = True
-                        else:
-                            try:
-                                is_symlink = entry.is_symlink()
-                            except OSError:
-                                # If is_symlink() raises an OSError, consider the
-                                # entry not to be a symbolic link, same behaviour
-                                # as os.path.islink().
-                                is_symlink = False
-                            walk_into = not is_symlink
-
-                        if walk_into:
-                            walk_dirs.append(entry.path)
+            dirs, nondirs, walk_dirs = _walk_scandir(top, topdown, followlinks)
         except OSError as error:
             if onerror is not None:
                 onerror(error)
@@ -431,6 +450,58 @@ def walk(top, topdown=True, onerror=None, followlinks=False):
             for new_path in reversed(walk_dirs):
                 stack.append(new_path)
 
+# The number of directories scanned ahead of walk() per worker thread.
+_WALK_PREFETCH = 4
+
+def _walk_parallel(top, topdown, onerror, followlinks, workers):
+    # The same traversal as walk(), but the directories on the top of the
+    # stack, which are visited next, are scanned ahead in a thread pool.
+    # Stack items are either tuples to yield or [path, future] lists.
+    from concurrent.futures import ThreadPoolExecutor
+
+    islink, join = path.islink, path.join
+    prefetch = _WALK_PREFETCH * workers
+    executor = ThreadPoolExecutor(workers)
+    try:
+        stack = [[top, None]]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, tuple):
+                yield item
+                continue
+
+            top, future = item
+            try:
+                if future is None:
+                    result = _walk_scandir(top, topdown, followlinks)
+                else:
+                    result = future.result()
+            except OSError as error:
+                if onerror is not None:
+                    onerror(error)
+                continue
+            dirs, nondirs, walk_dirs = result
+
+            if topdown:
+                yield top, dirs, nondirs
+                for dirname in reversed(dirs):
+                    new_path = join(top, dirname)
+                    # bpo-23605: see walk().
+                    if followlinks or not islink(new_path):
+                        stack.append([new_path, None])
+            else:
+                stack.append((top, dirs, nondirs))
+                for new_path in reversed(walk_dirs):
+                    stack.append([new_path, None])
+
+            # Start scanning the directories which will be visited next.
+            for item in reversed(stack[-prefetch:]):
+                if isinstance(item, list) and item[1] is None:
+                    item[1] = executor.submit(_walk_scandir, item[0],
+                                              topdown, followlinks)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
 __all__.append("walk")
 
 if {open, stat} <= supports_dir_fd and {scandir, stat} <= supports_fd:
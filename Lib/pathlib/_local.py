@@ -969,13 +969,15 @@ def rglob(self, pattern, *, case_sensitive=None, recurse_symlinks=False):
         pattern = self.parser.join('**', pattern)
         return self.glob(pattern, case_sensitive=case_sensitive, recurse_symlinks=recurse_symlinks)
 
-    def walk(self, top_down=True, on_error=None, follow_symlinks=False):
+    def walk(self, top_down=True, on_error=None, follow_symlinks=False, *,
+             workers=None):
         """Walk the directory tree from this directory, similar to os.walk()."""
         sys.audit("pathlib.Path.walk", self, on_error, follow_symlinks)
         root_dir = str(self)
         if not follow_symlinks:
             follow_symlinks = os._walk_symlinks_as_files
-        results = os.walk(root_dir, top_down, on_error, follow_symlinks)
+        results = os.walk(root_dir, top_down, on_error, follow_symlinks,
+                          workers=workers)
         for path_str, dirnames, filenames in results:
             if root_dir == '.':
                 path_str = path_str[2:]
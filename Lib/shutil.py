@@ -535,7 +535,93 @@ def _ignore_patterns(path, names):
         return set(ignored_names)
     return _ignore_patterns
 
-def _copytree(entries, src, dst, symlinks, ignore, copy_function,
+class _CopyTreeJobs:
+    """Copies the files for copytree(), in a thread pool if workers is given.
+
+    In parallel mode, the metadata of the directories is copied once all
+    their files have been copied, since creating a file modifies it.
+    """
+
+    def __init__(self, copy_function, workers=None, progress=None):
+        self.copy_function = copy_function
+        self.progress = progress
+        self.errors = []
+        self._dirs = []
+        if workers is None:
+            self._executor = None
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(workers)
+            self._pending = collections.deque()
+            # Bound memory usage with huge trees
+            self._max_pending = 64 * workers
+
+    def copy(self, srcobj, srcname, dstname):
+        if self._executor is None:
+            self.copy_function(srcobj, dstname)
+            if self.progress is not None:
+                self.progress(srcname, dstname)
+            return
+        future = self._executor.submit(self.copy_function, srcobj, dstname)
+        self._pending.append((srcname, dstname, future))
+        if len(self._pending) > self._max_pending:
+            self._wait(self._max_pending // 2)
+
+    def _wait(self, limit):
+        # Wait for the oldest copies until at most limit are pending.
+        pending = self._pending
+        while len(pending) > limit:
+            srcname, dstname, future = pending.popleft()
+            try:
+                future.result()
+            except Error as err:
+                self.errors.extend(err.args[0])
+            except OSError as why:
+                self.errors.append((srcname, dstname, str(why)))
+            else:
+                if self.progress is not None:
+                    self.progress(srcname, dstname)
+
+    def copydirstat(self, src, dst, errors):
+        if self._executor is None:
+            _copytree_copystat(src, dst, errors)
+        else:
+            self._dirs.append((src, dst))
+
+    def finish(self):
+        """Wait for all copies and return the list of errors."""
+        if self._executor is not None:
+            self._wait(0)
+            # Directories were added after their subdirectories
+            for src, dst in self._dirs:
+                _copytree_copystat(src, dst, self.errors)
+            self._dirs.clear()
+        return self.errors
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+def _copytree_copystat(src, dst, errors):
+    try:
+        copystat(src, dst)
+    except OSError as why:
+        # Copying file access times may fail on Windows
+        if getattr(why, 'winerror', None) is None:
+            errors.append((src, dst, str(why)))
+
+def _copytree_dir(src, dst, symlinks, ignore, jobs, ignore_dangling_symlinks,
+                  dirs_exist_ok):
+    sys.audit("shutil.copytree", src, dst)
+    with os.scandir(src) as itr:
+        entries = list(itr)
+    return _copytree(entries=entries, src=src, dst=dst, symlinks=symlinks,
+                     ignore=ignore, jobs=jobs,
+                     ignore_dangling_symlinks=ignore_dangling_symlinks,
+                     dirs_exist_ok=dirs_exist_ok)
+
+def _copytree(entries, src, dst, symlinks, ignore, jobs,
               ignore_dangling_symlinks, dirs_exist_ok=False):
     if ignore is not None:
         ignored_names = ignore(os.fspath(src), [x.name for x in entries])
@@ -544,6 +630,7 @@ def _copytree(entries, src, dst, symlinks, ignore, copy_function,
 
     os.makedirs(dst, exist_ok=dirs_exist_ok)
     errors = []
+    copy_function = jobs.copy_function
     use_srcentry = copy_function is copy2 or copy_function is copy
 
     for srcentry in entries:
@@ -574,35 +661,30 @@ def _copytree(entries, src, dst, symlinks, ignore, copy_function,
                         continue
                     # otherwise let the copy occur. copy2 will raise an error
                     if srcentry.is_dir():
-                        copytree(srcobj, dstname, symlinks, ignore,
-                                 copy_function, ignore_dangling_symlinks,
-                                 dirs_exist_ok)
+                        _copytree_dir(srcobj, dstname, symlinks, ignore, jobs,
+                                      ignore_dangling_symlinks, dirs_exist_ok)
                     else:
-                        copy_function(srcobj, dstname)
+                        jobs.copy(srcobj, srcname, dstname)
             elif srcentry.is_dir():
-                copytree(srcobj, dstname, symlinks, ignore, copy_function,
-                         ignore_dangling_symlinks, dirs_exist_ok)
+                _copytree_dir(srcobj, dstname, symlinks, ignore, jobs,
+                              ignore_dangling_symlinks, dirs_exist_ok)
             else:
                 # Will raise a SpecialFileError for unsupported file types
-                copy_function(srcobj, dstname)
+                jobs.copy(srcobj, srcname, dstname)
         # catch the Error from the recursive copytree so that we can
         # continue with other files
         except Error as err:
             errors.extend(err.args[0])
         except OSError as why:
             errors.append((srcname, dstname, str(why)))
-    try:
-        copystat(src, dst)
-    except OSError as why:
-        # Copying file access times may fail on Windows
-        if getattr(why, 'winerror', None) is None:
-            errors.append((src, dst, str(why)))
+    jobs.copydirstat(src, dst, errors)
     if errors:
         raise Error(errors)
     return dst
 
 def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
-             ignore_dangling_symlinks=False, dirs_exist_ok=False):
+             ignore_dangling_symlinks=False, dirs_exist_ok=False, *,
+             workers=None, progress=None):
     """Recursively copy a directory tree and return the destination directory.
 
     If exception(s) occur, an Error is raised with a list of reasons.
@@ -640,14 +722,31 @@ def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
     operation will continue if it encounters existing directories, and files
     within the `dst` tree will be overwritten by corresponding files from the
     `src` tree.
+
+    If workers is given, files are copied concurrently by a pool of that
+    many threads while the tree is being walked, and the metadata of the
+    directories is copied at the end.
+
+    The optional progress argument is a callable which is called with the
+    source and destination paths of every file once it has been copied.
+    It is always called from the thread which called copytree().
     """
-    sys.audit("shutil.copytree", src, dst)
-    with os.scandir(src) as itr:
-        entries = list(itr)
-    return _copytree(entries=entries, src=src, dst=dst, symlinks=symlinks,
-                     ignore=ignore, copy_function=copy_function,
-                     ignore_dangling_symlinks=ignore_dangling_symlinks,
-                     dirs_exist_ok=dirs_exist_ok)
+    if workers is not None and workers <= 0:
+        raise ValueError("workers must be greater than 0")
+    jobs = _CopyTreeJobs(copy_function, workers, progress)
+    try:
+        try:
+            _copytree_dir(src, dst, symlinks, ignore, jobs,
+                          ignore_dangling_symlinks, dirs_exist_ok)
+        except Error as err:
+            errors = err.args[0] + jobs.finish()
+        else:
+            errors = jobs.finish()
+    finally:
+        jobs.close()
+    if errors:
+        raise Error(errors)
+    return dst
 
 if hasattr(os.stat_result, 'st_file_attributes'):
     def _rmtree_islink(st):
@@ -708,7 +807,9 @@ def _rmtree_safe_fd(path, dir_fd, onexc):
     # While the unsafe rmtree works fine on bytes, the fd based does not.
     if isinstance(path, bytes):
         path = os.fsdecode(path)
-    stack = [(os.lstat, dir_fd, path, None)]
+    _rmtree_safe_fd_stack([(os.lstat, dir_fd, path, None)], onexc)
+
+def _rmtree_safe_fd_stack(stack, onexc):
     try:
         while stack:
             _rmtree_safe_fd_step(stack, onexc)
@@ -794,13 +895,188 @@ def _rmtree_safe_fd_step(stack, onexc):
         err.filename = path
         onexc(func, path, err)
 
+# Maximal number of directories removed concurrently by the parallel
+# rmtree(), each of which holds an open file descriptor.
+_RMTREE_MAX_FDS = 256
+
+class _RmtreeDir:
+    __slots__ = ('parent', 'dirfd', 'path', 'entry', 'fd', 'pending',
+                 'remove')
+
+    def __init__(self, parent, dirfd, path, entry):
+        self.parent = parent
+        self.dirfd = dirfd
+        self.path = path
+        self.entry = entry
+        self.fd = None
+        # Own scan and subdirectories being removed concurrently
+        self.pending = 1
+        self.remove = False
+
+class _ParallelRmtree:
+    """Fd-based rmtree() removing subdirectories in a thread pool.
+
+    Every directory is scanned by a task which unlinks its files and
+    submits a new task for each subdirectory.  The directory itself is
+    removed when all these tasks are done.  When _RMTREE_MAX_FDS
+    directories are already open, subdirectories are removed by the
+    current task, like _rmtree_safe_fd() does.
+
+    Calls to onexc are serialized.  If onexc raises an exception, no new
+    work is started and the exception is reraised by run().
+    """
+
+    def __init__(self, onexc, workers):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        self._user_onexc = onexc
+        self._lock = threading.Lock()
+        self._onexc_lock = threading.Lock()
+        self._done = threading.Event()
+        self._executor = ThreadPoolExecutor(workers)
+        self._fds = 1
+        self._error = None
+
+    def run(self, path, dir_fd):
+        try:
+            self._executor.submit(self._scan,
+                                  _RmtreeDir(None, dir_fd, path, None))
+            self._done.wait()
+        except BaseException as exc:
+            # Make the tasks stop and wait for them to close their fds
+            with self._onexc_lock:
+                if self._error is None:
+                    self._error = exc
+            raise
+        finally:
+            self._executor.shutdown()
+        if self._error is not None:
+            try:
+                raise self._error
+            finally:
+                self._error = None
+
+    def _onexc(self, func, path, exc):
+        with self._onexc_lock:
+            if self._error is not None:
+                return
+            try:
+                self._user_onexc(func, path, exc)
+            except BaseException as error:
+                self._error = error
+
+    def _scan(self, node):
+        try:
+            if self._error is None:
+                self._scan_dir(node)
+        except BaseException as error:
+            with self._onexc_lock:
+                if self._error is None:
+                    self._error = error
+        self._release(node)
+
+    def _scan_dir(self, node):
+        # Same as the os.lstat step of _rmtree_safe_fd_step()
+        path = node.path
+        name = path if node.entry is None else node.entry.name
+        subdirs = []
+        func = os.lstat
+        try:
+            if node.entry is None:
+                orig_st = os.lstat(name, dir_fd=node.dirfd)
+            else:
+                orig_st = node.entry.stat(follow_symlinks=False)
+
+            func = os.open  # For error reporting.
+            node.fd = os.open(name, os.O_RDONLY | os.O_NONBLOCK,
+                              dir_fd=node.dirfd)
+
+            func = os.path.islink  # For error reporting.
+            if not os.path.samestat(orig_st, os.fstat(node.fd)):
+                # Symlinks to directories are forbidden, see GH-46010.
+                raise OSError("Cannot call rmtree on a symbolic link")
+            node.remove = True
+
+            func = os.scandir  # For error reporting.
+            with os.scandir(node.fd) as scandir_it:
+                entries = list(scandir_it)
+            for entry in entries:
+                fullname = os.path.join(path, entry.name)
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append((fullname, entry))
+                        continue
+                except FileNotFoundError:
+                    continue
+                except OSError:
+                    pass
+                try:
+                    os.unlink(entry.name, dir_fd=node.fd)
+                except FileNotFoundError:
+                    continue
+                except OSError as err:
+                    self._onexc(os.unlink, fullname, err)
+        except FileNotFoundError as err:
+            if node.entry is None:
+                err.filename = path
+                self._onexc(func, path, err)
+        except OSError as err:
+            err.filename = path
+            self._onexc(func, path, err)
+
+        for fullname, entry in subdirs:
+            if self._error is not None:
+                break
+            with self._lock:
+                parallel = self._fds < _RMTREE_MAX_FDS
+                if parallel:
+                    self._fds += 1
+                    node.pending += 1
+            if parallel:
+                self._executor.submit(
+                    self._scan, _RmtreeDir(node, node.fd, fullname, entry))
+            else:
+                _rmtree_safe_fd_stack([(os.lstat, node.fd, fullname, entry)],
+                                      self._onexc)
+
+    def _release(self, node):
+        # Remove the directories whose subdirectories are all removed.
+        while node is not None:
+            with self._lock:
+                node.pending -= 1
+                if node.pending:
+                    return
+            if node.fd is not None:
+                try:
+                    os.close(node.fd)
+                except OSError as err:
+                    self._onexc(os.close, node.path, err)
+            if node.remove and self._error is None:
+                name = node.path if node.entry is None else node.entry.name
+                try:
+                    os.rmdir(name, dir_fd=node.dirfd)
+                except FileNotFoundError as err:
+                    if node.entry is None:
+                        err.filename = node.path
+                        self._onexc(os.rmdir, node.path, err)
+                except OSError as err:
+                    err.filename = node.path
+                    self._onexc(os.rmdir, node.path, err)
+            if node.parent is None:
+                self._done.set()
+            else:
+                with self._lock:
+                    self._fds -= 1
+            node = node.parent
+
 _use_fd_functions = ({os.open, os.stat, os.unlink, os.rmdir} <=
                      os.supports_dir_fd and
                      os.scandir in os.supports_fd and
                      os.stat in os.supports_follow_symlinks)
 _rmtree_impl = _rmtree_safe_fd if _use_fd_functions else _rmtree_unsafe
 
-def rmtree(path, ignore_errors=False, onerror=None, *, onexc=None, dir_fd=None):
+def rmtree(path, ignore_errors=False, onerror=None, *, onexc=None, dir_fd=None,
+           workers=None):
     """Recursively delete a directory tree.
 
     If dir_fd is not None, it should be a file descriptor open to a directory;
@@ -819,6 +1095,11 @@ def rmtree(path, ignore_errors=False, onerror=None, *, onexc=None, dir_fd=None):
 
     onerror is deprecated and only remains for backwards compatibility.
     If both onerror and onexc are set, onerror is ignored and onexc is used.
+
+    If workers is given and the platform supports the fd-based functions
+    used to avoid symlink attacks, subdirectories are removed concurrently
+    by a pool of that many threads.  Calls to onexc or onerror are then
+    made from these threads, one at a time.
     """
 
     sys.audit("shutil.rmtree", path, dir_fd)
@@ -842,6 +1123,15 @@ def onexc(*args):
                     exc_info = type(exc), exc, exc.__traceback__
                 return onerror(func, path, exc_info)
 
+    if workers is not None:
+        if workers <= 0:
+            raise ValueError("workers must be greater than 0")
+        if _rmtree_impl is _rmtree_safe_fd:
+            # While the unsafe rmtree works fine on bytes, the fd based does not.
+            if isinstance(path, bytes):
+                path = os.fsdecode(path)
+            _ParallelRmtree(onexc, workers).run(path, dir_fd)
+            return
     _rmtree_impl(path, dir_fd, onexc)
 
 # Allow introspection of whether or not the hardening against symlink
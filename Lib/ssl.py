@@ -262,6 +262,7 @@ class _TLSMessageType:
 import socket as _socket
 import base64        # for DER-to-PEM translation
 import errno
+import io
 import warnings
 
 
@@ -274,6 +275,12 @@ class _TLSMessageType:
 
 _RESTRICTED_SERVER_CIPHERS = _DEFAULT_CIPHERS
 
+# Errors of SSL_sendfile() meaning that the file cannot be sent with the
+# sendfile() system call, in which case SSLSocket.sendfile() uses send()
+_SENDFILE_FALLBACK_ERRNOS = frozenset({
+    errno.EINVAL, errno.EOPNOTSUPP, errno.ENOSYS, errno.ESPIPE,
+})
+
 CertificateError = SSLCertVerificationError
 
 
@@ -1267,13 +1274,64 @@ def sendall(self, data, flags=0):
 
     def sendfile(self, file, offset=0, count=None):
         """Send a file, possibly by using os.sendfile() if this is a
-        clear-text socket.  Return the total number of bytes sent.
+        clear-text socket or by using the kernel TLS sendfile() if the
+        connection is offloaded to the kernel.  Return the total number
+        of bytes sent.
         """
-        if self._sslobj is not None:
-            return self._sendfile_use_send(file, offset, count)
-        else:
+        if self._sslobj is None:
             # os.sendfile() works with plain sockets only
             return super().sendfile(file, offset, count)
+        if (self._sslobj.uses_ktls_for_send()
+                and hasattr(self._sslobj, 'sendfile')):
+            try:
+                return self._sendfile_use_ssl_sendfile(file, offset, count)
+            except _socket._GiveupOnSendfile:
+                pass
+        return self._sendfile_use_send(file, offset, count)
+
+    def _sendfile_use_ssl_sendfile(self, file, offset=0, count=None):
+        self._check_sendfile_params(file, offset, count)
+        if self.gettimeout() == 0:
+            raise ValueError("non-blocking sockets are not supported")
+        try:
+            fileno = file.fileno()
+        except (AttributeError, io.UnsupportedOperation) as err:
+            raise _socket._GiveupOnSendfile(err)  # not a regular file
+        try:
+            fsize = os.fstat(fileno).st_size
+        except OSError as err:
+            raise _socket._GiveupOnSendfile(err)  # not a regular file
+        if not fsize:
+            return 0  # empty file
+        # Truncate to 1GiB to avoid OverflowError, see bpo-38319.
+        blocksize = min(count or fsize, 2 ** 30)
+        total_sent = 0
+        # localize variable access to minimize overhead
+        ssl_sendfile = self._sslobj.sendfile
+        try:
+            while True:
+                if count:
+                    blocksize = min(count - total_sent, blocksize)
+                    if blocksize <= 0:
+                        break
+                # The timeout of the socket is handled by sendfile().
+                try:
+                    sent = ssl_sendfile(fileno, offset, blocksize)
+                except OSError as err:
+                    if (total_sent == 0 and not isinstance(err, SSLError)
+                            and err.errno in _SENDFILE_FALLBACK_ERRNOS):
+                        # 'file' is not a regular mmap(2)-like file, fall
+                        # back on encrypting the data with send().
+                        raise _socket._GiveupOnSendfile(err)
+                    raise
+                if sent == 0:
+                    break  # EOF
+                offset += sent
+                total_sent += sent
+            return total_sent
+        finally:
+            if total_sent > 0 and hasattr(file, 'seek'):
+                file.seek(offset)
 
     def recv(self, buflen=1024, flags=0):
         self._checkClosed()
@@ -339,9 +339,12 @@ class _Stream:
     """
 
     def __init__(self, name, mode, comptype, fileobj, bufsize,
-                 compresslevel):
+                 compresslevel, workers=None):
         """Construct a _Stream object.
         """
+        if workers is not None and (comptype != "gz" or mode != "w"):
+            raise ValueError("workers is only supported for writing "
+                             "gzip compressed streams")
         self._extfileobj = True
         if fileobj is None:
             fileobj = _LowLevelFile(name, mode)
@@ -374,7 +377,7 @@ def __init__(self, name, mode, comptype, fileobj, bufsize,
                     self.exception = zlib.error
                     self._init_read_gz()
                 else:
-                    self._init_write_gz(compresslevel)
+                    self._init_write_gz(compresslevel, workers)
 
             elif comptype == "bz2":
                 try:
@@ -413,14 +416,18 @@ def __del__(self):
         if hasattr(self, "closed") and not self.closed:
             self.close()
 
-    def _init_write_gz(self, compresslevel):
+    def _init_write_gz(self, compresslevel, workers=None):
         """Initialize for writing with gzip compression.
         """
-        self.cmp = self.zlib.compressobj(compresslevel,
-                                         self.zlib.DEFLATED,
-                                         -self.zlib.MAX_WBITS,
-                                         self.zlib.DEF_MEM_LEVEL,
-                                         0)
+        if workers is not None:
+            from gzip import _ParallelCompressor
+            self.cmp = _ParallelCompressor(compresslevel, workers)
+        else:
+            self.cmp = self.zlib.compressobj(compresslevel,
+                                             self.zlib.DEFLATED,
+                                             -self.zlib.MAX_WBITS,
+                                             self.zlib.DEF_MEM_LEVEL,
+                                             0)
         timestamp = struct.pack("<L", int(time.time()))
         self.__write(b"\037\213\010\010" + timestamp + b"\002\377")
         if self.name.endswith(".gz"):
@@ -1887,8 +1894,9 @@ def not_compressed(comptype):
                 raise ValueError("mode must be 'r' or 'w'")
 
             compresslevel = kwargs.pop("compresslevel", 9)
+            workers = kwargs.pop("workers", None)
             stream = _Stream(name, filemode, comptype, fileobj, bufsize,
-                             compresslevel)
+                             compresslevel, workers)
             try:
                 t = cls(name, filemode, stream, **kwargs)
             except:
@@ -1911,9 +1919,11 @@ def taropen(cls, name, mode="r", fileobj=None, **kwargs):
         return cls(name, mode, fileobj, **kwargs)
 
     @classmethod
-    def gzopen(cls, name, mode="r", fileobj=None, compresslevel=9, **kwargs):
+    def gzopen(cls, name, mode="r", fileobj=None, compresslevel=9,
+               workers=None, **kwargs):
         """Open gzip compressed tar archive name for reading or writing.
-           Appending is not allowed.
+           Appending is not allowed.  If workers is given when writing, the
+           archive is compressed in parallel by that number of threads.
         """
         if mode not in ("r", "w", "x"):
             raise ValueError("mode must be 'r', 'w' or 'x'")
@@ -1924,7 +1934,8 @@ def gzopen(cls, name, mode="r", fileobj=None, compresslevel=9, **kwargs):
             raise CompressionError("gzip module is not available") from None
 
         try:
-            fileobj = GzipFile(name, mode + "b", compresslevel, fileobj)
+            fileobj = GzipFile(name, mode + "b", compresslevel, fileobj,
+                               workers=workers)
         except OSError as e:
             if fileobj is not None and mode == 'r':
                 raise ReadError("not a gzip file") from e
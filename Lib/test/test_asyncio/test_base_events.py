@@ -2,6 +2,7 @@
 
 import concurrent.futures
 import errno
+import heapq
 import math
 import platform
 import socket
@@ -412,6 +413,41 @@ def cb(loop):
         self.assertTrue(processed)
         self.assertEqual([handle], list(self.loop._ready))
 
+    def test__run_once_timer_wheel(self):
+        self.loop._process_events = mock.Mock()
+        self.loop._run_once()
+        calls = []
+
+        # Short delays go to the timer wheel, long delays to the heap.
+        h1 = self.loop.call_later(0.3, calls.append, 1)
+        h2 = self.loop.call_later(0.2, calls.append, 2)
+        h3 = self.loop.call_later(0.2, calls.append, 3)
+        h4 = self.loop.call_later(0.1, calls.append, 4)
+        h4.cancel()
+        self.assertEqual(self.loop._timer_wheel.count, 4)
+        self.assertEqual(self.loop._timer_cancelled_count, 1)
+        h5 = self.loop.call_later(10.0, calls.append, 5)
+        self.assertEqual(self.loop._scheduled, [h5])
+        # Timers of the heap and of the wheel run in order.
+        h6 = asyncio.TimerHandle(h2.when() + 0.05, calls.append, (6,),
+                                 self.loop, None)
+        heapq.heappush(self.loop._scheduled, h6)
+
+        self.loop._run_once()
+        t = self.loop._selector.select.call_args[0][0]
+        self.assertTrue(0.05 < t <= 0.1, t)
+
+        with mock.patch.object(self.loop, 'time',
+                               return_value=h1.when() + 0.01):
+            self.loop._run_once()
+        self.assertEqual(calls, [2, 3, 6, 1])
+        self.assertEqual(self.loop._timer_wheel.count, 0)
+        self.assertEqual(self.loop._timer_cancelled_count, 0)
+        self.assertEqual(self.loop._scheduled, [h5])
+        self.assertFalse(h1._scheduled)
+        self.assertFalse(h4._scheduled)
+        self.assertTrue(h5._scheduled)
+
     def test__run_once_cancelled_event_cleanup(self):
         self.loop._process_events = mock.Mock()
 
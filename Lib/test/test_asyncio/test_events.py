@@ -2375,6 +2375,17 @@ class SelectEventLoopTests(EventLoopTestsMixin,
         def create_event_loop(self):
             return asyncio.SelectorEventLoop(selectors.SelectSelector())
 
+    if hasattr(asyncio, 'UringEventLoop'):
+        class UringEventLoopTests(EventLoopTestsMixin,
+                                  SubprocessTestsMixin,
+                                  test_utils.TestCase):
+
+            def create_event_loop(self):
+                try:
+                    return asyncio.UringEventLoop()
+                except OSError as exc:
+                    self.skipTest(f'io_uring is not available: {exc}')
+
 
 def noop(*args, **kwargs):
     pass
@@ -0,0 +1,246 @@
+"""Tests for pools.py"""
+
+import asyncio
+import unittest
+from test.test_asyncio import utils as test_utils
+from test.support import socket_helper
+
+try:
+    import ssl
+except ImportError:
+    ssl = None
+
+
+def tearDownModule():
+    asyncio._set_event_loop_policy(None)
+
+
+class ConnectionPoolTests(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.accepted = 0
+        self.server = await asyncio.start_server(
+            self.handle_client, socket_helper.HOSTv4, 0)
+        self.addAsyncCleanup(self.close_server, self.server)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def close_server(self, server):
+        server.close()
+        server.close_clients()
+        await server.wait_closed()
+
+    async def handle_client(self, reader, writer):
+        # Echo lines, prefixed with the number of the connection.
+        self.accepted += 1
+        number = self.accepted
+        try:
+            while line := await reader.readline():
+                if line == b'close\n':
+                    break
+                writer.write(b'%d:%s' % (number, line))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def make_pool(self, **kwargs):
+        pool = asyncio.ConnectionPool(**kwargs)
+        self.addAsyncCleanup(pool.close)
+        return pool
+
+    async def request(self, reader, writer, data):
+        writer.write(data + b'\n')
+        return await reader.readline()
+
+    async def test_reuse(self):
+        pool = self.make_pool()
+        for _ in range(3):
+            async with pool.connection(socket_helper.HOSTv4,
+                                       self.port) as (reader, writer):
+                self.assertEqual(await self.request(reader, writer, b'a'),
+                                 b'1:a\n')
+        self.assertEqual(self.accepted, 1)
+        self.assertIn('idle=1', repr(pool))
+
+    async def test_concurrent_connections(self):
+        pool = self.make_pool()
+        conn1 = await pool.acquire(socket_helper.HOSTv4, self.port)
+        conn2 = await pool.acquire(socket_helper.HOSTv4, self.port)
+        self.assertIsNot(conn1[1], conn2[1])
+        self.assertIn('in_use=2', repr(pool))
+        pool.release(conn1[1])
+        pool.release(conn2[1])
+        # The most recently released connection is reused first.
+        reader, writer = await pool.acquire(socket_helper.HOSTv4, self.port)
+        self.assertIs(writer, conn2[1])
+        pool.release(writer)
+        with self.assertRaises(ValueError):
+            pool.release(writer)
+
+    async def test_max_size(self):
+        pool = self.make_pool(max_size=1)
+        reader, writer = await pool.acquire(socket_helper.HOSTv4, self.port)
+        task = asyncio.create_task(
+            pool.acquire(socket_helper.HOSTv4, self.port))
+        await asyncio.sleep(0.01)
+        self.assertFalse(task.done())
+        pool.release(writer)
+        reader2, writer2 = await task
+        self.assertIs(writer2, writer)
+        # A discarded connection frees a slot for a new connection.
+        task = asyncio.create_task(
+            pool.acquire(socket_helper.HOSTv4, self.port))
+        await asyncio.sleep(0.01)
+        self.assertFalse(task.done())
+        pool.release(writer2, discard=True)
+        reader3, writer3 = await task
+        self.assertIsNot(writer3, writer)
+        self.assertTrue(writer.is_closing())
+        pool.release(writer3)
+        with self.assertRaises(ValueError):
+            asyncio.ConnectionPool(max_size=0)
+
+    async def test_max_size_cancelled_waiter(self):
+        pool = self.make_pool(max_size=1)
+        reader, writer = await pool.acquire(socket_helper.HOSTv4, self.port)
+        task1 = asyncio.create_task(
+            pool.acquire(socket_helper.HOSTv4, self.port))
+        task2 = asyncio.create_task(
+            pool.acquire(socket_helper.HOSTv4, self.port))
+        await asyncio.sleep(0)
+        pool.release(writer)
+        task1.cancel()
+        reader2, writer2 = await task2
+        self.assertIs(writer2, writer)
+        self.assertTrue(task1.cancelled())
+        pool.release(writer2)
+
+    async def test_discard_on_error(self):
+        pool = self.make_pool()
+        with self.assertRaises(ZeroDivisionError):
+            async with pool.connection(socket_helper.HOSTv4,
+                                       self.port) as (reader, writer):
+                1/0
+        self.assertTrue(writer.is_closing())
+        async with pool.connection(socket_helper.HOSTv4,
+                                   self.port) as (reader, writer):
+            self.assertEqual(await self.request(reader, writer, b'a'),
+                             b'2:a\n')
+
+    async def test_unread_data_not_reused(self):
+        pool = self.make_pool()
+        async with pool.connection(socket_helper.HOSTv4,
+                                   self.port) as (reader, writer):
+            writer.write(b'a\n')
+            await reader.readexactly(2)
+        self.assertTrue(writer.is_closing())
+        self.assertNotIn('idle', repr(pool))
+
+    async def test_closed_by_peer(self):
+        pool = self.make_pool()
+        async with pool.connection(socket_helper.HOSTv4,
+                                   self.port) as (reader, writer):
+            writer.write(b'close\n')
+        self.assertEqual(await reader.read(), b'')
+        async with pool.connection(socket_helper.HOSTv4,
+                                   self.port) as (reader2, writer2):
+            self.assertIsNot(writer2, writer)
+            self.assertEqual(await self.request(reader2, writer2, b'a'),
+                             b'2:a\n')
+        self.assertTrue(writer.is_closing())
+
+    async def test_health_check(self):
+        checked = []
+
+        async def health_check(reader, writer):
+            checked.append(writer)
+            return await self.request(reader, writer, b'ping') != b'1:ping\n'
+
+        pool = self.make_pool(health_check=health_check)
+        async with pool.connection(socket_helper.HOSTv4,
+                                   self.port) as (reader, writer):
+            pass
+        self.assertEqual(checked, [])
+        async with pool.connection(socket_helper.HOSTv4,
+                                   self.port) as (reader2, writer2):
+            self.assertIsNot(writer2, writer)
+        self.assertEqual(checked, [writer])
+        self.assertTrue(writer.is_closing())
+        async with pool.connection(socket_helper.HOSTv4,
+                                   self.port) as (reader3, writer3):
+            self.assertIs(writer3, writer2)
+        self.assertEqual(checked, [writer, writer2])
+
+    async def test_idle_timeout(self):
+        pool = self.make_pool(idle_timeout=0.01)
+        async with pool.connection(socket_helper.HOSTv4,
+                                   self.port) as (reader, writer):
+            pass
+        self.assertIn('idle=1', repr(pool))
+        await asyncio.sleep(0.05)
+        self.assertTrue(writer.is_closing())
+        self.assertNotIn('idle', repr(pool))
+        self.assertEqual(pool._pools, {})
+
+    async def test_max_connecting(self):
+        pool = self.make_pool(max_connecting=1)
+        connections = await asyncio.gather(*[
+            pool.acquire(socket_helper.HOSTv4, self.port) for _ in range(3)])
+        self.assertEqual(len({writer for reader, writer in connections}), 3)
+        for reader, writer in connections:
+            pool.release(writer)
+        with self.assertRaises(ValueError):
+            asyncio.ConnectionPool(max_connecting=0)
+
+    async def test_connection_error(self):
+        pool = self.make_pool(max_size=1)
+        port = socket_helper.find_unused_port()
+        for _ in range(2):
+            with self.assertRaises(OSError):
+                await pool.acquire(socket_helper.HOSTv4, port)
+        self.assertEqual(pool._pools, {})
+
+    async def test_close(self):
+        pool = asyncio.ConnectionPool(max_size=1)
+        async with pool:
+            reader, writer = await pool.acquire(socket_helper.HOSTv4,
+                                                self.port)
+            waiter = asyncio.create_task(
+                pool.acquire(socket_helper.HOSTv4, self.port))
+            await asyncio.sleep(0)
+        self.assertTrue(pool.is_closed())
+        with self.assertRaisesRegex(RuntimeError, 'closed'):
+            await waiter
+        with self.assertRaisesRegex(RuntimeError, 'closed'):
+            await pool.acquire(socket_helper.HOSTv4, self.port)
+        self.assertFalse(writer.is_closing())
+        pool.release(writer)
+        self.assertTrue(writer.is_closing())
+
+    @unittest.skipIf(ssl is None, 'No ssl module')
+    async def test_tls_reuse(self):
+        tls_server = await asyncio.start_server(
+            self.handle_client, socket_helper.HOSTv4, 0,
+            ssl=test_utils.simple_server_sslcontext())
+        self.addAsyncCleanup(self.close_server, tls_server)
+        port = tls_server.sockets[0].getsockname()[1]
+        client_context = test_utils.simple_client_sslcontext()
+        pool = self.make_pool()
+        for _ in range(2):
+            async with pool.connection(socket_helper.HOSTv4, port,
+                                       ssl=client_context) as (reader, writer):
+                self.assertIsNotNone(writer.get_extra_info('ssl_object'))
+                self.assertEqual(await self.request(reader, writer, b'a'),
+                                 b'1:a\n')
+        self.assertEqual(self.accepted, 1)
+        # A different TLS context is a different destination.
+        async with pool.connection(
+                socket_helper.HOSTv4, port,
+                ssl=test_utils.simple_client_sslcontext()) as (reader, writer):
+            self.assertEqual(await self.request(reader, writer, b'a'),
+                             b'2:a\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
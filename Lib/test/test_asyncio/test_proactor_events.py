@@ -1,5 +1,6 @@
 """Tests for proactor_events.py"""
 
+import errno
 import io
 import socket
 import unittest
@@ -336,6 +337,21 @@ def test_call_connection_lost(self):
         self.assertTrue(self.protocol.connection_lost.called)
         self.assertTrue(self.sock.close.called)
 
+    def test_call_connection_lost_shutdown_enotconn(self):
+        tr = self.socket_transport()
+        self.sock.shutdown.side_effect = OSError(errno.ENOTCONN, 'ENOTCONN')
+        tr._call_connection_lost(None)
+        self.assertTrue(self.protocol.connection_lost.called)
+        self.assertTrue(self.sock.close.called)
+
+    def test_call_connection_lost_shutdown_error(self):
+        tr = self.socket_transport()
+        self.sock.shutdown.side_effect = OSError(errno.EBADF, 'EBADF')
+        with self.assertRaises(OSError):
+            tr._call_connection_lost(None)
+        self.assertTrue(self.protocol.connection_lost.called)
+        self.assertFalse(self.sock.close.called)
+
     def test_write_eof(self):
         tr = self.socket_transport()
         self.assertTrue(tr.can_write_eof())
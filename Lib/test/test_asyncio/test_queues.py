@@ -432,6 +432,116 @@ async def test_cancelled_put_silence_value_error_exception(self):
             await put_task
 
 
+class QueueBatchTests(unittest.IsolatedAsyncioTestCase):
+
+    def test_nonblocking_get_many(self):
+        q = asyncio.Queue()
+        self.assertRaises(asyncio.QueueEmpty, q.get_many_nowait)
+        q.put_many_nowait(range(5))
+        self.assertEqual(q.get_many_nowait(2), [0, 1])
+        self.assertEqual(q.get_many_nowait(), [2, 3, 4])
+        self.assertRaises(asyncio.QueueEmpty, q.get_many_nowait, 1)
+        self.assertRaises(ValueError, q.get_many_nowait, 0)
+
+    async def test_get_many_order(self):
+        for q_class, expected in [(asyncio.Queue, [1, 3, 2]),
+                                  (asyncio.LifoQueue, [2, 3, 1]),
+                                  (asyncio.PriorityQueue, [1, 2, 3])]:
+            with self.subTest(q_class=q_class):
+                q = q_class()
+                await q.put_many([1, 3, 2])
+                self.assertEqual(await q.get_many(), expected)
+
+    async def test_get_many_wait(self):
+        q = asyncio.Queue()
+        task = asyncio.create_task(q.get_many(10))
+        await asyncio.sleep(0)
+        self.assertFalse(task.done())
+        q.put_many_nowait([1, 2, 3])
+        self.assertEqual(await task, [1, 2, 3])
+        with self.assertRaises(ValueError):
+            await q.get_many(-1)
+
+    async def test_get_many_wakes_up_putters(self):
+        q = asyncio.Queue(2)
+        q.put_many_nowait([1, 2])
+        putters = [asyncio.create_task(q.put(i)) for i in (3, 4, 5)]
+        await asyncio.sleep(0)
+        self.assertEqual(q.get_many_nowait(), [1, 2])
+        await asyncio.sleep(0)
+        self.assertEqual(sum(t.done() for t in putters), 2)
+        self.assertEqual(q.get_many_nowait(), [3, 4])
+        await asyncio.sleep(0)
+        self.assertEqual(q.get_many_nowait(), [5])
+        await asyncio.gather(*putters)
+
+    async def test_put_many_wakes_up_getters(self):
+        q = asyncio.Queue()
+        getters = [asyncio.create_task(q.get()) for _ in range(3)]
+        await asyncio.sleep(0)
+        q.put_many_nowait([1, 2])
+        await asyncio.sleep(0)
+        self.assertEqual(sorted(t.result() for t in getters if t.done()),
+                         [1, 2])
+        q.put_nowait(3)
+        self.assertEqual(sorted(await asyncio.gather(*getters)), [1, 2, 3])
+
+    def test_nonblocking_put_many_full(self):
+        q = asyncio.Queue(3)
+        q.put_nowait(0)
+        self.assertRaises(asyncio.QueueFull, q.put_many_nowait, [1, 2, 3])
+        self.assertEqual(q.qsize(), 1)
+        q.put_many_nowait(iter([1, 2]))
+        self.assertEqual(q.get_many_nowait(), [0, 1, 2])
+
+    async def test_put_many_wait(self):
+        q = asyncio.Queue(2)
+        task = asyncio.create_task(q.put_many(range(5)))
+        await asyncio.sleep(0)
+        self.assertFalse(task.done())
+        self.assertEqual(q.get_many_nowait(), [0, 1])
+        await asyncio.sleep(0)
+        self.assertEqual(q.get_many_nowait(), [2, 3])
+        await asyncio.sleep(0)
+        self.assertEqual(q.get_many_nowait(), [4])
+        await task
+        self.assertTrue(q.empty())
+
+    async def test_put_many_cancelled(self):
+        q = asyncio.Queue(2)
+        task = asyncio.create_task(q.put_many([1, 2, 3]))
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(q.get_many_nowait(), [1, 2])
+        self.assertFalse(q._putters)
+
+    async def test_task_done(self):
+        q = asyncio.Queue()
+        await q.put_many([1, 2, 3])
+        self.assertEqual(q._unfinished_tasks, 3)
+        for item in await q.get_many():
+            q.task_done()
+        await q.join()
+
+    async def test_shutdown(self):
+        q = asyncio.Queue(1)
+        q.put_nowait(1)
+        putter = asyncio.create_task(q.put_many([2, 3]))
+        await asyncio.sleep(0)
+        q.shutdown()
+        with self.assertRaises(asyncio.QueueShutDown):
+            await putter
+        with self.assertRaises(asyncio.QueueShutDown):
+            q.put_many_nowait([4])
+        self.assertEqual(await q.get_many(), [1])
+        with self.assertRaises(asyncio.QueueShutDown):
+            await q.get_many()
+        with self.assertRaises(asyncio.QueueShutDown):
+            q.get_many_nowait()
+
+
 class LifoQueueTests(unittest.IsolatedAsyncioTestCase):
 
     async def test_order(self):
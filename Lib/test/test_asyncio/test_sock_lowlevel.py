@@ -674,6 +674,16 @@ class SelectEventLoopTests(BaseSockTestsMixin,
         def create_event_loop(self):
             return asyncio.SelectorEventLoop(selectors.SelectSelector())
 
+    if hasattr(asyncio, 'UringEventLoop'):
+        class UringEventLoopTests(BaseSockTestsMixin,
+                                  test_utils.TestCase):
+
+            def create_event_loop(self):
+                try:
+                    return asyncio.UringEventLoop()
+                except OSError as exc:
+                    self.skipTest(f'io_uring is not available: {exc}')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,6 @@
 """Tests for streams.py."""
 
+import array
 import gc
 import os
 import queue
@@ -586,6 +587,103 @@ def test_readexactly_exception(self):
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readexactly(2))
 
+    def test_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(10)
+        read_task = self.loop.create_task(stream.readinto(buf))
+
+        def cb():
+            stream.feed_data(b'line1\nline2\n')
+        self.loop.call_soon(cb)
+
+        n = self.loop.run_until_complete(read_task)
+        self.assertEqual(n, 10)
+        self.assertEqual(buf, b'line1\nline')
+        self.assertEqual(b'2\n', stream._buffer)
+
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 2)
+        self.assertEqual(buf, b'2\nne1\nline')
+        self.assertEqual(b'', stream._buffer)
+
+        stream.feed_eof()
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 0)
+
+    def test_readinto_buffers(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        n = self.loop.run_until_complete(stream.readinto(bytearray()))
+        self.assertEqual(n, 0)
+        self.assertEqual(self.DATA, stream._buffer)
+
+        buf = array.array('i', [0, 0])
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 8)
+        self.assertEqual(buf.tobytes(), self.DATA[:8])
+
+        with self.assertRaises(TypeError):
+            self.loop.run_until_complete(stream.readinto(b'readonly'))
+        self.assertEqual(self.DATA[8:], stream._buffer)
+
+    def test_readinto_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.set_exception(ValueError())
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete,
+            stream.readinto(bytearray(2)))
+
+    def test_readexactly_into(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(2 * len(self.DATA))
+        read_task = self.loop.create_task(stream.readexactly_into(buf))
+
+        def cb():
+            stream.feed_data(self.DATA)
+            stream.feed_data(self.DATA)
+            stream.feed_data(self.DATA)
+        self.loop.call_soon(cb)
+
+        self.assertIsNone(self.loop.run_until_complete(read_task))
+        self.assertEqual(self.DATA + self.DATA, buf)
+        self.assertEqual(self.DATA, stream._buffer)
+
+        view = memoryview(bytearray(b'xxxx'))
+        self.loop.run_until_complete(stream.readexactly_into(view[1:3]))
+        self.assertEqual(view, b'x' + self.DATA[:2] + b'x')
+
+    def test_readexactly_into_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(2 * len(self.DATA))
+        read_task = self.loop.create_task(stream.readexactly_into(buf))
+
+        def cb():
+            stream.feed_data(self.DATA)
+            stream.feed_eof()
+        self.loop.call_soon(cb)
+
+        with self.assertRaises(asyncio.IncompleteReadError) as cm:
+            self.loop.run_until_complete(read_task)
+        self.assertEqual(cm.exception.partial, self.DATA)
+        self.assertEqual(cm.exception.expected, len(buf))
+        self.assertEqual(bytes(len(buf)), buf)
+        self.assertEqual(b'', stream._buffer)
+
+    def test_readexactly_into_limit(self):
+        stream = asyncio.StreamReader(limit=3, loop=self.loop)
+        stream.feed_data(b'chunk')
+        buf = bytearray(5)
+        self.loop.run_until_complete(stream.readexactly_into(buf))
+        self.assertEqual(b'chunk', buf)
+        self.assertEqual(b'', stream._buffer)
+
+    def test_readexactly_into_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.set_exception(ValueError())
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete,
+            stream.readexactly_into(bytearray(2)))
+
     def test_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
         self.assertIsNone(stream.exception())
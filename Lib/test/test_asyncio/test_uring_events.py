@@ -0,0 +1,189 @@
+import errno
+import os
+import socket
+import unittest
+
+from test import support
+from test.support import import_helper
+
+_uring = import_helper.import_module('_uring')
+
+import asyncio
+from asyncio import uring_events
+from test.test_asyncio import utils as test_utils
+
+
+def tearDownModule():
+    asyncio._set_event_loop_policy(None)
+
+
+class RingTests(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            self.ring = _uring.Ring(8)
+        except OSError as exc:
+            self.skipTest(f'io_uring is not available: {exc}')
+        self.addCleanup(self.ring.close)
+
+    def wait(self, count):
+        completed = []
+        while len(completed) < count:
+            completed += self.ring.wait(support.SHORT_TIMEOUT)
+        return completed
+
+    def test_recv_send(self):
+        a, b = socket.socketpair()
+        self.addCleanup(a.close)
+        self.addCleanup(b.close)
+        recv = self.ring.recv(a.fileno(), 100)
+        send = self.ring.send(b.fileno(), b'spam')
+        self.assertEqual(self.ring.pending, 2)
+        self.assertEqual(sorted(self.wait(2)),
+                         sorted([(recv, 4, b'spam'), (send, 4, None)]))
+        self.assertEqual(self.ring.pending, 0)
+
+        buf = bytearray(10)
+        recv = self.ring.recv_into(a.fileno(), buf)
+        self.ring.send(b.fileno(), b'eggs')
+        self.assertIn((recv, 4, None), self.wait(2))
+        self.assertEqual(buf[:4], b'eggs')
+
+    def test_read_write(self):
+        r, w = os.pipe()
+        self.addCleanup(os.close, r)
+        self.addCleanup(os.close, w)
+        write = self.ring.write(w, b'ham')
+        self.assertEqual(self.wait(1), [(write, 3, None)])
+        read = self.ring.read(r, 10)
+        self.assertEqual(self.wait(1), [(read, 3, b'ham')])
+
+    def test_cancel(self):
+        a, b = socket.socketpair()
+        self.addCleanup(a.close)
+        self.addCleanup(b.close)
+        recv = self.ring.recv(a.fileno(), 100)
+        self.assertEqual(self.ring.wait(0), [])
+        self.ring.cancel(recv)
+        self.assertEqual(self.wait(1), [(recv, -errno.ECANCELED, None)])
+
+    def test_errors(self):
+        r, w = os.pipe()
+        os.close(w)
+        self.addCleanup(os.close, r)
+        write = self.ring.write(r, b'x')
+        self.assertEqual(self.wait(1), [(write, -errno.EBADF, None)])
+        with self.assertRaises(ValueError):
+            self.ring.wait(-1)
+
+    def test_close(self):
+        self.assertFalse(self.ring.closed)
+        self.ring.close()
+        self.assertTrue(self.ring.closed)
+        self.ring.close()
+        with self.assertRaises(ValueError):
+            self.ring.read(0, 1)
+        with self.assertRaises(ValueError):
+            self.ring.fileno()
+
+
+class ProactorTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        try:
+            self.loop = uring_events.UringEventLoop()
+        except OSError as exc:
+            self.skipTest(f'io_uring is not available: {exc}')
+        self.set_event_loop(self.loop)
+        self.proactor = self.loop._proactor
+
+    def socketpair(self):
+        a, b = socket.socketpair()
+        self.addCleanup(a.close)
+        self.addCleanup(b.close)
+        a.setblocking(False)
+        b.setblocking(False)
+        return a, b
+
+    def test_send_partial_writes(self):
+        a, b = self.socketpair()
+        a.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        data = os.urandom(1024 * 1024)
+
+        async def recv_all():
+            chunks = []
+            size = 0
+            while size < len(data):
+                chunk = await self.proactor.recv(b, 65536)
+                chunks.append(chunk)
+                size += len(chunk)
+            return b''.join(chunks)
+
+        async def main():
+            send = self.proactor.send(a, data)
+            received = await recv_all()
+            self.assertEqual(await send, len(data))
+            self.assertEqual(received, data)
+
+        self.loop.run_until_complete(main())
+
+    def test_cancel(self):
+        a, b = self.socketpair()
+
+        async def main():
+            fut = self.proactor.recv(a, 100)
+            await asyncio.sleep(0)
+            fut.cancel()
+            await asyncio.sleep(0)
+            self.assertTrue(fut.cancelled())
+            b.send(b'data')
+            # The data is not consumed by the cancelled operation.
+            self.assertEqual(await self.proactor.recv(a, 100), b'data')
+
+        self.loop.run_until_complete(main())
+
+    def test_close_with_pending_operations(self):
+        a, b = self.socketpair()
+        fut = self.proactor.recv(a, 100)
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.proactor.close()
+        self.assertTrue(fut.cancelled())
+        self.assertEqual(self.proactor._cache, {})
+        self.assertTrue(self.proactor._ring is None)
+
+    def test_pipe(self):
+        r, w = os.pipe()
+        rfile = open(r, 'rb', buffering=0)
+        wfile = open(w, 'wb', buffering=0)
+        self.addCleanup(rfile.close)
+        self.addCleanup(wfile.close)
+
+        async def main():
+            self.assertEqual(await self.proactor.send(wfile, b'spam'), 4)
+            self.assertEqual(await self.proactor.recv(rfile, 100), b'spam')
+
+        self.loop.run_until_complete(main())
+
+    def test_reader_rearmed(self):
+        a, b = self.socketpair()
+        received = []
+
+        def reader():
+            data = a.recv(100)
+            received.append(data)
+            if len(received) == 3:
+                self.loop.remove_reader(a)
+                self.loop.stop()
+            else:
+                b.send(b'x')
+
+        self.loop.add_reader(a, reader)
+        b.send(b'x')
+        self.loop.run_forever()
+        self.assertEqual(received, [b'x'] * 3)
+        self.assertFalse(self.loop.remove_reader(a))
+
+
+if __name__ == '__main__':
+    unittest.main()
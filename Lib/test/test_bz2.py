@@ -146,6 +146,35 @@ def testReadMultiStreamTrailingJunk(self):
         with BZ2File(self.filename) as bz2f:
             self.assertEqual(bz2f.read(), self.TEXT * 5)
 
+    def testReadMultiStreamWorkers(self):
+        with support.swap_attr(_compression, 'PARALLEL_SEGMENT_SIZE', 100):
+            for workers in 1, 3:
+                self.createTempFile(streams=20)
+                with BZ2File(self.filename, workers=workers) as bz2f:
+                    self.assertEqual(bz2f.read(), self.TEXT * 20)
+                    bz2f.seek(len(self.TEXT) * 5 + 10)
+                    self.assertEqual(bz2f.read(10), self.TEXT[10:20])
+                self.createTempFile(streams=20, suffix=self.BAD_DATA)
+                with BZ2File(self.filename, workers=workers) as bz2f:
+                    self.assertEqual(bz2f.read(), self.TEXT * 20)
+                self.createTempFile(streams=20, suffix=self.DATA[:-10])
+                with BZ2File(self.filename, workers=workers) as bz2f:
+                    self.assertRaises(EOFError, bz2f.read)
+
+    def testReadMultiStreamWorkersLargeOutput(self):
+        large = bytes(100_000)
+        with open(self.filename, 'wb') as f:
+            f.write(self.DATA * 5 + bz2.compress(large) + self.DATA * 5)
+        with (support.swap_attr(_compression, 'PARALLEL_SEGMENT_SIZE', 100),
+              support.swap_attr(_compression, 'PARALLEL_MAX_OUTPUT', 50_000)):
+            with BZ2File(self.filename, workers=2) as bz2f:
+                self.assertEqual(bz2f.read(),
+                                 self.TEXT * 5 + large + self.TEXT * 5)
+
+    def testWorkersErrors(self):
+        self.assertRaises(ValueError, BZ2File, BytesIO(), workers=0)
+        self.assertRaises(ValueError, BZ2File, BytesIO(), 'w', workers=2)
+
     def testRead0(self):
         self.createTempFile()
         with BZ2File(self.filename) as bz2f:
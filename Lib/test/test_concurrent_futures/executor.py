@@ -1,3 +1,4 @@
+import itertools
 import threading
 import time
 import weakref
@@ -6,6 +7,9 @@
 from test.support import Py_GIL_DISABLED
 
 
+def add(x, y):
+    return x + y
+
 def mul(x, y):
     return x * y
 
@@ -49,6 +53,87 @@ def test_map(self):
                 list(self.executor.map(pow, range(10), range(10), chunksize=3)),
                 list(map(pow, range(10), range(10))))
 
+    def test_map_buffersize_type_validation(self):
+        for buffersize in ("foo", 2.0):
+            with self.subTest(buffersize=buffersize):
+                with self.assertRaisesRegex(
+                    TypeError,
+                    "buffersize must be an integer or None",
+                ):
+                    self.executor.map(str, range(4), buffersize=buffersize)
+
+    def test_map_buffersize_value_validation(self):
+        for buffersize in (0, -1):
+            with self.subTest(buffersize=buffersize):
+                with self.assertRaisesRegex(
+                    ValueError,
+                    "buffersize must be None or > 0",
+                ):
+                    self.executor.map(str, range(4), buffersize=buffersize)
+
+    def test_map_buffersize(self):
+        ints = range(4)
+        for buffersize in (1, 2, len(ints), len(ints) * 2):
+            with self.subTest(buffersize=buffersize):
+                res = self.executor.map(str, ints, buffersize=buffersize)
+                self.assertListEqual(list(res), ["0", "1", "2", "3"])
+
+    def test_map_buffersize_on_multiple_iterables(self):
+        ints = range(4)
+        for buffersize in (1, 2, len(ints), len(ints) * 2):
+            with self.subTest(buffersize=buffersize):
+                res = self.executor.map(add, ints, ints, buffersize=buffersize)
+                self.assertListEqual(list(res), [0, 2, 4, 6])
+
+    def test_map_buffersize_on_infinite_iterable(self):
+        res = self.executor.map(str, itertools.count(), buffersize=2)
+        self.assertEqual(next(res, None), "0")
+        self.assertEqual(next(res, None), "1")
+        self.assertEqual(next(res, None), "2")
+
+    def test_map_buffersize_on_empty_iterable(self):
+        res = self.executor.map(str, [], buffersize=2)
+        self.assertIsNone(next(res, None))
+
+    def test_map_buffersize_pulls_lazily(self):
+        pulled = []
+
+        def ints():
+            for i in range(10):
+                pulled.append(i)
+                yield i
+
+        res = self.executor.map(str, ints(), buffersize=2)
+        self.assertEqual(len(pulled), 2)
+        self.assertEqual(next(res), "0")
+        self.assertEqual(len(pulled), 3)
+        self.assertEqual(list(res), [str(i) for i in range(1, 10)])
+
+    def test_map_buffersize_without_executor_reference(self):
+        # The result iterator stops submitting tasks once the executor
+        # is collected, but yields the results of the submitted tasks.
+        executor = self.executor_type(max_workers=1)
+        res = executor.map(str, itertools.count(), buffersize=2)
+        executor.shutdown(wait=True)
+        del executor
+        support.gc_collect()  # For PyPy or other GCs.
+        self.assertEqual(list(res), ["0", "1"])
+
+    def test_map_unordered(self):
+        for buffersize in (None, 1, 3):
+            with self.subTest(buffersize=buffersize):
+                res = self.executor.map(mul, range(10), range(10),
+                                        buffersize=buffersize, ordered=False)
+                self.assertCountEqual(list(res), [i * i for i in range(10)])
+        res = self.executor.map(mul, range(10), range(10), chunksize=3,
+                                ordered=False)
+        self.assertCountEqual(list(res), [i * i for i in range(10)])
+
+    def test_map_unordered_exception(self):
+        res = self.executor.map(divmod, [1, 1], [0, 0], ordered=False)
+        with self.assertRaises(ZeroDivisionError):
+            next(res)
+
     def test_map_exception(self):
         i = self.executor.map(divmod, [1, 1, 1, 1], [2, 3, 0, 5])
         self.assertEqual(i.__next__(), (0, 1))
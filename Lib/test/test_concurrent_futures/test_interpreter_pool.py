@@ -1,3 +1,4 @@
+import array
 import asyncio
 import contextlib
 import io
@@ -47,6 +48,14 @@ def get_current_interpid(*extra):
     return (interpid, *extra)
 
 
+def echo(*args):
+    return args
+
+
+def fill(view, value):
+    view[:] = bytes([value]) * len(view)
+
+
 class InterpretersMixin(InterpreterPoolMixin):
 
     def pipe(self):
@@ -289,6 +298,59 @@ def test_idle_thread_reuse(self):
         self.assertEqual(len(executor._threads), 1)
         executor.shutdown(wait=True)
 
+    def test_submit_buffers(self):
+        executor = self.executor_type()
+        large = bytes(range(256)) * 16
+        for obj in [
+            b'spam',
+            large,
+            bytearray(b'spam'),
+            bytearray(large),
+            array.array('i', [1, 2, 3]),
+            array.array('d', range(1000)),
+            [large, bytearray(large), {'a': array.array('q', range(1000))}],
+        ]:
+            with self.subTest(obj=type(obj)):
+                res, = executor.submit(echo, obj).result()
+                self.assertEqual(res, obj)
+                self.assertIs(type(res), type(obj))
+                self.assertIsNot(res, obj)
+
+        # An object referenced several times is rebuilt once.
+        obj = bytearray(large)
+        res = executor.submit(echo, [obj, obj]).result()
+        self.assertIs(res[0][0], res[0][1])
+        executor.shutdown(wait=True)
+
+    def test_submit_mutable_buffers(self):
+        # The bytearray and array.array arguments are copied when the call
+        # is submitted: they can be resized, and their later changes are
+        # not seen by the call.
+        executor = self.executor_type()
+        large = bytes(range(256)) * 16
+        for obj, more in [(bytearray(large), b'spam'),
+                          (array.array('d', range(1000)), [1.0])]:
+            with self.subTest(obj=type(obj)):
+                expected = obj[:]
+                future = executor.submit(echo, obj)
+                obj[1] = obj[0]
+                obj.extend(more)
+                res, = future.result()
+                self.assertEqual(res, expected)
+        executor.shutdown(wait=True)
+
+    def test_submit_memoryview(self):
+        # The memoryviews passed as arguments share their memory with the
+        # worker interpreter.
+        executor = self.executor_type()
+        for data in [bytearray(10), bytearray(10_000)]:
+            executor.submit(fill, memoryview(data), 42).result()
+            self.assertEqual(data, bytes([42]) * len(data))
+        data = array.array('d', range(1000))
+        res, = executor.submit(echo, memoryview(data)).result()
+        self.assertEqual(res.tolist(), data.tolist())
+        executor.shutdown(wait=True)
+
     def test_pickle_errors_propagate(self):
         # GH-125864: Pickle errors happen before the script tries to execute, so the
         # queue used to wait infinitely.
@@ -1,4 +1,6 @@
+import array
 import os
+import pickle
 import sys
 import threading
 import time
@@ -9,7 +11,7 @@
 from test import support
 from test.support import hashlib_helper
 
-from .executor import ExecutorTest, mul
+from .executor import ExecutorTest, capture, mul
 from .util import (
     ProcessPoolForkMixin, ProcessPoolForkserverMixin, ProcessPoolSpawnMixin,
     create_executor_tests, setup_module)
@@ -23,6 +25,13 @@ def __del__(self):
         self.event.set()
 
 
+def make_unpicklable_result(size):
+    return bytes(size), lambda: None
+
+def get_pid_and_imported(name):
+    return os.getpid(), name in sys.modules
+
+
 class ProcessPoolExecutorTest(ExecutorTest):
 
     @unittest.skipUnless(sys.platform=='win32', 'Windows-only process limit')
@@ -190,6 +199,129 @@ def test_max_tasks_early_shutdown(self):
         for i, future in enumerate(futures):
             self.assertEqual(future.result(), mul(i, i))
 
+    def test_shared_memory_threshold_invalid(self):
+        with self.assertRaises(TypeError):
+            self.executor_type(1, mp_context=self.get_context(),
+                               shared_memory_threshold=1.5)
+        for threshold in (0, -1):
+            with self.assertRaises(ValueError):
+                self.executor_type(1, mp_context=self.get_context(),
+                                   shared_memory_threshold=threshold)
+
+    def test_shared_memory_dump(self):
+        from concurrent.futures.process import (
+            _dump_to_shared_memory, _load_from_shared_memory)
+        small = b'x' * 100
+        data, shm, layout = _dump_to_shared_memory((small,), 1000)
+        self.assertIsNone(shm)
+        self.assertEqual(_load_from_shared_memory(data, None, layout, True),
+                         (small,))
+
+        large = b'y' * 1000
+        data, shm, layout = _dump_to_shared_memory((small, large), 1000)
+        self.assertIsNotNone(shm)
+        self.assertNotIn(large, data)
+        self.assertEqual(shm.size, len(large))
+        shm.close()
+        self.assertEqual(_load_from_shared_memory(data, shm.name, layout,
+                                                  True),
+                         (small, large))
+
+    def test_shared_memory(self):
+        executor = self.executor_type(2, mp_context=self.get_context(),
+                                      shared_memory_threshold=1000)
+        data = bytes(range(256)) * 100
+        values = [
+            data,
+            bytearray(data),
+            memoryview(data),
+            memoryview(array.array('d', range(2000))),
+            memoryview(bytes(6000)).cast('i', (30, 50)),
+            b'small',
+            {'nested': [data, (bytearray(data), b'')]},
+        ]
+        for value in values:
+            with self.subTest(value=value):
+                args, kwargs = executor.submit(capture, value,
+                                               key=value).result()
+                for result in (args[0], kwargs['key']):
+                    self.assertIs(type(result), type(value))
+                    self.assertEqual(result, value)
+                    if isinstance(value, memoryview):
+                        self.assertEqual(result.format, value.format)
+                        self.assertEqual(result.shape, value.shape)
+        # Objects with out-of-band buffers of their own.
+        for value in (pickle.PickleBuffer(data),
+                      pickle.PickleBuffer(bytearray(data))):
+            args, _ = executor.submit(capture, value).result()
+            self.assertEqual(bytes(args[0]), data)
+
+        results = executor.map(capture, [data] * 10, chunksize=3)
+        self.assertEqual([args for args, _ in results], [(data,)] * 10)
+        executor.shutdown()
+        self.assertEqual(executor._shared_memory_segments, {})
+
+    def test_shared_memory_unpicklable_result(self):
+        executor = self.executor_type(1, mp_context=self.get_context(),
+                                      shared_memory_threshold=1000)
+        future = executor.submit(make_unpicklable_result, 2000)
+        with self.assertRaises(Exception):
+            future.result()
+        self.assertEqual(executor.submit(mul, 2, 3).result(), 6)
+        executor.shutdown()
+        self.assertEqual(executor._shared_memory_segments, {})
+
+    def test_preload_modules(self):
+        context = self.get_context()
+        with self.assertRaises(TypeError):
+            self.executor_type(1, mp_context=context, preload_modules=[1])
+        executor = self.executor_type(1, mp_context=context,
+                                      preload_modules=['colorsys'])
+        _, imported = executor.submit(get_pid_and_imported,
+                                      'colorsys').result()
+        self.assertTrue(imported)
+        executor.shutdown()
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'need the forkserver')
+    def test_preload_modules_defaults_to_forkserver_context(self):
+        from multiprocessing import forkserver
+        preload = forkserver._forkserver._preload_modules
+        self.addCleanup(forkserver.set_forkserver_preload, preload)
+        # not using self.executor as we need to control construction.
+        executor = self.executor_type(1, preload_modules=['colorsys'])
+        self.assertEqual(executor._mp_context.get_start_method(),
+                         "forkserver")
+        self.assertEqual(forkserver._forkserver._preload_modules,
+                         [*dict.fromkeys([*preload, 'colorsys'])])
+
+    def test_spare_workers(self):
+        context = self.get_context()
+        for spare_workers in (-1, 1.0):
+            with self.assertRaises((TypeError, ValueError)):
+                self.executor_type(1, mp_context=context,
+                                   spare_workers=spare_workers)
+        if context.get_start_method(allow_none=False) == "fork":
+            with self.assertRaises(ValueError):
+                self.executor_type(1, mp_context=context, spare_workers=1)
+            return
+        # not using self.executor as we need to control construction.
+        executor = self.executor_type(
+                1, mp_context=context, max_tasks_per_child=1,
+                spare_workers=2)
+        f1 = executor.submit(time.sleep, 0.1)
+        # The worker and the spare workers are started on the first call.
+        started = set(executor._processes)
+        self.assertEqual(len(started), 3)
+        f1.result()
+        # The spare workers replace the workers which exit.
+        pid2, _ = executor.submit(get_pid_and_imported, 'os').result()
+        pid3, _ = executor.submit(get_pid_and_imported, 'os').result()
+        self.assertIn(pid2, started)
+        self.assertIn(pid3, started)
+        self.assertNotEqual(pid2, pid3)
+        self.assertLessEqual(len(executor._processes), 3)
+        executor.shutdown()
+
     def test_python_finalization_error(self):
         # gh-109047: Catch RuntimeError on thread creation
         # during Python finalization.
@@ -4,6 +4,7 @@
 import multiprocessing.util
 import os
 import threading
+import time
 import unittest
 from concurrent import futures
 from test import support
@@ -23,6 +24,28 @@ def record_finished(n):
         self.executor.shutdown(wait=True)
         self.assertCountEqual(finished, range(10))
 
+    def test_map_unordered_yields_as_completed(self):
+        event = threading.Event()
+
+        def wait_for_event(i):
+            if i == 0:
+                event.wait(support.SHORT_TIMEOUT)
+            return i
+
+        res = self.executor.map(wait_for_event, range(3), ordered=False)
+        self.assertCountEqual([next(res), next(res)], [1, 2])
+        event.set()
+        self.assertEqual(list(res), [0])
+
+    def test_map_unordered_timeout(self):
+        event = threading.Event()
+        self.addCleanup(event.set)
+        res = self.executor.map(event.wait, [support.SHORT_TIMEOUT, 0],
+                                timeout=0.1, ordered=False)
+        self.assertFalse(next(res))
+        with self.assertRaises(futures.TimeoutError):
+            next(res)
+
     def test_default_workers(self):
         executor = self.executor_type()
         expected = min(32, (os.process_cpu_count() or 1) + 4)
@@ -113,6 +136,94 @@ def log_n_wait(ident):
         self.assertListEqual(log, ["ident='first' started", "ident='first' stopped"])
 
 
+class ThreadPoolWorkStealingTest(ThreadPoolMixin, ExecutorTest, BaseTestCase):
+    executor_kwargs = {'work_stealing': True}
+
+    def test_local_work_items_lifo(self):
+        executor = self.executor_type(1, work_stealing=True)
+        order = []
+        def parent():
+            return [executor.submit(order.append, i) for i in range(3)]
+        for f in executor.submit(parent).result():
+            f.result()
+        self.assertEqual(order, [2, 1, 0])
+        executor.shutdown(wait=True)
+
+    def test_steal_from_waiting_worker(self):
+        executor = self.executor_type(2, work_stealing=True)
+        def parent():
+            # The child is in the deque of this worker: the other worker
+            # must steal it.
+            return executor.submit(mul, 6, 7).result(support.SHORT_TIMEOUT)
+        # Start both workers, so that the other worker is idle.
+        barrier = threading.Barrier(2)
+        for f in [executor.submit(barrier.wait) for _ in range(2)]:
+            f.result()
+        for _ in range(20):
+            self.assertEqual(executor.submit(parent).result(), 42)
+        executor.shutdown(wait=True)
+
+    def test_fan_out(self):
+        executor = self.executor_type(4, work_stealing=True)
+        total = sum(3 ** i for i in range(6))
+        done = []
+        lock = threading.Lock()
+        finished = threading.Event()
+        def node(depth):
+            if depth:
+                for _ in range(3):
+                    executor.submit(node, depth - 1)
+            with lock:
+                done.append(depth)
+                if len(done) == total:
+                    finished.set()
+        executor.submit(node, 5)
+        self.assertTrue(finished.wait(support.SHORT_TIMEOUT))
+        executor.shutdown(wait=True)
+        self.assertEqual(len(done), total)
+        self.assertEqual(executor._work_queue._idle, 0)
+        self.assertEqual(executor._work_queue._wakeups, 0)
+
+    def test_submit_from_worker_after_shutdown(self):
+        executor = self.executor_type(1, work_stealing=True)
+        started = threading.Event()
+        resume = threading.Event()
+        def parent():
+            child = executor.submit(mul, 2, 3)
+            started.set()
+            resume.wait(support.SHORT_TIMEOUT)
+            with self.assertRaises(RuntimeError):
+                executor.submit(mul, 2, 3)
+            return child
+        f = executor.submit(parent)
+        started.wait(support.SHORT_TIMEOUT)
+        t = threading.Thread(target=executor.shutdown)
+        t.start()
+        while not executor._shutdown:
+            time.sleep(0.001)
+        resume.set()
+        t.join()
+        # The work items submitted before shutdown are run.
+        self.assertEqual(f.result().result(), 6)
+
+    def test_cancel_futures_local(self):
+        executor = self.executor_type(1, work_stealing=True)
+        started = threading.Event()
+        resume = threading.Event()
+        def parent():
+            children = [executor.submit(mul, 2, 3) for _ in range(3)]
+            started.set()
+            resume.wait(support.SHORT_TIMEOUT)
+            return children
+        f = executor.submit(parent)
+        started.wait(support.SHORT_TIMEOUT)
+        executor.shutdown(wait=False, cancel_futures=True)
+        resume.set()
+        for child in f.result():
+            self.assertTrue(child.cancelled())
+        executor.shutdown(wait=True)
+
+
 def setUpModule():
     setup_module()
 
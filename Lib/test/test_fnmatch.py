@@ -5,7 +5,7 @@
 import string
 import warnings
 
-from fnmatch import fnmatch, fnmatchcase, translate, filter
+from fnmatch import fnmatch, fnmatchcase, translate, filter, PatternSet
 
 class FnmatchTestCase(unittest.TestCase):
 
@@ -346,5 +346,65 @@ def test_sep(self):
                          ['usr/bin', 'usr\\lib'] if normsep else ['usr\\lib'])
 
 
+class PatternSetTestCase(unittest.TestCase):
+
+    patterns = ['abc', '', '*', '**', '*.py', '**.c', 'test_*', 'x**',
+                '*ab*', 'a?c', '[!a]*', '*.[ch]', 'foo*bar', 'a\nb']
+    names = ['abc', '', 'x', 'a.py', 'a.pyc', 'b.c', 'test_x', 'test',
+             'xab', 'aab', 'a.h', 'fooxbar', 'a\nb', 'Abc', 'A.PY',
+             '.py\n']
+
+    def test_match(self):
+        for i in range(len(self.patterns)):
+            for j in range(i + 1, len(self.patterns) + 1):
+                patterns = self.patterns[i:j]
+                patternset = PatternSet(patterns)
+                for name in self.names:
+                    with self.subTest(patterns=patterns, name=name):
+                        self.assertIs(patternset.match(name),
+                                      any(fnmatch(name, pat)
+                                          for pat in patterns))
+
+    def test_case_sensitive(self):
+        ignorecase = os.path.normcase('P') == os.path.normcase('p')
+        for pattern, name in [('*.py', 'ABC.PY'), ('abc', 'ABC'),
+                              ('a*', 'ABC.PY'), ('[a]bc', 'ABC')]:
+            with self.subTest(pattern=pattern):
+                self.assertIs(PatternSet([pattern]).match(name), ignorecase)
+                self.assertFalse(PatternSet([pattern], case_sensitive=True)
+                                 .match(name))
+                self.assertTrue(PatternSet([pattern], case_sensitive=False)
+                                .match(name))
+        patternset = PatternSet(['ABC'], case_sensitive=True)
+        self.assertTrue(patternset.match('ABC'))
+        self.assertFalse(patternset.match('abc'))
+
+    def test_empty(self):
+        patternset = PatternSet([])
+        self.assertFalse(patternset.match('abc'))
+        self.assertFalse(patternset.match(''))
+        self.assertEqual(len(patternset), 0)
+
+    def test_filter(self):
+        patternset = PatternSet(['P*', '*l'])
+        self.assertEqual(patternset.filter(['Python', 'Ruby', 'Perl', 'Tcl']),
+                         ['Python', 'Perl', 'Tcl'])
+        self.assertEqual(patternset.patterns, ('P*', '*l'))
+        self.assertEqual(len(patternset), 2)
+        self.assertEqual(repr(patternset), "PatternSet(['P*', '*l'])")
+
+    def test_bytes(self):
+        patternset = PatternSet([b'te*', b'*\xff', b'a?c', b'x'])
+        self.assertEqual(patternset.filter([b'test', b'a\xff', b'abc', b'x',
+                                            b'y', b'ab']),
+                         [b'test', b'a\xff', b'abc', b'x'])
+
+    def test_mix_bytes_str(self):
+        self.assertRaises(TypeError, PatternSet, ['a', b'b'])
+        self.assertRaises(TypeError, PatternSet(['a*']).match, b'a')
+        self.assertRaises(TypeError, PatternSet([b'*a']).match, 'a')
+        self.assertRaises(TypeError, PatternSet([b'a?']).match, 'ab')
+
+
 if __name__ == "__main__":
     unittest.main()
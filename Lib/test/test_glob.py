@@ -394,6 +394,81 @@ def test_glob_many_open_files(self):
             for it in iters:
                 self.assertEqual(next(it), p)
 
+    def test_globmany(self):
+        patterns = ['*', '?', 'a*', '*/', '*/*', 'a/**', '**/EF', '**/*F',
+                    '**', '**/', 'a/**/', '**/**/E*', '.*', 'a/bcd/*/ha',
+                    'a/*/*', 'nonexistent/*']
+        for recursive in (False, True):
+            for include_hidden in (False, True):
+                kwargs = dict(root_dir=self.tempdir, recursive=recursive,
+                              include_hidden=include_hidden)
+                with self.subTest(**kwargs):
+                    result = glob.globmany(patterns, **kwargs)
+                    self.assertEqual(list(result), patterns)
+                    for pattern in patterns:
+                        expected = set(glob.glob(pattern, **kwargs))
+                        self.assertEqual(len(result[pattern]), len(expected))
+                        self.assertEqual(set(result[pattern]), expected)
+
+    def test_globmany_bytes(self):
+        result = glob.globmany([b'a*', b'**/EF'], root_dir=os.fsencode(self.tempdir),
+                               recursive=True)
+        self.assertCountEqual(result[b'a*'], [b'a', b'aaa', b'aab'])
+        self.assertCountEqual(result[b'**/EF'],
+                              [b'EF', os.path.join(b'a', b'bcd', b'EF')] +
+                              ([os.path.join(b'sym3', b'EF')]
+                               if can_symlink() else []))
+
+    def test_iglobmany(self):
+        with change_cwd(self.tempdir):
+            pairs = list(glob.iglobmany(['a*', '*a', 'Z*']))
+        self.assertCountEqual(pairs, [('a*', 'a'), ('a*', 'aaa'), ('a*', 'aab'),
+                                      ('*a', 'a'), ('*a', 'aaa'), ('Z*', 'ZZZ')])
+
+    def test_globmany_exclude(self):
+        result = glob.globmany(['**/*F', '**'], exclude=['a', '*/zzz*'],
+                               root_dir=self.tempdir, recursive=True)
+        self.assertCountEqual(result['**/*F'],
+                              [os.path.join('aab', 'F'), 'EF'] +
+                              ([os.path.join('sym3', 'EF')]
+                               if can_symlink() else []))
+        self.assertNotIn('a', result['**'])
+        self.assertNotIn(os.path.join('a', 'D'), result['**'])
+        self.assertNotIn(os.path.join('aaa', 'zzzF'), result['**'])
+        self.assertIn('aaa', result['**'])
+
+        result = glob.globmany(['*'], exclude=['a*/'], root_dir=self.tempdir)
+        self.assertCountEqual(result['*'], ['ZZZ', 'EF'] +
+                              (['sym1', 'sym2', 'sym3'] if can_symlink() else []))
+
+    def test_globmany_prunes(self):
+        scanned = []
+        def scandir(path):
+            scanned.append(path)
+            return real_scandir(path)
+        real_scandir = os.scandir
+        with support.swap_attr(os, 'scandir', scandir):
+            result = glob.globmany(['a/bcd/*', 'aa?/*F'],
+                                   root_dir=self.tempdir)
+        self.assertCountEqual(result['a/bcd/*'],
+                              [os.path.join('a', 'bcd', 'EF'),
+                               os.path.join('a', 'bcd', 'efg')])
+        self.assertCountEqual(result['aa?/*F'],
+                              [os.path.join('aab', 'F'),
+                               os.path.join('aaa', 'zzzF')])
+        self.assertCountEqual(scanned,
+                              [self.tempdir,
+                               os.path.join(self.tempdir, 'a'),
+                               os.path.join(self.tempdir, 'a', 'bcd'),
+                               os.path.join(self.tempdir, 'aaa'),
+                               os.path.join(self.tempdir, 'aab')])
+
+    def test_globmany_errors(self):
+        with self.assertRaises(ValueError):
+            glob.globmany([os.path.abspath('a')])
+        with self.assertRaises(ValueError):
+            glob.globmany(['a/../b'])
+
     def test_glob0(self):
         with self.assertWarns(DeprecationWarning):
             glob.glob0(self.tempdir, 'a')
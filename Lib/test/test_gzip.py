@@ -1,14 +1,17 @@
 """Test script for the gzip module.
 """
 
+import _compression
 import array
 import functools
 import io
 import os
+import random
 import struct
 import sys
 import unittest
 from subprocess import PIPE, Popen
+from test import support
 from test.support import import_helper
 from test.support import os_helper
 from test.support import _4G, bigmemtest, requires_subprocess
@@ -858,6 +861,204 @@ def test_write_seek_write(self):
         data = b.getvalue()
         self.assertEqual(gzip.decompress(data), message * 2)
 
+    def test_write_workers(self):
+        data = b''.join(b'%d\n' % i for i in range(200_000))
+        outputs = []
+        for workers in 1, 2, 4:
+            with self.subTest(workers=workers):
+                b = io.BytesIO()
+                with gzip.GzipFile(fileobj=b, mode='w', mtime=0,
+                                   workers=workers) as f:
+                    for i in range(0, len(data), 10_000):
+                        chunk = data[i:i + 10_000]
+                        self.assertEqual(f.write(chunk), len(chunk))
+                    self.assertEqual(f.tell(), len(data))
+                self.assertEqual(gzip.decompress(b.getvalue()), data)
+                outputs.append(b.getvalue())
+        # The output does not depend on the number of threads
+        self.assertEqual(outputs[1], outputs[0])
+        self.assertEqual(outputs[2], outputs[0])
+
+    def test_write_workers_flush(self):
+        b = io.BytesIO()
+        with gzip.GzipFile(fileobj=b, mode='w', workers=2) as f:
+            f.write(data1)
+            f.flush()
+            d = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+            partial = io.BytesIO(b.getvalue())
+            gzip._read_gzip_header(partial)
+            self.assertEqual(d.decompress(partial.read()), data1)
+            f.write(data2)
+            f.flush(zlib.Z_FULL_FLUSH)
+            f.write(data1 * 10_000)
+        self.assertEqual(gzip.decompress(b.getvalue()),
+                         data1 + data2 + data1 * 10_000)
+
+    def test_write_workers_empty(self):
+        b = io.BytesIO()
+        with gzip.GzipFile(fileobj=b, mode='w', workers=2):
+            pass
+        self.assertEqual(gzip.decompress(b.getvalue()), b'')
+
+    def test_bad_workers(self):
+        for workers in 0, -1:
+            with self.assertRaises(ValueError):
+                gzip.GzipFile(self.filename, 'wb', workers=workers)
+        self.assertFalse(os.path.exists(self.filename))
+
+    def make_members(self, count):
+        rand = random.Random(0)
+        members = [b''.join(b'%d %s\n' % (i, rand.randbytes(rand.randrange(20)).hex().encode())
+                            for i in range(rand.randrange(1, 500)))
+                   for _ in range(count)]
+        compressed = b''.join(gzip.compress(member, mtime=i)
+                              for i, member in enumerate(members))
+        return members, compressed
+
+    def test_read_workers(self):
+        members, compressed = self.make_members(50)
+        data = b''.join(members)
+        with support.swap_attr(_compression, 'PARALLEL_SEGMENT_SIZE', 1000):
+            for workers in 1, 2, 4:
+                with self.subTest(workers=workers):
+                    f = gzip.GzipFile(fileobj=io.BytesIO(compressed),
+                                      workers=workers)
+                    with f:
+                        self.assertEqual(f.read(100), data[:100])
+                        self.assertEqual(f.read(), data[100:])
+                        self.assertEqual(f.mtime, 49)
+                        f.seek(5000)
+                        self.assertEqual(f.read(100), data[5000:5100])
+                        f.seek(-10, io.SEEK_END)
+                        self.assertEqual(f.read(), data[-10:])
+
+    def test_read_workers_large_member(self):
+        # Members larger than PARALLEL_MAX_SEGMENT are read sequentially
+        members, compressed = self.make_members(20)
+        data = b''.join(members)
+        with (support.swap_attr(_compression, 'PARALLEL_SEGMENT_SIZE', 100),
+              support.swap_attr(_compression, 'PARALLEL_MAX_SEGMENT', 200)):
+            with gzip.GzipFile(fileobj=io.BytesIO(compressed), workers=2) as f:
+                self.assertEqual(f.read(), data)
+                self.assertEqual(f.mtime, 19)
+
+    def test_read_workers_large_output(self):
+        # Members decompressing to more than PARALLEL_MAX_OUTPUT bytes are
+        # read sequentially
+        members, compressed = self.make_members(10)
+        data = b''.join(members)
+        large = bytes(100_000)
+        with (support.swap_attr(_compression, 'PARALLEL_SEGMENT_SIZE', 100),
+              support.swap_attr(_compression, 'PARALLEL_MAX_OUTPUT', 50_000)):
+            with gzip.GzipFile(fileobj=io.BytesIO(compressed +
+                                                  gzip.compress(large) +
+                                                  compressed),
+                               workers=2) as f:
+                self.assertEqual(f.read(), data + large + data)
+
+    def test_read_workers_false_boundary(self):
+        # A gzip header inside the compressed data of a member
+        members, compressed = self.make_members(10)
+        data = b''.join(members)
+        member = gzip.compress(b'\x1f\x8b\x08\x00' * 1000, compresslevel=0)
+        with support.swap_attr(_compression, 'PARALLEL_SEGMENT_SIZE', 100):
+            with gzip.GzipFile(fileobj=io.BytesIO(member + compressed),
+                               workers=2) as f:
+                self.assertEqual(f.read(), b'\x1f\x8b\x08\x00' * 1000 + data)
+
+    def test_read_workers_errors(self):
+        members, compressed = self.make_members(20)
+        with support.swap_attr(_compression, 'PARALLEL_SEGMENT_SIZE', 100):
+            corrupted = bytearray(compressed)
+            corrupted[len(compressed) // 2] ^= 0x55
+            for data, exc in [(compressed + b'garbage', gzip.BadGzipFile),
+                              (compressed[:-10], EOFError),
+                              (corrupted, (gzip.BadGzipFile, zlib.error))]:
+                with gzip.GzipFile(fileobj=io.BytesIO(data), workers=2) as f:
+                    self.assertRaises(exc, f.read)
+        index = gzip.GzipIndex.build(io.BytesIO(compressed))
+        with self.assertRaises(ValueError):
+            gzip.GzipFile(fileobj=io.BytesIO(compressed), index=index,
+                          workers=2)
+
+    def make_index_data(self):
+        rand = random.Random(0)
+        data = b''.join(b'%d %s\n' % (i, rand.randbytes(rand.randrange(20)).hex().encode())
+                        for i in range(30000))
+        with gzip.GzipFile(self.filename, 'wb') as f:
+            f.write(data[:300000])
+        with gzip.GzipFile(self.filename, 'ab') as f:
+            f.write(data[300000:])
+        return data
+
+    def test_index_seek(self):
+        data = self.make_index_data()
+        index = gzip.GzipIndex.build(self.filename, span=10000)
+        self.assertEqual(index.size, len(data))
+        self.assertEqual(index.compressed_size, os.path.getsize(self.filename))
+        self.assertGreater(len(index), 10)
+        rand = random.Random(1)
+        with gzip.GzipFile(self.filename, index=index) as f:
+            for i in range(100):
+                offset = rand.randrange(len(data) + 100)
+                size = rand.randrange(10000)
+                f.seek(offset)
+                self.assertEqual(f.tell(), min(offset, len(data)))
+                self.assertEqual(f.read(size), data[offset:offset + size])
+            f.seek(-5, io.SEEK_END)
+            self.assertEqual(f.read(), data[-5:])
+            f.seek(300000 - 5)
+            self.assertEqual(f.read(10), data[300000 - 5:300000 + 5])
+            f.seek(0)
+            self.assertEqual(f.read(), data)
+
+    def test_index_save_load(self):
+        data = self.make_index_data()
+        index = gzip.GzipIndex.build(self.filename, span=50000)
+        indexname = self.filename + '.idx'
+        self.addCleanup(os_helper.unlink, indexname)
+        index.save(indexname)
+        loaded = gzip.GzipIndex.load(indexname)
+        self.assertEqual(loaded.size, index.size)
+        self.assertEqual(loaded.compressed_size, index.compressed_size)
+        self.assertEqual(loaded._points, index._points)
+        with open(self.filename, 'rb') as fileobj:
+            with gzip.GzipFile(fileobj=fileobj, index=loaded) as f:
+                f.seek(400000)
+                self.assertEqual(f.read(1000), data[400000:401000])
+
+    def test_index_empty(self):
+        with gzip.GzipFile(self.filename, 'wb'):
+            pass
+        index = gzip.GzipIndex.build(self.filename)
+        self.assertEqual(index.size, 0)
+        self.assertEqual(len(index), 1)
+        with gzip.GzipFile(self.filename, index=index) as f:
+            self.assertEqual(f.seek(0, io.SEEK_END), 0)
+            self.assertEqual(f.read(), b'')
+
+    def test_index_errors(self):
+        data = self.make_index_data()
+        index = gzip.GzipIndex.build(self.filename)
+        with self.assertRaises(ValueError):
+            gzip.GzipIndex.build(self.filename, span=0)
+        with self.assertRaises(ValueError):
+            gzip.GzipFile(fileobj=io.BytesIO(gzip.compress(data)), index=index)
+        with self.assertRaises(ValueError):
+            gzip.GzipFile(fileobj=io.BytesIO(), mode='wb', index=index)
+        with self.assertRaises(ValueError):
+            gzip.GzipIndex.load(io.BytesIO(b'GZIPIDX0' + bytes(24)))
+        saved = io.BytesIO()
+        index.save(saved)
+        with self.assertRaises(ValueError):
+            gzip.GzipIndex.load(io.BytesIO(saved.getvalue()[:-1]))
+        corrupted = bytearray(gzip.compress(data))
+        corrupted[-5] ^= 1
+        with self.assertRaises(gzip.BadGzipFile):
+            gzip.GzipIndex.build(io.BytesIO(corrupted))
+        with self.assertRaises(EOFError):
+            gzip.GzipIndex.build(io.BytesIO(corrupted[:-10]))
+
 
 class TestOpen(BaseTest):
     def test_binary_modes(self):
@@ -5,6 +5,7 @@
 import itertools
 import os
 import array
+import asyncio
 import re
 import socket
 import threading
@@ -2525,5 +2526,228 @@ def _create_connection(address, timeout=None, source_address=None):
         self.assertTrue(sock.file_closed)
 
 
+class AsyncHTTPConnectionTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        # The server sends the responses of self.responses in order, one
+        # after each request, and records the requests in self.requests.
+        self.requests = []
+        self.responses = []
+        self.accepted = 0
+        server = await asyncio.start_server(self.handle_client, HOST, 0)
+        self.addAsyncCleanup(self.close_server, server)
+        self.port = server.sockets[0].getsockname()[1]
+
+    async def close_server(self, server):
+        server.close()
+        server.close_clients()
+        await server.wait_closed()
+
+    async def handle_client(self, reader, writer):
+        self.accepted += 1
+        try:
+            while request_line := await reader.readline():
+                headers = client._parse_header_lines(
+                    await self.read_headers(reader))
+                body = b''
+                if headers['Transfer-Encoding'] == 'chunked':
+                    while size := int(await reader.readline(), 16):
+                        body += await reader.readexactly(size)
+                        await reader.readexactly(2)
+                    await self.read_headers(reader)
+                elif headers['Content-Length']:
+                    body = await reader.readexactly(
+                        int(headers['Content-Length']))
+                self.requests.append((request_line, headers, body))
+                response = self.responses.pop(0)
+                if response is None:
+                    break
+                writer.write(response)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def read_headers(self, reader):
+        lines = []
+        while (line := await reader.readline()) not in (b'\r\n', b''):
+            lines.append(line)
+        return lines
+
+    def make_connection(self):
+        conn = client.AsyncHTTPConnection(HOST, self.port)
+        self.addAsyncCleanup(conn.close)
+        return conn
+
+    def add_response(self, body, headers='', status='200 OK'):
+        if 'Transfer-Encoding' not in headers:
+            headers += f'Content-Length: {len(body)}\r\n'
+        self.responses.append(
+            f'HTTP/1.1 {status}\r\n{headers}\r\n'.encode() + body)
+
+    async def test_keep_alive(self):
+        conn = self.make_connection()
+        for i in range(3):
+            self.add_response(b'body%d' % i, 'X-Num: %d\r\n' % i)
+            await conn.request('GET', '/path%d' % i)
+            resp = await conn.getresponse()
+            self.assertEqual(resp.status, 200)
+            self.assertEqual(resp.reason, 'OK')
+            self.assertEqual(resp.getheader('X-Num'), str(i))
+            self.assertEqual(await resp.read(), b'body%d' % i)
+            self.assertTrue(resp.isclosed())
+        self.assertEqual(self.accepted, 1)
+        request_line, headers, body = self.requests[0]
+        self.assertEqual(request_line, b'GET /path0 HTTP/1.1\r\n')
+        self.assertEqual(headers['Host'], f'{HOST}:{self.port}')
+        self.assertEqual(headers['Accept-Encoding'], 'identity')
+        self.assertIsNone(headers['Content-Length'])
+
+    async def test_pipelining(self):
+        conn = self.make_connection()
+        self.add_response(b'first')
+        self.add_response(b'second')
+        await conn.request('GET', '/1')
+        await conn.request('HEAD', '/2')
+        resp1 = await conn.getresponse()
+        with self.assertRaises(client.ResponseNotReady):
+            await conn.getresponse()
+        self.assertEqual(await resp1.read(), b'first')
+        resp2 = await conn.getresponse()
+        # The response to HEAD has no body.
+        self.assertTrue(resp2.isclosed())
+        self.assertEqual(resp2.getheader('Content-Length'), '6')
+        self.assertEqual(await resp2.read(), b'')
+        with self.assertRaises(client.ResponseNotReady):
+            await conn.getresponse()
+        self.assertEqual(self.accepted, 1)
+
+    async def test_chunked_response(self):
+        conn = self.make_connection()
+        self.responses.append((chunked_start + last_chunk_extended +
+                               trailers + chunked_end).encode())
+        self.add_response(b'next')
+        await conn.request('GET', '/')
+        resp = await conn.getresponse()
+        self.assertTrue(resp.chunked)
+        chunks = [chunk async for chunk in resp]
+        self.assertEqual(b''.join(chunks), chunked_expected)
+        self.assertEqual(chunks[:2], [b'hello worl', b'd! '])
+        self.assertTrue(resp.isclosed())
+        await conn.request('GET', '/')
+        resp = await conn.getresponse()
+        self.assertEqual(await resp.read(3), b'nex')
+        self.assertEqual(await resp.read(), b't')
+        self.assertEqual(self.accepted, 1)
+
+    async def test_request_body(self):
+        async def async_body():
+            yield b'async '
+            yield b''
+            yield b'body'
+
+        conn = self.make_connection()
+        for body in (b'bytes body', 'str body', [b'iterable ', b'body'],
+                     async_body()):
+            self.add_response(b'')
+            await conn.request('POST', '/', body)
+            await (await conn.getresponse()).read()
+        bodies = [body for request_line, headers, body in self.requests]
+        self.assertEqual(bodies, [b'bytes body', b'str body',
+                                  b'iterable body', b'async body'])
+        self.assertEqual(self.requests[0][1]['Content-Length'], '10')
+        self.assertEqual(self.requests[1][1]['Content-Length'], '8')
+        for request_line, headers, body in self.requests[2:]:
+            self.assertEqual(headers['Transfer-Encoding'], 'chunked')
+            self.assertIsNone(headers['Content-Length'])
+
+    async def test_connection_close(self):
+        conn = self.make_connection()
+        self.add_response(b'closed', 'Connection: close\r\n')
+        self.add_response(b'reopened')
+        await conn.request('GET', '/')
+        resp = await conn.getresponse()
+        self.assertTrue(resp.will_close)
+        self.assertEqual(await resp.read(), b'closed')
+        # A new connection is opened by the next request.
+        await conn.request('GET', '/')
+        resp = await conn.getresponse()
+        self.assertEqual(await resp.read(), b'reopened')
+        self.assertEqual(self.accepted, 2)
+
+    async def test_close_unread_response(self):
+        conn = self.make_connection()
+        self.add_response(b'unread body')
+        self.add_response(b'body')
+        await conn.request('GET', '/')
+        resp = await conn.getresponse()
+        resp.close()
+        self.assertEqual(await resp.read(), b'')
+        # The connection cannot be reused with unread data.
+        await conn.request('GET', '/')
+        resp = await conn.getresponse()
+        self.assertEqual(await resp.read(), b'body')
+        self.assertEqual(self.accepted, 2)
+
+    async def test_remote_disconnected(self):
+        conn = self.make_connection()
+        self.responses.append(None)
+        await conn.request('GET', '/')
+        with self.assertRaises(client.RemoteDisconnected):
+            await conn.getresponse()
+
+    async def test_incomplete_read(self):
+        conn = self.make_connection()
+        self.responses.append(b'HTTP/1.1 200 OK\r\n'
+                              b'Content-Length: 10\r\n\r\nHello')
+        self.responses.append(None)
+        await conn.request('GET', '/')
+        await conn.request('GET', '/')
+        resp = await conn.getresponse()
+        with self.assertRaises(client.IncompleteRead):
+            await resp.read()
+        self.assertTrue(resp.isclosed())
+        # The pipelined request was lost with the connection.
+        with self.assertRaises(client.RemoteDisconnected):
+            await conn.getresponse()
+
+    @unittest.skipIf(not hasattr(client, 'AsyncHTTPSConnection'),
+                     'http.client.AsyncHTTPSConnection not available')
+    async def test_https(self):
+        import ssl
+        server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        server_context.load_cert_chain(CERT_localhost)
+        server = await asyncio.start_server(self.handle_client, 'localhost',
+                                            0, ssl=server_context)
+        self.addAsyncCleanup(self.close_server, server)
+        port = server.sockets[0].getsockname()[1]
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.load_verify_locations(CERT_localhost)
+        conn = client.AsyncHTTPSConnection('localhost', port, context=context)
+        self.addAsyncCleanup(conn.close)
+        self.add_response(b'secret')
+        await conn.request('GET', '/')
+        resp = await conn.getresponse()
+        self.assertEqual(await resp.read(), b'secret')
+
+    async def test_response_not_ready(self):
+        conn = self.make_connection()
+        with self.assertRaises(client.ResponseNotReady):
+            await conn.getresponse()
+
+    async def test_invalid_request(self):
+        conn = self.make_connection()
+        with self.assertRaises(ValueError):
+            await conn.request('GET', '/', headers={'X-Bad': 'a\nb'})
+        with self.assertRaises(TypeError):
+            await conn.request('POST', '/', body=42)
+        self.assertEqual(self.requests, [])
+
+
+def tearDownModule():
+    asyncio._set_event_loop_policy(None)
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -8,6 +8,8 @@
      SimpleHTTPRequestHandler, CGIHTTPRequestHandler
 from http import server, HTTPStatus
 
+import asyncio
+import functools
 import os
 import socket
 import sys
@@ -1352,6 +1354,198 @@ def test_windows_colon(self):
             self.assertEqual(path, self.translated_3)
 
 
+class AsyncHTTPServerTestCase(unittest.IsolatedAsyncioTestCase):
+    class request_handler(NoLogRequestHandler,
+                          server.AsyncBaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        async def do_GET(self):
+            body = ('%s %d' % (self.path, id(self))).encode()
+            self.send_response(HTTPStatus.OK)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        async def do_POST(self):
+            body = await self.rfile.readexactly(
+                int(self.headers['Content-Length']))
+            self.send_response(HTTPStatus.OK)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body.upper())
+
+        async def do_SLOW(self):
+            await asyncio.sleep(0.1)
+            await self.do_GET()
+
+        async def do_ERROR(self):
+            raise ZeroDivisionError
+
+    async def asyncSetUp(self):
+        self.server = await self.start_server(self.request_handler)
+
+    async def start_server(self, handler):
+        httpd = server.AsyncHTTPServer(('localhost', 0), handler)
+        await httpd.start_serving()
+        self.addAsyncCleanup(self.close_server, httpd)
+        return httpd
+
+    async def close_server(self, httpd):
+        httpd.close()
+        await httpd.wait_closed()
+
+    def connect(self, httpd=None):
+        httpd = httpd or self.server
+        conn = http.client.AsyncHTTPConnection(*httpd.server_address[:2])
+        self.addAsyncCleanup(conn.close)
+        return conn
+
+    async def get(self, conn, path, method='GET', body=None):
+        await conn.request(method, path, body)
+        response = await conn.getresponse()
+        return response, await response.read()
+
+    async def test_keep_alive(self):
+        self.assertEqual(self.server.server_port,
+                         self.server.server_address[1])
+        conn = self.connect()
+        response, body1 = await self.get(conn, '/1')
+        self.assertEqual(response.status, HTTPStatus.OK)
+        self.assertFalse(response.will_close)
+        response, body2 = await self.get(conn, '/2')
+        path1, handler1 = body1.split()
+        path2, handler2 = body2.split()
+        self.assertEqual((path1, path2), (b'/1', b'/2'))
+        # Both requests were handled on the same connection.
+        self.assertEqual(handler1, handler2)
+
+    async def test_request_body(self):
+        conn = self.connect()
+        response, body = await self.get(conn, '/', 'POST', b'data')
+        self.assertEqual(body, b'DATA')
+        response, body = await self.get(conn, '/', 'POST', b'again')
+        self.assertEqual(body, b'AGAIN')
+
+    async def test_concurrent_connections(self):
+        conns = [self.connect() for _ in range(20)]
+        results = await asyncio.gather(
+            *[self.get(conn, '/', 'SLOW') for conn in conns])
+        self.assertEqual(len({body for response, body in results}), 20)
+
+    async def test_errors(self):
+        conn = self.connect()
+        with support.captured_stderr():
+            response, body = await self.get(conn, '/', 'UNKNOWN')
+        self.assertEqual(response.status, HTTPStatus.NOT_IMPLEMENTED)
+        self.assertTrue(response.will_close)
+
+        reader, writer = await asyncio.open_connection(
+            *self.server.server_address[:2])
+        self.addCleanup(writer.close)
+        writer.write(b'GET /' + b'x' * 70000 + b' HTTP/1.1\r\n\r\n')
+        with support.captured_stderr():
+            line = await reader.readline()
+        self.assertIn(b'414', line)
+
+        reader, writer = await asyncio.open_connection(
+            *self.server.server_address[:2])
+        self.addCleanup(writer.close)
+        writer.write(b'GET / HTTP/1.1\r\n' + b'X: y\r\n' * 101 + b'\r\n')
+        with support.captured_stderr():
+            line = await reader.readline()
+        self.assertIn(b'431', line)
+
+    async def test_handler_exception(self):
+        conn = self.connect()
+        with support.captured_stderr() as err:
+            with self.assertRaises(http.client.RemoteDisconnected):
+                await self.get(conn, '/', 'ERROR')
+        self.assertIn('ZeroDivisionError', err.getvalue())
+
+    async def test_idle_timeout(self):
+        class Handler(self.request_handler):
+            timeout = 0.05
+
+        httpd = await self.start_server(Handler)
+        conn = self.connect(httpd)
+        await self.get(conn, '/')
+        await asyncio.sleep(0.2)
+        with support.captured_stderr():
+            with self.assertRaises(http.client.RemoteDisconnected):
+                await self.get(conn, '/')
+
+    async def test_close(self):
+        conn1 = self.connect()
+        await self.get(conn1, '/')
+        conn2 = self.connect()
+        await conn2.request('SLOW', '/')
+        await asyncio.sleep(0.02)
+        self.server.close()
+        # The request being handled is completed, then its connection
+        # is closed like the idle connection.
+        response = await asyncio.wait_for(conn2.getresponse(), 5)
+        self.assertTrue((await response.read()).startswith(b'/ '))
+        await asyncio.wait_for(self.server.wait_closed(), 5)
+        with self.assertRaises(http.client.RemoteDisconnected):
+            await self.get(conn1, '/')
+
+
+class AsyncSimpleHTTPServerTestCase(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.tempdir = tempfile.mkdtemp(dir=os.getcwd())
+        self.addCleanup(os_helper.rmtree, self.tempdir)
+        self.data = os.urandom(300_000)
+        with open(os.path.join(self.tempdir, 'test.bin'), 'wb') as f:
+            f.write(self.data)
+
+        class Handler(NoLogRequestHandler,
+                      server.AsyncSimpleHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+        handler = functools.partial(Handler, directory=self.tempdir)
+        self.server = server.AsyncHTTPServer(('localhost', 0), handler)
+        await self.server.start_serving()
+        self.addAsyncCleanup(self.close_server)
+        self.conn = http.client.AsyncHTTPConnection(
+            *self.server.server_address[:2])
+        self.addAsyncCleanup(self.conn.close)
+
+    async def close_server(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def get(self, path, method='GET'):
+        await self.conn.request(method, path)
+        response = await self.conn.getresponse()
+        return response, await response.read()
+
+    async def test_get(self):
+        loop = asyncio.get_running_loop()
+        with mock.patch.object(loop, 'sendfile',
+                               wraps=loop.sendfile) as sendfile:
+            response, body = await self.get('/test.bin')
+        self.assertEqual(response.status, HTTPStatus.OK)
+        self.assertEqual(body, self.data)
+        self.assertEqual(response.getheader('Content-Length'),
+                         str(len(self.data)))
+        sendfile.assert_called_once()
+        response, body = await self.get('/test.bin', 'HEAD')
+        self.assertEqual(body, b'')
+        self.assertEqual(response.getheader('Content-Length'),
+                         str(len(self.data)))
+        # The connection is kept open after the file was sent.
+        response, body = await self.get('/test.bin')
+        self.assertEqual(body, self.data)
+
+    async def test_directory(self):
+        response, body = await self.get('/')
+        self.assertEqual(response.status, HTTPStatus.OK)
+        self.assertIn(b'test.bin', body)
+        response, body = await self.get('/missing')
+        self.assertEqual(response.status, HTTPStatus.NOT_FOUND)
+
+
 class MiscTestCase(unittest.TestCase):
     def test_all(self):
         expected = []
@@ -1429,5 +1623,9 @@ def setUpModule():
     unittest.addModuleCleanup(os.chdir, os.getcwd())
 
 
+def tearDownModule():
+    asyncio._set_event_loop_policy(None)
+
+
 if __name__ == '__main__':
     unittest.main()
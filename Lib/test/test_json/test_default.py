@@ -1,4 +1,6 @@
 import collections
+import dataclasses
+import enum
 from test.test_json import PyTest, CTest
 
 
@@ -36,6 +38,102 @@ def test_ordereddict(self):
             self.dumps(od, sort_keys=True),
             '{"a": 1, "b": 2, "c": 3, "d": 4}')
 
+    def test_dataclass(self):
+        @dataclasses.dataclass
+        class Point:
+            y: int
+            x: int
+            tags: list = dataclasses.field(default_factory=list)
+
+        p = Point(1, 2, [Point(3, 4)])
+        self.assertEqual(
+            self.dumps(p),
+            '{"y": 1, "x": 2, "tags": [{"y": 3, "x": 4, "tags": []}]}')
+        self.assertEqual(
+            self.dumps(p, sort_keys=True),
+            '{"tags": [{"tags": [], "x": 4, "y": 3}], "x": 2, "y": 1}')
+        self.assertEqual(
+            self.dumps(p, indent=1),
+            '{\n "y": 1,\n "x": 2,\n "tags": [\n  {\n   "y": 3,\n'
+            '   "x": 4,\n   "tags": []\n  }\n ]\n}')
+        with self.assertRaises(TypeError):
+            self.dumps(Point)
+
+    def test_empty_dataclass(self):
+        @dataclasses.dataclass
+        class Empty:
+            pass
+
+        self.assertEqual(self.dumps([Empty()]), '[{}]')
+        self.assertEqual(self.dumps([Empty()], indent=2), '[\n  {}\n]')
+
+    def test_enum(self):
+        class Color(enum.Enum):
+            RED = 'red'
+            GREEN = (0, 255, 0)
+
+        self.assertEqual(self.dumps([Color.RED, Color.GREEN]),
+                         '["red", [0, 255, 0]]')
+        self.assertEqual(self.dumps({'c': Color.RED}), '{"c": "red"}')
+
+    def test_overridden_default(self):
+        @dataclasses.dataclass
+        class Point:
+            x: int
+
+        class Encoder(self.json.JSONEncoder):
+            def default(self, o):
+                return repr(o)
+
+        self.assertEqual(self.dumps(Point(1), cls=Encoder), '"%r"' % Point(1))
+        self.assertEqual(self.dumps(Point(1), default=str),
+                         self.dumps(str(Point(1))))
+
+    def test_dispatch_table(self):
+        class A:
+            pass
+        class B(A):
+            pass
+        class C:
+            pass
+
+        calls = []
+        def convert_a(o):
+            calls.append(o)
+            return type(o).__name__
+        table = {A: convert_a, frozenset: sorted}
+        self.assertEqual(
+            self.dumps([A(), B(), B(), frozenset({2, 1})],
+                       dispatch_table=table),
+            '["A", "B", "B", [1, 2]]')
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(
+            self.dumps([C(), B()], dispatch_table=table,
+                       default=lambda o: 'default'),
+            '["default", "B"]')
+        with self.assertRaises(TypeError):
+            self.dumps(C(), dispatch_table=table)
+
+    def test_dispatch_table_priority(self):
+        @dataclasses.dataclass
+        class Point:
+            x: int
+
+        class Encoder(self.json.JSONEncoder):
+            dispatch_table = {Point: lambda p: [p.x]}
+            def default(self, o):
+                raise AssertionError
+
+        self.assertEqual(self.dumps(Point(1), cls=Encoder), '[1]')
+        self.assertEqual(self.dumps(Point(1), default=repr,
+                                    dispatch_table={Point: str}),
+                         self.dumps(str(Point(1))))
+
+    def test_dispatch_table_not_used_for_supported_types(self):
+        table = {int: str, list: str, dict: str, object: str}
+        self.assertEqual(self.dumps([1, {'a': []}], dispatch_table=table),
+                         '[1, {"a": []}]')
+
 
 class TestPyDefault(TestDefault, PyTest): pass
 class TestCDefault(TestDefault, CTest): pass
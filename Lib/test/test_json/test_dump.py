@@ -1,4 +1,4 @@
-from io import StringIO
+from io import BytesIO, StringIO
 from test.test_json import PyTest, CTest
 
 from test.support import bigmemtest, _1G
@@ -12,6 +12,57 @@ def test_dump(self):
     def test_dumps(self):
         self.assertEqual(self.dumps({}), '{}')
 
+    def test_dumpb(self):
+        self.assertEqual(self.json.dumpb({}), b'{}')
+        for obj in [[], 'abc', 1, 1.5, None, True, {'a': [1, 2.5, None]}]:
+            self.assertEqual(self.json.dumpb(obj), self.dumps(obj).encode())
+        obj = {'\xe9': ['\u20ac', '\U0001f600']}
+        self.assertEqual(self.json.dumpb(obj), self.dumps(obj).encode())
+        self.assertEqual(self.json.dumpb(obj, ensure_ascii=False),
+                         self.dumps(obj, ensure_ascii=False).encode())
+        self.assertEqual(self.json.dumpb('\ud800', ensure_ascii=False),
+                         b'"\xed\xa0\x80"')
+
+    def test_dumpb_large(self):
+        # Large enough to be produced in several chunks
+        obj = [{'key': i, 'value': 'x' * (i % 100), 'text': '\xe9' * (i % 3)}
+               for i in range(10000)]
+        for kwargs in [{}, {'ensure_ascii': False}, {'indent': 2},
+                       {'sort_keys': True, 'separators': (',', ':')}]:
+            with self.subTest(**kwargs):
+                self.assertEqual(self.json.dumpb(obj, **kwargs),
+                                 self.dumps(obj, **kwargs).encode())
+
+    def test_encode_into(self):
+        obj = [{'key': i, 'value': '\xe9' * (i % 100)} for i in range(10000)]
+        expected = self.dumps(obj, ensure_ascii=False).encode()
+        encoder = self.json.JSONEncoder(ensure_ascii=False)
+        buf = bytearray(b'data: ')
+        self.assertIsNone(encoder.encode_into(obj, buf))
+        self.assertEqual(buf, b'data: ' + expected)
+        bio = BytesIO()
+        self.assertIsNone(encoder.encode_into(obj, bio))
+        self.assertEqual(bio.getvalue(), expected)
+
+    def test_encode_into_error(self):
+        buf = bytearray()
+        with self.assertRaises(TypeError):
+            self.json.JSONEncoder().encode_into([1, 2, object()], buf)
+        with self.assertRaises(TypeError):
+            self.json.JSONEncoder().encode_into([], StringIO())
+        with self.assertRaises(AttributeError):
+            self.json.JSONEncoder().encode_into([], object())
+
+    def test_encode_into_subclass(self):
+        class Encoder(self.json.JSONEncoder):
+            def iterencode(self, o, _one_shot=False):
+                yield from super().iterencode(o, _one_shot)
+                yield '\n'
+        buf = bytearray()
+        Encoder().encode_into([1, 2], buf)
+        self.assertEqual(buf, b'[1, 2]\n')
+        self.assertEqual(self.json.dumpb([1, 2], cls=Encoder), b'[1, 2]\n')
+
     def test_dump_skipkeys(self):
         v = {b'invalid_key': False, 'valid_key': True}
         with self.assertRaises(TypeError):
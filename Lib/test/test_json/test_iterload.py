@@ -0,0 +1,158 @@
+from io import StringIO, BytesIO
+from test.test_json import PyTest, CTest
+
+
+DOC = [
+    {"a": [1, 2, {"b": "x\"]}y"}], "c": None},
+    1.5, "str\\", [], {}, [[[]]], True, False, None, -3e5, "\xe9€\U0001f600",
+]
+
+
+class TestIterload:
+    def feed_chunks(self, data, size, **kwargs):
+        decoder = self.json.JSONStreamDecoder(**kwargs)
+        values = []
+        for i in range(0, len(data), size):
+            values += decoder.feed(data[i:i + size])
+        values += decoder.close()
+        return values
+
+    def test_array_elements(self):
+        s = self.dumps(DOC, ensure_ascii=False)
+        for size in range(1, 20):
+            with self.subTest(size=size):
+                self.assertEqual(self.feed_chunks(s, size), DOC)
+
+    def test_bytes_chunks(self):
+        s = self.dumps(DOC, ensure_ascii=False)
+        for encoding in ['utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le',
+                         'utf-16-be', 'utf-32', 'utf-32-le', 'utf-32-be']:
+            data = s.encode(encoding)
+            for size in (1, 3, 7, 64):
+                with self.subTest(encoding=encoding, size=size):
+                    self.assertEqual(self.feed_chunks(data, size), DOC)
+
+    def test_values_are_returned_when_complete(self):
+        decoder = self.json.JSONStreamDecoder()
+        self.assertEqual(decoder.feed('[1'), [])
+        self.assertEqual(decoder.feed(', "a'), [1])
+        self.assertEqual(decoder.feed('b", {"c"'), ['ab'])
+        self.assertEqual(decoder.feed(': 2}, 3'), [{'c': 2}])
+        self.assertEqual(decoder.feed(']'), [3])
+        self.assertEqual(decoder.close(), [])
+
+    def test_memory_is_bounded(self):
+        decoder = self.json.JSONStreamDecoder()
+        decoder.feed('[')
+        for i in range(1000):
+            self.assertEqual(decoder.feed('[%d, "%s' % (i, 'x' * i)), [])
+            self.assertGreater(sum(map(len, decoder._buffer)), i)
+            self.assertEqual(decoder.feed('"], '), [[i, 'x' * i]])
+            self.assertLess(sum(map(len, decoder._buffer)), 10)
+
+    def test_large_value_in_small_chunks(self):
+        # The chunks of a value are only joined when it is complete
+        decoder = self.json.JSONStreamDecoder()
+        self.assertEqual(decoder.feed('[{"a": ["'), [])
+        for i in range(1000):
+            self.assertEqual(decoder.feed('x\\'), [])
+            self.assertEqual(decoder.feed('"y'), [])
+        self.assertEqual(len(decoder._buffer), 2001)
+        self.assertEqual(decoder.feed('"]}, 1'), [{'a': ['x"y' * 1000]}])
+        self.assertEqual(decoder.feed(']'), [1])
+        self.assertEqual(decoder.close(), [])
+
+    def test_not_an_array(self):
+        for doc in [{'a': [1, 2]}, 'abc', 1, 1.5, None, True, []]:
+            with self.subTest(doc=doc):
+                s = self.dumps(doc)
+                expected = [doc] if doc != [] else []
+                self.assertEqual(self.feed_chunks(s, 1), expected)
+                self.assertEqual(list(self.json.iterload(StringIO(s))),
+                                 expected)
+
+    def test_lines(self):
+        s = ''.join(self.dumps(x) + '\n' for x in DOC)
+        for size in range(1, 10):
+            with self.subTest(size=size):
+                self.assertEqual(self.feed_chunks(s, size, lines=True), DOC)
+        self.assertEqual(self.feed_chunks('1 2\t[3]{"a":4}"5"', 1, lines=True),
+                         [1, 2, [3], {'a': 4}, '5'])
+        self.assertEqual(self.feed_chunks('', 1, lines=True), [])
+        self.assertEqual(self.feed_chunks(' \n ', 1, lines=True), [])
+
+    def test_iterload(self):
+        s = self.dumps(DOC)
+        self.assertEqual(list(self.json.iterload(StringIO(s))), DOC)
+        self.assertEqual(list(self.json.iterload(BytesIO(s.encode()))), DOC)
+        s = ''.join(self.dumps(x) + '\n' for x in DOC)
+        self.assertEqual(list(self.json.iterload(StringIO(s), lines=True)),
+                         DOC)
+
+    def test_iterload_is_lazy(self):
+        fp = StringIO('[1, 2, ' + '3, ' * 100_000 + '4]')
+        it = self.json.iterload(fp)
+        self.assertEqual(next(it), 1)
+        self.assertLess(fp.tell(), 100_000)
+
+    def test_iterload_hooks(self):
+        s = '[{"a": 1.5, "b": 2}, {"c": NaN}]'
+        values = list(self.json.iterload(StringIO(s),
+                                         object_pairs_hook=tuple,
+                                         parse_float=str, parse_int=float,
+                                         parse_constant=repr))
+        self.assertEqual(values, [(('a', '1.5'), ('b', 2.0)),
+                                  (('c', "'NaN'"),)])
+
+    def test_errors(self):
+        for data, msg in [
+            ('', 'Expecting value'),
+            ('[', 'Expecting value'),
+            ('[1,', 'Expecting value'),
+            ('[1', "Expecting ',' delimiter"),
+            ('[1 2]', "Expecting ',' delimiter"),
+            ('[1,]', 'Illegal trailing comma before end of array'),
+            ('[1] 2', 'Extra data'),
+            ('1 2', 'Extra data'),
+            ('[tru]', 'Expecting value'),
+            ('"abc', 'Unterminated string starting at'),
+            ('{"a" 1}', "Expecting ':' delimiter"),
+            ('\ufeff[]', 'Unexpected UTF-8 BOM (decode using utf-8-sig)'),
+        ]:
+            with self.subTest(data=data):
+                with self.assertRaises(self.JSONDecodeError) as cm:
+                    list(self.json.iterload(StringIO(data)))
+                self.assertEqual(cm.exception.msg, msg)
+
+    def test_error_position(self):
+        for data, size, pos, lineno, colno in [
+            ('[1, 2, 3 4]', 1, 9, 1, 10),
+            ('[1, 2,\n 3 4]', 2, 10, 2, 4),
+            ('[1,\n 2,\n {"a" 3}]', 3, 14, 3, 7),
+            ('[{"a":\n 1}, {"b" 2}]', 4, 17, 2, 11),
+            ('1\n2\n[3 4]', 1, 7, 3, 4),
+        ]:
+            with self.subTest(data=data):
+                with self.assertRaises(self.JSONDecodeError) as cm:
+                    self.feed_chunks(data, size, lines=data.startswith('1'))
+                err = cm.exception
+                self.assertEqual((err.pos, err.lineno, err.colno),
+                                 (pos, lineno, colno))
+                self.assertIn(f'line {lineno} column {colno} (char {pos})',
+                              str(err))
+
+    def test_invalid_input_type(self):
+        decoder = self.json.JSONStreamDecoder()
+        with self.assertRaises(TypeError):
+            decoder.feed([])
+        decoder.feed('[')
+        with self.assertRaises(TypeError):
+            decoder.feed(b'1')
+        decoder = self.json.JSONStreamDecoder()
+        decoder.feed(b'[')
+        with self.assertRaises(TypeError):
+            decoder.feed('1')
+
+
+class TestPyIterload(TestIterload, PyTest): pass
+class TestCIterload(TestIterload, CTest): pass
@@ -867,6 +867,42 @@ def test_read_multistream_trailing_junk(self):
         with LZMAFile(BytesIO(COMPRESSED_XZ * 5 + COMPRESSED_BOGUS)) as f:
             self.assertEqual(f.read(), INPUT * 5)
 
+    def test_read_multistream_workers(self):
+        saved_segment_size = _compression.PARALLEL_SEGMENT_SIZE
+        _compression.PARALLEL_SEGMENT_SIZE = 100
+        try:
+            for workers in 1, 3:
+                with LZMAFile(BytesIO(COMPRESSED_XZ * 20),
+                              workers=workers) as f:
+                    self.assertEqual(f.read(), INPUT * 20)
+                    f.seek(len(INPUT) * 5 + 10)
+                    self.assertEqual(f.read(10), INPUT[10:20])
+                with LZMAFile(BytesIO(COMPRESSED_XZ * 20 + COMPRESSED_BOGUS),
+                              workers=workers) as f:
+                    self.assertEqual(f.read(), INPUT * 20)
+                with LZMAFile(BytesIO(COMPRESSED_XZ * 5 + COMPRESSED_ALONE),
+                              workers=workers) as f:
+                    self.assertEqual(f.read(), INPUT * 6)
+                with LZMAFile(BytesIO(COMPRESSED_XZ * 20 + COMPRESSED_XZ[:-10]),
+                              workers=workers) as f:
+                    self.assertRaises(EOFError, f.read)
+        finally:
+            _compression.PARALLEL_SEGMENT_SIZE = saved_segment_size
+
+    def test_read_multistream_workers_large_output(self):
+        large = bytes(100_000)
+        data = COMPRESSED_XZ * 5 + lzma.compress(large) + COMPRESSED_XZ * 5
+        with (support.swap_attr(_compression, 'PARALLEL_SEGMENT_SIZE', 100),
+              support.swap_attr(_compression, 'PARALLEL_MAX_OUTPUT', 50_000)):
+            with LZMAFile(BytesIO(data), workers=2) as f:
+                self.assertEqual(f.read(), INPUT * 5 + large + INPUT * 5)
+
+    def test_workers_errors(self):
+        with self.assertRaises(ValueError):
+            LZMAFile(BytesIO(), workers=0)
+        with self.assertRaises(ValueError):
+            LZMAFile(BytesIO(), "w", workers=2)
+
     def test_read_from_file(self):
         with TempFile(TESTFN, COMPRESSED_XZ):
             with LZMAFile(TESTFN) as f:
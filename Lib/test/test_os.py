@@ -1883,6 +1883,44 @@ def walk(self, top, **kwargs):
             bdirs[:] = list(map(os.fsencode, dirs))
             bfiles[:] = list(map(os.fsencode, files))
 
+class ParallelWalkTests(WalkTests):
+    """Tests for os.walk() with workers."""
+    def walk(self, top, **kwargs):
+        if 'follow_symlinks' in kwargs:
+            kwargs['followlinks'] = kwargs.pop('follow_symlinks')
+        return os.walk(top, workers=3, **kwargs)
+
+    def test_walk_same_order(self):
+        base = os.path.join(os_helper.TESTFN, 'wide')
+        os.makedirs(base)
+        for i in range(20):
+            for j in range(i % 4):
+                os.makedirs(os.path.join(base, f'd{i}', f'e{j}'))
+            create_file(os.path.join(base, f'f{i}'))
+        for topdown in (True, False):
+            with self.subTest(topdown=topdown):
+                expected = list(os.walk(base, topdown))
+                for workers in (1, 2, 8):
+                    self.assertEqual(list(os.walk(base, topdown,
+                                                  workers=workers)),
+                                     expected)
+
+    def test_walk_prune_prefetched(self):
+        base = os.path.join(os_helper.TESTFN, 'prune')
+        for name in 'abcd':
+            os.makedirs(os.path.join(base, name, 'sub'))
+        walk_it = os.walk(base, workers=2)
+        root, dirs, files = next(walk_it)
+        dirs[:] = ['b']
+        self.assertEqual([root for root, dirs, files in walk_it],
+                         [os.path.join(base, 'b'),
+                          os.path.join(base, 'b', 'sub')])
+
+    def test_walk_bad_workers(self):
+        for workers in (0, -1):
+            with self.assertRaises(ValueError):
+                next(os.walk(self.walk_path, workers=workers))
+
 @unittest.skipUnless(hasattr(os, 'fwalk'), "Test needs os.fwalk()")
 class BytesFwalkTests(FwalkTests):
     """Tests for os.walk() with bytes."""
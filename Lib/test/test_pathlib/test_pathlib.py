@@ -3197,6 +3197,13 @@ def test_walk_bad_dir(self):
         finally:
             path1new.rename(path1)
 
+    def test_walk_workers(self):
+        for top_down in (True, False):
+            with self.subTest(top_down=top_down):
+                expected = list(self.walk_path.walk(top_down))
+                self.assertEqual(list(self.walk_path.walk(top_down, workers=2)),
+                                 expected)
+
     def test_walk_many_open_files(self):
         depth = 30
         base = self.cls(self.base, 'deep')
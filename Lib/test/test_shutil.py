@@ -16,6 +16,7 @@
 import string
 import contextlib
 import io
+import threading
 from shutil import (make_archive,
                     register_archive_format, unregister_archive_format,
                     get_archive_formats, Error, unpack_archive,
@@ -748,6 +749,93 @@ def test_rmtree_above_recursion_limit(self):
         with support.infinite_recursion(recursion_limit):
             shutil.rmtree(TESTFN)
 
+    def make_rmtree_victim(self, victim, depth=3):
+        os.mkdir(victim)
+        for i in range(3):
+            create_file(os.path.join(victim, 'f%d' % i), 'foo')
+        if depth:
+            for i in range(3):
+                self.make_rmtree_victim(os.path.join(victim, 'd%d' % i),
+                                        depth - 1)
+
+    def test_rmtree_workers(self):
+        tmp = self.mkdtemp()
+        victim = os.path.join(tmp, 'killme')
+        for max_fds in 2, 4, 100:
+            with self.subTest(max_fds=max_fds):
+                self.make_rmtree_victim(victim)
+                with support.swap_attr(shutil, '_RMTREE_MAX_FDS', max_fds):
+                    shutil.rmtree(victim, workers=3)
+                self.assertFalse(os.path.lexists(victim))
+        self.make_rmtree_victim(victim, depth=1)
+        shutil.rmtree(os.fsencode(victim), workers=2)
+        self.assertFalse(os.path.lexists(victim))
+        self.make_rmtree_victim(victim, depth=1)
+        dir_fd = os.open(tmp, os.O_RDONLY)
+        self.addCleanup(os.close, dir_fd)
+        if shutil.rmtree.avoids_symlink_attacks:
+            shutil.rmtree('killme', dir_fd=dir_fd, workers=2)
+            self.assertFalse(os.path.lexists(victim))
+        for workers in 0, -1:
+            with self.assertRaises(ValueError):
+                shutil.rmtree(tmp, workers=workers)
+        self.assertTrue(os.path.exists(tmp))
+
+    @os_helper.skip_unless_symlink
+    def test_rmtree_workers_symlinks(self):
+        tmp = self.mkdtemp()
+        victim = os.path.join(tmp, 'killme')
+        keep = os.path.join(tmp, 'keep')
+        self.make_rmtree_victim(victim, depth=2)
+        self.make_rmtree_victim(keep, depth=1)
+        os.symlink(keep, os.path.join(victim, 'd1', 'link'))
+        os.symlink(keep, os.path.join(tmp, 'link'))
+        shutil.rmtree(victim, workers=2)
+        self.assertFalse(os.path.lexists(victim))
+        self.assertEqual(len(os.listdir(keep)), 6)
+        errors = []
+        shutil.rmtree(os.path.join(tmp, 'link'),
+                      onexc=lambda *args: errors.append(args), workers=2)
+        self.assertEqual(len(errors), 1)
+        self.assertIs(errors[0][0], os.path.islink)
+        self.assertEqual(len(os.listdir(keep)), 6)
+
+    def test_rmtree_workers_errors(self):
+        tmp = self.mkdtemp()
+        victim = os.path.join(tmp, 'killme')
+        real_unlink = os.unlink
+        def unlink(path, *args, **kwargs):
+            if os.path.basename(path) == 'f1':
+                raise PermissionError(errno.EACCES, 'denied', path)
+            return real_unlink(path, *args, **kwargs)
+
+        self.make_rmtree_victim(victim, depth=1)
+        errors = []
+        def onexc(*args):
+            self.assertNotIn(threading.current_thread(), calling)
+            calling.append(threading.current_thread())
+            errors.append(args)
+            calling.pop()
+        calling = []
+        with unittest.mock.patch('os.unlink', unlink):
+            shutil.rmtree(victim, onexc=onexc, workers=3)
+        # The four f1 files, and the four directories which contain them
+        unlink_errors = [e for e in errors if e[0] is unlink]
+        self.assertEqual(len(unlink_errors), 4)
+        self.assertEqual(len(errors), 8)
+        self.assertIn(os.path.join(victim, 'd2', 'f1'),
+                      [path for func, path, exc in unlink_errors])
+        self.assertEqual(sorted(os.listdir(victim)), ['d0', 'd1', 'd2', 'f1'])
+
+        with unittest.mock.patch('os.unlink', unlink):
+            with self.assertRaises(PermissionError):
+                shutil.rmtree(victim, workers=3)
+        shutil.rmtree(victim, workers=3)
+        self.assertFalse(os.path.lexists(victim))
+
+        self.assertRaises(FileNotFoundError, shutil.rmtree, victim, workers=2)
+        shutil.rmtree(victim, ignore_errors=True, workers=2)
+
 
 class TestCopyTree(BaseTest, unittest.TestCase):
 
@@ -991,6 +1079,73 @@ def custom_cpfun(a, b):
         shutil.copytree(src, dst, copy_function=custom_cpfun)
         self.assertEqual(len(flag), 1)
 
+    def make_tree(self, src, depth=2, width=3):
+        for i in range(width):
+            create_file((src, 'file%d' % i), 'content %s %d' % (src, i))
+        if depth:
+            for i in range(width):
+                path = os.path.join(src, 'dir%d' % i)
+                os.mkdir(path)
+                self.make_tree(path, depth - 1, width)
+        os.utime(src, ns=(10**18, 10**18 + depth))
+
+    def test_copytree_workers(self):
+        src = self.mkdtemp()
+        dst = os.path.join(self.mkdtemp(), 'dst')
+        self.make_tree(src)
+        progress = []
+        def callback(srcname, dstname):
+            self.assertIs(threading.current_thread(), threading.main_thread())
+            progress.append((srcname, dstname))
+        self.assertEqual(shutil.copytree(src, dst, workers=4,
+                                         progress=callback), dst)
+        # 3 + 3 * (3 + 3 * 3) files
+        self.assertEqual(len(progress), 39)
+        for srcname, dstname in progress:
+            self.assertEqual(os.path.relpath(srcname, src),
+                             os.path.relpath(dstname, dst))
+            self.assertEqual(read_file(dstname), read_file(srcname))
+            self.assertEqual(os.stat(dstname).st_mtime_ns,
+                             os.stat(srcname).st_mtime_ns)
+        for dirpath, dirnames, filenames in os.walk(src):
+            dstpath = os.path.join(dst, os.path.relpath(dirpath, src))
+            self.assertEqual(sorted(os.listdir(dstpath)),
+                             sorted(dirnames + filenames))
+            # Directory metadata is copied after the files
+            self.assertEqual(os.stat(dstpath).st_mtime_ns,
+                             os.stat(dirpath).st_mtime_ns)
+
+    def test_copytree_workers_errors(self):
+        src = self.mkdtemp()
+        dst = os.path.join(self.mkdtemp(), 'dst')
+        self.make_tree(src, depth=1)
+        def copy_function(srcname, dstname):
+            if os.path.basename(srcname) == 'file1':
+                raise OSError('cannot copy')
+            shutil.copy2(srcname, dstname)
+        with self.assertRaises(shutil.Error) as cm:
+            shutil.copytree(src, dst, copy_function=copy_function, workers=2)
+        errors = sorted(cm.exception.args[0])
+        self.assertEqual(len(errors), 4)
+        self.assertEqual(errors[0], (os.path.join(src, 'dir0', 'file1'),
+                                     os.path.join(dst, 'dir0', 'file1'),
+                                     'cannot copy'))
+        self.assertTrue(os.path.isfile(os.path.join(dst, 'dir2', 'file2')))
+        for workers in 0, -1:
+            with self.assertRaises(ValueError):
+                shutil.copytree(src, dst + '2', workers=workers)
+        self.assertFalse(os.path.exists(dst + '2'))
+
+    def test_copytree_progress(self):
+        src = self.mkdtemp()
+        dst = os.path.join(self.mkdtemp(), 'dst')
+        self.make_tree(src, depth=1)
+        progress = []
+        shutil.copytree(src, dst, progress=lambda *args: progress.append(args))
+        self.assertEqual(len(progress), 12)
+        self.assertIn((os.path.join(src, 'dir1', 'file2'),
+                       os.path.join(dst, 'dir1', 'file2')), progress)
+
     # Issue #3002: copyfile and copytree block indefinitely on named pipes
     @unittest.skipUnless(hasattr(os, "mkfifo"), 'requires os.mkfifo()')
     @os_helper.skip_unless_symlink
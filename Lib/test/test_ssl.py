@@ -4284,6 +4284,74 @@ def test_sendfile(self):
                     s.sendfile(file)
                     self.assertEqual(s.recv(1024), TEST_DATA)
 
+    def test_sendfile_ktls(self):
+        TEST_DATA = bytes(range(256)) * 16
+        with open(os_helper.TESTFN, 'wb') as f:
+            f.write(TEST_DATA)
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        client_context, server_context, hostname = testing_context()
+        client_context.options |= getattr(ssl, 'OP_ENABLE_KTLS', 0)
+        server = ThreadedEchoServer(context=server_context, chatty=False)
+        with server:
+            with client_context.wrap_socket(socket.socket(),
+                                            server_hostname=hostname) as s:
+                s.connect((HOST, server.port))
+                uses_ktls = s._sslobj.uses_ktls_for_send()
+                with open(os_helper.TESTFN, 'rb') as file:
+                    if uses_ktls:
+                        with unittest.mock.patch.object(
+                            s, '_sendfile_use_send',
+                            side_effect=AssertionError('not zero-copy')):
+                            self.assertEqual(s.sendfile(file, 100, 1000),
+                                             1000)
+                    else:
+                        self.assertEqual(s.sendfile(file, 100, 1000), 1000)
+                    self.assertEqual(file.tell(), 1100)
+                    data = b''
+                    while len(data) < 1000:
+                        data += s.recv(1024)
+                    self.assertEqual(data, TEST_DATA[100:1100].lower())
+        if not uses_ktls:
+            self.skipTest('kernel TLS is not used for sending')
+
+    def test_sendfile_ktls_errors(self):
+        # Only the errors meaning that the file cannot be sent with
+        # sendfile() fall back on send().
+        with open(os_helper.TESTFN, 'wb') as f:
+            f.write(b'data')
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        client_context, server_context, hostname = testing_context()
+        server = ThreadedEchoServer(context=server_context, chatty=False)
+        with server:
+            with client_context.wrap_socket(socket.socket(),
+                                            server_hostname=hostname) as s:
+                s.connect((HOST, server.port))
+                if not hasattr(s._sslobj, 'sendfile'):
+                    self.skipTest('requires SSL_sendfile()')
+                sslobj = unittest.mock.Mock(wraps=s._sslobj)
+                sslobj.uses_ktls_for_send.return_value = True
+                for exc, fallback in [
+                    (OSError(errno.EINVAL, 'EINVAL'), True),
+                    (OSError(errno.EOPNOTSUPP, 'EOPNOTSUPP'), True),
+                    (OSError(errno.EPIPE, 'EPIPE'), False),
+                    (ssl.SSLError(errno.EINVAL, 'SSL error'), False),
+                    (TimeoutError(), False),
+                ]:
+                    with (self.subTest(exc=exc),
+                          unittest.mock.patch.object(s, '_sslobj', sslobj),
+                          unittest.mock.patch.object(
+                              s, '_sendfile_use_send',
+                              return_value=4) as sendfile_use_send,
+                          open(os_helper.TESTFN, 'rb') as file):
+                        sslobj.sendfile.side_effect = exc
+                        if fallback:
+                            self.assertEqual(s.sendfile(file), 4)
+                            sendfile_use_send.assert_called_once()
+                        else:
+                            with self.assertRaises(type(exc)):
+                                s.sendfile(file)
+                            sendfile_use_send.assert_not_called()
+
     def test_session(self):
         client_context, server_context, hostname = testing_context()
         # TODO: sessions aren't compatible with TLSv1.3 yet
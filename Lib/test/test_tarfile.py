@@ -1746,6 +1746,22 @@ def _test_gz_header(self, compresslevel):
         fobj = self._compressed_tar(compresslevel)
         self.assertEqual(fobj.getvalue()[:3], b"\x1f\x8b\x08")
 
+    def _test_gz_workers(self):
+        data = b"".join(b"%d\n" % i for i in range(100_000))
+        outputs = []
+        for workers in 1, 3:
+            fobj = io.BytesIO()
+            with tarfile.open(tmpname, self.mode, fobj,
+                              workers=workers) as tarfl:
+                tarinfo = tarfile.TarInfo("foo")
+                tarinfo.size = len(data)
+                tarfl.addfile(tarinfo, io.BytesIO(data))
+            outputs.append(fobj.getvalue())
+            fobj.seek(0)
+            with tarfile.open(fileobj=fobj) as tarfl:
+                self.assertEqual(tarfl.extractfile("foo").read(), data)
+        self.assertEqual(outputs[0][10:], outputs[1][10:])
+
 class Bz2CompressWriteTest(Bz2Test, _CompressedWriteTest, unittest.TestCase):
     prefix = "w:"
     def test_compression_levels(self):
@@ -1768,6 +1784,9 @@ def test_compression_levels(self):
         self._test_gz_header(5)
         self._test_gz_header(9)
 
+    def test_workers(self):
+        self._test_gz_workers()
+
 class GzCompressStreamWriteTest(GzipTest, _CompressedWriteTest,
         unittest.TestCase):
     prefix = "w|"
@@ -1776,6 +1795,9 @@ def test_compression_levels(self):
         self._test_gz_header(5)
         self._test_gz_header(9)
 
+    def test_workers(self):
+        self._test_gz_workers()
+
 class CompressLevelRaises(unittest.TestCase):
     def test_compresslevel_wrong_modes(self):
         compresslevel = 5
@@ -1794,6 +1816,13 @@ def test_wrong_compresslevels(self):
         with self.assertRaises(ValueError):
             tarfile.open(tmpname, "w|bz2", fobj, compresslevel=10)
 
+    def test_workers_wrong_modes(self):
+        fobj = io.BytesIO()
+        with self.assertRaises(TypeError):
+            tarfile.open(tmpname, "w:", fobj, workers=2)
+        with self.assertRaises(ValueError):
+            tarfile.open(tmpname, "w|", fobj, workers=2)
+
 class GNUWriteTest(unittest.TestCase):
     # This testcase checks for correct creation of GNU Longname
     # and Longlink extended headers (cp. bug #812325).
@@ -1,5 +1,6 @@
 import _pyio
 import array
+import collections.abc
 import contextlib
 import importlib.util
 import io
@@ -10,6 +11,7 @@
 import struct
 import subprocess
 import sys
+import threading
 import time
 import unittest
 import unittest.mock as mock
@@ -19,7 +21,7 @@
 from tempfile import TemporaryFile
 from random import randint, random, randbytes
 
-from test import archiver_tests
+from test import archiver_tests, support
 from test.support import script_helper, os_helper
 from test.support import (
     findfile, requires_zlib, requires_bz2, requires_lzma,
@@ -2430,19 +2432,24 @@ def test_full_overlap(self):
             b'\x06\x00\x00\x00\x00\x02\x00\x02\x00^\x00\x00\x00/\x00\x00'
             b'\x00\x00\x00'
         )
-        with zipfile.ZipFile(io.BytesIO(data), 'r') as zipf:
-            self.assertEqual(zipf.namelist(), ['a', 'b'])
-            zi = zipf.getinfo('a')
-            self.assertEqual(zi.header_offset, 0)
-            self.assertEqual(zi.compress_size, 16)
-            self.assertEqual(zi.file_size, 1033)
-            zi = zipf.getinfo('b')
-            self.assertEqual(zi.header_offset, 0)
-            self.assertEqual(zi.compress_size, 16)
-            self.assertEqual(zi.file_size, 1033)
-            self.assertEqual(len(zipf.read('a')), 1033)
-            with self.assertRaisesRegex(zipfile.BadZipFile, 'File name.*differ'):
-                zipf.read('b')
+        for lazy_index in False, True:
+            with (self.subTest(lazy_index=lazy_index),
+                  zipfile.ZipFile(io.BytesIO(data), 'r',
+                                  lazy_index=lazy_index) as zipf):
+                self.assertEqual(zipf.namelist(), ['a', 'b'])
+                zi = zipf.getinfo('a')
+                self.assertEqual(zi.header_offset, 0)
+                self.assertEqual(zi.compress_size, 16)
+                self.assertEqual(zi.file_size, 1033)
+                zi = zipf.getinfo('b')
+                self.assertEqual(zi.header_offset, 0)
+                self.assertEqual(zi.compress_size, 16)
+                self.assertEqual(zi.file_size, 1033)
+                # The second entry ends where it starts
+                self.assertEqual(zi._end_offset, 0)
+                self.assertEqual(len(zipf.read('a')), 1033)
+                with self.assertRaisesRegex(zipfile.BadZipFile, 'File name.*differ'):
+                    zipf.read('b')
 
     @requires_zlib()
     def test_quoted_overlap(self):
@@ -2461,19 +2468,22 @@ def test_quoted_overlap(self):
             b'bPK\x05\x06\x00\x00\x00\x00\x02\x00\x02\x00^\x00\x00'
             b'\x00S\x00\x00\x00\x00\x00'
         )
-        with zipfile.ZipFile(io.BytesIO(data), 'r') as zipf:
-            self.assertEqual(zipf.namelist(), ['a', 'b'])
-            zi = zipf.getinfo('a')
-            self.assertEqual(zi.header_offset, 0)
-            self.assertEqual(zi.compress_size, 52)
-            self.assertEqual(zi.file_size, 1064)
-            zi = zipf.getinfo('b')
-            self.assertEqual(zi.header_offset, 36)
-            self.assertEqual(zi.compress_size, 16)
-            self.assertEqual(zi.file_size, 1033)
-            with self.assertRaisesRegex(zipfile.BadZipFile, 'Overlapped entries'):
-                zipf.read('a')
-            self.assertEqual(len(zipf.read('b')), 1033)
+        for lazy_index in False, True:
+            with (self.subTest(lazy_index=lazy_index),
+                  zipfile.ZipFile(io.BytesIO(data), 'r',
+                                  lazy_index=lazy_index) as zipf):
+                self.assertEqual(zipf.namelist(), ['a', 'b'])
+                zi = zipf.getinfo('a')
+                self.assertEqual(zi.header_offset, 0)
+                self.assertEqual(zi.compress_size, 52)
+                self.assertEqual(zi.file_size, 1064)
+                zi = zipf.getinfo('b')
+                self.assertEqual(zi.header_offset, 36)
+                self.assertEqual(zi.compress_size, 16)
+                self.assertEqual(zi.file_size, 1033)
+                with self.assertRaisesRegex(zipfile.BadZipFile, 'Overlapped entries'):
+                    zipf.read('a')
+                self.assertEqual(len(zipf.read('b')), 1033)
 
     def tearDown(self):
         unlink(TESTFN)
@@ -3365,6 +3375,11 @@ def test_read_with_metadata_encoding(self):
         with zipfile.ZipFile(TESTFN, "r", metadata_encoding='shift_jis') as zipfp:
             self._test_read(zipfp, self.file_names, self.file_content)
 
+    def test_read_with_metadata_encoding_lazy_index(self):
+        with zipfile.ZipFile(TESTFN, "r", metadata_encoding='shift_jis',
+                             lazy_index=True) as zipfp:
+            self._test_read(zipfp, self.file_names, self.file_content)
+
     def test_read_without_metadata_encoding(self):
         # Read the ZIP archive without metadata_encoding
         expected_names = [name.encode('shift_jis').decode('cp437')
@@ -3520,6 +3535,316 @@ def test_too_short(self):
             b"zzz", zipfile._Extra.strip(b"zzz", (self.ZIP64_EXTRA,)))
 
 
+class AbstractParallelWriteTests:
+    def setUp(self):
+        self.files = []
+        for i in range(20):
+            data = b''.join(b'%d %d\n' % (i, j) for j in range(i * 1000))
+            self.files.append((f'file{i}', data))
+
+    def tearDown(self):
+        unlink(TESTFN)
+        unlink(TESTFN2)
+
+    def make_archive(self, f, workers):
+        with zipfile.ZipFile(f, 'w', self.compression,
+                             workers=workers) as zipfp:
+            for name, data in self.files[:10]:
+                zinfo = zipfile.ZipInfo(name, (2024, 1, 1, 0, 0, 0))
+                zinfo.compress_type = self.compression
+                zipfp.writestr(zinfo, data)
+            zipfp.mkdir('dir')
+            for name, data in self.files[10:]:
+                zinfo = zipfile.ZipInfo(name, (2024, 1, 1, 0, 0, 0))
+                zipfp.writestr(zinfo, bytearray(data),
+                               compress_type=self.compression)
+
+    def test_same_as_serial(self):
+        expected = io.BytesIO()
+        self.make_archive(expected, None)
+        for workers in 1, 2, 4:
+            with self.subTest(workers=workers):
+                f = io.BytesIO()
+                self.make_archive(f, workers)
+                self.assertEqual(f.getvalue(), expected.getvalue())
+                with zipfile.ZipFile(f) as zipfp:
+                    self.assertIsNone(zipfp.testzip())
+
+    def test_unseekable(self):
+        f = Unseekable(io.BytesIO())
+        self.make_archive(f, 2)
+        with zipfile.ZipFile(f.fp) as zipfp:
+            self.assertEqual(zipfp.namelist()[10:12], ['dir/', 'file10'])
+            for name, data in self.files:
+                self.assertEqual(zipfp.read(name), data)
+
+    def test_write(self):
+        with open(TESTFN, 'wb') as f:
+            f.write(self.files[-1][1])
+        with zipfile.ZipFile(TESTFN2, 'w', self.compression,
+                             workers=2) as zipfp:
+            zipfp.write(TESTFN, 'a')
+            zipfp.writestr('b', b'b')
+            zipfp.write(TESTFN, 'c')
+            # Compressed members are written before returning the list
+            self.assertEqual(zipfp.namelist(), ['a', 'b', 'c'])
+            with zipfp.open('d', 'w') as f:
+                f.write(b'd')
+            zipfp.write(TESTFN, 'e')
+        with zipfile.ZipFile(TESTFN2) as zipfp:
+            self.assertEqual(zipfp.namelist(), ['a', 'b', 'c', 'd', 'e'])
+            self.assertEqual(zipfp.read('a'), self.files[-1][1])
+            self.assertEqual(zipfp.read('e'), self.files[-1][1])
+            self.assertEqual(zipfp.getinfo('e').compress_type,
+                             self.compression)
+
+    def test_write_large_file(self):
+        # Large files are compressed in the calling thread, after the
+        # pending members
+        with open(TESTFN, 'wb') as f:
+            f.write(self.files[-1][1])
+        with (mock.patch('zipfile._PARALLEL_MAX_FILE_SIZE',
+                         len(self.files[-1][1]) - 1),
+              zipfile.ZipFile(TESTFN2, 'w', self.compression,
+                              workers=2) as zipfp):
+            zipfp.writestr('a', b'a')
+            with mock.patch('zipfile._compress_file') as compress_file:
+                zipfp.write(TESTFN, 'b')
+            compress_file.assert_not_called()
+            zipfp.writestr('c', b'c')
+        with zipfile.ZipFile(TESTFN2) as zipfp:
+            self.assertEqual(zipfp.namelist(), ['a', 'b', 'c'])
+            self.assertEqual(zipfp.read('b'), self.files[-1][1])
+            self.assertIsNone(zipfp.testzip())
+
+    def test_write_error(self):
+        # Errors opening the file are raised by write()
+        with zipfile.ZipFile(TESTFN2, 'w', self.compression,
+                             workers=2) as zipfp:
+            zipfp.writestr('a', b'a')
+            with mock.patch('zipfile.open', create=True,
+                            side_effect=PermissionError):
+                with self.assertRaises(PermissionError):
+                    zipfp.write(__file__, 'b')
+            zipfp.writestr('c', b'c')
+            self.assertEqual(zipfp.namelist(), ['a', 'c'])
+
+    def test_close_cancelled(self):
+        # The files of the members whose compression is cancelled because
+        # of an error are closed
+        compress_file = zipfile._compress_file
+        fail = threading.Event()
+        resume = threading.Event()
+
+        def compress(src, *args):
+            if os.path.basename(src.name) == 'a':
+                fail.wait(support.SHORT_TIMEOUT)
+                src.close()
+                raise OSError('compression failed')
+            resume.wait(support.SHORT_TIMEOUT)
+            return compress_file(src, *args)
+
+        with temp_dir() as d, mock.patch('zipfile._compress_file', compress):
+            zipfp = zipfile.ZipFile(TESTFN2, 'w', self.compression,
+                                    workers=2)
+            for name in 'abcd':
+                with open(os.path.join(d, name), 'wb') as f:
+                    f.write(name.encode())
+                zipfp.write(os.path.join(d, name), name)
+            pending = list(zipfp._pending)
+            executor = zipfp._executor
+            shutdown = executor.shutdown
+
+            def cancel_and_resume(**kwargs):
+                # Cancel the queued members while the workers are busy
+                shutdown(wait=False, cancel_futures=True)
+                resume.set()
+                shutdown(**kwargs)
+
+            executor.shutdown = cancel_and_resume
+            fail.set()
+            with self.assertRaises(OSError):
+                zipfp.close()
+        self.assertTrue(pending[3][1].cancelled())
+        for zinfo, future, src in pending:
+            self.assertTrue(src.closed, zinfo.filename)
+
+    def test_append(self):
+        self.make_archive(TESTFN2, None)
+        with zipfile.ZipFile(TESTFN2, 'a', self.compression,
+                             workers=2) as zipfp:
+            zipfp.writestr('new', b'new data')
+        with zipfile.ZipFile(TESTFN2) as zipfp:
+            self.assertEqual(len(zipfp.namelist()), 22)
+            self.assertEqual(zipfp.read('new'), b'new data')
+            self.assertIsNone(zipfp.testzip())
+
+
+class StoredParallelWriteTests(AbstractParallelWriteTests, unittest.TestCase):
+    compression = zipfile.ZIP_STORED
+
+    def test_bad_workers(self):
+        with self.assertRaises(ValueError):
+            zipfile.ZipFile(TESTFN2, 'w', workers=0)
+        self.make_archive(TESTFN2, None)
+        with self.assertRaises(ValueError):
+            zipfile.ZipFile(TESTFN2, 'r', workers=2)
+
+    def test_compression_not_available(self):
+        with zipfile.ZipFile(io.BytesIO(), 'w', workers=2) as zipfp:
+            with mock.patch('zipfile.zlib', None):
+                with self.assertRaises(RuntimeError):
+                    zipfp.writestr('a', b'a',
+                                   compress_type=zipfile.ZIP_DEFLATED)
+            self.assertEqual(zipfp.namelist(), [])
+
+@requires_zlib()
+class DeflateParallelWriteTests(AbstractParallelWriteTests,
+                                unittest.TestCase):
+    compression = zipfile.ZIP_DEFLATED
+
+@requires_bz2()
+class Bzip2ParallelWriteTests(AbstractParallelWriteTests, unittest.TestCase):
+    compression = zipfile.ZIP_BZIP2
+
+@requires_lzma()
+class LzmaParallelWriteTests(AbstractParallelWriteTests, unittest.TestCase):
+    compression = zipfile.ZIP_LZMA
+
+
+class LazyIndexTests(unittest.TestCase):
+    def setUp(self):
+        with zipfile.ZipFile(TESTFN, "w", zipfile.ZIP_STORED) as zipfp:
+            zipfp.comment = b'archive comment'
+            zipfp.writestr('dir/', b'')
+            for i in range(100):
+                zinfo = zipfile.ZipInfo(f'dir/file{i}', (2024, 1, 2, 3, 4, i % 60))
+                zinfo.comment = b'comment %d' % i
+                zipfp.writestr(zinfo, b'data %d' % i)
+            with self.assertWarns(UserWarning):
+                zipfp.writestr('dir/file7', b'duplicate')
+            zipfp.writestr('\u20ac', b'euro')
+
+    def tearDown(self):
+        unlink(TESTFN)
+
+    def assertSameInfo(self, zinfo, expected):
+        for attr in zipfile.ZipInfo.__slots__:
+            self.assertEqual(getattr(zinfo, attr), getattr(expected, attr),
+                             attr)
+
+    def check_lazy_index(self, file):
+        with (zipfile.ZipFile(TESTFN) as expected,
+              zipfile.ZipFile(file, lazy_index=True) as zipfp):
+            self.assertEqual(zipfp.comment, b'archive comment')
+            self.assertEqual(zipfp.namelist(), expected.namelist())
+            self.assertEqual(len(zipfp.infolist()), 103)
+            for zinfo, expected_info in zip(zipfp.infolist(),
+                                            expected.infolist(), strict=True):
+                self.assertSameInfo(zinfo, expected_info)
+            self.assertSameInfo(zipfp.infolist()[-1], expected.infolist()[-1])
+            self.assertEqual(len(zipfp.infolist()[10:20]), 10)
+            with self.assertRaises(IndexError):
+                zipfp.infolist()[103]
+            self.assertEqual(len(zipfp.NameToInfo), 102)
+            self.assertEqual(list(zipfp.NameToInfo), list(expected.NameToInfo))
+            for name in expected.namelist():
+                self.assertSameInfo(zipfp.getinfo(name), expected.getinfo(name))
+                self.assertEqual(zipfp.read(name), expected.read(name))
+            self.assertEqual(zipfp.read('dir/file7'), b'duplicate')
+            self.assertEqual(zipfp.read('\u20ac'), b'euro')
+            self.assertIn('dir/file99', zipfp.NameToInfo)
+            self.assertNotIn('dir/file100', zipfp.NameToInfo)
+            self.assertNotIn(b'dir/file1', zipfp.NameToInfo)
+            self.assertIsNone(zipfp.NameToInfo.get('dir/file100'))
+            with self.assertRaises(KeyError):
+                zipfp.getinfo('dir/file100')
+            self.assertIsNone(zipfp.testzip())
+
+    def test_file(self):
+        self.check_lazy_index(TESTFN)
+
+    def test_file_object(self):
+        with open(TESTFN, 'rb') as f:
+            self.check_lazy_index(io.BytesIO(f.read()))
+
+    def test_open_is_lazy(self):
+        with zipfile.ZipFile(TESTFN, lazy_index=True) as zipfp:
+            self.assertIsNone(zipfp._index._offsets)
+            self.assertEqual(zipfp.read('dir/file1'), b'data 1')
+            self.assertIsNotNone(zipfp._index._table)
+
+    def test_views(self):
+        with (zipfile.ZipFile(TESTFN) as expected,
+              zipfile.ZipFile(TESTFN, lazy_index=True) as zipfp):
+            # The ZipInfo instances are created once
+            zinfo = zipfp.getinfo('dir/file1')
+            self.assertIs(zipfp.getinfo('dir/file1'), zinfo)
+            self.assertIs(zipfp.NameToInfo['dir/file1'], zinfo)
+            self.assertIs(zipfp.filelist[2], zinfo)
+            zinfo.comment = b'changed'
+            self.assertEqual(zipfp.getinfo('dir/file1').comment, b'changed')
+            zinfo.comment = b'comment 1'
+
+            self.assertIsInstance(zipfp.infolist(), list)
+            self.assertIs(zipfp.infolist()[2], zinfo)
+            self.assertIsInstance(zipfp.filelist, collections.abc.Sequence)
+            self.assertEqual(zipfp.filelist.index(zinfo), 2)
+            self.assertIn(zinfo, zipfp.filelist)
+            self.assertEqual(list(reversed(zipfp.filelist)),
+                             zipfp.infolist()[::-1])
+
+            self.assertIsInstance(zipfp.NameToInfo, collections.abc.Mapping)
+            self.assertEqual(list(zipfp.NameToInfo.keys()),
+                             list(expected.NameToInfo.keys()))
+            self.assertEqual([zinfo.filename
+                              for zinfo in zipfp.NameToInfo.values()],
+                             [zinfo.filename
+                              for zinfo in expected.NameToInfo.values()])
+            for (name, zinfo), (expected_name, expected_info) in zip(
+                    zipfp.NameToInfo.items(), expected.NameToInfo.items(),
+                    strict=True):
+                self.assertEqual(name, expected_name)
+                self.assertSameInfo(zinfo, expected_info)
+            self.assertEqual(zipfp.NameToInfo.get('dir/file7').file_size, 9)
+
+    def test_executable_prepended(self):
+        for name in 'exe_with_zip', 'exe_with_z64':
+            with self.subTest(name=name):
+                name = findfile(name, subdir='archivetestdata')
+                with (zipfile.ZipFile(name) as expected,
+                      zipfile.ZipFile(name, lazy_index=True) as zipfp):
+                    for zinfo, expected_info in zip(zipfp.infolist(),
+                                                    expected.infolist(),
+                                                    strict=True):
+                        self.assertSameInfo(zinfo, expected_info)
+                        self.assertEqual(zipfp.read(zinfo),
+                                         expected.read(expected_info))
+
+    def test_write_modes(self):
+        for mode in 'w', 'x', 'a':
+            with self.subTest(mode=mode):
+                with self.assertRaises(ValueError):
+                    zipfile.ZipFile(TESTFN2, mode, lazy_index=True)
+        self.assertFalse(os.path.exists(TESTFN2))
+
+    def test_closed(self):
+        zipfp = zipfile.ZipFile(TESTFN, lazy_index=True)
+        zipfp.close()
+        with self.assertRaises(ValueError):
+            zipfp.getinfo('dir/file1')
+
+    def test_bad_central_directory(self):
+        with open(TESTFN, 'rb') as f:
+            data = bytearray(f.read())
+        start = data.index(zipfile.stringCentralDir)
+        data[start + 1] = 0
+        with zipfile.ZipFile(io.BytesIO(data), lazy_index=True) as zipfp:
+            with self.assertRaisesRegex(zipfile.BadZipFile,
+                                        'Bad magic number'):
+                zipfp.namelist()
+
+
 class StatIO(_pyio.BytesIO):
     """Buffer which remembers the number of bytes that were read."""
 
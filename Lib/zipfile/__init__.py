@@ -3,7 +3,10 @@
 
 XXX references to utf-8 need further investigation.
 """
+import array
 import binascii
+import bisect
+import collections.abc
 import importlib.util
 import io
 import os
@@ -1273,9 +1276,19 @@ def write(self, data):
         if self._compressor:
             data = self._compressor.compress(data)
             self._compress_size += len(data)
+        else:
+            self._compress_size += nbytes
         self._fileobj.write(data)
         return nbytes
 
+    def _write_compressed(self, data, crc, file_size):
+        # Write the data compressed in advance by _compress_member()
+        self._compressor = None
+        self._file_size = file_size
+        self._compress_size = len(data)
+        self._crc = crc
+        self._fileobj.write(data)
+
     def close(self):
         if self.closed:
             return
@@ -1286,9 +1299,7 @@ def close(self):
                 buf = self._compressor.flush()
                 self._compress_size += len(buf)
                 self._fileobj.write(buf)
-                self._zinfo.compress_size = self._compress_size
-            else:
-                self._zinfo.compress_size = self._file_size
+            self._zinfo.compress_size = self._compress_size
             self._zinfo.CRC = self._crc
             self._zinfo.file_size = self._file_size
 
@@ -1323,6 +1334,306 @@ def close(self):
 
 
 
+def _compress_member(data, compress_type, compresslevel):
+    """Return the compressed data, the CRC and the size of data."""
+    crc = crc32(data)
+    file_size = len(data)
+    compressor = _get_compressor(compress_type, compresslevel)
+    if compressor:
+        data = compressor.compress(data) + compressor.flush()
+    return data, crc, file_size
+
+
+# Files larger than this are not compressed in memory by worker threads
+_PARALLEL_MAX_FILE_SIZE = 32 * 1024 * 1024
+
+
+def _compress_file(src, compress_type, compresslevel):
+    """Return the compressed content, the CRC and the size of an open
+    binary file, which is closed."""
+    crc = 0
+    file_size = 0
+    chunks = []
+    compressor = _get_compressor(compress_type, compresslevel)
+    with src:
+        while data := src.read(1024*64):
+            crc = crc32(data, crc)
+            file_size += len(data)
+            if compressor:
+                data = compressor.compress(data)
+            chunks.append(data)
+    if compressor:
+        chunks.append(compressor.flush())
+    return b"".join(chunks), crc, file_size
+
+
+def _decode_filename(filename, flags, metadata_encoding):
+    if flags & _MASK_UTF_FILENAME:
+        # UTF-8 file names extension
+        return filename.decode('utf-8')
+    else:
+        # Historical ZIP filename encoding
+        return filename.decode(metadata_encoding or 'cp437')
+
+
+def _read_central_dir_entry(data, pos, concat, metadata_encoding):
+    """Return the ZipInfo for the central directory entry at *pos* in *data*
+    and the position of the next entry."""
+    if len(data) - pos < sizeCentralDir:
+        raise BadZipFile("Truncated central directory")
+    centdir = struct.unpack_from(structCentralDir, data, pos)
+    if centdir[_CD_SIGNATURE] != stringCentralDir:
+        raise BadZipFile("Bad magic number for central directory")
+    pos += sizeCentralDir
+    end = pos + centdir[_CD_FILENAME_LENGTH]
+    filename = bytes(data[pos:end])
+    orig_filename_crc = crc32(filename)
+    filename = _decode_filename(filename, centdir[_CD_FLAG_BITS],
+                                metadata_encoding)
+    # Create ZipInfo instance to store file information
+    x = ZipInfo(filename)
+    pos, end = end, end + centdir[_CD_EXTRA_FIELD_LENGTH]
+    x.extra = bytes(data[pos:end])
+    pos, end = end, end + centdir[_CD_COMMENT_LENGTH]
+    x.comment = bytes(data[pos:end])
+    x.header_offset = centdir[_CD_LOCAL_HEADER_OFFSET]
+    (x.create_version, x.create_system, x.extract_version, x.reserved,
+     x.flag_bits, x.compress_type, t, d,
+     x.CRC, x.compress_size, x.file_size) = centdir[1:12]
+    if x.extract_version > MAX_EXTRACT_VERSION:
+        raise NotImplementedError("zip file version %.1f" %
+                                  (x.extract_version / 10))
+    x.volume, x.internal_attr, x.external_attr = centdir[15:18]
+    # Convert date/time code to (year, month, day, hour, min, sec)
+    x._raw_time = t
+    x.date_time = ( (d>>9)+1980, (d>>5)&0xF, d&0x1F,
+                    t>>11, (t>>5)&0x3F, (t&0x1F) * 2 )
+    x._decodeExtra(orig_filename_crc)
+    x.header_offset = x.header_offset + concat
+    return x, end
+
+
+# Offsets of fields in a central directory entry used by _CentralDirIndex
+_CD_FLAG_BITS_OFFSET = 8
+_CD_LENGTHS_OFFSET = 28
+_CD_LOCAL_HEADER_OFFSET_OFFSET = 42
+_struct_cd_lengths = struct.Struct("<3H")
+# flag bits and file name length
+_struct_cd_flags = struct.Struct("<H18xH")
+
+class _CentralDirIndex:
+    """Compact index of the entries of a central directory.
+
+    Only the offsets of the entries in the central directory and the hashes
+    of their names are kept in memory, in arrays built the first time they
+    are needed.  ZipInfo instances are created on demand and kept, so that
+    the same instance is returned for an entry.
+    """
+
+    def __init__(self, data, base, size, concat, start_dir, metadata_encoding):
+        self._data = data           # bytes or mmap of the central directory
+        self._base = base           # start of the central directory in data
+        self._size = size
+        self._concat = concat
+        self._start_dir = start_dir
+        self._metadata_encoding = metadata_encoding
+        self._offsets = None        # offset of each entry in data
+        self._hashes = None         # hash of the name of each entry
+        self._table = None          # open addressing hash table of indices
+        self._header_offsets = None # sorted local header offsets
+        self._header_indices = None # entry index of each header offset
+        self._infos = {}            # ZipInfo of each materialized entry
+
+    def close(self):
+        data = self._data
+        self._data = None
+        if hasattr(data, 'close'):
+            data.close()
+
+    def _get_data(self):
+        if self._data is None:
+            raise ValueError(
+                "Attempt to use ZIP archive that was already closed")
+        return self._data
+
+    def _get_offsets(self):
+        offsets = self._offsets
+        if offsets is None:
+            data = self._get_data()
+            pos = self._base
+            end = pos + self._size
+            size = len(data)
+            unpack_lengths = _struct_cd_lengths.unpack_from
+            offsets = array.array('q')
+            while pos < end:
+                if size - pos < sizeCentralDir:
+                    raise BadZipFile("Truncated central directory")
+                if data[pos:pos+4] != stringCentralDir:
+                    raise BadZipFile("Bad magic number for central directory")
+                offsets.append(pos)
+                n, m, k = unpack_lengths(data, pos + _CD_LENGTHS_OFFSET)
+                pos += sizeCentralDir + n + m + k
+            self._offsets = offsets
+        return offsets
+
+    def __len__(self):
+        return len(self._get_offsets())
+
+    def name(self, i):
+        """Return the name of the i-th entry."""
+        data = self._get_data()
+        pos = self._get_offsets()[i]
+        flags, length = _struct_cd_flags.unpack_from(
+            data, pos + _CD_FLAG_BITS_OFFSET)
+        pos += sizeCentralDir
+        filename = _decode_filename(bytes(data[pos:pos + length]), flags,
+                                    self._metadata_encoding)
+        return _sanitize_filename(filename)
+
+    def namelist(self):
+        data = self._get_data()
+        metadata_encoding = self._metadata_encoding
+        unpack_flags = _struct_cd_flags.unpack_from
+        names = []
+        for pos in self._get_offsets():
+            flags, length = unpack_flags(data, pos + _CD_FLAG_BITS_OFFSET)
+            pos += sizeCentralDir
+            filename = _decode_filename(bytes(data[pos:pos + length]), flags,
+                                        metadata_encoding)
+            names.append(_sanitize_filename(filename))
+        return names
+
+    def info(self, i):
+        """Return the ZipInfo instance for the i-th entry."""
+        try:
+            return self._infos[i]
+        except KeyError:
+            pass
+        data = self._get_data()
+        zinfo, _ = _read_central_dir_entry(data, self._get_offsets()[i],
+                                           self._concat,
+                                           self._metadata_encoding)
+        # Like _RealGetContents(), an entry sharing its local header with
+        # an earlier entry ends where it starts.
+        header_offsets = self._get_header_offsets()
+        offset = zinfo.header_offset
+        j = bisect.bisect_left(header_offsets, offset)
+        if self._header_indices[j] != i:
+            zinfo._end_offset = offset
+        else:
+            j = bisect.bisect_right(header_offsets, offset, j)
+            if j < len(header_offsets):
+                zinfo._end_offset = header_offsets[j]
+            else:
+                zinfo._end_offset = self._start_dir
+        self._infos[i] = zinfo
+        return zinfo
+
+    def _get_header_offsets(self):
+        header_offsets = self._header_offsets
+        if header_offsets is None:
+            data = self._get_data()
+            offsets = []
+            for i, pos in enumerate(self._get_offsets()):
+                offset, = struct.unpack_from(
+                    "<L", data, pos + _CD_LOCAL_HEADER_OFFSET_OFFSET)
+                if offset == 0xFFFFFFFF:
+                    # The actual offset is in the Zip64 extra field
+                    offset = _read_central_dir_entry(
+                        data, pos, self._concat,
+                        self._metadata_encoding)[0].header_offset
+                else:
+                    offset += self._concat
+                offsets.append((offset, i))
+            offsets.sort()
+            header_offsets = self._header_offsets = array.array(
+                'q', [offset for offset, i in offsets])
+            self._header_indices = array.array(
+                'q', [i for offset, i in offsets])
+        return header_offsets
+
+    def _get_table(self):
+        table = self._table
+        if table is None:
+            n = len(self)
+            mask = (1 << (2 * n).bit_length()) - 1
+            hashes = array.array('q', [0]) * n
+            table = array.array('q', [-1]) * (mask + 1)
+            for i, name in enumerate(self.namelist()):
+                hashes[i] = h = hash(name)
+                j = h & mask
+                while (k := table[j]) >= 0:
+                    # A later entry with the same name replaces the earlier
+                    if hashes[k] == h and self.name(k) == name:
+                        break
+                    j = (j + 1) & mask
+                table[j] = i
+            self._hashes = hashes
+            self._table = table
+        return table
+
+    def find(self, name):
+        """Return the index of the last entry with the given name, or -1."""
+        table = self._get_table()
+        hashes = self._hashes
+        mask = len(table) - 1
+        h = hash(name)
+        j = h & mask
+        while (k := table[j]) >= 0:
+            if hashes[k] == h and self.name(k) == name:
+                return k
+            j = (j + 1) & mask
+        return -1
+
+
+class _LazyInfoList(collections.abc.Sequence):
+    """Read-only sequence of the ZipInfo instances of a _CentralDirIndex."""
+
+    def __init__(self, index):
+        self._index = index
+
+    def __len__(self):
+        return len(self._index)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._index.info(j) for j in range(*i.indices(len(self)))]
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError('list index out of range')
+        return self._index.info(i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._index.info(i)
+
+
+class _LazyNameToInfo(collections.abc.Mapping):
+    """Read-only mapping of names to the ZipInfo instances of a
+    _CentralDirIndex."""
+
+    def __init__(self, index):
+        self._index = index
+
+    def __len__(self):
+        table = self._index._get_table()
+        return len(table) - table.count(-1)
+
+    def __contains__(self, name):
+        return isinstance(name, str) and self._index.find(name) >= 0
+
+    def __getitem__(self, name):
+        i = self._index.find(name) if isinstance(name, str) else -1
+        if i < 0:
+            raise KeyError(name)
+        return self._index.info(i)
+
+    def __iter__(self):
+        return iter(dict.fromkeys(self._index.namelist()))
+
+
 class ZipFile:
     """ Class with methods to open, read, write, close, list zip files.
 
@@ -1343,14 +1654,23 @@ class ZipFile:
                    When using ZIP_STORED or ZIP_LZMA this keyword has no effect.
                    When using ZIP_DEFLATED integers 0 through 9 are accepted.
                    When using ZIP_BZIP2 integers 1 through 9 are accepted.
+    lazy_index: if True and mode is 'r', the central directory is indexed
+                on demand and ZipInfo instances are only created when
+                they are requested.
+    workers: None or the number of threads used to compress the members
+             passed to write() and writestr() in parallel.  They are
+             written to the archive in the order of the calls.
 
     """
 
     fp = None                   # Set here since __del__ checks it
+    _index = None
+    _pending = ()
     _windows_illegal_name_trans_table = None
 
     def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
-                 compresslevel=None, *, strict_timestamps=True, metadata_encoding=None):
+                 compresslevel=None, *, strict_timestamps=True, metadata_encoding=None,
+                 lazy_index=False, workers=None):
         """Open the ZIP file with mode read 'r', write 'w', exclusive create 'x',
         or append 'a'."""
         if mode not in ('r', 'w', 'x', 'a'):
@@ -1370,11 +1690,25 @@ def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
         self._comment = b''
         self._strict_timestamps = strict_timestamps
         self.metadata_encoding = metadata_encoding
+        self._lazy_index = lazy_index
+        self._index = None
 
         # Check that we don't try to write with nonconforming codecs
         if self.metadata_encoding and mode != 'r':
             raise ValueError(
                 "metadata_encoding is only supported for reading files")
+        if lazy_index and mode != 'r':
+            raise ValueError(
+                "lazy_index is only supported for reading files")
+        if workers is not None:
+            if mode == 'r':
+                raise ValueError(
+                    "workers is only supported for writing files")
+            if workers <= 0:
+                raise ValueError("workers must be greater than 0")
+        self._workers = workers
+        self._executor = None
+        self._pending = []      # Members being compressed by workers
 
         # Check if we were passed a file-like object
         if isinstance(file, os.PathLike):
@@ -1493,54 +1827,25 @@ def _RealGetContents(self):
         self.start_dir = offset_cd + concat
         if self.start_dir < 0:
             raise BadZipFile("Bad offset for central directory")
+        if self._lazy_index:
+            data, base = self._map_central_dir(size_cd)
+            self._index = _CentralDirIndex(data, base, size_cd, concat,
+                                           self.start_dir,
+                                           self.metadata_encoding)
+            self.filelist = _LazyInfoList(self._index)
+            self.NameToInfo = _LazyNameToInfo(self._index)
+            return
         fp.seek(self.start_dir, 0)
         data = fp.read(size_cd)
-        fp = io.BytesIO(data)
         total = 0
         while total < size_cd:
-            centdir = fp.read(sizeCentralDir)
-            if len(centdir) != sizeCentralDir:
-                raise BadZipFile("Truncated central directory")
-            centdir = struct.unpack(structCentralDir, centdir)
-            if centdir[_CD_SIGNATURE] != stringCentralDir:
-                raise BadZipFile("Bad magic number for central directory")
-            if self.debug > 2:
-                print(centdir)
-            filename = fp.read(centdir[_CD_FILENAME_LENGTH])
-            orig_filename_crc = crc32(filename)
-            flags = centdir[_CD_FLAG_BITS]
-            if flags & _MASK_UTF_FILENAME:
-                # UTF-8 file names extension
-                filename = filename.decode('utf-8')
-            else:
-                # Historical ZIP filename encoding
-                filename = filename.decode(self.metadata_encoding or 'cp437')
-            # Create ZipInfo instance to store file information
-            x = ZipInfo(filename)
-            x.extra = fp.read(centdir[_CD_EXTRA_FIELD_LENGTH])
-            x.comment = fp.read(centdir[_CD_COMMENT_LENGTH])
-            x.header_offset = centdir[_CD_LOCAL_HEADER_OFFSET]
-            (x.create_version, x.create_system, x.extract_version, x.reserved,
-             x.flag_bits, x.compress_type, t, d,
-             x.CRC, x.compress_size, x.file_size) = centdir[1:12]
-            if x.extract_version > MAX_EXTRACT_VERSION:
-                raise NotImplementedError("zip file version %.1f" %
-                                          (x.extract_version / 10))
-            x.volume, x.internal_attr, x.external_attr = centdir[15:18]
-            # Convert date/time code to (year, month, day, hour, min, sec)
-            x._raw_time = t
-            x.date_time = ( (d>>9)+1980, (d>>5)&0xF, d&0x1F,
-                            t>>11, (t>>5)&0x3F, (t&0x1F) * 2 )
-            x._decodeExtra(orig_filename_crc)
-            x.header_offset = x.header_offset + concat
+            if self.debug > 2 and len(data) - total >= sizeCentralDir:
+                print(struct.unpack_from(structCentralDir, data, total))
+            x, total = _read_central_dir_entry(data, total, concat,
+                                               self.metadata_encoding)
             self.filelist.append(x)
             self.NameToInfo[x.filename] = x
 
-            # update total bytes read from central directory
-            total = (total + sizeCentralDir + centdir[_CD_FILENAME_LENGTH]
-                     + centdir[_CD_EXTRA_FIELD_LENGTH]
-                     + centdir[_CD_COMMENT_LENGTH])
-
             if self.debug > 2:
                 print("total", total)
 
@@ -1551,13 +1856,42 @@ def _RealGetContents(self):
             zinfo._end_offset = end_offset
             end_offset = zinfo.header_offset
 
+    def _map_central_dir(self, size_cd):
+        """Return a buffer containing the central directory and its offset
+        in the buffer.
+
+        The file is memory-mapped if possible, otherwise the central
+        directory is read into memory.
+        """
+        try:
+            import mmap
+            fileno = self.fp.fileno()
+            # The offset of a mapping must be a multiple of the allocation
+            # granularity.
+            offset = self.start_dir - self.start_dir % mmap.ALLOCATIONGRANULARITY
+            length = self.start_dir - offset + size_cd
+            if length:
+                return (mmap.mmap(fileno, length, offset=offset,
+                                  access=mmap.ACCESS_READ),
+                        self.start_dir - offset)
+        except (ImportError, AttributeError, OSError, ValueError):
+            pass
+        self.fp.seek(self.start_dir, 0)
+        return self.fp.read(size_cd), 0
+
     def namelist(self):
         """Return a list of file names in the archive."""
+        self._write_pending()
+        if self._index is not None:
+            return self._index.namelist()
         return [data.filename for data in self.filelist]
 
     def infolist(self):
         """Return a list of class ZipInfo instances for files in the
         archive."""
+        self._write_pending()
+        if self._index is not None:
+            return list(self.filelist)
         return self.filelist
 
     def printdir(self, file=None):
@@ -1587,6 +1921,7 @@ def testzip(self):
 
     def getinfo(self, name):
         """Return the instance of ZipInfo given 'name'."""
+        self._write_pending()
         info = self.NameToInfo.get(name)
         if info is None:
             raise KeyError(
@@ -1650,6 +1985,7 @@ def open(self, name, mode="r", pwd=None, *, force_zip64=False):
         if not self.fp:
             raise ValueError(
                 "Attempt to use ZIP archive that was already closed")
+        self._write_pending()
 
         # Make sure we have an info object
         if isinstance(name, ZipInfo):
@@ -1920,6 +2256,13 @@ def write(self, filename, arcname=None,
             else:
                 zinfo.compress_level = self.compresslevel
 
+            if (self._workers is not None and
+                zinfo.file_size <= _PARALLEL_MAX_FILE_SIZE):
+                _check_compression(zinfo.compress_type)
+                # Open the file now to raise errors in the caller
+                src = open(filename, "rb")
+                self._write_parallel(zinfo, _compress_file, src)
+                return
             with open(filename, "rb") as src, self.open(zinfo, 'w') as dest:
                 shutil.copyfileobj(src, dest, 1024*8)
 
@@ -1951,11 +2294,47 @@ def writestr(self, zinfo_or_arcname, data,
         if compresslevel is not None:
             zinfo.compress_level = compresslevel
 
+        if self._workers is not None:
+            # Copy the data since it is compressed after returning
+            self._write_parallel(zinfo, _compress_member, bytes(data))
+            return
         zinfo.file_size = len(data)            # Uncompressed size
         with self._lock:
             with self.open(zinfo, mode='w') as dest:
                 dest.write(data)
 
+    def _write_parallel(self, zinfo, compress, source):
+        """Compress a member in a worker thread.
+
+        The members are written to the archive in the order in which they
+        are submitted, as soon as they are compressed.
+        """
+        _check_compression(zinfo.compress_type)
+        with self._lock:
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self._executor = ThreadPoolExecutor(self._workers)
+            future = self._executor.submit(compress, source,
+                                           zinfo.compress_type,
+                                           zinfo.compress_level)
+            self._pending.append((zinfo, future, source))
+            # Limit the memory used by the compressed data
+            self._write_pending(2 * self._workers)
+
+    def _write_pending(self, limit=0):
+        """Write the members compressed by the worker threads which are
+        done, waiting for the first ones while more than limit are pending."""
+        pending = self._pending
+        if not pending:
+            return
+        with self._lock:
+            while pending and (len(pending) > limit or pending[0][1].done()):
+                zinfo, future, _ = pending.pop(0)
+                data, crc, file_size = future.result()
+                zinfo.file_size = file_size
+                with self._open_to_write(zinfo) as dest:
+                    dest._write_compressed(data, crc, file_size)
+
     def mkdir(self, zinfo_or_directory_name, mode=511):
         """Creates a directory inside the zip archive."""
         if isinstance(zinfo_or_directory_name, ZipInfo):
@@ -1975,6 +2354,7 @@ def mkdir(self, zinfo_or_directory_name, mode=511):
         else:
             raise TypeError("Expected type str or ZipInfo")
 
+        self._write_pending()
         with self._lock:
             if self._seekable:
                 self.fp.seek(self.start_dir)
@@ -2007,14 +2387,27 @@ def close(self):
                              "Close the writing handle before closing the zip.")
 
         try:
-            if self.mode in ('w', 'x', 'a') and self._didModify: # write ending records
-                with self._lock:
-                    if self._seekable:
-                        self.fp.seek(self.start_dir)
-                    self._write_end_record()
+            try:
+                self._write_pending()
+            finally:
+                if self.mode in ('w', 'x', 'a') and self._didModify: # write ending records
+                    with self._lock:
+                        if self._seekable:
+                            self.fp.seek(self.start_dir)
+                        self._write_end_record()
         finally:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+                # Close the files of the members which were not compressed
+                for zinfo, future, source in self._pending:
+                    if future.cancelled() and not isinstance(source, bytes):
+                        source.close()
+                self._pending.clear()
             fp = self.fp
             self.fp = None
+            if self._index is not None:
+                self._index.close()
             self._fpclose(fp)
 
     def _write_end_record(self):
@@ -45,6 +45,8 @@ typedef struct _PyEncoderObject {
     PyObject *indent;
     PyObject *key_separator;
     PyObject *item_separator;
+    PyObject *dispatch;
+    PyObject *dispatch_cache;
     char sort_keys;
     char skipkeys;
     int allow_nan;
@@ -58,11 +60,27 @@ static PyMemberDef encoder_members[] = {
     {"indent", _Py_T_OBJECT, offsetof(PyEncoderObject, indent), Py_READONLY, "indent"},
     {"key_separator", _Py_T_OBJECT, offsetof(PyEncoderObject, key_separator), Py_READONLY, "key_separator"},
     {"item_separator", _Py_T_OBJECT, offsetof(PyEncoderObject, item_separator), Py_READONLY, "item_separator"},
+    {"dispatch", _Py_T_OBJECT, offsetof(PyEncoderObject, dispatch), Py_READONLY, "dispatch"},
     {"sort_keys", Py_T_BOOL, offsetof(PyEncoderObject, sort_keys), Py_READONLY, "sort_keys"},
     {"skipkeys", Py_T_BOOL, offsetof(PyEncoderObject, skipkeys), Py_READONLY, "skipkeys"},
     {NULL}
 };
 
+/* Destination of the UTF-8 output of Encoder.encode_utf8().
+ *
+ * The output is flushed from the PyUnicodeWriter in chunks of about
+ * ENCODER_CHUNK_SIZE characters, so that the whole output never exists
+ * as a str.  Chunks are passed to write if it is not NULL, otherwise they
+ * are accumulated in the bytes object result.
+ */
+typedef struct {
+    PyObject *write;
+    PyObject *result;
+    Py_ssize_t size;
+} encoder_sink;
+
+#define ENCODER_CHUNK_SIZE (64 * 1024)
+
 /* Forward decls */
 
 static PyObject *
@@ -86,11 +104,13 @@ encoder_dealloc(PyObject *self);
 static int
 encoder_clear(PyEncoderObject *self);
 static int
-encoder_listencode_list(PyEncoderObject *s, PyUnicodeWriter *writer, PyObject *seq, Py_ssize_t indent_level, PyObject *indent_cache);
+encoder_listencode_list(PyEncoderObject *s, PyUnicodeWriter *writer, encoder_sink *sink, PyObject *seq, Py_ssize_t indent_level, PyObject *indent_cache);
+static int
+encoder_listencode_obj(PyEncoderObject *s, PyUnicodeWriter *writer, encoder_sink *sink, PyObject *obj, Py_ssize_t indent_level, PyObject *indent_cache);
 static int
-encoder_listencode_obj(PyEncoderObject *s, PyUnicodeWriter *writer, PyObject *obj, Py_ssize_t indent_level, PyObject *indent_cache);
+encoder_listencode_dict(PyEncoderObject *s, PyUnicodeWriter *writer, encoder_sink *sink, PyObject *dct, Py_ssize_t indent_level, PyObject *indent_cache);
 static int
-encoder_listencode_dict(PyEncoderObject *s, PyUnicodeWriter *writer, PyObject *dct, Py_ssize_t indent_level, PyObject *indent_cache);
+encoder_encode_key_value(PyEncoderObject *s, PyUnicodeWriter *writer, encoder_sink *sink, bool *first, PyObject *dct, PyObject *key, PyObject *value, Py_ssize_t indent_level, PyObject *indent_cache, PyObject *item_separator);
 static PyObject *
 _encoded_const(PyObject *obj);
 static void
@@ -1215,17 +1235,18 @@ static PyType_Spec PyScannerType_spec = {
 static PyObject *
 encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    static char *kwlist[] = {"markers", "default", "encoder", "indent", "key_separator", "item_separator", "sort_keys", "skipkeys", "allow_nan", NULL};
+    static char *kwlist[] = {"markers", "default", "encoder", "indent", "key_separator", "item_separator", "sort_keys", "skipkeys", "allow_nan", "dispatch", NULL};
 
     PyEncoderObject *s;
     PyObject *markers, *defaultfn, *encoder, *indent, *key_separator;
     PyObject *item_separator;
+    PyObject *dispatch = Py_None;
     int sort_keys, skipkeys, allow_nan;
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OOOOUUppp:make_encoder", kwlist,
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OOOOUUppp|O:make_encoder", kwlist,
         &markers, &defaultfn, &encoder, &indent,
         &key_separator, &item_separator,
-        &sort_keys, &skipkeys, &allow_nan))
+        &sort_keys, &skipkeys, &allow_nan, &dispatch))
         return NULL;
 
     if (markers != Py_None && !PyDict_Check(markers)) {
@@ -1245,6 +1266,16 @@ encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     s->indent = Py_NewRef(indent);
     s->key_separator = Py_NewRef(key_separator);
     s->item_separator = Py_NewRef(item_separator);
+    s->dispatch = NULL;
+    s->dispatch_cache = NULL;
+    if (dispatch != Py_None) {
+        s->dispatch = Py_NewRef(dispatch);
+        s->dispatch_cache = PyDict_New();
+        if (s->dispatch_cache == NULL) {
+            Py_DECREF(s);
+            return NULL;
+        }
+    }
     s->sort_keys = sort_keys;
     s->skipkeys = skipkeys;
     s->allow_nan = allow_nan;
@@ -1372,7 +1403,7 @@ encoder_call(PyEncoderObject *self, PyObject *args, PyObject *kwds)
             return NULL;
         }
     }
-    if (encoder_listencode_obj(self, writer, obj, indent_level, indent_cache)) {
+    if (encoder_listencode_obj(self, writer, NULL, obj, indent_level, indent_cache)) {
         PyUnicodeWriter_Discard(writer);
         Py_XDECREF(indent_cache);
         return NULL;
@@ -1388,6 +1419,147 @@ encoder_call(PyEncoderObject *self, PyObject *args, PyObject *kwds)
     return result;
 }
 
+static int
+encoder_sink_append(encoder_sink *sink, const char *data, Py_ssize_t size)
+{
+    if (sink->result == NULL) {
+        sink->result = PyBytes_FromStringAndSize(NULL, size);
+        if (sink->result == NULL) {
+            return -1;
+        }
+    }
+    else if (PyBytes_GET_SIZE(sink->result) - sink->size < size) {
+        /* Overallocate by 25% to amortize the cost of the resizes */
+        Py_ssize_t newsize = sink->size + size;
+        if (newsize <= PY_SSIZE_T_MAX - newsize / 4) {
+            newsize += newsize / 4;
+        }
+        if (_PyBytes_Resize(&sink->result, newsize) < 0) {
+            return -1;
+        }
+    }
+    memcpy(PyBytes_AS_STRING(sink->result) + sink->size, data, size);
+    sink->size += size;
+    return 0;
+}
+
+/* Move the content of writer encoded to UTF-8 to sink.  Unless final is
+ * true, nothing is done until the writer holds at least ENCODER_CHUNK_SIZE
+ * characters.  The buffer of the writer is reused for the next chunk. */
+static int
+encoder_flush(PyUnicodeWriter *writer, encoder_sink *sink, int final)
+{
+    _PyUnicodeWriter *w = (_PyUnicodeWriter *)writer;
+    if (sink == NULL || w->pos == 0 ||
+        (!final && w->pos < ENCODER_CHUNK_SIZE))
+    {
+        return 0;
+    }
+    assert(!w->readonly);
+
+    PyObject *chunk;
+    if (w->maxchar < 128) {
+        /* ASCII data is also valid UTF-8 */
+        if (sink->write == NULL) {
+            if (encoder_sink_append(sink, w->data, w->pos) < 0) {
+                return -1;
+            }
+            w->pos = 0;
+            return 0;
+        }
+        chunk = PyBytes_FromStringAndSize(w->data, w->pos);
+    }
+    else {
+        PyObject *str = PyUnicode_FromKindAndData(w->kind, w->data, w->pos);
+        if (str == NULL) {
+            return -1;
+        }
+        chunk = PyUnicode_AsEncodedString(str, "utf-8", "surrogatepass");
+        Py_DECREF(str);
+    }
+    if (chunk == NULL) {
+        return -1;
+    }
+    w->pos = 0;
+
+    int rc;
+    if (sink->write == NULL) {
+        rc = encoder_sink_append(sink, PyBytes_AS_STRING(chunk),
+                                 PyBytes_GET_SIZE(chunk));
+    }
+    else {
+        PyObject *res = PyObject_CallOneArg(sink->write, chunk);
+        rc = res == NULL ? -1 : 0;
+        Py_XDECREF(res);
+    }
+    Py_DECREF(chunk);
+    return rc;
+}
+
+PyDoc_STRVAR(encoder_encode_utf8_doc,
+"encode_utf8($self, obj, _current_indent_level, /, write=None)\n"
+"--\n"
+"\n"
+"Return the JSON representation of obj encoded to UTF-8.\n"
+"\n"
+"If write is not None, it is called with successive chunks of\n"
+"the output instead and None is returned.");
+
+static PyObject *
+encoder_encode_utf8(PyEncoderObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"", "", "write", NULL};
+    PyObject *obj;
+    PyObject *write = Py_None;
+    Py_ssize_t indent_level;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On|O:encode_utf8", kwlist,
+                                     &obj, &indent_level, &write))
+        return NULL;
+
+    encoder_sink sink = {
+        .write = write == Py_None ? NULL : write,
+        .result = NULL,
+        .size = 0,
+    };
+    PyUnicodeWriter *writer = PyUnicodeWriter_Create(0);
+    if (writer == NULL) {
+        return NULL;
+    }
+
+    PyObject *indent_cache = NULL;
+    if (self->indent != Py_None) {
+        indent_cache = create_indent_cache(self, indent_level);
+        if (indent_cache == NULL) {
+            goto error;
+        }
+    }
+    if (encoder_listencode_obj(self, writer, &sink, obj, indent_level, indent_cache) ||
+        encoder_flush(writer, &sink, 1) < 0)
+    {
+        goto error;
+    }
+    Py_XDECREF(indent_cache);
+    PyUnicodeWriter_Discard(writer);
+
+    if (sink.write != NULL) {
+        Py_RETURN_NONE;
+    }
+    if (sink.result == NULL) {
+        return PyBytes_FromStringAndSize(NULL, 0);
+    }
+    if (_PyBytes_Resize(&sink.result, sink.size) < 0) {
+        return NULL;
+    }
+    return sink.result;
+
+error:
+    Py_XDECREF(indent_cache);
+    Py_XDECREF(sink.result);
+    PyUnicodeWriter_Discard(writer);
+    return NULL;
+}
+
 static PyObject *
 _encoded_const(PyObject *obj)
 {
@@ -1463,9 +1635,85 @@ _steal_accumulate(PyUnicodeWriter *writer, PyObject *stolen)
     return rval;
 }
 
+static PyObject *
+encoder_find_converter(PyEncoderObject *s, PyObject *obj)
+{
+    /* Return the converter for objects which can't otherwise be serialized:
+       a callable, or a tuple of attribute names to encode as a JSON object.
+       The result of dispatch() is cached for each type. */
+    PyObject *type = (PyObject *)Py_TYPE(obj);
+    PyObject *converter;
+
+    if (s->dispatch == NULL) {
+        return Py_NewRef(s->defaultfn);
+    }
+    if (PyDict_GetItemRef(s->dispatch_cache, type, &converter) != 0) {
+        return converter;
+    }
+    converter = PyObject_CallOneArg(s->dispatch, type);
+    if (converter == NULL) {
+        return NULL;
+    }
+    if (PyDict_SetItem(s->dispatch_cache, type, converter) < 0) {
+        Py_DECREF(converter);
+        return NULL;
+    }
+    return converter;
+}
+
+static int
+encoder_listencode_fields(PyEncoderObject *s, PyUnicodeWriter *writer,
+                          encoder_sink *sink, PyObject *obj, PyObject *names,
+                          Py_ssize_t indent_level, PyObject *indent_cache)
+{
+    /* Encode the attributes of obj listed in names as a JSON object */
+    bool first = true;
+
+    if (PyTuple_GET_SIZE(names) == 0) {
+        return PyUnicodeWriter_WriteUTF8(writer, "{}", 2);
+    }
+    if (PyUnicodeWriter_WriteChar(writer, '{')) {
+        return -1;
+    }
+
+    PyObject *separator = s->item_separator; // borrowed reference
+    if (s->indent != Py_None) {
+        indent_level++;
+        separator = get_item_separator(s, indent_level, indent_cache);
+        if (separator == NULL ||
+            write_newline_indent(writer, indent_level, indent_cache) < 0)
+        {
+            return -1;
+        }
+    }
+
+    for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(names); i++) {
+        PyObject *name = PyTuple_GET_ITEM(names, i);
+        PyObject *value = PyObject_GetAttr(obj, name);
+        if (value == NULL) {
+            return -1;
+        }
+        int rv = encoder_encode_key_value(s, writer, sink, &first, obj,
+                                          name, value, indent_level,
+                                          indent_cache, separator);
+        Py_DECREF(value);
+        if (rv < 0) {
+            return -1;
+        }
+    }
+
+    if (s->indent != Py_None) {
+        indent_level--;
+        if (write_newline_indent(writer, indent_level, indent_cache) < 0) {
+            return -1;
+        }
+    }
+    return PyUnicodeWriter_WriteChar(writer, '}');
+}
+
 static int
 encoder_listencode_obj(PyEncoderObject *s, PyUnicodeWriter *writer,
-                       PyObject *obj,
+                       encoder_sink *sink, PyObject *obj,
                        Py_ssize_t indent_level, PyObject *indent_cache)
 {
     /* Encode Python object obj to a JSON term */
@@ -1506,14 +1754,14 @@ encoder_listencode_obj(PyEncoderObject *s, PyUnicodeWriter *writer,
     else if (PyList_Check(obj) || PyTuple_Check(obj)) {
         if (_Py_EnterRecursiveCall(" while encoding a JSON object"))
             return -1;
-        rv = encoder_listencode_list(s, writer, obj, indent_level, indent_cache);
+        rv = encoder_listencode_list(s, writer, sink, obj, indent_level, indent_cache);
         _Py_LeaveRecursiveCall();
         return rv;
     }
     else if (PyDict_Check(obj)) {
         if (_Py_EnterRecursiveCall(" while encoding a JSON object"))
             return -1;
-        rv = encoder_listencode_dict(s, writer, obj, indent_level, indent_cache);
+        rv = encoder_listencode_dict(s, writer, sink, obj, indent_level, indent_cache);
         _Py_LeaveRecursiveCall();
         return rv;
     }
@@ -1536,21 +1784,40 @@ encoder_listencode_obj(PyEncoderObject *s, PyUnicodeWriter *writer,
                 return -1;
             }
         }
-        newobj = PyObject_CallOneArg(s->defaultfn, obj);
-        if (newobj == NULL) {
+        PyObject *converter = encoder_find_converter(s, obj);
+        if (converter == NULL) {
             Py_XDECREF(ident);
             return -1;
         }
+        if (PyTuple_CheckExact(converter)) {
+            if (_Py_EnterRecursiveCall(" while encoding a JSON object")) {
+                Py_DECREF(converter);
+                Py_XDECREF(ident);
+                return -1;
+            }
+            rv = encoder_listencode_fields(s, writer, sink, obj, converter,
+                                           indent_level, indent_cache);
+            _Py_LeaveRecursiveCall();
+            Py_DECREF(converter);
+        }
+        else {
+            newobj = PyObject_CallOneArg(converter, obj);
+            Py_DECREF(converter);
+            if (newobj == NULL) {
+                Py_XDECREF(ident);
+                return -1;
+            }
+
+            if (_Py_EnterRecursiveCall(" while encoding a JSON object")) {
+                Py_DECREF(newobj);
+                Py_XDECREF(ident);
+                return -1;
+            }
+            rv = encoder_listencode_obj(s, writer, sink, newobj, indent_level, indent_cache);
+            _Py_LeaveRecursiveCall();
 
-        if (_Py_EnterRecursiveCall(" while encoding a JSON object")) {
             Py_DECREF(newobj);
-            Py_XDECREF(ident);
-            return -1;
         }
-        rv = encoder_listencode_obj(s, writer, newobj, indent_level, indent_cache);
-        _Py_LeaveRecursiveCall();
-
-        Py_DECREF(newobj);
         if (rv) {
             _PyErr_FormatNote("when serializing %T object", obj);
             Py_XDECREF(ident);
@@ -1568,7 +1835,8 @@ encoder_listencode_obj(PyEncoderObject *s, PyUnicodeWriter *writer,
 }
 
 static int
-encoder_encode_key_value(PyEncoderObject *s, PyUnicodeWriter *writer, bool *first,
+encoder_encode_key_value(PyEncoderObject *s, PyUnicodeWriter *writer,
+                         encoder_sink *sink, bool *first,
                          PyObject *dct, PyObject *key, PyObject *value,
                          Py_ssize_t indent_level, PyObject *indent_cache,
                          PyObject *item_separator)
@@ -1626,16 +1894,16 @@ encoder_encode_key_value(PyEncoderObject *s, PyUnicodeWriter *writer, bool *firs
     if (PyUnicodeWriter_WriteStr(writer, s->key_separator) < 0) {
         return -1;
     }
-    if (encoder_listencode_obj(s, writer, value, indent_level, indent_cache) < 0) {
+    if (encoder_listencode_obj(s, writer, sink, value, indent_level, indent_cache) < 0) {
         _PyErr_FormatNote("when serializing %T item %R", dct, key);
         return -1;
     }
-    return 0;
+    return encoder_flush(writer, sink, 0);
 }
 
 static int
 encoder_listencode_dict(PyEncoderObject *s, PyUnicodeWriter *writer,
-                        PyObject *dct,
+                        encoder_sink *sink, PyObject *dct,
                        Py_ssize_t indent_level, PyObject *indent_cache)
 {
     /* Encode Python dict dct a JSON term */
@@ -1695,7 +1963,7 @@ encoder_listencode_dict(PyEncoderObject *s, PyUnicodeWriter *writer,
 
             key = PyTuple_GET_ITEM(item, 0);
             value = PyTuple_GET_ITEM(item, 1);
-            if (encoder_encode_key_value(s, writer, &first, dct, key, value,
+            if (encoder_encode_key_value(s, writer, sink, &first, dct, key, value,
                                          indent_level, indent_cache,
                                          separator) < 0)
                 goto bail;
@@ -1705,7 +1973,7 @@ encoder_listencode_dict(PyEncoderObject *s, PyUnicodeWriter *writer,
     } else {
         Py_ssize_t pos = 0;
         while (PyDict_Next(dct, &pos, &key, &value)) {
-            if (encoder_encode_key_value(s, writer, &first, dct, key, value,
+            if (encoder_encode_key_value(s, writer, sink, &first, dct, key, value,
                                          indent_level, indent_cache,
                                          separator) < 0)
                 goto bail;
@@ -1737,7 +2005,7 @@ encoder_listencode_dict(PyEncoderObject *s, PyUnicodeWriter *writer,
 
 static int
 encoder_listencode_list(PyEncoderObject *s, PyUnicodeWriter *writer,
-                        PyObject *seq,
+                        encoder_sink *sink, PyObject *seq,
                         Py_ssize_t indent_level, PyObject *indent_cache)
 {
     PyObject *ident = NULL;
@@ -1789,10 +2057,13 @@ encoder_listencode_list(PyEncoderObject *s, PyUnicodeWriter *writer,
             if (PyUnicodeWriter_WriteStr(writer, separator) < 0)
                 goto bail;
         }
-        if (encoder_listencode_obj(s, writer, obj, indent_level, indent_cache)) {
+        if (encoder_listencode_obj(s, writer, sink, obj, indent_level, indent_cache)) {
             _PyErr_FormatNote("when serializing %T item %zd", seq, i);
             goto bail;
         }
+        if (encoder_flush(writer, sink, 0) < 0) {
+            goto bail;
+        }
     }
     if (ident != NULL) {
         if (PyDict_DelItem(s->markers, ident))
@@ -1840,6 +2111,8 @@ encoder_traverse(PyEncoderObject *self, visitproc visit, void *arg)
     Py_VISIT(self->indent);
     Py_VISIT(self->key_separator);
     Py_VISIT(self->item_separator);
+    Py_VISIT(self->dispatch);
+    Py_VISIT(self->dispatch_cache);
     return 0;
 }
 
@@ -1853,10 +2126,18 @@ encoder_clear(PyEncoderObject *self)
     Py_CLEAR(self->indent);
     Py_CLEAR(self->key_separator);
     Py_CLEAR(self->item_separator);
+    Py_CLEAR(self->dispatch);
+    Py_CLEAR(self->dispatch_cache);
     return 0;
 }
 
-PyDoc_STRVAR(encoder_doc, "Encoder(markers, default, encoder, indent, key_separator, item_separator, sort_keys, skipkeys, allow_nan)");
+PyDoc_STRVAR(encoder_doc, "Encoder(markers, default, encoder, indent, key_separator, item_separator, sort_keys, skipkeys, allow_nan, dispatch=None)");
+
+static PyMethodDef encoder_methods[] = {
+    {"encode_utf8", _PyCFunction_CAST(encoder_encode_utf8),
+     METH_VARARGS | METH_KEYWORDS, encoder_encode_utf8_doc},
+    {NULL, NULL, 0, NULL}
+};
 
 static PyType_Slot PyEncoderType_slots[] = {
     {Py_tp_doc, (void *)encoder_doc},
@@ -1865,6 +2146,7 @@ static PyType_Slot PyEncoderType_slots[] = {
     {Py_tp_traverse, encoder_traverse},
     {Py_tp_clear, encoder_clear},
     {Py_tp_members, encoder_members},
+    {Py_tp_methods, encoder_methods},
     {Py_tp_new, encoder_new},
     {0, 0}
 };
@@ -0,0 +1,979 @@
+/* Linux io_uring interface for the asyncio proactor event loop.
+ *
+ * A Ring owns an io_uring instance.  Operations are prepared in the
+ * submission queue by the recv(), send(), accept(), poll(), ... methods,
+ * which return an identifier for the operation, and are submitted in one
+ * batch by the next call to wait(), which returns the completed operations.
+ *
+ * The buffers used by an operation are kept alive until its completion has
+ * been reaped, even if the operation is cancelled.
+ */
+
+#ifndef Py_BUILD_CORE_BUILTIN
+#  define Py_BUILD_CORE_MODULE 1
+#endif
+
+#include "Python.h"
+#include "pycore_moduleobject.h"  // _PyModule_GetState()
+#include "pycore_time.h"          // _PyTime_FromSecondsObject()
+
+#include <linux/io_uring.h>
+#include <sys/mman.h>             // mmap()
+#include <sys/socket.h>           // MSG_NOSIGNAL
+#include <sys/syscall.h>          // __NR_io_uring_setup
+#include <unistd.h>               // syscall()
+
+typedef struct {
+    PyTypeObject *RingType;
+} uring_state;
+
+static uring_state *
+get_uring_state(PyObject *module)
+{
+    uring_state *state = _PyModule_GetState(module);
+    assert(state);
+    return state;
+}
+
+static struct PyModuleDef uringmodule;
+#define get_uring_state_by_type(type) \
+    (get_uring_state(PyType_GetModuleByDef(type, &uringmodule)))
+
+/* The user data of operations whose completion is ignored. */
+#define IGNORED_USER_DATA 0
+
+#define SEC_TO_NS (1000 * 1000 * 1000)
+
+typedef struct {
+    PyObject_HEAD
+    int fd;
+    unsigned features;
+    /* Submission queue */
+    void *sq_ptr;
+    size_t sq_size;
+    unsigned *sq_head;
+    unsigned *sq_tail;
+    unsigned *sq_mask;
+    unsigned *sq_entries;
+    unsigned *sq_array;
+    struct io_uring_sqe *sqes;
+    size_t sqes_size;
+    unsigned sq_tail_local;
+    unsigned to_submit;
+    /* Completion queue */
+    void *cq_ptr;
+    size_t cq_size;
+    unsigned *cq_head;
+    unsigned *cq_tail;
+    unsigned *cq_mask;
+    struct io_uring_cqe *cqes;
+    /* user data => capsule of the buffers of the operation */
+    PyObject *pending;
+    uint64_t next_user_data;
+} RingObject;
+
+/* The buffers of an operation in flight. */
+typedef struct {
+    PyObject *result;     // bytes object read into, or NULL
+    Py_buffer view;
+    int has_view;
+} Operation;
+
+#define OPERATION_CAPSULE_NAME "_uring.Operation"
+
+static void
+operation_destructor(PyObject *capsule)
+{
+    Operation *op = PyCapsule_GetPointer(capsule, OPERATION_CAPSULE_NAME);
+    if (op == NULL) {
+        PyErr_WriteUnraisable(capsule);
+        return;
+    }
+    Py_XDECREF(op->result);
+    if (op->has_view) {
+        PyBuffer_Release(&op->view);
+    }
+    PyMem_Free(op);
+}
+
+/*[clinic input]
+module _uring
+class _uring.Ring "RingObject *" "get_uring_state_by_type(type)->RingType"
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=42236a9afbf99420]*/
+
+static int
+ring_check_open(RingObject *self)
+{
+    if (self->fd < 0) {
+        PyErr_SetString(PyExc_ValueError, "I/O operation on closed ring");
+        return -1;
+    }
+    return 0;
+}
+
+static int
+ring_enter(RingObject *self, unsigned to_submit, unsigned min_complete,
+           unsigned flags, void *arg, size_t argsz)
+{
+    int ret;
+    Py_BEGIN_ALLOW_THREADS
+    ret = (int)syscall(__NR_io_uring_enter, self->fd, to_submit,
+                       min_complete, flags, arg, argsz);
+    Py_END_ALLOW_THREADS
+    return ret;
+}
+
+/* Submit the prepared operations without waiting. */
+static int
+ring_submit(RingObject *self)
+{
+    while (self->to_submit) {
+        int ret = (int)syscall(__NR_io_uring_enter, self->fd,
+                               self->to_submit, 0, 0, NULL, 0);
+        if (ret < 0) {
+            if (errno == EINTR) {
+                continue;
+            }
+            PyErr_SetFromErrno(PyExc_OSError);
+            return -1;
+        }
+        self->to_submit -= (unsigned)ret;
+        if (ret == 0) {
+            break;
+        }
+    }
+    return 0;
+}
+
+/* Return a cleared submission queue entry, submitting the prepared ones
+   first if the queue is full. */
+static struct io_uring_sqe *
+ring_get_sqe(RingObject *self)
+{
+    if (ring_check_open(self) < 0) {
+        return NULL;
+    }
+    unsigned head = __atomic_load_n(self->sq_head, __ATOMIC_ACQUIRE);
+    if (self->sq_tail_local - head >= *self->sq_entries) {
+        if (ring_submit(self) < 0) {
+            return NULL;
+        }
+        head = __atomic_load_n(self->sq_head, __ATOMIC_ACQUIRE);
+        if (self->sq_tail_local - head >= *self->sq_entries) {
+            errno = EBUSY;
+            PyErr_SetFromErrno(PyExc_OSError);
+            return NULL;
+        }
+    }
+    unsigned index = self->sq_tail_local & *self->sq_mask;
+    struct io_uring_sqe *sqe = &self->sqes[index];
+    memset(sqe, 0, sizeof(*sqe));
+    return sqe;
+}
+
+/* Queue the entry returned by the last ring_get_sqe() call. */
+static void
+ring_push_sqe(RingObject *self)
+{
+    unsigned index = self->sq_tail_local & *self->sq_mask;
+    self->sq_array[index] = index;
+    self->sq_tail_local++;
+    __atomic_store_n(self->sq_tail, self->sq_tail_local, __ATOMIC_RELEASE);
+    self->to_submit++;
+}
+
+/* Register the buffers of a new operation and return its user data,
+   or 0 on error.  Steal the reference to result, and the view. */
+static uint64_t
+ring_add_operation(RingObject *self, struct io_uring_sqe *sqe,
+                   PyObject *result, Py_buffer *view)
+{
+    Operation *op = PyMem_Calloc(1, sizeof(Operation));
+    if (op == NULL) {
+        PyErr_NoMemory();
+        goto error;
+    }
+    op->result = result;
+    if (view != NULL) {
+        op->view = *view;
+        op->has_view = 1;
+    }
+    PyObject *capsule = PyCapsule_New(op, OPERATION_CAPSULE_NAME,
+                                      operation_destructor);
+    if (capsule == NULL) {
+        PyMem_Free(op);
+        goto error;
+    }
+    uint64_t user_data = self->next_user_data++;
+    PyObject *key = PyLong_FromUnsignedLongLong(user_data);
+    if (key == NULL) {
+        Py_DECREF(capsule);
+        return 0;
+    }
+    int res = PyDict_SetItem(self->pending, key, capsule);
+    Py_DECREF(key);
+    Py_DECREF(capsule);
+    if (res < 0) {
+        return 0;
+    }
+    sqe->user_data = user_data;
+    ring_push_sqe(self);
+    return user_data;
+
+error:
+    Py_XDECREF(result);
+    if (view != NULL) {
+        PyBuffer_Release(view);
+    }
+    return 0;
+}
+
+static PyObject *
+ring_prep_rw(RingObject *self, int opcode, int fd, void *addr,
+             unsigned int len, uint64_t offset, int flags,
+             PyObject *result, Py_buffer *view)
+{
+    struct io_uring_sqe *sqe = ring_get_sqe(self);
+    if (sqe == NULL) {
+        Py_XDECREF(result);
+        if (view != NULL) {
+            PyBuffer_Release(view);
+        }
+        return NULL;
+    }
+    sqe->opcode = opcode;
+    sqe->fd = fd;
+    sqe->addr = (uint64_t)(uintptr_t)addr;
+    sqe->len = len;
+    sqe->off = offset;
+    sqe->msg_flags = (uint32_t)flags;
+    uint64_t user_data = ring_add_operation(self, sqe, result, view);
+    if (user_data == 0) {
+        return NULL;
+    }
+    return PyLong_FromUnsignedLongLong(user_data);
+}
+
+static PyObject *
+ring_prep_read(RingObject *self, int opcode, int fd, Py_ssize_t size,
+               uint64_t offset, int flags)
+{
+    if (size < 0) {
+        PyErr_SetString(PyExc_ValueError, "negative buffersize");
+        return NULL;
+    }
+    if (size > UINT_MAX) {
+        size = UINT_MAX;
+    }
+    PyObject *result = PyBytes_FromStringAndSize(NULL, size);
+    if (result == NULL) {
+        return NULL;
+    }
+    return ring_prep_rw(self, opcode, fd, PyBytes_AS_STRING(result),
+                        (unsigned int)size, offset, flags, result, NULL);
+}
+
+static PyObject *
+ring_prep_buffer(RingObject *self, int opcode, int fd, Py_buffer *buffer,
+                 uint64_t offset, int flags)
+{
+    /* Keep our own export of the buffer until the completion. */
+    Py_buffer view;
+    int writable = (opcode == IORING_OP_RECV || opcode == IORING_OP_READ);
+    if (PyObject_GetBuffer(buffer->obj, &view,
+                           writable ? PyBUF_WRITABLE : PyBUF_SIMPLE) < 0) {
+        return NULL;
+    }
+    unsigned int len = view.len > UINT_MAX ? UINT_MAX : (unsigned int)view.len;
+    return ring_prep_rw(self, opcode, fd, view.buf, len, offset, flags,
+                        NULL, &view);
+}
+
+/*[clinic input]
+@classmethod
+_uring.Ring.__new__ as ring_new
+
+    entries: unsigned_int(bitwise=False) = 256
+
+Create an io_uring instance with a submission queue of the given size.
+[clinic start generated code]*/
+
+static PyObject *
+ring_new_impl(PyTypeObject *type, unsigned int entries)
+/*[clinic end generated code: output=f848e982461875a8 input=abe2cf7c89bbca57]*/
+{
+    RingObject *self = (RingObject *)type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+    self->fd = -1;
+    self->sq_ptr = MAP_FAILED;
+    self->cq_ptr = MAP_FAILED;
+    self->sqes = MAP_FAILED;
+    self->next_user_data = IGNORED_USER_DATA + 1;
+    self->pending = PyDict_New();
+    if (self->pending == NULL) {
+        goto error;
+    }
+
+    struct io_uring_params params;
+    memset(&params, 0, sizeof(params));
+    params.flags = IORING_SETUP_CLAMP;
+    int fd = (int)syscall(__NR_io_uring_setup, entries, &params);
+    if (fd < 0) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        goto error;
+    }
+    self->fd = fd;
+    self->features = params.features;
+    if (!(params.features & IORING_FEAT_EXT_ARG) ||
+        !(params.features & IORING_FEAT_NODROP))
+    {
+        errno = ENOSYS;
+        PyErr_SetFromErrno(PyExc_OSError);
+        goto error;
+    }
+
+    self->sq_size = params.sq_off.array + params.sq_entries * sizeof(unsigned);
+    self->cq_size = (params.cq_off.cqes +
+                     params.cq_entries * sizeof(struct io_uring_cqe));
+    self->sq_ptr = mmap(NULL, self->sq_size, PROT_READ | PROT_WRITE,
+                        MAP_SHARED | MAP_POPULATE, fd, IORING_OFF_SQ_RING);
+    if (self->sq_ptr == MAP_FAILED) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        goto error;
+    }
+    self->cq_ptr = mmap(NULL, self->cq_size, PROT_READ | PROT_WRITE,
+                        MAP_SHARED | MAP_POPULATE, fd, IORING_OFF_CQ_RING);
+    if (self->cq_ptr == MAP_FAILED) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        goto error;
+    }
+    self->sqes_size = params.sq_entries * sizeof(struct io_uring_sqe);
+    self->sqes = mmap(NULL, self->sqes_size, PROT_READ | PROT_WRITE,
+                      MAP_SHARED | MAP_POPULATE, fd, IORING_OFF_SQES);
+    if (self->sqes == MAP_FAILED) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        goto error;
+    }
+
+    char *sq = self->sq_ptr;
+    self->sq_head = (unsigned *)(sq + params.sq_off.head);
+    self->sq_tail = (unsigned *)(sq + params.sq_off.tail);
+    self->sq_mask = (unsigned *)(sq + params.sq_off.ring_mask);
+    self->sq_entries = (unsigned *)(sq + params.sq_off.ring_entries);
+    self->sq_array = (unsigned *)(sq + params.sq_off.array);
+    self->sq_tail_local = *self->sq_tail;
+    char *cq = self->cq_ptr;
+    self->cq_head = (unsigned *)(cq + params.cq_off.head);
+    self->cq_tail = (unsigned *)(cq + params.cq_off.tail);
+    self->cq_mask = (unsigned *)(cq + params.cq_off.ring_mask);
+    self->cqes = (struct io_uring_cqe *)(cq + params.cq_off.cqes);
+    return (PyObject *)self;
+
+error:
+    Py_DECREF(self);
+    return NULL;
+}
+
+static void
+ring_unmap(RingObject *self)
+{
+    if (self->sqes != MAP_FAILED) {
+        munmap(self->sqes, self->sqes_size);
+        self->sqes = MAP_FAILED;
+    }
+    if (self->cq_ptr != MAP_FAILED) {
+        munmap(self->cq_ptr, self->cq_size);
+        self->cq_ptr = MAP_FAILED;
+    }
+    if (self->sq_ptr != MAP_FAILED) {
+        munmap(self->sq_ptr, self->sq_size);
+        self->sq_ptr = MAP_FAILED;
+    }
+}
+
+static void
+ring_close_fd(RingObject *self)
+{
+    ring_unmap(self);
+    if (self->fd >= 0) {
+        close(self->fd);
+        self->fd = -1;
+    }
+    if (self->pending != NULL && PyDict_GET_SIZE(self->pending)) {
+        /* The kernel may still access the buffers of the operations which
+           did not complete: leak them. */
+        self->pending = NULL;
+    }
+}
+
+static int
+ring_traverse(RingObject *self, visitproc visit, void *arg)
+{
+    Py_VISIT(Py_TYPE(self));
+    return 0;
+}
+
+static void
+ring_dealloc(RingObject *self)
+{
+    PyTypeObject *tp = Py_TYPE(self);
+    PyObject_GC_UnTrack(self);
+    ring_close_fd(self);
+    Py_XDECREF(self->pending);
+    tp->tp_free(self);
+    Py_DECREF(tp);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.close
+
+Close the ring.
+
+The buffers of the operations which did not complete are leaked.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_close_impl(RingObject *self)
+/*[clinic end generated code: output=447415269da3419f input=e8f62f45db4d5710]*/
+{
+    ring_close_fd(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_uring.Ring.fileno
+
+Return the file descriptor of the ring.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_fileno_impl(RingObject *self)
+/*[clinic end generated code: output=773263c5ad53ca3d input=1d3b281a9c69238b]*/
+{
+    if (ring_check_open(self) < 0) {
+        return NULL;
+    }
+    return PyLong_FromLong(self->fd);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.recv
+
+    fd: fildes
+    size: Py_ssize_t
+    flags: int = 0
+    /
+
+Prepare receiving up to size bytes from the socket fd.
+
+The result of the operation is the data received.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_recv_impl(RingObject *self, int fd, Py_ssize_t size, int flags)
+/*[clinic end generated code: output=cbef43e2fa71bec0 input=235db5e47ca5bbdb]*/
+{
+    return ring_prep_read(self, IORING_OP_RECV, fd, size, 0, flags);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.recv_into
+
+    fd: fildes
+    buffer: Py_buffer(accept={rwbuffer})
+    flags: int = 0
+    /
+
+Prepare receiving data from the socket fd into a writable buffer.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_recv_into_impl(RingObject *self, int fd, Py_buffer *buffer,
+                           int flags)
+/*[clinic end generated code: output=1ad2535142116400 input=9b54d5e328dc0b14]*/
+{
+    return ring_prep_buffer(self, IORING_OP_RECV, fd, buffer, 0, flags);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.send
+
+    fd: fildes
+    buffer: Py_buffer
+    flags: int = 0
+    /
+
+Prepare sending data from a buffer to the socket fd.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_send_impl(RingObject *self, int fd, Py_buffer *buffer, int flags)
+/*[clinic end generated code: output=c32d8b36b960f49f input=189797d16b4942de]*/
+{
+    return ring_prep_buffer(self, IORING_OP_SEND, fd, buffer, 0,
+                            flags | MSG_NOSIGNAL);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.read
+
+    fd: fildes
+    size: Py_ssize_t
+    offset: long_long = -1
+    /
+
+Prepare reading up to size bytes from fd.
+
+If offset is -1, read from the current file position.  The result of the
+operation is the data read.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_read_impl(RingObject *self, int fd, Py_ssize_t size,
+                      long long offset)
+/*[clinic end generated code: output=c840d95f497055bb input=98bf784f67e63304]*/
+{
+    return ring_prep_read(self, IORING_OP_READ, fd, size,
+                          (uint64_t)offset, 0);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.read_into
+
+    fd: fildes
+    buffer: Py_buffer(accept={rwbuffer})
+    offset: long_long = -1
+    /
+
+Prepare reading from fd into a writable buffer.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_read_into_impl(RingObject *self, int fd, Py_buffer *buffer,
+                           long long offset)
+/*[clinic end generated code: output=fc9242df8d1988d9 input=761bc5cac5860058]*/
+{
+    return ring_prep_buffer(self, IORING_OP_READ, fd, buffer,
+                            (uint64_t)offset, 0);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.write
+
+    fd: fildes
+    buffer: Py_buffer
+    offset: long_long = -1
+    /
+
+Prepare writing data from a buffer to fd.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_write_impl(RingObject *self, int fd, Py_buffer *buffer,
+                       long long offset)
+/*[clinic end generated code: output=eb7807ebce1c943e input=8929049fa8a66a5c]*/
+{
+    return ring_prep_buffer(self, IORING_OP_WRITE, fd, buffer,
+                            (uint64_t)offset, 0);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.accept
+
+    fd: fildes
+    flags: int = 0
+    /
+
+Prepare accepting a connection on the listening socket fd.
+
+The result of the operation is the file descriptor of the new socket.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_accept_impl(RingObject *self, int fd, int flags)
+/*[clinic end generated code: output=a3c369f202fa044b input=a36f51a931ee5877]*/
+{
+    struct io_uring_sqe *sqe = ring_get_sqe(self);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_ACCEPT;
+    sqe->fd = fd;
+    sqe->accept_flags = (uint32_t)flags;
+    uint64_t user_data = ring_add_operation(self, sqe, NULL, NULL);
+    if (user_data == 0) {
+        return NULL;
+    }
+    return PyLong_FromUnsignedLongLong(user_data);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.poll
+
+    fd: fildes
+    events: unsigned_int(bitwise=True)
+    /
+
+Prepare waiting until fd is ready for the events in the select.POLL* mask.
+
+The result of the operation is the mask of the ready events.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_poll_impl(RingObject *self, int fd, unsigned int events)
+/*[clinic end generated code: output=f93f4107dd05e549 input=8eca5e659ecfcfac]*/
+{
+    struct io_uring_sqe *sqe = ring_get_sqe(self);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_POLL_ADD;
+    sqe->fd = fd;
+#if PY_BIG_ENDIAN
+    /* The kernel reads poll32_events as two swapped 16-bit halves. */
+    events = (events << 16) | (events >> 16);
+#endif
+    sqe->poll32_events = events;
+    uint64_t user_data = ring_add_operation(self, sqe, NULL, NULL);
+    if (user_data == 0) {
+        return NULL;
+    }
+    return PyLong_FromUnsignedLongLong(user_data);
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.cancel
+
+    user_data: unsigned_long_long(bitwise=True)
+    /
+
+Prepare cancelling an operation.
+
+The operation still completes, with -ECANCELED as result if it was
+cancelled before completing.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_cancel_impl(RingObject *self, unsigned long long user_data)
+/*[clinic end generated code: output=811f38be4a2661fc input=8045a97d6193e7d1]*/
+{
+    struct io_uring_sqe *sqe = ring_get_sqe(self);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_ASYNC_CANCEL;
+    sqe->fd = -1;
+    sqe->addr = user_data;
+    sqe->user_data = IGNORED_USER_DATA;
+    ring_push_sqe(self);
+    Py_RETURN_NONE;
+}
+
+/* Append the completed operations to a list. */
+static int
+ring_reap(RingObject *self, PyObject *completed)
+{
+    /* Every fallible allocation is done before the operation is removed
+       from the pending dict: if one fails, the completion is left in the
+       ring to be reaped by the next call. */
+    unsigned head = *self->cq_head;
+    unsigned tail = __atomic_load_n(self->cq_tail, __ATOMIC_ACQUIRE);
+    int err = 0;
+    for (; head != tail; head++) {
+        struct io_uring_cqe *cqe = &self->cqes[head & *self->cq_mask];
+        if (cqe->user_data == IGNORED_USER_DATA) {
+            continue;
+        }
+        PyObject *key = PyLong_FromUnsignedLongLong(cqe->user_data);
+        if (key == NULL) {
+            err = -1;
+            break;
+        }
+        int found = PyDict_Contains(self->pending, key);
+        if (found <= 0) {
+            Py_DECREF(key);
+            if (found < 0) {
+                err = -1;
+                break;
+            }
+            /* Unknown operation. */
+            continue;
+        }
+        PyObject *res = PyLong_FromLong(cqe->res);
+        if (res == NULL) {
+            Py_DECREF(key);
+            err = -1;
+            break;
+        }
+        PyObject *item = PyTuple_Pack(3, key, res, Py_None);
+        Py_DECREF(res);
+        if (item == NULL) {
+            Py_DECREF(key);
+            err = -1;
+            break;
+        }
+        if (PyList_Append(completed, item) < 0) {
+            Py_DECREF(item);
+            Py_DECREF(key);
+            err = -1;
+            break;
+        }
+        PyObject *capsule;
+        found = PyDict_Pop(self->pending, key, &capsule);
+        Py_DECREF(key);
+        assert(found == 1);
+        Operation *op = PyCapsule_GetPointer(capsule, OPERATION_CAPSULE_NAME);
+        if (op != NULL && op->result != NULL && cqe->res >= 0) {
+            PyObject *data = op->result;
+            op->result = NULL;
+            if (_PyBytes_Resize(&data, cqe->res) < 0) {
+                /* Report the error to this operation only. */
+                data = PyErr_GetRaisedException();
+            }
+            PyTuple_SET_ITEM(item, 2, data);
+            Py_DECREF(Py_None);
+        }
+        else if (op == NULL) {
+            PyTuple_SET_ITEM(item, 2, PyErr_GetRaisedException());
+            Py_DECREF(Py_None);
+        }
+        Py_DECREF(capsule);
+        Py_DECREF(item);
+    }
+    __atomic_store_n(self->cq_head, head, __ATOMIC_RELEASE);
+    return err;
+}
+
+/*[clinic input]
+@critical_section
+_uring.Ring.wait
+
+    timeout as timeout_obj: object = None
+
+Submit the prepared operations and wait for completed operations.
+
+Wait at most timeout seconds, or forever if timeout is None.  Return a list
+of (user_data, result, data) tuples.  result is the negated errno value
+if the operation failed.  data is the data read by recv() and read(), the
+exception raised while completing the operation, or None.
+[clinic start generated code]*/
+
+static PyObject *
+_uring_Ring_wait_impl(RingObject *self, PyObject *timeout_obj)
+/*[clinic end generated code: output=480a97563d86ffbc input=fb5cb516fdbd80c7]*/
+{
+    struct __kernel_timespec ts;
+    struct io_uring_getevents_arg arg;
+    memset(&arg, 0, sizeof(arg));
+    int wait = 1;
+    if (timeout_obj != Py_None) {
+        PyTime_t timeout;
+        if (_PyTime_FromSecondsObject(&timeout, timeout_obj,
+                                      _PyTime_ROUND_TIMEOUT) < 0) {
+            return NULL;
+        }
+        if (timeout < 0) {
+            PyErr_SetString(PyExc_ValueError, "timeout must be non-negative");
+            return NULL;
+        }
+        if (timeout == 0) {
+            wait = 0;
+        }
+        ts.tv_sec = timeout / SEC_TO_NS;
+        ts.tv_nsec = timeout % SEC_TO_NS;
+        arg.ts = (uint64_t)(uintptr_t)&ts;
+    }
+    if (ring_check_open(self) < 0) {
+        return NULL;
+    }
+    PyObject *completed = PyList_New(0);
+    if (completed == NULL) {
+        return NULL;
+    }
+    /* Do not block if completions are already available. */
+    if (*self->cq_head != __atomic_load_n(self->cq_tail, __ATOMIC_ACQUIRE)) {
+        wait = 0;
+    }
+    unsigned flags = 0;
+    unsigned min_complete = 0;
+    if (wait) {
+        flags = IORING_ENTER_GETEVENTS | IORING_ENTER_EXT_ARG;
+        min_complete = 1;
+    }
+    if (wait || self->to_submit) {
+        unsigned to_submit = self->to_submit;
+        int ret = ring_enter(self, to_submit, min_complete, flags,
+                             wait ? &arg : NULL, wait ? sizeof(arg) : 0);
+        if (ret < 0) {
+            if (errno != ETIME && errno != EINTR && errno != EBUSY &&
+                errno != EAGAIN)
+            {
+                PyErr_SetFromErrno(PyExc_OSError);
+                Py_DECREF(completed);
+                return NULL;
+            }
+            if (errno == EINTR && PyErr_CheckSignals() < 0) {
+                Py_DECREF(completed);
+                return NULL;
+            }
+        }
+        else {
+            self->to_submit -= (unsigned)ret;
+        }
+        if (self->fd < 0) {
+            /* The ring was closed while waiting. */
+            return completed;
+        }
+    }
+    if (ring_reap(self, completed) < 0) {
+        if (PyList_GET_SIZE(completed) == 0) {
+            Py_DECREF(completed);
+            return NULL;
+        }
+        /* Don't lose the reaped completions: the error (a failed
+           allocation) is dropped.  The completion which could not be
+           reaped is left in the ring and reaped by the next call. */
+        PyErr_Clear();
+    }
+    return completed;
+}
+
+static PyObject *
+ring_get_closed(RingObject *self, void *Py_UNUSED(closure))
+{
+    return PyBool_FromLong(self->fd < 0);
+}
+
+static PyObject *
+ring_get_pending(RingObject *self, void *Py_UNUSED(closure))
+{
+    if (self->pending == NULL) {
+        return PyLong_FromLong(0);
+    }
+    return PyLong_FromSsize_t(PyDict_GET_SIZE(self->pending));
+}
+
+#include "clinic/_uringmodule.c.h"
+
+static PyMethodDef ring_methods[] = {
+    _URING_RING_CLOSE_METHODDEF
+    _URING_RING_FILENO_METHODDEF
+    _URING_RING_RECV_METHODDEF
+    _URING_RING_RECV_INTO_METHODDEF
+    _URING_RING_SEND_METHODDEF
+    _URING_RING_READ_METHODDEF
+    _URING_RING_READ_INTO_METHODDEF
+    _URING_RING_WRITE_METHODDEF
+    _URING_RING_ACCEPT_METHODDEF
+    _URING_RING_POLL_METHODDEF
+    _URING_RING_CANCEL_METHODDEF
+    _URING_RING_WAIT_METHODDEF
+    {NULL, NULL}
+};
+
+static PyGetSetDef ring_getset[] = {
+    {"closed", (getter)ring_get_closed, NULL,
+     PyDoc_STR("True if the ring is closed.")},
+    {"pending", (getter)ring_get_pending, NULL,
+     PyDoc_STR("The number of operations which did not complete.")},
+    {NULL}
+};
+
+static PyType_Slot ring_slots[] = {
+    {Py_tp_dealloc, ring_dealloc},
+    {Py_tp_doc, (void *)ring_new__doc__},
+    {Py_tp_traverse, ring_traverse},
+    {Py_tp_methods, ring_methods},
+    {Py_tp_getset, ring_getset},
+    {Py_tp_new, ring_new},
+    {0, NULL},
+};
+
+static PyType_Spec ring_spec = {
+    .name = "_uring.Ring",
+    .basicsize = sizeof(RingObject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+              Py_TPFLAGS_IMMUTABLETYPE),
+    .slots = ring_slots,
+};
+
+
+/* Initialization function */
+
+PyDoc_STRVAR(uring_module_doc,
+"Interface to the Linux io_uring API, used by asyncio.uring_events.\n\
+This module is an implementation detail, please do not use it directly.");
+
+static int
+uringmodule_exec(PyObject *module)
+{
+    uring_state *state = get_uring_state(module);
+    state->RingType = (PyTypeObject *)PyType_FromModuleAndSpec(
+        module, &ring_spec, NULL);
+    if (state->RingType == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(module, state->RingType) < 0) {
+        return -1;
+    }
+    return 0;
+}
+
+static int
+uring_traverse(PyObject *module, visitproc visit, void *arg)
+{
+    uring_state *state = get_uring_state(module);
+    Py_VISIT(state->RingType);
+    return 0;
+}
+
+static int
+uring_clear(PyObject *module)
+{
+    uring_state *state = get_uring_state(module);
+    Py_CLEAR(state->RingType);
+    return 0;
+}
+
+static void
+uring_free(void *module)
+{
+    uring_clear((PyObject *)module);
+}
+
+static PyModuleDef_Slot uringmodule_slots[] = {
+    {Py_mod_exec, uringmodule_exec},
+    {Py_mod_multiple_interpreters, Py_MOD_PER_INTERPRETER_GIL_SUPPORTED},
+    {Py_mod_gil, Py_MOD_GIL_NOT_USED},
+    {0, NULL}
+};
+
+static struct PyModuleDef uringmodule = {
+    .m_base = PyModuleDef_HEAD_INIT,
+    .m_name = "_uring",
+    .m_doc = uring_module_doc,
+    .m_size = sizeof(uring_state),
+    .m_slots = uringmodule_slots,
+    .m_traverse = uring_traverse,
+    .m_clear = uring_clear,
+    .m_free = uring_free,
+};
+
+PyMODINIT_FUNC
+PyInit__uring(void)
+{
+    return PyModuleDef_Init(&uringmodule);
+}
@@ -0,0 +1,630 @@
+/*[clinic input]
+preserve
+[clinic start generated code]*/
+
+#if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+#  include "pycore_gc.h"          // PyGC_Head
+#  include "pycore_runtime.h"     // _Py_ID()
+#endif
+#include "pycore_abstract.h"      // _PyNumber_Index()
+#include "pycore_critical_section.h"// Py_BEGIN_CRITICAL_SECTION()
+#include "pycore_long.h"          // _PyLong_UnsignedInt_Converter()
+#include "pycore_modsupport.h"    // _PyArg_UnpackKeywords()
+
+PyDoc_STRVAR(ring_new__doc__,
+"Ring(entries=256)\n"
+"--\n"
+"\n"
+"Create an io_uring instance with a submission queue of the given size.");
+
+static PyObject *
+ring_new_impl(PyTypeObject *type, unsigned int entries);
+
+static PyObject *
+ring_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(entries), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"entries", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "Ring",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    PyObject * const *fastargs;
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+    Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 0;
+    unsigned int entries = 256;
+
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!fastargs) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (!_PyLong_UnsignedInt_Converter(fastargs[0], &entries)) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = ring_new_impl(type, entries);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_close__doc__,
+"close($self, /)\n"
+"--\n"
+"\n"
+"Close the ring.\n"
+"\n"
+"The buffers of the operations which did not complete are leaked.");
+
+#define _URING_RING_CLOSE_METHODDEF    \
+    {"close", (PyCFunction)_uring_Ring_close, METH_NOARGS, _uring_Ring_close__doc__},
+
+static PyObject *
+_uring_Ring_close_impl(RingObject *self);
+
+static PyObject *
+_uring_Ring_close(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_close_impl((RingObject *)self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_fileno__doc__,
+"fileno($self, /)\n"
+"--\n"
+"\n"
+"Return the file descriptor of the ring.");
+
+#define _URING_RING_FILENO_METHODDEF    \
+    {"fileno", (PyCFunction)_uring_Ring_fileno, METH_NOARGS, _uring_Ring_fileno__doc__},
+
+static PyObject *
+_uring_Ring_fileno_impl(RingObject *self);
+
+static PyObject *
+_uring_Ring_fileno(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _uring_Ring_fileno_impl((RingObject *)self);
+}
+
+PyDoc_STRVAR(_uring_Ring_recv__doc__,
+"recv($self, fd, size, flags=0, /)\n"
+"--\n"
+"\n"
+"Prepare receiving up to size bytes from the socket fd.\n"
+"\n"
+"The result of the operation is the data received.");
+
+#define _URING_RING_RECV_METHODDEF    \
+    {"recv", _PyCFunction_CAST(_uring_Ring_recv), METH_FASTCALL, _uring_Ring_recv__doc__},
+
+static PyObject *
+_uring_Ring_recv_impl(RingObject *self, int fd, Py_ssize_t size, int flags);
+
+static PyObject *
+_uring_Ring_recv(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int fd;
+    Py_ssize_t size;
+    int flags = 0;
+
+    if (!_PyArg_CheckPositional("recv", nargs, 2, 3)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[0]);
+    if (fd < 0) {
+        goto exit;
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[1]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        size = ival;
+    }
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    flags = PyLong_AsInt(args[2]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_recv_impl((RingObject *)self, fd, size, flags);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_recv_into__doc__,
+"recv_into($self, fd, buffer, flags=0, /)\n"
+"--\n"
+"\n"
+"Prepare receiving data from the socket fd into a writable buffer.");
+
+#define _URING_RING_RECV_INTO_METHODDEF    \
+    {"recv_into", _PyCFunction_CAST(_uring_Ring_recv_into), METH_FASTCALL, _uring_Ring_recv_into__doc__},
+
+static PyObject *
+_uring_Ring_recv_into_impl(RingObject *self, int fd, Py_buffer *buffer,
+                           int flags);
+
+static PyObject *
+_uring_Ring_recv_into(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int fd;
+    Py_buffer buffer = {NULL, NULL};
+    int flags = 0;
+
+    if (!_PyArg_CheckPositional("recv_into", nargs, 2, 3)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[0]);
+    if (fd < 0) {
+        goto exit;
+    }
+    if (PyObject_GetBuffer(args[1], &buffer, PyBUF_WRITABLE) < 0) {
+        _PyArg_BadArgument("recv_into", "argument 2", "read-write bytes-like object", args[1]);
+        goto exit;
+    }
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    flags = PyLong_AsInt(args[2]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_recv_into_impl((RingObject *)self, fd, &buffer, flags);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    /* Cleanup for buffer */
+    if (buffer.obj) {
+       PyBuffer_Release(&buffer);
+    }
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_send__doc__,
+"send($self, fd, buffer, flags=0, /)\n"
+"--\n"
+"\n"
+"Prepare sending data from a buffer to the socket fd.");
+
+#define _URING_RING_SEND_METHODDEF    \
+    {"send", _PyCFunction_CAST(_uring_Ring_send), METH_FASTCALL, _uring_Ring_send__doc__},
+
+static PyObject *
+_uring_Ring_send_impl(RingObject *self, int fd, Py_buffer *buffer, int flags);
+
+static PyObject *
+_uring_Ring_send(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int fd;
+    Py_buffer buffer = {NULL, NULL};
+    int flags = 0;
+
+    if (!_PyArg_CheckPositional("send", nargs, 2, 3)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[0]);
+    if (fd < 0) {
+        goto exit;
+    }
+    if (PyObject_GetBuffer(args[1], &buffer, PyBUF_SIMPLE) != 0) {
+        goto exit;
+    }
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    flags = PyLong_AsInt(args[2]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_send_impl((RingObject *)self, fd, &buffer, flags);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    /* Cleanup for buffer */
+    if (buffer.obj) {
+       PyBuffer_Release(&buffer);
+    }
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_read__doc__,
+"read($self, fd, size, offset=-1, /)\n"
+"--\n"
+"\n"
+"Prepare reading up to size bytes from fd.\n"
+"\n"
+"If offset is -1, read from the current file position.  The result of the\n"
+"operation is the data read.");
+
+#define _URING_RING_READ_METHODDEF    \
+    {"read", _PyCFunction_CAST(_uring_Ring_read), METH_FASTCALL, _uring_Ring_read__doc__},
+
+static PyObject *
+_uring_Ring_read_impl(RingObject *self, int fd, Py_ssize_t size,
+                      long long offset);
+
+static PyObject *
+_uring_Ring_read(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int fd;
+    Py_ssize_t size;
+    long long offset = -1;
+
+    if (!_PyArg_CheckPositional("read", nargs, 2, 3)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[0]);
+    if (fd < 0) {
+        goto exit;
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[1]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        size = ival;
+    }
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    offset = PyLong_AsLongLong(args[2]);
+    if (offset == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_read_impl((RingObject *)self, fd, size, offset);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_read_into__doc__,
+"read_into($self, fd, buffer, offset=-1, /)\n"
+"--\n"
+"\n"
+"Prepare reading from fd into a writable buffer.");
+
+#define _URING_RING_READ_INTO_METHODDEF    \
+    {"read_into", _PyCFunction_CAST(_uring_Ring_read_into), METH_FASTCALL, _uring_Ring_read_into__doc__},
+
+static PyObject *
+_uring_Ring_read_into_impl(RingObject *self, int fd, Py_buffer *buffer,
+                           long long offset);
+
+static PyObject *
+_uring_Ring_read_into(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int fd;
+    Py_buffer buffer = {NULL, NULL};
+    long long offset = -1;
+
+    if (!_PyArg_CheckPositional("read_into", nargs, 2, 3)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[0]);
+    if (fd < 0) {
+        goto exit;
+    }
+    if (PyObject_GetBuffer(args[1], &buffer, PyBUF_WRITABLE) < 0) {
+        _PyArg_BadArgument("read_into", "argument 2", "read-write bytes-like object", args[1]);
+        goto exit;
+    }
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    offset = PyLong_AsLongLong(args[2]);
+    if (offset == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_read_into_impl((RingObject *)self, fd, &buffer, offset);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    /* Cleanup for buffer */
+    if (buffer.obj) {
+       PyBuffer_Release(&buffer);
+    }
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_write__doc__,
+"write($self, fd, buffer, offset=-1, /)\n"
+"--\n"
+"\n"
+"Prepare writing data from a buffer to fd.");
+
+#define _URING_RING_WRITE_METHODDEF    \
+    {"write", _PyCFunction_CAST(_uring_Ring_write), METH_FASTCALL, _uring_Ring_write__doc__},
+
+static PyObject *
+_uring_Ring_write_impl(RingObject *self, int fd, Py_buffer *buffer,
+                       long long offset);
+
+static PyObject *
+_uring_Ring_write(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int fd;
+    Py_buffer buffer = {NULL, NULL};
+    long long offset = -1;
+
+    if (!_PyArg_CheckPositional("write", nargs, 2, 3)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[0]);
+    if (fd < 0) {
+        goto exit;
+    }
+    if (PyObject_GetBuffer(args[1], &buffer, PyBUF_SIMPLE) != 0) {
+        goto exit;
+    }
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    offset = PyLong_AsLongLong(args[2]);
+    if (offset == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_write_impl((RingObject *)self, fd, &buffer, offset);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    /* Cleanup for buffer */
+    if (buffer.obj) {
+       PyBuffer_Release(&buffer);
+    }
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_accept__doc__,
+"accept($self, fd, flags=0, /)\n"
+"--\n"
+"\n"
+"Prepare accepting a connection on the listening socket fd.\n"
+"\n"
+"The result of the operation is the file descriptor of the new socket.");
+
+#define _URING_RING_ACCEPT_METHODDEF    \
+    {"accept", _PyCFunction_CAST(_uring_Ring_accept), METH_FASTCALL, _uring_Ring_accept__doc__},
+
+static PyObject *
+_uring_Ring_accept_impl(RingObject *self, int fd, int flags);
+
+static PyObject *
+_uring_Ring_accept(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int fd;
+    int flags = 0;
+
+    if (!_PyArg_CheckPositional("accept", nargs, 1, 2)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[0]);
+    if (fd < 0) {
+        goto exit;
+    }
+    if (nargs < 2) {
+        goto skip_optional;
+    }
+    flags = PyLong_AsInt(args[1]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_accept_impl((RingObject *)self, fd, flags);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_poll__doc__,
+"poll($self, fd, events, /)\n"
+"--\n"
+"\n"
+"Prepare waiting until fd is ready for the events in the select.POLL* mask.\n"
+"\n"
+"The result of the operation is the mask of the ready events.");
+
+#define _URING_RING_POLL_METHODDEF    \
+    {"poll", _PyCFunction_CAST(_uring_Ring_poll), METH_FASTCALL, _uring_Ring_poll__doc__},
+
+static PyObject *
+_uring_Ring_poll_impl(RingObject *self, int fd, unsigned int events);
+
+static PyObject *
+_uring_Ring_poll(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int fd;
+    unsigned int events;
+
+    if (!_PyArg_CheckPositional("poll", nargs, 2, 2)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[0]);
+    if (fd < 0) {
+        goto exit;
+    }
+    events = (unsigned int)PyLong_AsUnsignedLongMask(args[1]);
+    if (events == (unsigned int)-1 && PyErr_Occurred()) {
+        goto exit;
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_poll_impl((RingObject *)self, fd, events);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_cancel__doc__,
+"cancel($self, user_data, /)\n"
+"--\n"
+"\n"
+"Prepare cancelling an operation.\n"
+"\n"
+"The operation still completes, with -ECANCELED as result if it was\n"
+"cancelled before completing.");
+
+#define _URING_RING_CANCEL_METHODDEF    \
+    {"cancel", (PyCFunction)_uring_Ring_cancel, METH_O, _uring_Ring_cancel__doc__},
+
+static PyObject *
+_uring_Ring_cancel_impl(RingObject *self, unsigned long long user_data);
+
+static PyObject *
+_uring_Ring_cancel(PyObject *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    unsigned long long user_data;
+
+    if (!PyLong_Check(arg)) {
+        _PyArg_BadArgument("cancel", "argument", "int", arg);
+        goto exit;
+    }
+    user_data = PyLong_AsUnsignedLongLongMask(arg);
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_cancel_impl((RingObject *)self, user_data);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_uring_Ring_wait__doc__,
+"wait($self, /, timeout=None)\n"
+"--\n"
+"\n"
+"Submit the prepared operations and wait for completed operations.\n"
+"\n"
+"Wait at most timeout seconds, or forever if timeout is None.  Return a list\n"
+"of (user_data, result, data) tuples.  result is the negated errno value\n"
+"if the operation failed.  data is the data read by recv() and read(), the\n"
+"exception raised while completing the operation, or None.");
+
+#define _URING_RING_WAIT_METHODDEF    \
+    {"wait", _PyCFunction_CAST(_uring_Ring_wait), METH_FASTCALL|METH_KEYWORDS, _uring_Ring_wait__doc__},
+
+static PyObject *
+_uring_Ring_wait_impl(RingObject *self, PyObject *timeout_obj);
+
+static PyObject *
+_uring_Ring_wait(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(timeout), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"timeout", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "wait",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    PyObject *timeout_obj = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    timeout_obj = args[0];
+skip_optional_pos:
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _uring_Ring_wait_impl((RingObject *)self, timeout_obj);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+/*[clinic end generated code: output=c6927bfdb2f2befe input=a9049054013a1b77]*/
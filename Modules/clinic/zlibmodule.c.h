@@ -983,6 +983,88 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(zlib_ZlibDecompressor__decompress_block__doc__,
+"_decompress_block($self, data, /)\n"
+"--\n"
+"\n"
+"Decompress *data* up to the end of the current deflate block.\n"
+"\n"
+"Return a tuple (output, data_type, unconsumed) where data_type is the\n"
+"zlib data_type field after the call and unconsumed is the number of input\n"
+"bytes that are still buffered.  Bit 128 of data_type is set if decompression\n"
+"stopped at a block boundary, bit 64 if the last block of the stream is being\n"
+"decoded, and the low 3 bits give the number of unused bits in the last\n"
+"consumed input byte.\n"
+"\n"
+"Used to build gzip access point indexes.");
+
+#define ZLIB_ZLIBDECOMPRESSOR__DECOMPRESS_BLOCK_METHODDEF    \
+    {"_decompress_block", (PyCFunction)zlib_ZlibDecompressor__decompress_block, METH_O, zlib_ZlibDecompressor__decompress_block__doc__},
+
+static PyObject *
+zlib_ZlibDecompressor__decompress_block_impl(ZlibDecompressor *self,
+                                             Py_buffer *data);
+
+static PyObject *
+zlib_ZlibDecompressor__decompress_block(PyObject *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    Py_buffer data = {NULL, NULL};
+
+    if (PyObject_GetBuffer(arg, &data, PyBUF_SIMPLE) != 0) {
+        goto exit;
+    }
+    return_value = zlib_ZlibDecompressor__decompress_block_impl((ZlibDecompressor *)self, &data);
+
+exit:
+    /* Cleanup for data */
+    if (data.obj) {
+       PyBuffer_Release(&data);
+    }
+
+    return return_value;
+}
+
+PyDoc_STRVAR(zlib_ZlibDecompressor__prime__doc__,
+"_prime($self, bits, value, /)\n"
+"--\n"
+"\n"
+"Insert the low *bits* bits of *value* into the input stream.\n"
+"\n"
+"This must be called before any data is decompressed.  It is used to resume\n"
+"decompression in the middle of a byte.");
+
+#define ZLIB_ZLIBDECOMPRESSOR__PRIME_METHODDEF    \
+    {"_prime", _PyCFunction_CAST(zlib_ZlibDecompressor__prime), METH_FASTCALL, zlib_ZlibDecompressor__prime__doc__},
+
+static PyObject *
+zlib_ZlibDecompressor__prime_impl(ZlibDecompressor *self, int bits,
+                                  int value);
+
+static PyObject *
+zlib_ZlibDecompressor__prime(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int bits;
+    int value;
+
+    if (!_PyArg_CheckPositional("_prime", nargs, 2, 2)) {
+        goto exit;
+    }
+    bits = PyLong_AsInt(args[0]);
+    if (bits == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+    value = PyLong_AsInt(args[1]);
+    if (value == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+    return_value = zlib_ZlibDecompressor__prime_impl((ZlibDecompressor *)self, bits, value);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(zlib_adler32__doc__,
 "adler32($module, data, value=1, /)\n"
 "--\n"
@@ -1109,4 +1191,4 @@ exit:
 #ifndef ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
     #define ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
 #endif /* !defined(ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF) */
-/*[clinic end generated code: output=969872868c303e8a input=a9049054013a1b77]*/
+/*[clinic end generated code: output=f7e1c1548346f952 input=a9049054013a1b77]*/
@@ -1440,14 +1440,20 @@ arrange_output_buffer_with_maximum(uint32_t *avail_out,
     return length;
 }
 
+/* True if inflate() was called with Z_BLOCK and stopped at the end of
+   a deflate block (or of the stream header). */
+#define AT_BLOCK_BOUNDARY(self, flush) \
+    ((flush) == Z_BLOCK && ((self)->zst.data_type & 128))
+
 /* Decompress data of length self->avail_in_real in self->state.next_in. The
    output buffer is allocated dynamically and returned. If the max_length is
    of sufficiently low size, max_length is allocated immediately. At most
    max_length bytes are returned, so some of the input may not be consumed.
    self->state.next_in and self->avail_in_real are updated to reflect the
-   consumed input. */
+   consumed input. If flush is Z_BLOCK, stop at the end of the current
+   deflate block. */
 static PyObject*
-decompress_buf(ZlibDecompressor *self, Py_ssize_t max_length)
+decompress_buf(ZlibDecompressor *self, Py_ssize_t max_length, int flush)
 {
     /* data_size is strictly positive, but because we repeatedly have to
        compare against max_length and PyBytes_GET_SIZE we declare it as
@@ -1496,7 +1502,7 @@ decompress_buf(ZlibDecompressor *self, Py_ssize_t max_length)
                 break;
             }
             Py_BEGIN_ALLOW_THREADS
-            err = inflate(&self->zst, Z_SYNC_FLUSH);
+            err = inflate(&self->zst, flush);
             Py_END_ALLOW_THREADS
             switch (err) {
             case Z_OK:  _Py_FALLTHROUGH;
@@ -1511,8 +1517,9 @@ decompress_buf(ZlibDecompressor *self, Py_ssize_t max_length)
                     break;
                 }
             }
-        } while (self->zst.avail_out == 0);
-    } while(err != Z_STREAM_END && self->avail_in_real != 0);
+        } while (self->zst.avail_out == 0 && !AT_BLOCK_BOUNDARY(self, flush));
+    } while (err != Z_STREAM_END && self->avail_in_real != 0 &&
+             !AT_BLOCK_BOUNDARY(self, flush));
 
     if (err == Z_STREAM_END) {
         self->eof = 1;
@@ -1546,7 +1553,7 @@ decompress_buf(ZlibDecompressor *self, Py_ssize_t max_length)
 
 static PyObject *
 decompress(ZlibDecompressor *self, uint8_t *data,
-           size_t len, Py_ssize_t max_length)
+           size_t len, Py_ssize_t max_length, int flush)
 {
     bool input_buffer_in_use;
     PyObject *result;
@@ -1596,7 +1603,7 @@ decompress(ZlibDecompressor *self, uint8_t *data,
         input_buffer_in_use = 0;
     }
 
-    result = decompress_buf(self, max_length);
+    result = decompress_buf(self, max_length, flush);
     if(result == NULL) {
         self->zst.next_in = NULL;
         return NULL;
@@ -1691,12 +1698,89 @@ zlib_ZlibDecompressor_decompress_impl(ZlibDecompressor *self,
         PyErr_SetString(PyExc_EOFError, "End of stream already reached");
     }
     else {
-        result = decompress(self, data->buf, data->len, max_length);
+        result = decompress(self, data->buf, data->len, max_length,
+                            Z_SYNC_FLUSH);
+    }
+    LEAVE_ZLIB(self);
+    return result;
+}
+
+/*[clinic input]
+zlib.ZlibDecompressor._decompress_block
+
+    data: Py_buffer
+    /
+
+Decompress *data* up to the end of the current deflate block.
+
+Return a tuple (output, data_type, unconsumed) where data_type is the
+zlib data_type field after the call and unconsumed is the number of input
+bytes that are still buffered.  Bit 128 of data_type is set if decompression
+stopped at a block boundary, bit 64 if the last block of the stream is being
+decoded, and the low 3 bits give the number of unused bits in the last
+consumed input byte.
+
+Used to build gzip access point indexes.
+[clinic start generated code]*/
+
+static PyObject *
+zlib_ZlibDecompressor__decompress_block_impl(ZlibDecompressor *self,
+                                             Py_buffer *data)
+/*[clinic end generated code: output=9e4f1db60dc50c4b input=49a200ff7339fc03]*/
+{
+    PyObject *result = NULL, *output;
+
+    ENTER_ZLIB(self);
+    if (self->eof) {
+        PyErr_SetString(PyExc_EOFError, "End of stream already reached");
+    }
+    else {
+        output = decompress(self, data->buf, data->len, -1, Z_BLOCK);
+        if (output != NULL) {
+            result = Py_BuildValue("Nin", output, self->zst.data_type,
+                                   self->avail_in_real);
+        }
     }
     LEAVE_ZLIB(self);
     return result;
 }
 
+/*[clinic input]
+zlib.ZlibDecompressor._prime
+
+    bits: int
+    value: int
+    /
+
+Insert the low *bits* bits of *value* into the input stream.
+
+This must be called before any data is decompressed.  It is used to resume
+decompression in the middle of a byte.
+[clinic start generated code]*/
+
+static PyObject *
+zlib_ZlibDecompressor__prime_impl(ZlibDecompressor *self, int bits,
+                                  int value)
+/*[clinic end generated code: output=bbf4cb3d7888d2cc input=91a980c920050d79]*/
+{
+    int err;
+    zlibstate *state = PyType_GetModuleState(Py_TYPE(self));
+
+    ENTER_ZLIB(self);
+    if (!self->is_initialised) {
+        LEAVE_ZLIB(self);
+        PyErr_SetString(PyExc_EOFError, "End of stream already reached");
+        return NULL;
+    }
+    err = inflatePrime(&self->zst, bits, value);
+    LEAVE_ZLIB(self);
+    if (err != Z_OK) {
+        zlib_error(state, self->zst, err, "while priming the decompressor");
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
 PyDoc_STRVAR(ZlibDecompressor__new____doc__,
 "_ZlibDecompressor(wbits=15, zdict=b\'\')\n"
 "--\n"
@@ -1805,6 +1889,8 @@ static PyMethodDef Decomp_methods[] =
 
 static PyMethodDef ZlibDecompressor_methods[] = {
     ZLIB_ZLIBDECOMPRESSOR_DECOMPRESS_METHODDEF
+    ZLIB_ZLIBDECOMPRESSOR__DECOMPRESS_BLOCK_METHODDEF
+    ZLIB_ZLIBDECOMPRESSOR__PRIME_METHODDEF
     {NULL}
 };
 
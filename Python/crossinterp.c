@@ -211,8 +211,10 @@ _set_xid_lookup_failure(dlcontext_t *ctx, PyObject *obj, const char *msg)
                         "object does not support cross-interpreter data");
     }
     else {
+        // Don't format the object itself, which can take a long time,
+        // e.g. for a large container.
         PyErr_Format(exctype,
-                     "%S does not support cross-interpreter data", obj);
+                     "%T object does not support cross-interpreter data", obj);
     }
 }
 
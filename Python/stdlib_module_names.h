@@ -93,6 +93,7 @@ static const char* _Py_stdlib_module_names[] = {
 "_tokenize",
 "_tracemalloc",
 "_typing",
+"_uring",
 "_uuid",
 "_warnings",
 "_weakref",
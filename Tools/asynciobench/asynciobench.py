@@ -0,0 +1,225 @@
+# Measure the throughput of the asyncio event loop scheduler: how many
+# callbacks per second BaseEventLoop._run_once() dispatches for the common
+# sources of callbacks (call_soon(), short timers, future completions,
+# task switches and I/O readiness).
+#
+# Usage: python Tools/asynciobench/asynciobench.py [-n N] [--loop LOOP]
+#                                                  [BENCHMARK ...]
+#
+# How to interpret the results:
+#
+# Callbacks (kHz): the number of callbacks run by the event loop in
+# thousands of callbacks per second, the best of several runs.  Higher is
+# better.  The benchmarks are micro-benchmarks of the event loop overhead:
+# the callbacks themselves do almost no work.
+
+import argparse
+import asyncio
+import selectors
+import socket
+import sys
+import time
+
+ALL_BENCHMARKS = {}
+
+
+def register_benchmark(func):
+    ALL_BENCHMARKS[func.__name__] = func
+    return func
+
+
+@register_benchmark
+def call_soon(loop, n):
+    # A batch of independent callbacks per loop iteration.
+    count = 0
+
+    def callback():
+        nonlocal count
+        count += 1
+        if count == n:
+            loop.stop()
+        elif count % 100 == 0:
+            for _ in range(100):
+                loop.call_soon(callback)
+
+    for _ in range(100):
+        loop.call_soon(callback)
+    loop.run_forever()
+    return count
+
+
+@register_benchmark
+def call_soon_chain(loop, n):
+    # One callback per loop iteration: measures the per-iteration overhead.
+    count = 0
+
+    def callback():
+        nonlocal count
+        count += 1
+        if count == n:
+            loop.stop()
+        else:
+            loop.call_soon(callback)
+
+    loop.call_soon(callback)
+    loop.run_forever()
+    return count
+
+
+@register_benchmark
+def call_later(loop, n):
+    # Timers which expire immediately: measures the cost of going through
+    # the heap of scheduled callbacks rather than the time spent sleeping.
+    count = 0
+
+    def callback():
+        nonlocal count
+        count += 1
+        if count == n:
+            loop.stop()
+        else:
+            loop.call_later(0, callback)
+
+    for _ in range(100):
+        loop.call_later(0, callback)
+    loop.run_forever()
+    return count
+
+
+@register_benchmark
+def cancelled_timers(loop, n):
+    # Timeouts which are almost always cancelled before they expire.
+    count = 0
+
+    def callback():
+        nonlocal count
+        count += 1
+        timer = loop.call_later(60, callback)
+        if count == n:
+            loop.stop()
+        else:
+            loop.call_soon(callback)
+        timer.cancel()
+
+    loop.call_soon(callback)
+    loop.run_forever()
+    return count
+
+
+@register_benchmark
+def futures(loop, n):
+    # Future done callbacks.
+    count = 0
+
+    def done(fut):
+        nonlocal count
+        count += 1
+        if count == n:
+            loop.stop()
+        else:
+            new = loop.create_future()
+            new.add_done_callback(done)
+            new.set_result(None)
+
+    for _ in range(100):
+        fut = loop.create_future()
+        fut.add_done_callback(done)
+        fut.set_result(None)
+    loop.run_forever()
+    return count
+
+
+@register_benchmark
+def tasks(loop, n):
+    # Task switches with asyncio.sleep(0).
+    per_task = n // 100
+
+    async def worker():
+        for _ in range(per_task):
+            await asyncio.sleep(0)
+
+    async def main():
+        await asyncio.gather(*[worker() for _ in range(100)])
+
+    loop.run_until_complete(main())
+    return per_task * 100
+
+
+@register_benchmark
+def readers(loop, n):
+    # I/O readiness callbacks with add_reader() on many sockets.
+    pairs = [socket.socketpair() for _ in range(50)]
+    count = 0
+
+    def make_reader(rsock, wsock):
+        def reader():
+            nonlocal count
+            rsock.recv(1)
+            count += 1
+            if count >= n:
+                loop.stop()
+            else:
+                wsock.send(b'x')
+        return reader
+
+    try:
+        for rsock, wsock in pairs:
+            rsock.setblocking(False)
+            loop.add_reader(rsock, make_reader(rsock, wsock))
+            wsock.send(b'x')
+        loop.run_forever()
+    finally:
+        for rsock, wsock in pairs:
+            loop.remove_reader(rsock)
+            rsock.close()
+            wsock.close()
+    return count
+
+
+LOOP_FACTORIES = {
+    'default': asyncio.new_event_loop,
+    'select': lambda: asyncio.SelectorEventLoop(selectors.SelectSelector()),
+}
+if hasattr(asyncio, 'UringEventLoop'):
+    LOOP_FACTORIES['uring'] = asyncio.UringEventLoop
+
+
+def bench(func, loop_factory, n, repeat):
+    best = None
+    for _ in range(repeat):
+        loop = loop_factory()
+        try:
+            t0 = time.perf_counter()
+            count = func(loop, n)
+            dt = time.perf_counter() - t0
+        finally:
+            loop.close()
+        rate = count / dt
+        if best is None or rate > best:
+            best = rate
+    return best
+
+
+def main(opts):
+    benchmarks = opts.benchmarks or list(ALL_BENCHMARKS)
+    for name in benchmarks:
+        if name not in ALL_BENCHMARKS:
+            sys.exit(f"unknown benchmark: {name}")
+    loop_factory = LOOP_FACTORIES[opts.loop]
+    print(f"{'Benchmark':<20}{'Callbacks (kHz)':>16}")
+    for name in benchmarks:
+        rate = bench(ALL_BENCHMARKS[name], loop_factory, opts.n, opts.repeat)
+        print(f"{name:<20}{rate / 1000:>16.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=100_000,
+                        help="number of callbacks per run")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="number of runs, the best one is reported")
+    parser.add_argument("--loop", choices=sorted(LOOP_FACTORIES),
+                        default='default', help="event loop to benchmark")
+    parser.add_argument("benchmarks", nargs="*",
+                        help="benchmarks to run (default: all)")
+    main(parser.parse_args())
@@ -0,0 +1,132 @@
+# This script measures how ThreadPoolExecutor scales with the number of
+# worker threads in the free-threaded interpreter, with the default shared
+# work queue and with work stealing (work_stealing=True).
+#
+# Each benchmark runs a tree of small tasks.  In the "fan_out" benchmark, the
+# tasks are submitted by the worker threads themselves: this is the pattern
+# that work stealing is intended for.  In the "flat" benchmark, all the tasks
+# are submitted by the main thread, which goes through the shared queue in
+# both modes.
+#
+# The speedup is relative to the same executor mode with a single worker
+# thread.  See ftscalingbench.py for advice on reducing the noise.
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# The iterations of the work done by each task.
+WORK_SCALE = 20
+
+
+def work():
+    accu = 0
+    for i in range(WORK_SCALE):
+        accu += i * i
+    return accu
+
+
+def fan_out(executor, depth, width):
+    if depth:
+        return [executor.submit(fan_out, executor, depth - 1, width)
+                for _ in range(width)]
+    return work()
+
+
+def run_fan_out(executor, opts):
+    futures = [executor.submit(fan_out, executor, opts.depth, opts.width)]
+    ntasks = 0
+    while futures:
+        ntasks += len(futures)
+        children = []
+        for f in futures:
+            result = f.result()
+            if isinstance(result, list):
+                children.extend(result)
+        futures = children
+    return ntasks
+
+
+def run_flat(executor, opts):
+    ntasks = opts.width ** opts.depth
+    futures = [executor.submit(work) for _ in range(ntasks)]
+    for f in futures:
+        f.result()
+    return ntasks
+
+
+ALL_BENCHMARKS = {
+    'fan_out': run_fan_out,
+    'flat': run_flat,
+}
+
+
+def bench(func, nthreads, work_stealing, opts):
+    best = None
+    for _ in range(opts.repeat):
+        with ThreadPoolExecutor(nthreads, work_stealing=work_stealing) as ex:
+            # Start the worker threads before measuring.
+            for f in [ex.submit(work) for _ in range(nthreads * 4)]:
+                f.result()
+            t0 = time.perf_counter_ns()
+            ntasks = func(ex, opts)
+            t1 = time.perf_counter_ns()
+        if best is None or t1 - t0 < best:
+            best = t1 - t0
+    return ntasks / (best / 1e9)
+
+
+def main(opts):
+    global WORK_SCALE
+    if not hasattr(sys, "_is_gil_enabled") or sys._is_gil_enabled():
+        sys.stderr.write("expected to be run with the  GIL disabled\n")
+
+    benchmark_names = opts.benchmarks or ALL_BENCHMARKS.keys()
+    for name in benchmark_names:
+        if name not in ALL_BENCHMARKS:
+            sys.stderr.write(f"Unknown benchmark: {name}\n")
+            sys.exit(1)
+
+    WORK_SCALE = opts.scale
+    max_threads = opts.threads
+    if max_threads == -1:
+        max_threads = os.process_cpu_count() or 1
+    thread_counts = []
+    n = 1
+    while n < max_threads:
+        thread_counts.append(n)
+        n *= 2
+    thread_counts.append(max_threads)
+
+    for name in benchmark_names:
+        func = ALL_BENCHMARKS[name]
+        for work_stealing in (False, True):
+            mode = "work stealing" if work_stealing else "shared queue"
+            baseline = None
+            for nthreads in thread_counts:
+                rate = bench(func, nthreads, work_stealing, opts)
+                if baseline is None:
+                    baseline = rate
+                print(f"{name:<8} {mode:<14} {nthreads:>3} threads "
+                      f"{rate:>10,.0f} tasks/s {rate / baseline:>5.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-t", "--threads", type=int, default=-1,
+                        help="maximum number of worker threads "
+                             "(default: the number of CPUs)")
+    parser.add_argument("--scale", type=int, default=20,
+                        help="work scale factor of a task (default=20)")
+    parser.add_argument("--depth", type=int, default=5,
+                        help="depth of the tree of tasks (default=5)")
+    parser.add_argument("--width", type=int, default=8,
+                        help="number of children of a task (default=8)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of runs, the best is kept (default=3)")
+    parser.add_argument("benchmarks", nargs="*",
+                        help="benchmarks to run")
+    options = parser.parse_args()
+    main(options)